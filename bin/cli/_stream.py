@@ -0,0 +1,56 @@
+"""
+_stream.py -- streaming row writers shared by `gaia query` and `gaia history`.
+
+Each writer consumes an iterable of dicts and writes as it goes, so output
+of a generator-backed query needs memory for one row, not the whole result:
+
+  - write_ndjson       one compact JSON object per line.
+  - write_csv          header + one CSV record per row (selected fields).
+  - write_json_array   byte-identical to ``json.dumps(list(rows), indent=2)``.
+
+Every writer returns the number of rows written.
+
+Naming convention: private module (leading underscore), like
+``_install_helpers.py``; the plugin loader skips it (no ``register``).
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from typing import IO, Iterable, Sequence
+
+
+def write_ndjson(rows: Iterable[dict], out: IO[str] | None = None) -> int:
+    """Write one JSON document per line."""
+    out = out or sys.stdout
+    n = 0
+    for row in rows:
+        out.write(json.dumps(row, default=str, separators=(",", ":")) + "\n")
+        n += 1
+    return n
+
+
+def write_csv(rows: Iterable[dict], fields: Sequence[str], out: IO[str] | None = None) -> int:
+    """Write *fields* of each row as CSV, with a header line."""
+    writer = csv.DictWriter(out or sys.stdout, fieldnames=list(fields),
+                            extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    n = 0
+    for row in rows:
+        writer.writerow({k: "" if row.get(k) is None else row.get(k) for k in fields})
+        n += 1
+    return n
+
+
+def write_json_array(rows: Iterable[dict], out: IO[str] | None = None) -> int:
+    """Write an indented JSON array element by element."""
+    out = out or sys.stdout
+    n = 0
+    for row in rows:
+        body = json.dumps(row, indent=2, default=str).replace("\n", "\n  ")
+        out.write(("[\n  " if n == 0 else ",\n  ") + body)
+        n += 1
+    out.write("\n]\n" if n else "[]\n")
+    return n
@@ -11,9 +11,11 @@ Flags:
   --json              Machine-readable output
 """
 
+import fcntl
 import json
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -120,17 +122,24 @@ def _matches_pattern(filename: str, pattern: str) -> bool:
     return fnmatch.fnmatch(filename, pattern)
 
 
-def _prune_old_files(root: Path, dir_rel: str, pattern: str, max_days: int, label: str, dry_run: bool) -> list:
-    """Return list of action dicts for files matching pattern older than max_days."""
+def _prune_old_files(root: Path, dir_rel: str, pattern: str, max_days: int, label: str, dry_run: bool,
+                     entries: list = None) -> list:
+    """Return list of action dicts for files matching pattern older than max_days.
+
+    *entries* is an optional pre-read listing of the directory (see
+    _apply_retention_policy).
+    """
     actions = []
     full_dir = root / dir_rel
-    if not full_dir.exists():
-        return actions
+    if entries is None:
+        if not full_dir.exists():
+            return actions
+        entries = list(full_dir.iterdir())
 
     import time
     cutoff = time.time() - max_days * 86400
 
-    for entry in full_dir.iterdir():
+    for entry in entries:
         if not _matches_pattern(entry.name, pattern):
             continue
         if not entry.is_file():
@@ -150,18 +159,21 @@ def _prune_old_files(root: Path, dir_rel: str, pattern: str, max_days: int, labe
     return actions
 
 
-def _prune_old_dirs(root: Path, dir_rel: str, max_days: int, label: str, dry_run: bool) -> list:
+def _prune_old_dirs(root: Path, dir_rel: str, max_days: int, label: str, dry_run: bool,
+                    entries: list = None) -> list:
     """Return list of action dicts for directories older than max_days."""
     import shutil
     import time
     actions = []
     full_dir = root / dir_rel
-    if not full_dir.exists():
-        return actions
+    if entries is None:
+        if not full_dir.exists():
+            return actions
+        entries = list(full_dir.iterdir())
 
     cutoff = time.time() - max_days * 86400
 
-    for entry in full_dir.iterdir():
+    for entry in entries:
         if not entry.is_dir():
             continue
         try:
@@ -179,8 +191,103 @@ def _prune_old_dirs(root: Path, dir_rel: str, max_days: int, label: str, dry_run
     return actions
 
 
+@contextmanager
+def _jsonl_lock(path: Path):
+    """Hold the writers' exclusive lock on *path* (``<name>.lock`` sibling).
+
+    Same convention as EventWriter (events.jsonl.lock) and
+    workflow_recorder._append_jsonl: a writer holds the lock across
+    open-append-close, so a rename made under it never strands a write on
+    the replaced inode.
+    """
+    lock_path = path.with_name(path.name + ".lock")
+    with open(lock_path, "w") as lf:
+        fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+
+def _line_timestamp(line: bytes, key: str = "timestamp"):
+    """Epoch seconds of a JSONL record's *key*, or None if absent/unparseable."""
+    try:
+        entry = json.loads(line)
+        ts_str = entry.get(key) if isinstance(entry, dict) else None
+        if not ts_str:
+            return None
+        from datetime import datetime
+        return datetime.fromisoformat(ts_str.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _next_stamped_line(fh, offset: int):
+    """Return (start, end, ts) of the first timestamped line starting at or after *offset*."""
+    if offset == 0:
+        fh.seek(0)
+    else:
+        fh.seek(offset - 1)
+        fh.readline()  # finish the line containing offset-1
+    while True:
+        start = fh.tell()
+        line = fh.readline()
+        if not line:
+            return start, start, None
+        ts = _line_timestamp(line)
+        if ts is not None:
+            return start, fh.tell(), ts
+
+
+def _retention_cut(fh, size: int, cutoff: float) -> int:
+    """Byte offset where records at or after *cutoff* begin.
+
+    Records are appended in time order, so this binary-searches byte
+    offsets for the first timestamped line whose timestamp is >= cutoff
+    and returns the end of the last older one: O(log n) parsed lines,
+    not a parse of the whole file. Untimestamped lines are skipped while
+    probing and fall on whichever side of the cut they sit.
+    """
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start, _end, ts = _next_stamped_line(fh, mid)
+        if ts is None or ts >= cutoff:
+            hi = mid
+        else:
+            lo = start + 1
+    if lo == 0:
+        return 0
+    # The line starting at lo-1 is the last record older than cutoff.
+    fh.seek(lo - 1)
+    fh.readline()
+    return fh.tell()
+
+
+def _count_lines(fh, end: int, chunk_size: int = 1 << 20) -> int:
+    """Count the lines in the first *end* bytes of *fh* (chunked, no parsing)."""
+    fh.seek(0)
+    count = 0
+    remaining = end
+    while remaining > 0:
+        chunk = fh.read(min(chunk_size, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        count += chunk.count(b"\n")
+    return count
+
+
 def _truncate_jsonl(root: Path, file_rel: str, max_days: int, label: str, dry_run: bool) -> list:
-    """Remove JSONL lines with timestamp older than max_days."""
+    """Remove JSONL lines with timestamp older than max_days.
+
+    Streams instead of loading the file: the cut is found by binary
+    search (records are time-ordered), the tail is copied to a temp file
+    in the same directory, and the temp file replaces the original with
+    an atomic rename -- all under the writers' lock (see _jsonl_lock).
+    """
+    import shutil
+    import tempfile
     import time
     actions = []
     full_path = root / file_rel
@@ -188,52 +295,64 @@ def _truncate_jsonl(root: Path, file_rel: str, max_days: int, label: str, dry_ru
         return actions
 
     cutoff = time.time() - max_days * 86400
-    removed = 0
 
-    try:
-        lines = full_path.read_text(encoding="utf-8").splitlines()
-        kept = []
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+    def _truncate(fh) -> int:
+        size = os.fstat(fh.fileno()).st_size
+        cut = _retention_cut(fh, size, cutoff)
+        if cut == 0:
+            return 0
+        removed = _count_lines(fh, cut)
+        if dry_run:
+            return removed
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{full_path.name}.", suffix=".tmp", dir=full_path.parent)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                fh.seek(cut)
+                shutil.copyfileobj(fh, out)
+                out.flush()
+                os.fsync(out.fileno())
+            shutil.copymode(full_path, tmp_name)
+            os.replace(tmp_name, full_path)
+        except BaseException:
             try:
-                entry = json.loads(line)
-                ts_str = entry.get("timestamp")
-                if ts_str:
-                    from datetime import datetime, timezone
-                    ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00")).timestamp()
-                    if ts < cutoff:
-                        removed += 1
-                        continue
-            except (json.JSONDecodeError, ValueError):
+                os.unlink(tmp_name)
+            except OSError:
                 pass
-            kept.append(line)
+            raise
+        return removed
 
-        if removed > 0:
-            actions.append({
-                "action": "truncate-jsonl",
-                "path": file_rel,
-                "removed": removed,
-                "label": label,
-            })
-            if not dry_run:
-                content = "\n".join(kept) + ("\n" if kept else "")
-                full_path.write_text(content, encoding="utf-8")
+    try:
+        if dry_run:
+            with open(full_path, "rb") as fh:
+                removed = _truncate(fh)
+        else:
+            with _jsonl_lock(full_path), open(full_path, "rb") as fh:
+                removed = _truncate(fh)
     except OSError:
-        pass
+        return actions
+
+    if removed > 0:
+        actions.append({
+            "action": "truncate-jsonl",
+            "path": file_rel,
+            "removed": removed,
+            "label": label,
+        })
 
     return actions
 
 
-def _prune_legacy_logs(root: Path, dir_rel: str, patterns: list, label: str, dry_run: bool) -> list:
+def _prune_legacy_logs(root: Path, dir_rel: str, patterns: list, label: str, dry_run: bool,
+                       entries: list = None) -> list:
     """Remove legacy log files matching any of the patterns (no age check)."""
     actions = []
     full_dir = root / dir_rel
-    if not full_dir.exists():
-        return actions
+    if entries is None:
+        if not full_dir.exists():
+            return actions
+        entries = list(full_dir.iterdir())
 
-    for entry in full_dir.iterdir():
+    for entry in entries:
         if not entry.is_file():
             continue
         if any(_matches_pattern(entry.name, p) for p in patterns):
@@ -295,18 +414,33 @@ def _prune_flag_by_ttl(root: Path, file_rel: str, max_hours: int, label: str, dr
 
 
 def _apply_retention_policy(root: Path, dry_run: bool) -> list:
-    """Apply all retention policy rules and return list of action dicts."""
+    """Apply all retention policy rules and return list of action dicts.
+
+    One pass: each policy directory is listed once and the listing is
+    shared by every rule on it (.claude/logs carries three).
+    """
     all_actions = []
+    listings = {}
+
+    def _listing(dir_rel: str) -> list:
+        if dir_rel not in listings:
+            try:
+                listings[dir_rel] = list((root / dir_rel).iterdir())
+            except OSError:
+                listings[dir_rel] = []
+        return listings[dir_rel]
 
     for policy in RETENTION_POLICY:
         ptype = policy["type"]
         if ptype == "files":
             all_actions.extend(
-                _prune_old_files(root, policy["dir"], policy["pattern"], policy["max_days"], policy["label"], dry_run)
+                _prune_old_files(root, policy["dir"], policy["pattern"], policy["max_days"], policy["label"], dry_run,
+                                 entries=_listing(policy["dir"]))
             )
         elif ptype == "dirs":
             all_actions.extend(
-                _prune_old_dirs(root, policy["dir"], policy["max_days"], policy["label"], dry_run)
+                _prune_old_dirs(root, policy["dir"], policy["max_days"], policy["label"], dry_run,
+                                entries=_listing(policy["dir"]))
             )
         elif ptype == "truncate-jsonl":
             all_actions.extend(
@@ -314,7 +448,8 @@ def _apply_retention_policy(root: Path, dry_run: bool) -> list:
             )
         elif ptype == "legacy":
             all_actions.extend(
-                _prune_legacy_logs(root, policy["dir"], policy["patterns"], policy["label"], dry_run)
+                _prune_legacy_logs(root, policy["dir"], policy["patterns"], policy["label"], dry_run,
+                                   entries=_listing(policy["dir"]))
             )
         elif ptype == "flag-ttl":
             all_actions.extend(
@@ -16,6 +16,16 @@ Checks:
 
 Severity: pass / info / warning / error
 Exit codes: 0=healthy, 1=warnings, 2=errors
+
+Checks run concurrently in a thread pool; a check that declares
+``depends_on`` starts only after those checks finished. Results keep the
+registry order and carry ``duration_ms``.
+
+``--fast`` reuses results of expensive checks (those registered with
+``cache_inputs``) from ``gaia.paths.cache_dir() / "doctor-checks.json"``.
+An entry is keyed on the project root and the size/mtime of the check's
+input files and expires after _CACHE_TTL_S. Override the cache file with
+GAIA_DOCTOR_CACHE=<path>, or disable it with GAIA_DOCTOR_CACHE=off.
 """
 
 import json
@@ -23,6 +33,9 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 
@@ -30,22 +43,31 @@ from pathlib import Path
 # Check Registry
 # ============================================================================
 
-# Global ordered registry of (order, name, fn) tuples populated by
-# @register_check. cmd_doctor iterates this list rather than a hardcoded
-# array. Order values are spaced (10, 20, 30...) to leave room for inserts.
+# Global ordered registry of (order, name, fn, depends_on, cache_inputs)
+# tuples populated by @register_check. cmd_doctor iterates this list rather
+# than a hardcoded array. Order values are spaced (10, 20, 30...) to leave
+# room for inserts.
 _CHECKS = []
 
+# Worker threads for the check pool.
+_MAX_WORKERS = 8
+
 
-def register_check(name: str, order: int):
+def register_check(name: str, order: int, depends_on=(), cache_inputs=None):
     """Register a check function in the global ordered registry.
 
     Args:
         name: Display name for the check (used as identifier for fallbacks).
-        order: Integer priority -- lower runs first. Use multiples of 10 to
-            leave room for future inserts.
+        order: Integer priority -- lower is reported first. Use multiples of
+            10 to leave room for future inserts.
+        depends_on: Names of checks that must finish before this one starts
+            (e.g. they inspect state this check creates as a side effect).
+        cache_inputs: Optional ``fn(project_root) -> list[Path]`` marking the
+            check as expensive; its result is reusable by ``--fast`` while
+            these files keep their size and mtime.
     """
     def decorator(fn):
-        _CHECKS.append((order, name, fn))
+        _CHECKS.append((order, name, fn, tuple(depends_on), cache_inputs))
         _CHECKS.sort(key=lambda x: x[0])
         return fn
     return decorator
@@ -93,6 +115,22 @@ def _package_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent
 
 
+def _claude_binaries(project_root: Path) -> list:
+    """Resolved Claude Code binaries on PATH (cache inputs of check_claude_code)."""
+    return [Path(p) for p in (shutil.which(c) for c in ("claude", "claude-code")) if p]
+
+
+def _fts5_inputs(project_root: Path) -> list:
+    """Files whose change invalidates the FTS5 count."""
+    em_dir = project_root / ".claude" / "project-context" / "episodic-memory"
+    return [em_dir / "index.json", em_dir / "search.db", em_dir / "search.db-wal"]
+
+
+def _scoring_inputs(project_root: Path) -> list:
+    """Module file whose change invalidates the scoring import check."""
+    return [_package_root() / "tools" / "memory" / "scoring.py"]
+
+
 # ============================================================================
 # Health Checks
 # ============================================================================
@@ -107,7 +145,7 @@ def check_gaia_version() -> dict:
     return _result("Gaia-Ops", "error", "Version unknown", "Reinstall @jaguilar87/gaia")
 
 
-@register_check("Claude Code", order=20)
+@register_check("Claude Code", order=20, cache_inputs=_claude_binaries)
 def check_claude_code() -> dict:
     """Check if Claude Code CLI is installed."""
     for cmd in ("claude", "claude-code"):
@@ -412,7 +450,8 @@ def check_memory_fts5_db(project_root: Path) -> dict:
     )
 
 
-@register_check("memory_fts5_count", order=130)
+@register_check("memory_fts5_count", order=130, depends_on=("memory_fts5_db",),
+                cache_inputs=_fts5_inputs)
 def check_memory_fts5_count(project_root: Path) -> dict:
     """Check FTS5 indexed count against total episode count in index.json."""
     index_path = project_root / ".claude" / "project-context" / "episodic-memory" / "index.json"
@@ -457,7 +496,7 @@ def check_memory_fts5_count(project_root: Path) -> dict:
     return _result("memory_fts5_count", "pass", f"{indexed}/{total} episodes indexed ({pct:.0%})")
 
 
-@register_check("memory_scoring", order=140)
+@register_check("memory_scoring", order=140, cache_inputs=_scoring_inputs)
 def check_memory_scoring(project_root: Path) -> dict:
     """Check that tools.memory.scoring is importable (scoring module available)."""
     try:
@@ -601,6 +640,176 @@ def check_memory_dirs(project_root: Path) -> dict:
     return _result("Memory dirs", "pass", f"{found}/{total} present")
 
 
+# ============================================================================
+# Check runner and --fast cache
+# ============================================================================
+
+_CACHE_VERSION = 1
+_CACHE_FILENAME = "doctor-checks.json"
+
+# Age, in seconds, after which a cached check result is recomputed.
+_CACHE_TTL_S = 300
+
+
+def _cache_path():
+    """Resolve the --fast cache file from the environment (None = disabled)."""
+    override = os.environ.get("GAIA_DOCTOR_CACHE", "")
+    if override.lower() in ("off", "0", "false", "no"):
+        return None
+    if override:
+        return Path(override)
+    pkg_root = str(_package_root())
+    if pkg_root not in sys.path:
+        sys.path.insert(0, pkg_root)
+    try:
+        from gaia.paths import cache_dir  # noqa: PLC0415
+    except ImportError:
+        return None
+    return cache_dir() / _CACHE_FILENAME
+
+
+class _CheckCache:
+    """Thread-safe store of expensive check results (see module docstring)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = None
+        self._dirty = False
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            entries = {}
+            if self.path is not None:
+                data = _read_json(self.path)
+                if isinstance(data, dict) and data.get("version") == _CACHE_VERSION:
+                    entries = data.get("entries") or {}
+            self._entries = entries
+        return self._entries
+
+    @staticmethod
+    def key(name: str, project_root: Path, inputs) -> str:
+        """Key for *name* over the current size/mtime of its *inputs*."""
+        stamps = []
+        for path in inputs:
+            try:
+                st = os.stat(path)
+                stamps.append([str(path), st.st_size, st.st_mtime_ns])
+            except OSError:
+                stamps.append([str(path), None])
+        return json.dumps([name, str(project_root), stamps])
+
+    def get(self, key: str):
+        """Return the cached result for *key*, or None on miss/expiry."""
+        if self.path is None:
+            return None
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry or time.time() - entry.get("at", 0) > _CACHE_TTL_S:
+            return None
+        return dict(entry["result"])
+
+    def put(self, key: str, result: dict) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            self._load()[key] = {"result": result, "at": time.time()}
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write fresh entries, dropping expired ones (temp file + rename). Best effort."""
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return
+            now = time.time()
+            entries = {k: v for k, v in self._load().items() if now - v.get("at", 0) <= _CACHE_TTL_S}
+            self._dirty = False
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"version": _CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def _invoke(fn, project_root: Path) -> dict:
+    """Call a check with project_root if it takes an argument."""
+    import inspect  # noqa: PLC0415
+
+    if len(inspect.signature(fn).parameters) == 0:
+        return fn()
+    return fn(project_root)
+
+
+def _run_one(spec, project_root: Path, cache) -> dict:
+    """Run (or, with a cache, reuse) one registered check and time it."""
+    _order, name, fn, _deps, cache_inputs = spec
+    started = time.perf_counter()
+    key = None
+    result = None
+    if cache is not None and cache_inputs is not None:
+        try:
+            key = cache.key(name, project_root, cache_inputs(project_root))
+            result = cache.get(key)
+        except Exception:
+            key = None
+    cached = result is not None
+    if not cached:
+        try:
+            result = _invoke(fn, project_root)
+            if key is not None:
+                cache.put(key, dict(result))
+        except Exception as exc:
+            result = _result(name or getattr(fn, "__name__", repr(fn)), "error", f"Error: {exc}")
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    if cached:
+        result["cached"] = True
+    return result
+
+
+def _run_checks(project_root: Path, cache=None, max_workers: int = _MAX_WORKERS) -> list:
+    """Run every registered check concurrently, honouring ``depends_on``.
+
+    A check is submitted once all the checks it depends on finished (names
+    that are not registered are ignored). Results come back in registry
+    order whatever the completion order.
+    """
+    specs = list(_CHECKS)
+    registered = {spec[1] for spec in specs}
+    waiting = {i: {d for d in spec[3] if d in registered} for i, spec in enumerate(specs)}
+    results = [None] * len(specs)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(specs) or 1))) as pool:
+        running = {}
+
+        def _submit_ready():
+            for i in [i for i, deps in waiting.items() if not deps]:
+                del waiting[i]
+                running[pool.submit(_run_one, specs[i], project_root, cache)] = i
+
+        _submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                results[i] = future.result()
+                for deps in waiting.values():
+                    deps.discard(specs[i][1])
+            _submit_ready()
+            if not running and waiting:
+                # Dependency cycle: run the rest in registry order.
+                for i in sorted(waiting):
+                    results[i] = _run_one(specs[i], project_root, cache)
+                waiting.clear()
+
+    return results
+
+
 # ============================================================================
 # Severity display
 # ============================================================================
@@ -652,32 +861,23 @@ def register(subparsers):
                      help="Emit JSON. bool.")
     sub.add_argument("--fix", action="store_true", default=False,
                      help="Attempt auto-fix for common issues. bool.")
+    sub.add_argument("--fast", action="store_true", default=False,
+                     help=f"Reuse expensive check results cached within the last {_CACHE_TTL_S}s "
+                          "whose input files are unchanged. bool.")
 
 
 def cmd_doctor(args) -> int:
     """Handler for `gaia doctor`."""
     project_root = _find_project_root()
+    started = time.perf_counter()
 
-    # Iterate the global check registry populated by @register_check.
-    # Each check function is invoked with project_root if it accepts an
-    # argument, or no args otherwise. The registry is sorted by `order`.
-    import inspect  # noqa: PLC0415
-
-    def _invoke(fn):
-        sig = inspect.signature(fn)
-        if len(sig.parameters) == 0:
-            return fn()
-        return fn(project_root)
-
-    def _fn_name(fn):
-        return getattr(fn, "__name__", repr(fn))
-
-    results = []
-    for _order, name, fn in _CHECKS:
-        try:
-            results.append(_invoke(fn))
-        except Exception as exc:
-            results.append(_result(name or _fn_name(fn), "error", f"Error: {exc}"))
+    # Run the global check registry populated by @register_check. Each check
+    # function is invoked with project_root if it accepts an argument, or no
+    # args otherwise; results come back sorted by `order`.
+    cache = _CheckCache(_cache_path()) if getattr(args, "fast", False) else None
+    results = _run_checks(project_root, cache)
+    if cache is not None:
+        cache.flush()
 
     has_errors = any(r["severity"] == "error" for r in results)
     has_warnings = any(r["severity"] == "warning" for r in results)
@@ -732,6 +932,7 @@ def cmd_doctor(args) -> int:
         output = {
             "healthy": not has_errors and not has_warnings,
             "status": status,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
             "checks": results,
             "fixes": fixes,
         }
@@ -12,15 +12,30 @@ Flags:
   --today / -t         Show only today's sessions
   --blocked / -b       Show only BLOCKED or NEEDS_INPUT sessions
   --agent / -a NAME    Filter by agent name
-  --limit / -n N       Max sessions to show (default 20)
+  --limit / -n N       Max sessions to show (default 20; 0 = all)
   --json               Machine-readable output
+  --format FMT         table | json | ndjson | csv
+
+Entries are read as a stream (metrics.jsonl line by line) and filtered
+lazily; the newest ``--limit`` are kept with a bounded heap, so memory does
+not grow with the history size. ``--limit 0`` streams every match in
+recorded order, which ndjson / csv write out row by row.
 """
 
+import heapq
 import json
 import os
 import sys
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# Streaming writers shared with `gaia query`; bin/ is on sys.path when run
+# via `python bin/gaia history`.
+from cli import _stream  # type: ignore  # noqa: E402
+
+_CSV_FIELDS = ("timestamp", "agent", "plan_status", "output_tokens_approx", "prompt")
 
 
 # ---------------------------------------------------------------------------
@@ -48,11 +63,11 @@ def _find_project_root() -> Path:
 # Data readers
 # ---------------------------------------------------------------------------
 
-def _read_workflow_metrics(root: Path) -> list:
+def _iter_workflow_metrics(root: Path) -> Iterator[dict]:
     """
-    Read agent session history.
+    Yield agent session history entries.
     Primary source: episodic-memory/index.json (episodes array with agent field).
-    Fallback: workflow-episodic-memory/metrics.jsonl.
+    Fallback: workflow-episodic-memory/metrics.jsonl, read line by line.
     """
     # Primary
     index_path = root / ".claude" / "project-context" / "episodic-memory" / "index.json"
@@ -61,31 +76,32 @@ def _read_workflow_metrics(root: Path) -> list:
             data = json.loads(index_path.read_text(encoding="utf-8"))
             episodes = [e for e in (data.get("episodes") or []) if e.get("agent")]
             if episodes:
-                return episodes
+                yield from episodes
+                return
         except (json.JSONDecodeError, OSError):
             pass
 
     # Fallback
     metrics_path = root / ".claude" / "project-context" / "workflow-episodic-memory" / "metrics.jsonl"
-    if not metrics_path.exists():
-        return []
-
-    entries = []
     try:
-        for line in metrics_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
+        with open(metrics_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
                 if entry.get("agent"):
-                    entries.append(entry)
-            except json.JSONDecodeError:
-                pass
+                    yield entry
     except OSError:
-        pass
+        return
+
 
-    return entries
+def _read_workflow_metrics(root: Path) -> list:
+    """Read agent session history into a list (see _iter_workflow_metrics)."""
+    return list(_iter_workflow_metrics(root))
 
 
 # ---------------------------------------------------------------------------
@@ -180,7 +196,7 @@ def register(subparsers):
         type=int,
         default=20,
         metavar="N",
-        help="Maximum number of sessions to show (default: 20)",
+        help="Maximum number of sessions to show (default: 20; 0 = all, in recorded order)",
     )
     p.add_argument(
         "--json",
@@ -188,61 +204,86 @@ def register(subparsers):
         default=False,
         help="Output results as JSON",
     )
+    p.add_argument(
+        "--format",
+        choices=("table", "json", "ndjson", "csv"),
+        default=None,
+        help="Output shape; ndjson / csv stream one session per line (default: table)",
+    )
     return p
 
 
+def _filtered(entries: Iterable[dict], args) -> Iterator[dict]:
+    """Apply --today / --blocked / --agent lazily."""
+    today_str = datetime.now(timezone.utc).date().isoformat()
+    today = getattr(args, "today", False)
+    blocked = getattr(args, "blocked", False)
+    agent_filter = getattr(args, "agent", None)
+    needle = agent_filter.lower() if agent_filter else None
+
+    for e in entries:
+        if today and not (e.get("timestamp") or "").startswith(today_str):
+            continue
+        if blocked and (e.get("plan_status") or "").upper() not in ("BLOCKED", "NEEDS_INPUT"):
+            continue
+        if needle and needle not in (e.get("agent") or "").lower():
+            continue
+        yield e
+
+
 def cmd_history(args) -> int:
     """Execute the history subcommand."""
     root = _find_project_root()
     claude_dir = root / ".claude"
-    as_json = getattr(args, "json", False)
+    fmt = getattr(args, "format", None) or ("json" if getattr(args, "json", False) else "table")
+    as_json = fmt == "json"
 
     if not claude_dir.exists():
-        if as_json:
+        if fmt != "table":
             print(json.dumps({"error": "gaia-ops not installed in this directory"}))
         else:
             print("\n  gaia-ops not installed in this directory")
             print("  Run: gaia scan\n")
         return 1
 
-    entries = _read_workflow_metrics(root)
+    stream = _iter_workflow_metrics(root)
+    first = next(stream, None)
 
-    if not entries:
+    if first is None:
         if as_json:
             print(json.dumps([]))
-        else:
+        elif fmt == "table":
             print("\n  No agent session history found yet")
             print("  History is recorded after each agent completes\n")
+        elif fmt == "csv":
+            _stream.write_csv((), _CSV_FIELDS)
         return 0
 
-    # Apply filters
-    today_str = datetime.now(timezone.utc).date().isoformat()
-
-    if getattr(args, "today", False):
-        entries = [e for e in entries if (e.get("timestamp") or "").startswith(today_str)]
+    matches = _filtered(chain([first], stream), args)
 
-    if getattr(args, "blocked", False):
-        entries = [e for e in entries
-                   if (e.get("plan_status") or "").upper() in ("BLOCKED", "NEEDS_INPUT")]
-
-    agent_filter = getattr(args, "agent", None)
-    if agent_filter:
-        needle = agent_filter.lower()
-        entries = [e for e in entries if needle in (e.get("agent") or "").lower()]
-
-    # Sort newest-first, apply limit
+    # Newest-first, limited: a bounded heap keeps only `limit` entries.
     limit = getattr(args, "limit", 20)
-    entries = sorted(entries, key=lambda e: e.get("timestamp") or "", reverse=True)[:limit]
-
-    if not entries:
-        if as_json:
-            print(json.dumps([]))
-        else:
-            print("\n  No sessions match the current filters\n")
+    if limit:
+        selected: Iterable[dict] = heapq.nlargest(
+            limit, matches, key=lambda e: e.get("timestamp") or ""
+        )
+    else:
+        selected = matches
+
+    if fmt == "ndjson":
+        _stream.write_ndjson(selected)
+        return 0
+    if fmt == "csv":
+        _stream.write_csv(selected, _CSV_FIELDS)
         return 0
 
     if as_json:
-        print(json.dumps(entries, indent=2))
+        _stream.write_json_array(selected)
+        return 0
+
+    entries = list(selected)
+    if not entries:
+        print("\n  No sessions match the current filters\n")
         return 0
 
     # Table output (mirrors JS column layout)
@@ -301,7 +342,7 @@ def cmd_history(args) -> int:
     print()
 
     # Tip (only when no active filters)
-    if not getattr(args, "today", False) and not getattr(args, "blocked", False) and not agent_filter:
+    if not getattr(args, "today", False) and not getattr(args, "blocked", False) and not getattr(args, "agent", None):
         print("  Flags: --today | --blocked | --agent <name> | --limit <n>\n")
 
     return 0
@@ -15,6 +15,13 @@ Output shape (always the same five columns regardless of surface):
     summary     -- short human line derived from the source row
 
 JSON output preserves the same shape plus the original row under ``raw``.
+``--format=ndjson`` / ``csv`` (and ``json``) stream rows from
+``gaia.store.reader.iter_query`` as they are read; with ``--last=0`` a
+90-day window is exported in constant memory.
+
+``--sync`` first mirrors new events.jsonl records into ``harness_events``
+(gaia.store.ingest) so the harness surface is current; ``session_end_hook``
+does the same at the end of every session.
 """
 
 from __future__ import annotations
@@ -23,12 +30,17 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 
 # Ensure the gaia package (repo root) is importable regardless of cwd.
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
+# Streaming writers shared with `gaia history`; bin/ is on sys.path when run
+# via `python bin/gaia query`.
+from cli import _stream  # type: ignore  # noqa: E402
+
 
 def _resolve_workspace(explicit: str | None) -> str | None:
     """Resolve workspace; ``None`` means 'no workspace filter'."""
@@ -44,6 +56,33 @@ def _resolve_workspace(explicit: str | None) -> str | None:
     return "me"
 
 
+def _events_file() -> Path:
+    """Locate the events.jsonl the hooks' EventWriter appends to.
+
+    Uses the hooks' own resolver (get_events_dir() in
+    hooks/modules/core/paths.py) so both sides always agree.
+    """
+    hooks_dir = str(_REPO_ROOT / "hooks")
+    if hooks_dir not in sys.path:
+        sys.path.insert(0, hooks_dir)
+    from modules.core.paths import get_events_dir
+
+    return get_events_dir() / "events.jsonl"
+
+
+def _sync_events() -> None:
+    """Ingest new events.jsonl records into harness_events (best-effort).
+
+    Rows take the workspace each record names (or NULL), not the one being
+    queried: events.jsonl is shared across workspaces.
+    """
+    try:
+        from gaia.store.ingest import ingest_events
+        ingest_events(_events_file())
+    except Exception as exc:
+        print(f"Warning: harness_events sync failed: {exc}", file=sys.stderr)
+
+
 def _err(msg: str, as_json: bool = False) -> int:
     if as_json:
         print(json.dumps({"error": msg}))
@@ -89,7 +128,7 @@ def _render_table(rows: list[dict]) -> None:
 
 
 def _render_grouped_count(rows: list[dict], group_by: str | None) -> None:
-    """Render the output of ``group_and_count`` as a small table."""
+    """Render the output of ``aggregate_query`` as a small table."""
     if not rows:
         print("(no results)")
         return
@@ -105,6 +144,20 @@ def _render_grouped_count(rows: list[dict], group_by: str | None) -> None:
         print(f"{(str(r.get(group_by) or '')):<{key_w}}  {r['count']}")
 
 
+_CSV_FIELDS = ("surface", "timestamp", "type", "agent", "summary")
+
+
+def _with_snippets(rows: Iterable[dict], needle: str) -> Iterator[dict]:
+    """Replace each row's summary with [bracketed] fragments around *needle*."""
+    from gaia.store.reader import _highlight_snippet, _row_text_for_snippet
+
+    for r in rows:
+        snippet = _highlight_snippet(_row_text_for_snippet(r), needle)
+        if snippet:
+            r["summary"] = snippet
+        yield r
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -112,11 +165,9 @@ def _render_grouped_count(rows: list[dict], group_by: str | None) -> None:
 def cmd_query(args) -> int:
     """Dispatcher for ``gaia query``."""
     from gaia.store.reader import (
-        cross_surface_query,
-        group_and_count,
+        aggregate_query,
+        iter_query,
         _extract_text_needle,
-        _highlight_snippet,
-        _row_text_for_snippet,
     )
 
     workspace = _resolve_workspace(getattr(args, "workspace", None))
@@ -128,18 +179,40 @@ def cmd_query(args) -> int:
     do_count = bool(getattr(args, "count", False))
     do_snippets = bool(getattr(args, "snippets", False))
 
+    if getattr(args, "sync", False) and surface in ("harness_events", "all"):
+        _sync_events()
+
+    filters = dict(
+        surface=surface,
+        workspace=workspace,
+        since=getattr(args, "since", None),
+        until=getattr(args, "until", None),
+        type=getattr(args, "type", None),
+        agent=getattr(args, "agent", None),
+        command_like=getattr(args, "command_like", None),
+        failed=getattr(args, "failed", False),
+    )
+
+    # --count / --group-by / --format=count: aggregate in SQL over the whole
+    # window (not over the --last capped rows).
+    if do_count or group_by or fmt == "count":
+        try:
+            grouped = aggregate_query(group_by=group_by, **filters)
+        except ValueError as exc:
+            return _err(str(exc), as_json=as_json)
+        if fmt == "count" and not (do_count or group_by):
+            print(grouped[0]["count"])
+            return 0
+        if as_json:
+            print(json.dumps(grouped, indent=2, default=str))
+            return 0
+        _render_grouped_count(grouped, group_by)
+        return 0
+
+    # Rows stream from the keyset-paginated, k-way merged iter_query; only
+    # the table renderer (which sizes its columns) materializes them.
     try:
-        rows = cross_surface_query(
-            surface=surface,
-            workspace=workspace,
-            since=getattr(args, "since", None),
-            until=getattr(args, "until", None),
-            last=last,
-            type=getattr(args, "type", None),
-            agent=getattr(args, "agent", None),
-            command_like=getattr(args, "command_like", None),
-            failed=getattr(args, "failed", False),
-        )
+        rows = iter_query(last=last or None, **filters)
     except ValueError as exc:
         return _err(str(exc), as_json=as_json)
 
@@ -152,32 +225,19 @@ def cmd_query(args) -> int:
             command_like=getattr(args, "command_like", None),
         )
         if needle:
-            for r in rows:
-                text = _row_text_for_snippet(r)
-                snippet = _highlight_snippet(text, needle)
-                if snippet:
-                    r["summary"] = snippet
-
-    # --count or --group-by: aggregate before rendering.
-    if do_count or group_by:
-        try:
-            grouped = group_and_count(rows, group_by=group_by)
-        except ValueError as exc:
-            return _err(str(exc), as_json=as_json)
-        if as_json or fmt == "json":
-            print(json.dumps(grouped, indent=2, default=str))
-            return 0
-        _render_grouped_count(grouped, group_by)
-        return 0
+            rows = _with_snippets(rows, needle)
 
-    if fmt == "count":
-        print(len(rows))
+    if fmt == "ndjson":
+        _stream.write_ndjson(rows)
+        return 0
+    if fmt == "csv":
+        _stream.write_csv(rows, _CSV_FIELDS)
         return 0
-    if as_json or fmt == "json":
-        print(json.dumps(rows, indent=2, default=str))
+    if as_json:
+        _stream.write_json_array(rows)
         return 0
 
-    _render_table(rows)
+    _render_table(list(rows))
     return 0
 
 
@@ -188,6 +248,8 @@ def cmd_query(args) -> int:
 _QUERY_EPILOG = """\
 Examples:
   gaia query --since=24h --failed
+  gaia query --sync --surface=harness_events --since=1h
+  gaia query --since=90d --last=0 --format=ndjson > events.ndjson
   gaia query --since=7d --command-like='%git push%' --group-by=day
 """
 
@@ -224,7 +286,9 @@ def register(subparsers) -> None:
     )
     p.add_argument(
         "--last", type=int, default=20, metavar="N",
-        help="Per-surface row cap. int. Default: 20.",
+        help="Per-surface row cap; 0 = no cap (stream the whole window). "
+             "int. Default: 20. Counts (--count, --group-by, --format=count) "
+             "cover the whole window.",
     )
     p.add_argument(
         "--agent", default=None, metavar="NAME",
@@ -256,10 +320,16 @@ def register(subparsers) -> None:
         help="Replace summary with [bracketed] fragments around the textual "
              "filter. No-op without --command-like / --type / --agent.",
     )
+    p.add_argument(
+        "--sync", action="store_true", default=False,
+        help="Ingest new events.jsonl records into harness_events before "
+             "querying. bool. Default: false.",
+    )
     p.add_argument(
         "--format", default="table",
-        choices=("table", "json", "count"),
-        help="Output shape. Default: table.",
+        choices=("table", "json", "ndjson", "csv", "count"),
+        help="Output shape. ndjson / csv / json stream rows as they are read "
+             "(constant memory with --last=0). Default: table.",
     )
     p.add_argument(
         "--json", action="store_true", default=False,
@@ -12,6 +12,11 @@ Modes:
   gaia scan --json                -> structured JSON output (scan-only, no setup/sync)
   gaia scan --scanners A,B,C      -> subset of scanners
   gaia scan --check-staleness     -> exit 0 if context is fresh, else scan
+  gaia scan --no-incremental      -> ignore the scan manifest, rescan everything
+  gaia scan --executor process    -> run CPU-bound scanners in a process pool
+  gaia scan --watch               -> keep project-context.json + gaia.db live (Ctrl-C stops)
+  gaia scan --profile             -> scan with a timing/I-O profile report
+  gaia scan --profile --profile-store -> also profile the gaia.db store sync
   gaia scan --no-color            -> disable ANSI color
   gaia scan --verbose / -v        -> per-scanner progress
 
@@ -89,6 +94,7 @@ def _build_summary(output, scanner_version: str) -> Dict[str, Any]:
         "sections_updated": output.sections_updated,
         "sections_preserved": output.sections_preserved,
         "scanners_run": len(output.scanner_results),
+        "scanners_reused": list(getattr(output, "reused_scanners", [])),
         "warnings_count": len(output.warnings),
         "errors_count": len(output.errors),
         "duration_ms": round(output.duration_ms, 1),
@@ -388,6 +394,85 @@ def _mode_scan_only(project_root: Path, scan_config, args: argparse.Namespace,
     return 1 if output.errors else 0
 
 
+def _mode_watch(project_root: Path, scan_config, args: argparse.Namespace,
+                scanner_version: str) -> int:
+    """Watch mode: refresh context + store on every debounced change burst.
+
+    Runs until interrupted. With --json, emits one JSON object per refresh
+    on stdout (NDJSON).
+    """
+    from dataclasses import asdict
+
+    from tools.scan.ui import RailUI
+    from tools.scan.watch import DEFAULT_INTERVAL_S, ScanWatcher
+
+    ui = RailUI(version=scanner_version, color=_use_color(args))
+    ui.start()
+    interval = getattr(args, "watch_interval", None) or DEFAULT_INTERVAL_S
+    watcher = ScanWatcher(project_root, scan_config, interval=interval)
+
+    def _report(cycle) -> None:
+        if getattr(args, "json", False):
+            print(json.dumps({"status": "error" if cycle.errors else "success",
+                              "mode": "watch", **asdict(cycle)}), flush=True)
+            return
+        what = f"{len(cycle.changed)} changed" if cycle.changed else "initial scan"
+        ran = ", ".join(cycle.scanners_run) or "none"
+        ui.done(cycle.duration_ms / 1000, suffix=f"{what} \u00b7 rescanned: {ran}")
+        if cycle.errors:
+            ui.warning(len(cycle.errors), cycle.errors[:20])
+
+    try:
+        watcher.run(on_cycle=_report)
+    except KeyboardInterrupt:
+        pass
+    ui.footer("Watch stopped.")
+    return 0
+
+
+def _mode_profile(project_root: Path, scan_config, args: argparse.Namespace,
+                  scanner_version: str) -> int:
+    """Profile mode: scan (+ store sync with --profile-store), then report where the time went.
+
+    Writes the report to .claude/project-context/scan-profile.json (or
+    --profile-output) so scan-time regressions can be tracked across
+    releases. With --json, the report is also printed on stdout.
+    """
+    from tools.scan.profile import PROFILE_FILENAME, format_profile, profile_scan
+    from tools.scan.ui import RailUI
+
+    ui = RailUI(version=scanner_version, color=_use_color(args))
+    ui.start()
+    ui.scanning()
+
+    output, profile = profile_scan(
+        project_root, scan_config, sync_store=getattr(args, "profile_store", False),
+    )
+    report = profile.to_dict()
+    report["scanner_version"] = scanner_version
+    report["executor"] = scan_config.executor
+    report["incremental"] = scan_config.incremental
+
+    out_path = Path(
+        getattr(args, "profile_output", None)
+        or project_root / ".claude" / "project-context" / PROFILE_FILENAME
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    for sec in format_profile(report):
+        ui.section(sec["name"], sec["lines"])
+    if report["errors"]:
+        ui.warning(len(report["errors"]), report["errors"][:20])
+    ui.done(report["total_ms"] / 1000, suffix=f"{len(output.scanner_results)} scanners profiled")
+    ui.footer(f"Profile written to {out_path}")
+
+    if getattr(args, "json", False):
+        print(json.dumps({"status": "error" if report["errors"] else "success",
+                          "mode": "profile", "profile_path": str(out_path), **report}, indent=2))
+    return 1 if report["errors"] else 0
+
+
 # ---------------------------------------------------------------------------
 # Plugin registration (discovered by bin/gaia)
 # ---------------------------------------------------------------------------
@@ -447,6 +532,54 @@ def register(subparsers) -> argparse.ArgumentParser:
         default=False,
         help="Scan all tools including extended (low-value) ones",
     )
+    p.add_argument(
+        "--no-incremental",
+        action="store_false",
+        default=True,
+        dest="incremental",
+        help="Rescan everything instead of reusing unchanged scanner results",
+    )
+    p.add_argument(
+        "--executor",
+        choices=("thread", "process"),
+        default=None,
+        help="Pool for CPU-bound scanners (default: thread, or $GAIA_SCAN_EXECUTOR)",
+    )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        default=False,
+        help="Keep watching the workspace and refresh context on changes",
+    )
+    p.add_argument(
+        "--watch-interval",
+        metavar="SECONDS",
+        type=float,
+        default=None,
+        dest="watch_interval",
+        help="Seconds between polls in --watch mode (default: 2)",
+    )
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Profile the scan (timings, file/byte/subprocess counts)",
+    )
+    p.add_argument(
+        "--profile-store",
+        action="store_true",
+        default=False,
+        dest="profile_store",
+        help="With --profile, also sync and profile the gaia.db store populators",
+    )
+    p.add_argument(
+        "--profile-output",
+        metavar="PATH",
+        default=None,
+        dest="profile_output",
+        help="Where --profile writes its JSON report "
+             "(default: .claude/project-context/scan-profile.json)",
+    )
     p.add_argument(
         "--no-color",
         action="store_true",
@@ -520,6 +653,9 @@ def cmd_scan(args: argparse.Namespace) -> int:
     scan_config = load_scan_config(project_root)
     scan_config.project_root = project_root
     scan_config.verbose = getattr(args, "verbose", False)
+    scan_config.incremental = getattr(args, "incremental", True)
+    if getattr(args, "executor", None):
+        scan_config.executor = args.executor
 
     if getattr(args, "scanners", None):
         scan_config.scanners = [
@@ -538,6 +674,30 @@ def cmd_scan(args: argparse.Namespace) -> int:
                 print(result["message"])
             return 0
 
+    if getattr(args, "watch", False):
+        try:
+            return _mode_watch(project_root, scan_config, args, scanner_version)
+        except Exception as exc:
+            msg = str(exc)
+            if getattr(args, "json", False):
+                print(json.dumps({"status": "error", "error": msg}))
+            else:
+                print(f"Error: {msg}", file=sys.stderr)
+            logging.exception("gaia scan failed")
+            return 1
+
+    if getattr(args, "profile", False):
+        try:
+            return _mode_profile(project_root, scan_config, args, scanner_version)
+        except Exception as exc:
+            msg = str(exc)
+            if getattr(args, "json", False):
+                print(json.dumps({"status": "error", "error": msg}))
+            else:
+                print(f"Error: {msg}", file=sys.stderr)
+            logging.exception("gaia scan failed")
+            return 1
+
     # --npm-postinstall implies --skip-claude-install and forces fresh mode.
     if getattr(args, "npm_postinstall", False):
         args.skip_claude_install = True
@@ -118,6 +118,13 @@ def _purge_db(db_path: Path, dry_run: bool) -> dict:
     if dry_run:
         return result
     try:
+        # Release pooled handles first so nothing keeps writing to the
+        # unlinked inode (see gaia.store.connection).
+        try:
+            from gaia.store.connection import close_all
+            close_all(db_path)
+        except ImportError:
+            pass
         db_path.unlink()
         result["removed"] = True
     except OSError as exc:
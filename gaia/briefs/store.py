@@ -126,7 +126,7 @@ def upsert_brief(
     """
     con = _connect(db_path)
     try:
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
             _ensure_workspace_row(con, workspace)
 
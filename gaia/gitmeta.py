@@ -0,0 +1,299 @@
+"""
+gaia.gitmeta -- In-process git metadata reader (no subprocess).
+
+Reads ``config``, ``HEAD``, ``packed-refs`` and loose refs straight from a
+repository's git directory, so workspace scans do not spawn ``git`` once
+per repo and per question. Handles:
+
+  - ``.git`` as a directory or as a ``gitdir: <path>`` file (linked
+    worktrees, submodules); a worktree's ``commondir`` points at the shared
+    config and refs while ``HEAD`` stays per-worktree
+  - discovery upward from any path inside the work tree, like ``git -C``
+  - ``url.<base>.insteadOf`` rewrites in the repository config, as applied
+    by ``git remote get-url``
+
+Results are cached per git directory and revalidated by the mtimes of the
+files and ref directories they were read from, so repeated lookups in one
+process (identity resolution, store population, the git scanner) cost a
+handful of ``stat`` calls.
+
+Global/system git config (``~/.gitconfig`` insteadOf rules, includes) is
+not consulted.
+
+Public API::
+
+    from gaia.gitmeta import GitMeta, find_git_dir, read_git_dir, repo_metadata, remote_origin
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+
+@dataclass(frozen=True)
+class GitMeta:
+    """Metadata of one repository (or linked worktree).
+
+    Attributes:
+        git_dir: The repository's git directory (per-worktree for worktrees).
+        common_dir: Directory holding config and refs (== git_dir unless
+            this is a linked worktree).
+        remotes: ``(name, url)`` pairs in config order (first url per remote).
+        head: Symbolic HEAD target (``refs/heads/main``), None when detached.
+        branches: Local branch names (loose + packed), sorted.
+        remote_branches: ``<remote>/<branch>`` names (loose + packed, no
+            ``<remote>/HEAD``), sorted.
+        url_rewrites: ``(insteadOf prefix, replacement base)`` pairs.
+    """
+
+    git_dir: Path
+    common_dir: Path
+    remotes: tuple[tuple[str, str], ...] = ()
+    head: str | None = None
+    branches: tuple[str, ...] = ()
+    remote_branches: tuple[str, ...] = ()
+    url_rewrites: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def branch(self) -> str | None:
+        """Checked-out branch name, or None when HEAD is detached."""
+        if self.head and self.head.startswith("refs/heads/"):
+            return self.head[len("refs/heads/"):]
+        return None
+
+    def remote_url(self, name: str = "origin") -> str | None:
+        """URL of remote *name* as ``git remote get-url`` reports it."""
+        for remote, url in self.remotes:
+            if remote == name:
+                best = max(
+                    (r for r in self.url_rewrites if url.startswith(r[0])),
+                    key=lambda r: len(r[0]),
+                    default=None,
+                )
+                return best[1] + url[len(best[0]):] if best else url
+        return None
+
+
+def resolve_git_dir(dot_git: Path) -> Path | None:
+    """Return the git directory behind a ``.git`` entry (dir or gitdir file)."""
+    try:
+        if dot_git.is_dir():
+            return dot_git
+        if not dot_git.is_file():
+            return None
+        content = dot_git.read_text(encoding="utf-8", errors="replace").strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    target = Path(content[len("gitdir:"):].strip())
+    if not target.is_absolute():
+        target = dot_git.parent / target
+    return target if target.is_dir() else None
+
+
+def find_git_dir(path: Path) -> Path | None:
+    """Find the git directory for *path* or its nearest enclosing work tree."""
+    try:
+        path = path.resolve()
+    except (OSError, RuntimeError):
+        return None
+    for candidate in (path, *path.parents):
+        dot_git = candidate / ".git"
+        if os.path.lexists(dot_git):
+            return resolve_git_dir(dot_git)
+    return None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    try:
+        rel = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    common = Path(rel) if os.path.isabs(rel) else git_dir / rel
+    try:
+        return common.resolve()
+    except (OSError, RuntimeError):
+        return common
+
+
+def _unquote(value: str) -> str:
+    out = []
+    in_quote = False
+    i = 0
+    while i < len(value):
+        ch = value[i]
+        if ch == "\\" and i + 1 < len(value):
+            out.append({"n": "\n", "t": "\t"}.get(value[i + 1], value[i + 1]))
+            i += 2
+            continue
+        if ch == '"':
+            in_quote = not in_quote
+        elif ch in "#;" and not in_quote:
+            break
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out).strip()
+
+
+def _parse_config(path: Path) -> tuple[tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]:
+    """Return (remotes, url_rewrites) from a git config file."""
+    remotes: dict[str, str] = {}
+    rewrites: list[tuple[str, str]] = []
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return (), ()
+    section = subsection = None
+    for raw in lines:
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            m = _SECTION_RE.match(line)
+            if m:
+                section, subsection = m.group(1).lower(), m.group(2)
+                if subsection is None and "." in section:
+                    # Legacy [remote.origin] form.
+                    section, _, subsection = section.partition(".")
+            else:
+                section = subsection = None
+            continue
+        key, sep, value = line.partition("=")
+        if not sep or subsection is None:
+            continue
+        key = key.strip().lower()
+        if section == "remote" and key == "url":
+            remotes.setdefault(subsection, _unquote(value))
+        elif section == "url" and key == "insteadof":
+            rewrites.append((_unquote(value), subsection))
+    return tuple(remotes.items()), tuple(rewrites)
+
+
+def _read_head(git_dir: Path) -> str | None:
+    try:
+        content = (git_dir / "HEAD").read_text(encoding="utf-8", errors="replace").strip()
+    except OSError:
+        return None
+    if content.startswith("ref:"):
+        return content[len("ref:"):].strip()
+    return None
+
+
+def _loose_refs(directory: Path, prefix: str, out: list[str]) -> None:
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in sorted(entries, key=lambda e: e.name):
+        name = f"{prefix}{entry.name}"
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                _loose_refs(Path(entry.path), f"{name}/", out)
+            else:
+                out.append(name)
+        except OSError:
+            continue
+
+
+def _packed_refs(common_dir: Path) -> list[str]:
+    try:
+        lines = (common_dir / "packed-refs").read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return []
+    refs = []
+    for line in lines:
+        if not line or line[0] in "#^":
+            continue
+        parts = line.split()
+        if len(parts) >= 2:
+            refs.append(parts[1])
+    return refs
+
+
+def _stamp(path: Path) -> tuple[int, int, int]:
+    # Size and inode catch same-mtime rewrites (git replaces files via rename).
+    try:
+        st = path.stat()
+    except OSError:
+        return (0, 0, 0)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _signature(git_dir: Path, common_dir: Path) -> tuple:
+    """Stat stamps of every file and ref directory a GitMeta is derived from."""
+    sig: list = [
+        _stamp(git_dir / "HEAD"),
+        _stamp(common_dir / "config"),
+        _stamp(common_dir / "packed-refs"),
+    ]
+    stack = [common_dir / "refs" / "heads", common_dir / "refs" / "remotes"]
+    while stack:
+        directory = stack.pop()
+        try:
+            sig.append(directory.stat().st_mtime_ns)
+            with os.scandir(directory) as it:
+                stack.extend(Path(e.path) for e in it if e.is_dir(follow_symlinks=False))
+        except OSError:
+            sig.append(0)
+    return tuple(sig)
+
+
+def _read(git_dir: Path, common_dir: Path) -> GitMeta:
+    remotes, rewrites = _parse_config(common_dir / "config")
+    heads: list[str] = []
+    remote_refs: list[str] = []
+    _loose_refs(common_dir / "refs" / "heads", "", heads)
+    _loose_refs(common_dir / "refs" / "remotes", "", remote_refs)
+    for ref in _packed_refs(common_dir):
+        if ref.startswith("refs/heads/"):
+            heads.append(ref[len("refs/heads/"):])
+        elif ref.startswith("refs/remotes/"):
+            remote_refs.append(ref[len("refs/remotes/"):])
+    return GitMeta(
+        git_dir=git_dir,
+        common_dir=common_dir,
+        remotes=remotes,
+        head=_read_head(git_dir),
+        branches=tuple(sorted(set(heads))),
+        remote_branches=tuple(sorted({r for r in remote_refs if not r.endswith("/HEAD")})),
+        url_rewrites=rewrites,
+    )
+
+
+_cache: dict[Path, tuple[tuple, GitMeta]] = {}
+_cache_lock = threading.Lock()
+
+
+def read_git_dir(git_dir: Path) -> GitMeta:
+    """Read (or return the cached, still-valid) metadata of *git_dir*."""
+    common_dir = _common_dir(git_dir)
+    sig = _signature(git_dir, common_dir)
+    with _cache_lock:
+        hit = _cache.get(git_dir)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    meta = _read(git_dir, common_dir)
+    with _cache_lock:
+        _cache[git_dir] = (sig, meta)
+    return meta
+
+
+def repo_metadata(path: Path) -> GitMeta | None:
+    """Metadata of the repository containing *path*, or None outside a repo."""
+    git_dir = find_git_dir(path)
+    return read_git_dir(git_dir) if git_dir is not None else None
+
+
+def remote_origin(path: Path) -> str | None:
+    """``git -C <path> remote get-url origin`` without the subprocess."""
+    meta = repo_metadata(path)
+    return meta.remote_url("origin") if meta is not None else None
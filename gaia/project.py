@@ -19,8 +19,6 @@ Public API::
 
 from __future__ import annotations
 
-import shutil
-import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -73,24 +71,13 @@ def _normalize_remote(url: str) -> str:
 def _git_remote_origin(cwd: Path) -> str | None:
     """Return the git remote `origin` URL or None if unavailable.
 
-    Uses subprocess with a short timeout. Never raises -- returns None on
-    any failure (no git, not a repo, no origin remote, timeout).
+    Read in-process from the repository's git metadata (gaia.gitmeta), so
+    no git binary or subprocess is needed. Never raises -- returns None on
+    any failure (not a repo, no origin remote, unreadable config).
     """
-    if shutil.which("git") is None:
-        return None
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(cwd), "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            timeout=2.0,
-        )
-    except (subprocess.TimeoutExpired, OSError):
-        return None
-    if result.returncode != 0:
-        return None
-    url = (result.stdout or "").strip()
-    return url or None
+    from gaia.gitmeta import remote_origin
+
+    return remote_origin(cwd)
 
 
 def current(cwd: Path | str | None = None) -> str:
@@ -8,6 +8,7 @@ Public API::
         upsert_app,
         delete_missing_in,
         bulk_upsert,
+        bulk_apply,
         wipe_workspace,
     )
     from gaia.store.provider import get_context
@@ -17,6 +18,7 @@ No runtime dependency on engram; patterns lifted with attribution (see NOTICE.md
 """
 
 from gaia.store.writer import (
+    bulk_apply,
     bulk_upsert,
     delete_missing_in,
     save_integration,
@@ -31,6 +33,7 @@ __all__ = [
     "upsert_app",
     "delete_missing_in",
     "bulk_upsert",
+    "bulk_apply",
     "wipe_workspace",
     "save_integration",
     "get_context",
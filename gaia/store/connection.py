@@ -0,0 +1,316 @@
+"""
+gaia.store.connection -- per-process connection pool for the Gaia SQLite substrate.
+
+Every public call in ``gaia.store.writer``, ``gaia.store.reader``,
+``gaia.store.provider`` and ``gaia.briefs.store`` goes through
+``writer._connect``, which delegates here. Instead of a fresh
+``sqlite3.connect`` (plus a stat of the DB file and a pragma round) per
+call, connections are pooled per (process, thread, db path):
+
+  * ``acquire(path)`` pops an idle pooled connection or opens a new one.
+  * ``con.close()`` on a pooled connection does NOT close it: any open
+    transaction is rolled back, per-call state is reset, and the connection
+    goes back to the idle list. Callers keep the existing
+    ``con = _connect(); try: ... finally: con.close()`` shape unchanged.
+  * A connection that is still checked out is never handed out twice, so
+    nested store calls get their own connection.
+
+Pragmas are applied once per physical connection (not per call):
+
+    journal_mode=WAL, synchronous=NORMAL, busy_timeout, foreign_keys=ON,
+    mmap_size, cache_size, temp_store=MEMORY
+
+Python's sqlite3 statement cache (``cached_statements``) lives on the
+connection, so pooling also keeps prepared statements warm across calls.
+
+Schema bootstrap runs once per process per DB file: the first physical
+connection reads ``PRAGMA user_version``. An empty DB gets ``schema.sql``;
+an older DB gets the additive statements in ``_UPGRADES``. Either way
+``user_version`` is stamped with ``SCHEMA_VERSION`` and later connections
+skip the check entirely.
+
+Pooled handles and the schema-ready mark remember the file identity
+(``st_dev``, ``st_ino``) they were opened against. ``acquire`` stats the
+path once per call; when the file was deleted or replaced behind the pool's
+back, the stale handles are closed and the new file is re-bootstrapped.
+
+Concurrency: pools are thread-local (sqlite3 connections are bound to their
+creating thread) and discarded after ``fork()``. Cross-process writers are
+serialized by SQLite itself; ``busy_timeout`` makes a blocked hook wait
+instead of failing with ``database is locked``.
+
+Environment variables:
+    GAIA_DB_POOL: set to ``0`` to disable pooling (every close() is real).
+    GAIA_DB_BUSY_TIMEOUT_MS: busy timeout in ms (default 5000).
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable
+
+_SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
+
+# Idle connections kept per (thread, db path). Extra releases really close.
+_MAX_IDLE = 4
+
+_STATEMENT_CACHE_SIZE = 256
+_MMAP_SIZE = 256 * 1024 * 1024  # 256 MiB
+_CACHE_SIZE_KIB = 16 * 1024     # 16 MiB page cache (negative pragma value = KiB)
+
+# Bump when schema.sql gains objects that existing DBs must also get, and
+# list the additive (idempotent) DDL for that version in _UPGRADES. An entry
+# is either a SQL statement or a callable taking the connection.
+SCHEMA_VERSION = 4
+
+
+def _add_column(table: str, column: str, decl: str) -> Callable[[sqlite3.Connection], None]:
+    """Upgrade step: ``ALTER TABLE ... ADD COLUMN`` unless the column exists."""
+    def step(con: sqlite3.Connection) -> None:
+        columns = {row[1] for row in con.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            con.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+    return step
+
+
+def _if_table(table: str, statement: str) -> Callable[[sqlite3.Connection], None]:
+    """Upgrade step: run *statement* only when *table* exists (e.g. an index)."""
+    def step(con: sqlite3.Connection) -> None:
+        exists = con.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        if exists:
+            con.execute(statement)
+    return step
+
+
+_UPGRADES: dict[int, tuple[str | Callable[[sqlite3.Connection], None], ...]] = {
+    2: (
+        """
+        CREATE TABLE IF NOT EXISTS workspace_versions (
+            workspace  TEXT NOT NULL PRIMARY KEY,
+            version    INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT,
+            FOREIGN KEY (workspace) REFERENCES workspaces(name) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS context_snapshots (
+            workspace TEXT NOT NULL PRIMARY KEY,
+            version   INTEGER NOT NULL,
+            payload   TEXT NOT NULL,
+            built_at  TEXT,
+            FOREIGN KEY (workspace) REFERENCES workspaces(name) ON DELETE CASCADE
+        )
+        """,
+    ),
+    3: (
+        """
+        CREATE TABLE IF NOT EXISTS harness_events (
+            id        INTEGER PRIMARY KEY AUTOINCREMENT,
+            workspace TEXT,
+            ts        TEXT NOT NULL,
+            type      TEXT NOT NULL,
+            source    TEXT,
+            agent     TEXT,
+            result    TEXT,
+            severity  TEXT,
+            payload   TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_harness_events_workspace_ts ON harness_events(workspace, ts DESC)",
+        _add_column("harness_events", "event_hash", "TEXT"),
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_harness_events_hash ON harness_events(event_hash)",
+        """
+        CREATE TABLE IF NOT EXISTS harness_ingest_cursors (
+            source      TEXT NOT NULL PRIMARY KEY,
+            inode       INTEGER NOT NULL,
+            offset      INTEGER NOT NULL,
+            fingerprint TEXT NOT NULL,
+            updated_at  TEXT
+        )
+        """,
+    ),
+    4: (
+        _if_table(
+            "episodes",
+            "CREATE INDEX IF NOT EXISTS idx_episodes_workspace_bucket "
+            "ON episodes(workspace, timestamp, type, agent)",
+        ),
+        _if_table(
+            "episodes",
+            "CREATE INDEX IF NOT EXISTS idx_episodes_type_timestamp ON episodes(type, timestamp)",
+        ),
+        _if_table(
+            "memory",
+            "CREATE INDEX IF NOT EXISTS idx_memory_workspace_bucket ON memory(workspace, updated_at, type)",
+        ),
+        "DROP INDEX IF EXISTS idx_harness_events_type",
+        "CREATE INDEX IF NOT EXISTS idx_harness_events_type_ts ON harness_events(type, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_harness_events_ts_bucket ON harness_events(ts, workspace, type, agent)",
+    ),
+}
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+# DB path -> file identity the schema was last verified against.
+_schema_ready: dict[str, tuple[int, int] | None] = {}
+
+
+def _pooling_enabled() -> bool:
+    return os.environ.get("GAIA_DB_POOL", "1") != "0"
+
+
+def _busy_timeout_ms() -> int:
+    try:
+        return int(os.environ.get("GAIA_DB_BUSY_TIMEOUT_MS", "5000"))
+    except ValueError:
+        return 5000
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection whose ``close()`` returns it to the pool."""
+
+    _pool_key: str | None = None
+    _checked_out: bool = False
+    _identity: tuple[int, int] | None = None
+
+    def close(self) -> None:  # noqa: D401 -- sqlite3 API
+        if self._pool_key is None or not _pooling_enabled():
+            super().close()
+            return
+        _release(self)
+
+    def really_close(self) -> None:
+        """Close the underlying handle, bypassing the pool."""
+        self._pool_key = None
+        super().close()
+
+
+def _file_identity(path: Path) -> tuple[int, int] | None:
+    """(st_dev, st_ino) of *path*, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _apply_pragmas(con: sqlite3.Connection) -> None:
+    con.execute(f"PRAGMA busy_timeout = {_busy_timeout_ms()}")
+    con.execute("PRAGMA journal_mode = WAL")
+    con.execute("PRAGMA synchronous = NORMAL")
+    con.execute("PRAGMA foreign_keys = ON")
+    con.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+    con.execute(f"PRAGMA cache_size = -{_CACHE_SIZE_KIB}")
+    con.execute("PRAGMA temp_store = MEMORY")
+
+
+def _ensure_schema(con: sqlite3.Connection, key: str) -> None:
+    """Bring the DB to SCHEMA_VERSION once per process (see module docstring)."""
+    if key in _schema_ready:
+        return
+    with _schema_lock:
+        if key in _schema_ready:
+            return
+        current = con.execute("PRAGMA user_version").fetchone()[0]
+        if current < SCHEMA_VERSION:
+            empty = con.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1"
+            ).fetchone() is None
+            if empty:
+                con.executescript(_SCHEMA_PATH.read_text(encoding="utf-8"))
+            else:
+                for version in sorted(v for v in _UPGRADES if v > current):
+                    for statement in _UPGRADES[version]:
+                        if callable(statement):
+                            statement(con)
+                        else:
+                            con.execute(statement)
+            con.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            con.commit()
+        _schema_ready[key] = _file_identity(Path(key))
+
+
+def _open(path: Path, key: str) -> PooledConnection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(
+        key,
+        factory=PooledConnection,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+        timeout=_busy_timeout_ms() / 1000,
+    )
+    con.row_factory = sqlite3.Row
+    _apply_pragmas(con)
+    _ensure_schema(con, key)
+    con._identity = _file_identity(path)
+    return con
+
+
+def _idle_pools() -> dict[str, list[PooledConnection]]:
+    """Return this thread's idle pools, discarding them after a fork."""
+    pid = os.getpid()
+    if getattr(_local, "pid", None) != pid:
+        # Connections inherited across fork() must not be reused; drop the
+        # references without closing (closing would touch the parent's handle).
+        _local.pid = pid
+        _local.idle = {}
+    return _local.idle
+
+
+def acquire(path: Path) -> PooledConnection:
+    """Return a ready-to-use connection for *path* (pooled when possible)."""
+    key = str(path)
+    identity = _file_identity(path)
+    pools = _idle_pools()
+    idle = pools.get(key)
+    if idle and any(c._identity != identity for c in idle):
+        # gaia.db was deleted or replaced: handles opened on the old inode
+        # must not be reused, and the new file needs its schema bootstrap.
+        for stale in [c for c in idle if c._identity != identity]:
+            idle.remove(stale)
+            stale.really_close()
+    if key in _schema_ready and _schema_ready[key] != identity:
+        _schema_ready.pop(key, None)
+    con = idle.pop() if idle else _open(path, key)
+    con._pool_key = key if _pooling_enabled() else None
+    con._checked_out = True
+    return con
+
+
+def _release(con: PooledConnection) -> None:
+    if not con._checked_out:
+        return
+    con._checked_out = False
+    try:
+        if con.in_transaction:
+            con.rollback()
+        con.row_factory = sqlite3.Row
+        con.set_trace_callback(None)
+        con.execute("PRAGMA foreign_keys = ON")
+    except sqlite3.Error:
+        con.really_close()
+        return
+
+    idle = _idle_pools().setdefault(con._pool_key, [])
+    if len(idle) >= _MAX_IDLE:
+        con.really_close()
+    else:
+        idle.append(con)
+
+
+def close_all(path: Path | None = None) -> None:
+    """Close idle pooled connections in this thread and forget schema state.
+
+    Call before deleting or replacing a DB file (e.g. ``gaia uninstall
+    --purge``) so the next ``acquire`` re-opens and re-bootstraps it.
+    """
+    pools = _idle_pools()
+    keys = [str(path)] if path is not None else list(pools)
+    for key in keys:
+        for con in pools.pop(key, []):
+            con.really_close()
+        _schema_ready.pop(key, None)
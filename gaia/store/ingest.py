@@ -0,0 +1,235 @@
+"""
+gaia.store.ingest -- live, idempotent mirror of events.jsonl into harness_events.
+
+``EventWriter`` (hooks/modules/events/event_writer.py) appends one JSON record
+per line to ``events.jsonl``. :func:`ingest_events` copies the records written
+since the last run into the ``harness_events`` table:
+
+  * A byte-offset cursor per source file lives in ``harness_ingest_cursors``.
+    Each run seeks to it and reads only the new tail. A trailing line without
+    its newline (a write in progress) is left for the next run.
+  * Every row carries ``event_hash`` -- sha256 of the canonical record -- under
+    a UNIQUE index, and rows are inserted with ``INSERT OR IGNORE``. Replaying
+    a file (after a reset, or a one-shot migration that already loaded it)
+    never duplicates rows.
+  * Rows are inserted in batches; each batch and the cursor advance commit in
+    ONE transaction, so a crash mid-run resumes at the last committed batch.
+  * ``events.jsonl`` is shared by every workspace, so a row's ``workspace``
+    comes from the record itself (its ``workspace`` or ``project`` field) and
+    is NULL when the record does not say -- never from whichever session
+    happens to run the ingest. Workspace-filtered queries already include
+    NULL-workspace harness events.
+  * The cursor also stores the inode and a fingerprint of the bytes right
+    before the offset. When the file was rotated, truncated or rewritten in
+    place (``cleanup_old_events``), the fingerprint no longer matches and the
+    file is re-read from the start; the hash index drops what is already in.
+
+Callers: ``session_end_hook`` (end of every session) and ``gaia query --sync``.
+``harness_events`` is a system mirror, not agent-authored state, so ingestion
+is not gated by ``agent_permissions``.
+
+Public API::
+
+    ingest_events(events_file, workspace=None, db_path=None) -> dict
+    event_hash(record) -> str
+    event_row(record, workspace=None) -> tuple
+    record_workspace(record) -> str | None
+    parse_line(line) -> dict | None
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping
+
+# Records per INSERT transaction.
+BATCH_SIZE = 500
+
+# Bytes before the cursor offset hashed into the cursor fingerprint.
+_FINGERPRINT_BYTES = 256
+
+COLUMNS = (
+    "workspace", "ts", "type", "source", "agent", "result", "severity", "payload", "event_hash",
+)
+
+_INSERT_SQL = (
+    f"INSERT OR IGNORE INTO harness_events ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUMNS)})"
+)
+
+_CURSOR_SQL = (
+    "INSERT INTO harness_ingest_cursors (source, inode, offset, fingerprint, updated_at) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(source) DO UPDATE SET inode = excluded.inode, offset = excluded.offset, "
+    "fingerprint = excluded.fingerprint, updated_at = excluded.updated_at"
+)
+
+
+def event_hash(record: Mapping[str, Any]) -> str:
+    """Return the dedupe key of an event record.
+
+    Key order and JSON escaping do not matter: the same record written by
+    ``EventWriter`` or re-serialized by a migration hashes the same.
+    """
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def record_workspace(record: Mapping[str, Any]) -> str | None:
+    """Workspace an events.jsonl record belongs to, or None when it does not say."""
+    for key in ("workspace", "project"):
+        value = record.get(key)
+        if isinstance(value, str) and value and value != "global":
+            return value
+    return None
+
+
+def event_row(record: Mapping[str, Any], workspace: str | None = None) -> tuple:
+    """Map an events.jsonl record to a ``harness_events`` row (``COLUMNS`` order).
+
+    The record's own workspace wins; *workspace* is only the fallback.
+    """
+    return (
+        record_workspace(record) or workspace,
+        record.get("ts"),
+        record.get("type"),
+        record.get("source"),
+        record.get("agent"),
+        record.get("result"),
+        record.get("severity"),
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")),
+        event_hash(record),
+    )
+
+
+def parse_line(line: bytes | str) -> dict | None:
+    """Decode one events.jsonl line; None for blank, malformed or incomplete records."""
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict) or not record.get("ts") or not record.get("type"):
+        return None
+    return record
+
+
+def _fingerprint(tail: bytes) -> str:
+    return hashlib.sha1(tail).hexdigest()
+
+
+def _start_offset(fh, cursor, inode: int, size: int) -> int:
+    """Offset to resume from: the cursor's, if it still describes this file."""
+    if cursor is None or cursor["inode"] != inode or cursor["offset"] > size:
+        return 0
+    offset = cursor["offset"]
+    window = min(offset, _FINGERPRINT_BYTES)
+    fh.seek(offset - window)
+    if _fingerprint(fh.read(window)) != cursor["fingerprint"]:
+        return 0
+    return offset
+
+
+def ingest_events(
+    events_file: Path,
+    *,
+    workspace: str | None = None,
+    db_path: Path | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> dict:
+    """Copy records appended to *events_file* since the last run into harness_events.
+
+    Args:
+        events_file: The ``events.jsonl`` written by ``EventWriter``.
+        workspace: Fallback ``harness_events.workspace`` for records that do
+            not carry their own (None = NULL). Only pass it for a file known
+            to hold a single workspace's events.
+        db_path: Optional explicit DB path (used by tests).
+        batch_size: Records per transaction.
+
+    Returns:
+        ``{"status": "ok" | "missing", "read": lines consumed, "inserted": new
+        rows, "duplicates": rows already present, "skipped": malformed lines,
+        "offset": cursor after the run, "reset": True when the cursor was
+        discarded and the file re-read from the start}``.
+    """
+    from gaia.store.writer import _connect
+
+    summary = {"status": "ok", "read": 0, "inserted": 0, "duplicates": 0, "skipped": 0,
+               "offset": 0, "reset": False}
+    source = str(Path(events_file).resolve())
+    try:
+        fh = open(source, "rb")
+    except FileNotFoundError:
+        summary["status"] = "missing"
+        return summary
+
+    con = _connect(db_path)
+    try:
+        with fh:
+            st = os.fstat(fh.fileno())
+            cursor = con.execute(
+                "SELECT inode, offset, fingerprint FROM harness_ingest_cursors WHERE source = ?",
+                (source,),
+            ).fetchone()
+            offset = _start_offset(fh, cursor, st.st_ino, st.st_size)
+            summary["reset"] = cursor is not None and offset == 0 and cursor["offset"] > 0
+            fh.seek(max(0, offset - _FINGERPRINT_BYTES))
+            tail = fh.read(offset - fh.tell())
+
+            rows: list[tuple] = []
+            committed = offset
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # partial write; picked up next run
+                offset += len(line)
+                tail = (tail + line)[-_FINGERPRINT_BYTES:]
+                summary["read"] += 1
+                if line.strip():
+                    record = parse_line(line)
+                    if record is None:
+                        summary["skipped"] += 1
+                    else:
+                        rows.append(event_row(record, workspace))
+                if len(rows) >= batch_size:
+                    _commit_batch(con, rows, source, st.st_ino, offset, tail, summary)
+                    rows = []
+                    committed = offset
+            if offset != committed or cursor is None or summary["reset"]:
+                _commit_batch(con, rows, source, st.st_ino, offset, tail, summary)
+            summary["offset"] = offset
+    finally:
+        con.close()
+    return summary
+
+
+def _commit_batch(con, rows: list[tuple], source: str, inode: int, offset: int,
+                  tail: bytes, summary: dict) -> None:
+    """Insert *rows* and advance the cursor to *offset* in one transaction."""
+    now = datetime.now(timezone.utc).isoformat()
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        before = con.total_changes
+        con.executemany(_INSERT_SQL, rows)
+        inserted = con.total_changes - before
+        con.execute(_CURSOR_SQL, (source, inode, offset, _fingerprint(tail), now))
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    summary["inserted"] += inserted
+    summary["duplicates"] += len(rows) - inserted
+
+
+__all__ = [
+    "BATCH_SIZE",
+    "COLUMNS",
+    "event_hash",
+    "event_row",
+    "ingest_events",
+    "parse_line",
+    "record_workspace",
+]
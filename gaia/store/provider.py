@@ -7,11 +7,19 @@ returns a dict shape that agents consume.
 The returned shape exposes ``workspace.projects`` for the list of
 git-bearing projects within the workspace.
 
+``get_context`` is served from a materialized snapshot (``context_snapshots``)
+keyed by the workspace write counter (``workspace_versions``) that
+``gaia.store.writer`` bumps on every entity write. A repeated read with no
+intervening write is a single indexed lookup plus ``json.loads``; the first
+read after a write rebuilds from the entity tables and stores the new
+snapshot.
+
 Patterns inspired by engram (https://github.com/koaning/engram), MIT License.
 """
 
 from __future__ import annotations
 
+import json
 import sqlite3
 from pathlib import Path
 from typing import Any
@@ -32,6 +40,111 @@ def _row_to_dict(row: sqlite3.Row, *, drop_workspace: bool = True) -> dict:
     return d
 
 
+def _load_snapshot(con: sqlite3.Connection, workspace: str) -> dict[str, Any] | None:
+    """Return the cached context if it matches the current workspace version."""
+    row = con.execute(
+        """
+        SELECT s.payload
+        FROM context_snapshots s
+        LEFT JOIN workspace_versions v ON v.workspace = s.workspace
+        WHERE s.workspace = ? AND s.version = COALESCE(v.version, 0)
+        """,
+        (workspace,),
+    ).fetchone()
+    if row is None:
+        return None
+    try:
+        return json.loads(row["payload"])
+    except ValueError:
+        return None
+
+
+def _store_snapshot(
+    con: sqlite3.Connection, workspace: str, version: int, context: dict[str, Any]
+) -> None:
+    """Persist *context* as the snapshot for *version*. Best effort.
+
+    A snapshot never replaces a newer one, so a slow reader that built from
+    an older version cannot clobber a concurrent reader's fresher result.
+    """
+    from gaia.store.writer import _now_iso
+
+    try:
+        con.execute(
+            """
+            INSERT INTO context_snapshots (workspace, version, payload, built_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(workspace) DO UPDATE SET
+                version  = excluded.version,
+                payload  = excluded.payload,
+                built_at = excluded.built_at
+            WHERE excluded.version >= context_snapshots.version
+            """,
+            (workspace, version, json.dumps(context, separators=(",", ":")), _now_iso()),
+        )
+        con.commit()
+    except sqlite3.Error:
+        # Cache write failures (e.g. locked DB) must never fail a read.
+        if con.in_transaction:
+            con.rollback()
+
+
+def _build_context(con: sqlite3.Connection, workspace: str) -> dict[str, Any] | None:
+    """SELECT every entity table for *workspace* into the context shape."""
+    # Resolve identity from workspaces table
+    ws_row = con.execute(
+        "SELECT name, identity, created_at FROM workspaces WHERE name = ?",
+        (workspace,),
+    ).fetchone()
+
+    if ws_row is None:
+        return None  # workspace not found -- caller emits exit 1
+
+    identity = ws_row["name"]
+    created_at = ws_row["created_at"]
+
+    _ORDER_COL = {
+        "gaia_installations": "machine",
+    }
+
+    def _select(table: str) -> list[dict]:
+        order_col = _ORDER_COL.get(table, "name")
+        cur = con.execute(
+            f"SELECT * FROM {table} WHERE workspace = ? ORDER BY {order_col}",
+            (workspace,),
+        )
+        return [_row_to_dict(r) for r in cur.fetchall()]
+
+    # workspace.* lists, keyed by entity type.
+    workspace_data: dict[str, Any] = {
+        "projects": _select("projects"),
+        "apps": _select("apps"),
+        "libraries": _select("libraries"),
+        "services": _select("services"),
+        "features": _select("features"),
+        "tf_modules": _select("tf_modules"),
+        "tf_live": _select("tf_live"),
+        "releases": _select("releases"),
+        "workloads": _select("workloads"),
+        "clusters_defined": _select("clusters_defined"),
+        "clusters": _select("clusters"),
+        "integrations": _select("integrations"),
+        "gaia_installations": _select("gaia_installations"),
+        "machines": _select("machines"),
+    }
+
+    return {
+        "identity": identity,
+        "stack": {},        # populated by future scanners (B2+)
+        "environment": {},  # populated by future scanners (B2+)
+        "git": {
+            "workspace_name": workspace,
+            "created_at": created_at,
+        },
+        "workspace": workspace_data,
+    }
+
+
 def get_context(workspace: str, *, db_path: Path | None = None) -> dict[str, Any]:
     """Return the JSON-shaped context for a workspace.
 
@@ -49,57 +162,23 @@ def get_context(workspace: str, *, db_path: Path | None = None) -> dict[str, Any
     """
     con = _connect(db_path)
     try:
-        # Resolve identity from workspaces table
-        ws_row = con.execute(
-            "SELECT name, identity, created_at FROM workspaces WHERE name = ?",
+        cached = _load_snapshot(con, workspace)
+        if cached is not None:
+            return cached
+
+        # Build and snapshot inside one read transaction so the version we
+        # record is the one the entity rows were read at.
+        con.execute("BEGIN")
+        version_row = con.execute(
+            "SELECT version FROM workspace_versions WHERE workspace = ?",
             (workspace,),
         ).fetchone()
+        version = version_row["version"] if version_row else 0
+        context = _build_context(con, workspace)
+        con.commit()
 
-        if ws_row is None:
-            return None  # workspace not found -- caller emits exit 1
-
-        identity = ws_row["name"]
-        created_at = ws_row["created_at"]
-
-        _ORDER_COL = {
-            "gaia_installations": "machine",
-        }
-
-        def _select(table: str) -> list[dict]:
-            order_col = _ORDER_COL.get(table, "name")
-            cur = con.execute(
-                f"SELECT * FROM {table} WHERE workspace = ? ORDER BY {order_col}",
-                (workspace,),
-            )
-            return [_row_to_dict(r) for r in cur.fetchall()]
-
-        # workspace.* lists, keyed by entity type.
-        workspace_data: dict[str, Any] = {
-            "projects": _select("projects"),
-            "apps": _select("apps"),
-            "libraries": _select("libraries"),
-            "services": _select("services"),
-            "features": _select("features"),
-            "tf_modules": _select("tf_modules"),
-            "tf_live": _select("tf_live"),
-            "releases": _select("releases"),
-            "workloads": _select("workloads"),
-            "clusters_defined": _select("clusters_defined"),
-            "clusters": _select("clusters"),
-            "integrations": _select("integrations"),
-            "gaia_installations": _select("gaia_installations"),
-            "machines": _select("machines"),
-        }
-
-        return {
-            "identity": identity,
-            "stack": {},        # populated by future scanners (B2+)
-            "environment": {},  # populated by future scanners (B2+)
-            "git": {
-                "workspace_name": workspace,
-                "created_at": created_at,
-            },
-            "workspace": workspace_data,
-        }
+        if context is not None:
+            _store_snapshot(con, workspace, version, context)
+        return context
     finally:
         con.close()
@@ -10,9 +10,16 @@ Design:
   * Cross-surface -- queries can mix curated ``memory`` rows, ``episodes``,
     and the append-only ``harness_events`` mirror in a single result set.
   * Filter-driven -- callers pass a ``filters`` dict; the function builds
-    one SELECT per surface, UNIONs the results in Python (each surface has
-    a different schema), and returns a list of normalized dicts that all
-    share the same shape.
+    one SELECT per surface, merges the results in Python (each surface has
+    a different schema), and returns normalized dicts that all share the
+    same shape.
+  * Streaming -- ``iter_query`` reads each surface with keyset pagination
+    and k-way merges the streams on timestamp, so a 90-day window costs one
+    page per surface in memory; ``cross_surface_query`` is its list form.
+  * Aggregates in SQL -- ``aggregate_query`` (``gaia query --count`` /
+    ``--group-by``) compiles the same filters to per-surface ``GROUP BY``
+    branches combined with ``UNION ALL``; counts are exact over the window,
+    not over the per-surface row cap.
 
 The unified output row shape is:
 
@@ -29,12 +36,12 @@ The unified output row shape is:
 
 from __future__ import annotations
 
-import json
+import heapq
 import re
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 
 # ---------------------------------------------------------------------------
@@ -106,15 +113,14 @@ def parse_when(value: str) -> str:
 # Per-surface query helpers
 # ---------------------------------------------------------------------------
 
-def _query_memory(
-    con: sqlite3.Connection,
+def _memory_where(
     *,
     workspace: str | None,
     since_iso: str | None,
     until_iso: str | None,
     type_filter: str | None,
-    limit: int,
-) -> list[dict]:
+    **_ignored: Any,
+) -> tuple[list[str], list[Any]]:
     where = []
     params: list[Any] = []
     if workspace:
@@ -129,43 +135,10 @@ def _query_memory(
     if type_filter:
         where.append("type = ?")
         params.append(type_filter)
+    return where, params
 
-    sql = (
-        "SELECT workspace, name, type, description, body, origin_session_id, "
-        "updated_at "
-        "FROM memory"
-    )
-    if where:
-        sql += " WHERE " + " AND ".join(where)
-    sql += " ORDER BY COALESCE(updated_at, '') DESC LIMIT ?"
-    params.append(limit)
-
-    rows = con.execute(sql, params).fetchall()
-    out = []
-    for r in rows:
-        d = {k: r[k] for k in r.keys()}
-        desc = (d.get("description") or "").strip()
-        body = (d.get("body") or "").strip().replace("\n", " ")
-        if len(body) > 80:
-            body = body[:77] + "..."
-        summary_parts = [d["name"]]
-        if desc:
-            summary_parts.append(f"-- {desc}")
-        elif body:
-            summary_parts.append(f"-- {body}")
-        out.append({
-            "surface": "memory",
-            "timestamp": d.get("updated_at") or "",
-            "type": d.get("type") or "",
-            "agent": None,
-            "summary": " ".join(summary_parts),
-            "raw": d,
-        })
-    return out
 
-
-def _query_episodes(
-    con: sqlite3.Connection,
+def _episodes_where(
     *,
     workspace: str | None,
     since_iso: str | None,
@@ -173,8 +146,8 @@ def _query_episodes(
     type_filter: str | None,
     agent_filter: str | None,
     failed: bool,
-    limit: int,
-) -> list[dict]:
+    **_ignored: Any,
+) -> tuple[list[str], list[Any]]:
     where = []
     params: list[Any] = []
     if workspace:
@@ -198,45 +171,10 @@ def _query_episodes(
             "(plan_status IN ('BLOCKED', 'NEEDS_INPUT') "
             "OR (outcome IS NOT NULL AND outcome NOT IN ('success', '')))"
         )
+    return where, params
 
-    sql = (
-        "SELECT episode_id, workspace, timestamp, session_id, task_id, agent, "
-        "type, title, plan_status, outcome, exit_code, duration_seconds "
-        "FROM episodes"
-    )
-    if where:
-        sql += " WHERE " + " AND ".join(where)
-    sql += " ORDER BY timestamp DESC LIMIT ?"
-    params.append(limit)
 
-    rows = con.execute(sql, params).fetchall()
-    out = []
-    for r in rows:
-        d = {k: r[k] for k in r.keys()}
-        title = (d.get("title") or "").strip()
-        ps = d.get("plan_status") or ""
-        oc = d.get("outcome") or ""
-        bits = [title or d.get("episode_id", "")]
-        tail = []
-        if ps:
-            tail.append(f"plan_status={ps}")
-        if oc and oc != ps:
-            tail.append(f"outcome={oc}")
-        if tail:
-            bits.append("[" + ", ".join(tail) + "]")
-        out.append({
-            "surface": "episodes",
-            "timestamp": d.get("timestamp") or "",
-            "type": d.get("type") or "",
-            "agent": d.get("agent"),
-            "summary": " ".join(bits),
-            "raw": d,
-        })
-    return out
-
-
-def _query_harness_events(
-    con: sqlite3.Connection,
+def _harness_events_where(
     *,
     workspace: str | None,
     since_iso: str | None,
@@ -245,8 +183,8 @@ def _query_harness_events(
     agent_filter: str | None,
     command_like: str | None,
     failed: bool,
-    limit: int,
-) -> list[dict]:
+    **_ignored: Any,
+) -> tuple[list[str], list[Any]]:
     where = []
     params: list[Any] = []
     if workspace:
@@ -278,42 +216,149 @@ def _query_harness_events(
         where.append(
             "(severity = 'error' OR result LIKE 'fail%' OR result LIKE 'error%')"
         )
+    return where, params
+
+
+def _memory_row(d: dict) -> dict:
+    desc = (d.get("description") or "").strip()
+    body = (d.get("body") or "").strip().replace("\n", " ")
+    if len(body) > 80:
+        body = body[:77] + "..."
+    summary_parts = [d["name"]]
+    if desc:
+        summary_parts.append(f"-- {desc}")
+    elif body:
+        summary_parts.append(f"-- {body}")
+    return {
+        "surface": "memory",
+        "timestamp": d.get("updated_at") or "",
+        "type": d.get("type") or "",
+        "agent": None,
+        "summary": " ".join(summary_parts),
+        "raw": d,
+    }
 
-    sql = (
-        "SELECT id, workspace, ts, type, source, agent, result, severity, payload "
-        "FROM harness_events"
-    )
-    if where:
-        sql += " WHERE " + " AND ".join(where)
-    sql += " ORDER BY ts DESC LIMIT ?"
-    params.append(limit)
 
-    rows = con.execute(sql, params).fetchall()
-    out = []
-    for r in rows:
-        d = {k: r[k] for k in r.keys()}
-        # Optional payload-level filtering: for command.executed, an exit_code
-        # field may live inside the JSON payload. When --failed was requested
-        # but the SQL approximation matched too broadly, keep the row as-is;
-        # users can refine with --command-like or --type.
-        result = (d.get("result") or "").strip().replace("\n", " ")
-        if len(result) > 80:
-            result = result[:77] + "..."
-        bits = []
-        sev = d.get("severity") or ""
-        if sev and sev != "info":
-            bits.append(f"({sev})")
-        if result:
-            bits.append(result)
-        out.append({
-            "surface": "harness_events",
-            "timestamp": d.get("ts") or "",
-            "type": d.get("type") or "",
-            "agent": d.get("agent") or None,
-            "summary": " ".join(bits) or f"id={d.get('id')}",
-            "raw": d,
-        })
-    return out
+def _episodes_row(d: dict) -> dict:
+    title = (d.get("title") or "").strip()
+    ps = d.get("plan_status") or ""
+    oc = d.get("outcome") or ""
+    bits = [title or d.get("episode_id", "")]
+    tail = []
+    if ps:
+        tail.append(f"plan_status={ps}")
+    if oc and oc != ps:
+        tail.append(f"outcome={oc}")
+    if tail:
+        bits.append("[" + ", ".join(tail) + "]")
+    return {
+        "surface": "episodes",
+        "timestamp": d.get("timestamp") or "",
+        "type": d.get("type") or "",
+        "agent": d.get("agent"),
+        "summary": " ".join(bits),
+        "raw": d,
+    }
+
+
+def _harness_events_row(d: dict) -> dict:
+    # Optional payload-level filtering: for command.executed, an exit_code
+    # field may live inside the JSON payload. When --failed was requested
+    # but the SQL approximation matched too broadly, keep the row as-is;
+    # users can refine with --command-like or --type.
+    result = (d.get("result") or "").strip().replace("\n", " ")
+    if len(result) > 80:
+        result = result[:77] + "..."
+    bits = []
+    sev = d.get("severity") or ""
+    if sev and sev != "info":
+        bits.append(f"({sev})")
+    if result:
+        bits.append(result)
+    return {
+        "surface": "harness_events",
+        "timestamp": d.get("ts") or "",
+        "type": d.get("type") or "",
+        "agent": d.get("agent") or None,
+        "summary": " ".join(bits) or f"id={d.get('id')}",
+        "raw": d,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Keyset-paginated row streams
+# ---------------------------------------------------------------------------
+
+# Rows fetched per page by _iter_surface.
+PAGE_SIZE = 500
+
+# surface -> (table, selected columns, timestamp sort expr, WHERE builder, row builder)
+_ROW_SURFACES = {
+    "memory": (
+        "memory",
+        "workspace, name, type, description, body, origin_session_id, updated_at",
+        "COALESCE(updated_at, '')",
+        _memory_where,
+        _memory_row,
+    ),
+    "episodes": (
+        "episodes",
+        "episode_id, workspace, timestamp, session_id, task_id, agent, "
+        "type, title, plan_status, outcome, exit_code, duration_seconds",
+        "timestamp",
+        _episodes_where,
+        _episodes_row,
+    ),
+    "harness_events": (
+        "harness_events",
+        "id, workspace, ts, type, source, agent, result, severity, payload",
+        "ts",
+        _harness_events_where,
+        _harness_events_row,
+    ),
+}
+
+
+def _iter_surface(
+    con: sqlite3.Connection,
+    surface: str,
+    filters: dict,
+    *,
+    limit: int | None,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[dict]:
+    """Yield normalized rows of one surface, newest first.
+
+    Keyset pagination: each page is ``ORDER BY ts DESC, rowid DESC LIMIT n``
+    resuming strictly after the last ``(ts, rowid)`` seen, so pages cost the
+    same wherever they fall in the window and at most one page is in memory.
+    Pages are fetched completely before yielding, so several surface streams
+    can interleave on one connection.
+    """
+    table, columns, ts_expr, build_where, build_row = _ROW_SURFACES[surface]
+    where, params = build_where(**filters)
+    remaining = limit
+    after: tuple | None = None
+    while remaining is None or remaining > 0:
+        clauses = list(where)
+        page_params = list(params)
+        if after is not None:
+            clauses.append(f"({ts_expr}, rowid) < (?, ?)")
+            page_params.extend(after)
+        n = page_size if remaining is None else min(page_size, remaining)
+        sql = f"SELECT {columns}, {ts_expr} AS _ts, rowid AS _rowid FROM {table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {ts_expr} DESC, rowid DESC LIMIT ?"
+        page = con.execute(sql, page_params + [n]).fetchall()
+        for r in page:
+            d = {k: r[k] for k in r.keys() if k not in ("_ts", "_rowid")}
+            yield build_row(d)
+        if len(page) < n:
+            return
+        if remaining is not None:
+            remaining -= len(page)
+        after = (page[-1]["_ts"], page[-1]["_rowid"])
 
 
 # ---------------------------------------------------------------------------
@@ -435,6 +480,184 @@ def group_and_count(
     return out
 
 
+# Per-surface (table, timestamp expr, agent expr, WHERE builder) used by
+# aggregate_query. The expressions mirror the normalized row shape, so SQL
+# buckets match what group_and_count computes over cross_surface_query rows.
+_AGGREGATE_SURFACES = {
+    "memory": ("memory", "COALESCE(updated_at, '')", "''", _memory_where),
+    "episodes": ("episodes", "timestamp", "COALESCE(agent, '')", _episodes_where),
+    "harness_events": ("harness_events", "ts", "COALESCE(agent, '')", _harness_events_where),
+}
+
+
+def _bucket_expr(surface: str, group_by: str) -> str:
+    _, ts_expr, agent_expr, _ = _AGGREGATE_SURFACES[surface]
+    if group_by == "day":
+        return f"substr({ts_expr}, 1, 10)"
+    if group_by == "agent":
+        return agent_expr
+    if group_by == "type":
+        return "COALESCE(type, '')"
+    return f"'{surface}'"
+
+
+def aggregate_query(
+    *,
+    surface: str = "all",
+    group_by: str | None = None,
+    workspace: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    type: str | None = None,
+    agent: str | None = None,
+    command_like: str | None = None,
+    failed: bool = False,
+    db_path: Path | None = None,
+) -> list[dict]:
+    """Count matching rows (optionally bucketed) with SQL ``GROUP BY``.
+
+    Same filters and output shape as ``group_and_count(cross_surface_query(...))``
+    but exact over the whole window: there is no per-surface ``last`` cap and
+    no row is materialized. Each surface contributes one
+    ``SELECT bucket, COUNT(*) ... GROUP BY bucket`` (served from its covering
+    index); the branches are combined with ``UNION ALL`` and summed.
+
+    Buckets: ``day`` = ``substr(timestamp, 1, 10)``, ``agent`` / ``type`` = the
+    column ('' when NULL; memory has no agent), ``surface`` = the surface name.
+    Filters a surface does not have (``agent`` on memory, ``command_like``
+    outside harness_events) are ignored for it, as in cross_surface_query.
+
+    Returns:
+        ``[{"count": N}]`` without ``group_by``; otherwise
+        ``[{group_by: key, "count": n}, ...]`` ordered by descending count,
+        ties broken by key.
+
+    Raises:
+        ValueError: for an unknown surface / group_by or unparseable time.
+    """
+    if surface not in VALID_SURFACES:
+        raise ValueError(
+            f"invalid surface '{surface}'; must be one of {list(VALID_SURFACES)}"
+        )
+    if group_by and group_by not in VALID_GROUP_BY:
+        raise ValueError(
+            f"invalid group_by '{group_by}'; must be one of {list(VALID_GROUP_BY)}"
+        )
+
+    filters = dict(
+        workspace=workspace,
+        since_iso=parse_when(since) if since else None,
+        until_iso=parse_when(until) if until else None,
+        type_filter=type,
+        agent_filter=agent,
+        command_like=command_like,
+        failed=failed,
+    )
+    surfaces = list(_AGGREGATE_SURFACES) if surface == "all" else [surface]
+
+    branches: list[str] = []
+    params: list[Any] = []
+    for name in surfaces:
+        table, _, _, build_where = _AGGREGATE_SURFACES[name]
+        where, where_params = build_where(**filters)
+        bucket = _bucket_expr(name, group_by) if group_by else "NULL"
+        sql = f"SELECT {bucket} AS bucket, COUNT(*) AS n FROM {table}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if group_by:
+            sql += " GROUP BY bucket"
+        branches.append(sql)
+        params.extend(where_params)
+
+    union = " UNION ALL ".join(branches)
+    con = _connect(db_path)
+    try:
+        if not group_by:
+            total = con.execute(
+                f"SELECT COALESCE(SUM(n), 0) FROM ({union})", params
+            ).fetchone()[0]
+            return [{"count": total}]
+        rows = con.execute(
+            f"SELECT bucket, SUM(n) AS count FROM ({union}) "
+            "GROUP BY bucket ORDER BY count DESC, bucket",
+            params,
+        ).fetchall()
+    finally:
+        con.close()
+    return [{group_by: r["bucket"], "count": r["count"]} for r in rows]
+
+
+def iter_query(
+    *,
+    surface: str = "all",
+    workspace: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    last: int | None = None,
+    type: str | None = None,
+    agent: str | None = None,
+    command_like: str | None = None,
+    failed: bool = False,
+    page_size: int = PAGE_SIZE,
+    db_path: Path | None = None,
+) -> Iterator[dict]:
+    """Stream a cross-surface query, newest first, in constant memory.
+
+    Same filters and row shape as :func:`cross_surface_query`. Each surface
+    is read as a keyset-paginated stream (see ``_iter_surface``) and the
+    streams are k-way merged on ``timestamp`` with ``heapq.merge``, so at
+    most one page per surface is held at a time however wide the window.
+
+    Arguments are validated eagerly (``ValueError`` is raised by this call,
+    not by the first ``next()``); the DB connection is held until the
+    returned iterator is exhausted or closed.
+
+    Args:
+        last:       Per-surface row limit; ``None`` streams the whole window.
+        page_size:  Rows fetched per surface per round trip.
+
+    Returns:
+        Iterator of dicts with keys ``surface, timestamp, type, agent,
+        summary, raw``.
+    """
+    if surface not in VALID_SURFACES:
+        raise ValueError(
+            f"invalid surface '{surface}'; must be one of {list(VALID_SURFACES)}"
+        )
+    filters = dict(
+        workspace=workspace,
+        since_iso=parse_when(since) if since else None,
+        until_iso=parse_when(until) if until else None,
+        type_filter=type,
+        agent_filter=agent,
+        command_like=command_like,
+        failed=failed,
+    )
+    surfaces = list(_ROW_SURFACES) if surface == "all" else [surface]
+    return _merged_rows(surfaces, filters, last, page_size, db_path)
+
+
+def _merged_rows(
+    surfaces: list[str],
+    filters: dict,
+    last: int | None,
+    page_size: int,
+    db_path: Path | None,
+) -> Iterator[dict]:
+    con = _connect(db_path)
+    try:
+        streams = [
+            _iter_surface(con, name, filters, limit=last, page_size=page_size)
+            for name in surfaces
+        ]
+        # Ties keep surface order (memory, episodes, harness_events).
+        yield from heapq.merge(
+            *streams, key=lambda r: r["timestamp"], reverse=True
+        )
+    finally:
+        con.close()
+
+
 def cross_surface_query(
     *,
     surface: str = "all",
@@ -453,7 +676,8 @@ def cross_surface_query(
     Each surface is queried independently with the filters that apply to it,
     then results are merged (newest first by ``timestamp``) and capped at
     ``last`` per surface (NOT globally -- callers wanting a global cap can
-    slice the returned list).
+    slice the returned list). This is ``list(iter_query(...))``; use
+    :func:`iter_query` to stream large windows.
 
     Args:
         surface:       ``memory`` | ``episodes`` | ``harness_events`` | ``all``.
@@ -481,63 +705,27 @@ def cross_surface_query(
         Normalized list of dicts, each with keys
         ``surface, timestamp, type, agent, summary, raw``.
     """
-    if surface not in VALID_SURFACES:
-        raise ValueError(
-            f"invalid surface '{surface}'; must be one of {list(VALID_SURFACES)}"
-        )
-
-    since_iso = parse_when(since) if since else None
-    until_iso = parse_when(until) if until else None
-
-    con = _connect(db_path)
-    try:
-        results: list[dict] = []
-        if surface in ("memory", "all"):
-            results.extend(_query_memory(
-                con,
-                workspace=workspace,
-                since_iso=since_iso,
-                until_iso=until_iso,
-                type_filter=type,
-                limit=last,
-            ))
-        if surface in ("episodes", "all"):
-            results.extend(_query_episodes(
-                con,
-                workspace=workspace,
-                since_iso=since_iso,
-                until_iso=until_iso,
-                type_filter=type,
-                agent_filter=agent,
-                failed=failed,
-                limit=last,
-            ))
-        if surface in ("harness_events", "all"):
-            results.extend(_query_harness_events(
-                con,
-                workspace=workspace,
-                since_iso=since_iso,
-                until_iso=until_iso,
-                type_filter=type,
-                agent_filter=agent,
-                command_like=command_like,
-                failed=failed,
-                limit=last,
-            ))
-    finally:
-        con.close()
-
-    # Sort merged result newest-first by timestamp string (ISO8601 sorts
-    # lexicographically). Empty timestamps sink to the bottom.
-    results.sort(key=lambda r: r.get("timestamp") or "", reverse=True)
-    return results
+    return list(iter_query(
+        surface=surface,
+        workspace=workspace,
+        since=since,
+        until=until,
+        last=last,
+        type=type,
+        agent=agent,
+        command_like=command_like,
+        failed=failed,
+        db_path=db_path,
+    ))
 
 
 __all__ = [
     "VALID_SURFACES",
     "VALID_GROUP_BY",
     "parse_when",
+    "aggregate_query",
     "cross_surface_query",
+    "iter_query",
     "group_and_count",
     "_highlight_snippet",
     "_extract_text_needle",
@@ -530,6 +530,9 @@ CREATE TABLE IF NOT EXISTS episodes (
 
 CREATE INDEX IF NOT EXISTS idx_episodes_workspace_timestamp ON episodes(workspace, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_episodes_session ON episodes(session_id);
+-- Covering indexes for gaia.store.reader.aggregate_query (GROUP BY day/type/agent).
+CREATE INDEX IF NOT EXISTS idx_episodes_workspace_bucket ON episodes(workspace, timestamp, type, agent);
+CREATE INDEX IF NOT EXISTS idx_episodes_type_timestamp ON episodes(type, timestamp);
 
 CREATE VIRTUAL TABLE IF NOT EXISTS episodes_fts USING fts5(
     episode_id UNINDEXED,
@@ -576,6 +579,7 @@ CREATE TABLE IF NOT EXISTS memory (
 
 CREATE INDEX IF NOT EXISTS idx_memory_workspace ON memory(workspace);
 CREATE INDEX IF NOT EXISTS idx_memory_type ON memory(type);
+CREATE INDEX IF NOT EXISTS idx_memory_workspace_bucket ON memory(workspace, updated_at, type);
 
 CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
     workspace UNINDEXED,
@@ -619,7 +623,7 @@ CREATE TABLE IF NOT EXISTS context_contracts (
 CREATE INDEX IF NOT EXISTS idx_context_contracts_workspace ON context_contracts(workspace);
 
 -- ---------------------------------------------------------------------------
--- harness_events: append-only mirror of events.jsonl
+-- harness_events: append-only mirror of events.jsonl (see gaia.store.ingest)
 -- ---------------------------------------------------------------------------
 CREATE TABLE IF NOT EXISTS harness_events (
     id        INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -630,8 +634,45 @@ CREATE TABLE IF NOT EXISTS harness_events (
     agent     TEXT,
     result    TEXT,
     severity  TEXT,
-    payload   TEXT
+    payload   TEXT,
+    event_hash TEXT             -- sha256 of the canonical record; dedupe key
 );
 
 CREATE INDEX IF NOT EXISTS idx_harness_events_workspace_ts ON harness_events(workspace, ts DESC);
-CREATE INDEX IF NOT EXISTS idx_harness_events_type ON harness_events(type);
+CREATE INDEX IF NOT EXISTS idx_harness_events_type_ts ON harness_events(type, ts);
+CREATE INDEX IF NOT EXISTS idx_harness_events_ts_bucket ON harness_events(ts, workspace, type, agent);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_harness_events_hash ON harness_events(event_hash);
+
+-- ---------------------------------------------------------------------------
+-- harness_ingest_cursors: how far gaia.store.ingest has read each events.jsonl.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS harness_ingest_cursors (
+    source      TEXT NOT NULL PRIMARY KEY,  -- absolute path of the events.jsonl
+    inode       INTEGER NOT NULL,
+    offset      INTEGER NOT NULL,           -- byte offset just past the last ingested line
+    fingerprint TEXT NOT NULL,              -- sha1 of the bytes right before offset
+    updated_at  TEXT
+);
+
+-- ---------------------------------------------------------------------------
+-- workspace_versions: monotonically increasing write counter per workspace.
+-- Bumped by gaia.store.writer whenever a write actually changes entity rows.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS workspace_versions (
+    workspace  TEXT NOT NULL PRIMARY KEY,  -- FK -> workspaces.name
+    version    INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT,
+    FOREIGN KEY (workspace) REFERENCES workspaces(name) ON DELETE CASCADE
+);
+
+-- ---------------------------------------------------------------------------
+-- context_snapshots: materialized gaia.store.provider.get_context() payload.
+-- Valid only while `version` equals workspace_versions.version.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS context_snapshots (
+    workspace TEXT NOT NULL PRIMARY KEY,  -- FK -> workspaces.name
+    version   INTEGER NOT NULL,
+    payload   TEXT NOT NULL,              -- JSON of get_context() output
+    built_at  TEXT,
+    FOREIGN KEY (workspace) REFERENCES workspaces(name) ON DELETE CASCADE
+);
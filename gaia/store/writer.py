@@ -7,6 +7,10 @@ before touching data. If the (table, agent) pair is missing or has
 ``allow_write=0``, the operation returns ``{"status": "rejected",
 "reason": "not_authorized"}`` without modifying the DB.
 
+Write transactions open with ``BEGIN IMMEDIATE`` so concurrent hook
+processes queue on the write lock (honouring ``busy_timeout``) instead of
+failing a deferred read->write upgrade with ``database is locked``.
+
 Vocabulary:
   * ``workspaces`` table -- organizational containers (e.g. "me", "bildwiz").
   * ``projects`` table  -- git-bearing source projects within a workspace.
@@ -22,20 +26,22 @@ Public API::
     upsert_app(workspace, project, name, fields, agent, topic_key=None) -> dict
     delete_missing_in(table, workspace, surviving_keys) -> int
     bulk_upsert(table, workspace, rows, agent) -> dict
+    bulk_apply(workspace, upserts, agent, prunes=()) -> dict
     wipe_workspace(workspace) -> None
 """
 
 from __future__ import annotations
 
+import functools
+import itertools
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
-# Schema file lives alongside this module
-_SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
+from gaia.store import connection as _pool
 
-# Tables we recognize (whitelist for delete_missing_in / bulk_upsert)
+# Tables we recognize (whitelist for delete_missing_in / bulk_upsert / bulk_apply)
 _KNOWN_TABLES = {
     "workspaces",
     "projects",
@@ -54,6 +60,25 @@ _KNOWN_TABLES = {
     "machines",
 }
 
+# Primary-key fragments (after ``workspace``) per table.
+_PK_COLUMNS = {
+    "workspaces": ("name",),
+    "projects": ("name",),
+    "apps": ("project", "name"),
+    "libraries": ("project", "name"),
+    "services": ("project", "name"),
+    "features": ("project", "name"),
+    "tf_modules": ("project", "name"),
+    "tf_live": ("project", "name"),
+    "releases": ("project", "name"),
+    "workloads": ("project", "name"),
+    "clusters_defined": ("project", "name"),
+    "clusters": ("name",),
+    "integrations": ("name",),
+    "gaia_installations": ("machine",),
+    "machines": ("name",),
+}
+
 
 # ---------------------------------------------------------------------------
 # Connection management
@@ -67,7 +92,11 @@ def _db_path() -> Path:
 
 
 def _connect(db_path: Path | None = None) -> sqlite3.Connection:
-    """Open a connection, ensuring the schema is materialized.
+    """Return a pooled connection, ensuring the schema is materialized.
+
+    Connections come from :mod:`gaia.store.connection`: pragmas and the
+    schema bootstrap run once per physical connection / process, and
+    ``con.close()`` returns the connection to the pool.
 
     Args:
         db_path: Optional explicit DB path (used by tests). When None,
@@ -78,16 +107,7 @@ def _connect(db_path: Path | None = None) -> sqlite3.Connection:
     """
     if db_path is None:
         db_path = _db_path()
-
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    fresh = not db_path.exists()
-    con = sqlite3.connect(str(db_path))
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys = ON")
-    if fresh:
-        con.executescript(_SCHEMA_PATH.read_text(encoding="utf-8"))
-        con.commit()
-    return con
+    return _pool.acquire(db_path)
 
 
 def _now_iso() -> str:
@@ -95,6 +115,21 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def _bump_workspace_version(con: sqlite3.Connection, workspace: str) -> None:
+    """Advance the workspace write counter inside the caller's transaction.
+
+    ``provider.get_context`` serves its materialized snapshot only while the
+    snapshot's version matches this counter, so every write to an entity
+    table must call this before committing. The workspaces row must exist.
+    """
+    con.execute(
+        "INSERT INTO workspace_versions (workspace, version, updated_at) VALUES (?, 1, ?) "
+        "ON CONFLICT(workspace) DO UPDATE SET "
+        "version = version + 1, updated_at = excluded.updated_at",
+        (workspace, _now_iso()),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Permission enforcement
 # ---------------------------------------------------------------------------
@@ -236,7 +271,7 @@ def upsert_project(
     try:
         if not _is_authorized(con, "projects", agent):
             return _rejected()
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
             _ensure_workspace_row(con, workspace, workspace_path)
             data = {k: fields.get(k) for k in _PROJECT_FIELDS}
@@ -259,6 +294,7 @@ def upsert_project(
                     data["primary_language"], _now_iso(), topic_key,
                 ),
             )
+            _bump_workspace_version(con, workspace)
             con.commit()
         except Exception:
             con.rollback()
@@ -305,7 +341,7 @@ def upsert_app(
     try:
         if not _is_authorized(con, "apps", agent):
             return _rejected()
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
             _ensure_workspace_row(con, workspace)
             # Ensure parent project row exists -- create a minimal stub if missing
@@ -337,6 +373,7 @@ def upsert_app(
                     topic_key, _now_iso(),
                 ),
             )
+            _bump_workspace_version(con, workspace)
             con.commit()
         except Exception:
             con.rollback()
@@ -380,45 +417,13 @@ def delete_missing_in(
     surviving = list(surviving_keys)
     con = _connect(db_path)
     try:
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
-            pk_columns = {
-                "workspaces": ("name",),
-                "projects": ("name",),
-                "apps": ("project", "name"),
-                "libraries": ("project", "name"),
-                "services": ("project", "name"),
-                "features": ("project", "name"),
-                "tf_modules": ("project", "name"),
-                "tf_live": ("project", "name"),
-                "releases": ("project", "name"),
-                "workloads": ("project", "name"),
-                "clusters_defined": ("project", "name"),
-                "clusters": ("name",),
-                "integrations": ("name",),
-                "gaia_installations": ("machine",),
-                "machines": ("name",),
-            }[table]
-
-            cols_sql = ", ".join(pk_columns)
-            existing = con.execute(
-                f"SELECT {cols_sql} FROM {table} WHERE workspace = ?",
-                (workspace,),
-            ).fetchall()
-            existing_set = {tuple(row) for row in existing}
-            surviving_set = {tuple(s) for s in surviving}
-            to_delete = existing_set - surviving_set
-
-            count = 0
-            for key in to_delete:
-                placeholders = " AND ".join(f"{c} = ?" for c in pk_columns)
-                con.execute(
-                    f"DELETE FROM {table} WHERE workspace = ? AND {placeholders}",
-                    (workspace, *key),
-                )
-                count += 1
+            deleted = _delete_missing(con, table, workspace, surviving)
+            if deleted:
+                _bump_workspace_version(con, workspace)
             con.commit()
-            return count
+            return deleted
         except Exception:
             con.rollback()
             raise
@@ -426,10 +431,80 @@ def delete_missing_in(
         con.close()
 
 
+def _delete_missing(
+    con: sqlite3.Connection,
+    table: str,
+    workspace: str,
+    surviving: Iterable[Sequence[Any]],
+    *,
+    project: str | None = None,
+) -> int:
+    """Delete rows whose PK is not in *surviving*, inside the caller's txn.
+
+    With *project* set, only that project's rows are candidates, so sibling
+    projects never need to be listed as survivors.
+    """
+    pk_columns = _PK_COLUMNS[table]
+    cols_sql = ", ".join(pk_columns)
+    if project is None:
+        existing = con.execute(
+            f"SELECT {cols_sql} FROM {table} WHERE workspace = ?",
+            (workspace,),
+        ).fetchall()
+    else:
+        existing = con.execute(
+            f"SELECT {cols_sql} FROM {table} WHERE workspace = ? AND project = ?",
+            (workspace, project),
+        ).fetchall()
+    existing_set = {tuple(row) for row in existing}
+    surviving_set = {tuple(s) for s in surviving}
+    to_delete = existing_set - surviving_set
+
+    placeholders = " AND ".join(f"{c} = ?" for c in pk_columns)
+    con.executemany(
+        f"DELETE FROM {table} WHERE workspace = ? AND {placeholders}",
+        [(workspace, *key) for key in to_delete],
+    )
+    return len(to_delete)
+
+
 # ---------------------------------------------------------------------------
 # Public API: bulk_upsert
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=256)
+def _upsert_sql(table: str, cols: tuple[str, ...]) -> str:
+    """Build (once per column shape) the INSERT ... ON CONFLICT statement.
+
+    Only the non-PK columns present in ``cols`` are updated on conflict.
+    """
+    pk = ("workspace", *_PK_COLUMNS[table])
+    placeholders = ", ".join(["?"] * len(cols))
+    update_cols = [c for c in cols if c not in pk]
+    head = f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders}) "
+    if not update_cols:
+        return head + f"ON CONFLICT({', '.join(pk)}) DO NOTHING"
+    set_clause = ", ".join(f"{c} = excluded.{c}" for c in update_cols)
+    return head + f"ON CONFLICT({', '.join(pk)}) DO UPDATE SET {set_clause}"
+
+
+def _project_params(workspace: str, rows: list[Mapping[str, Any]], now: str) -> list[tuple]:
+    """Normalize project rows to the fixed ``upsert_project`` column shape."""
+    return [
+        (workspace, r["name"], *(r.get(k) for k in _PROJECT_FIELDS), now, r.get("topic_key"))
+        for r in rows
+    ]
+
+
+def _app_params(workspace: str, rows: list[Mapping[str, Any]], now: str) -> list[tuple]:
+    """Normalize app rows to the fixed ``upsert_app`` column shape."""
+    return [
+        (workspace, r["project"], r["name"], *(r.get(k) for k in _APP_FIELDS),
+         r.get("topic_key"), now)
+        for r in rows
+    ]
+
+
 def bulk_upsert(
     table: str,
     workspace: str,
@@ -440,104 +515,149 @@ def bulk_upsert(
 ) -> dict:
     """Upsert multiple rows in a single transaction.
 
+    One connection, one permission check and one transaction regardless of
+    table or row count. Statements are built once per column shape and run
+    with ``executemany``.
+
+    ``projects`` and ``apps`` keep the ``upsert_project`` / ``upsert_app``
+    semantics (fixed column set, ``scanner_ts`` stamped now, missing apps
+    parents created as stub projects). Every other table uses
+    ON CONFLICT DO UPDATE on ONLY the columns the caller provided; rows are
+    grouped into consecutive runs of the same column shape so application
+    order is preserved.
+
     Returns:
         {"applied": int, "rejected": int}
     """
-    rows_list = list(rows)
-    applied = 0
-    rejected = 0
-    if table == "projects":
-        for r in rows_list:
-            res = upsert_project(
-                workspace,
-                r["name"],
-                r,
-                agent,
-                topic_key=r.get("topic_key"),
-                db_path=db_path,
-            )
-            if res.get("status") == "applied":
-                applied += 1
-            else:
-                rejected += 1
-        return {"applied": applied, "rejected": rejected}
-
-    if table == "apps":
-        for r in rows_list:
-            res = upsert_app(
-                workspace,
-                r["project"],
-                r["name"],
-                r,
-                agent,
-                topic_key=r.get("topic_key"),
-                db_path=db_path,
-            )
-            if res.get("status") == "applied":
-                applied += 1
-            else:
-                rejected += 1
-        return {"applied": applied, "rejected": rejected}
-
-    # Generic path: enforce permission + ON CONFLICT DO UPDATE that ONLY
-    # updates the columns the caller provided.
-    pk_columns = {
-        "workspaces": ("name",),
-        "projects": ("name",),
-        "apps": ("project", "name"),
-        "libraries": ("project", "name"),
-        "services": ("project", "name"),
-        "features": ("project", "name"),
-        "tf_modules": ("project", "name"),
-        "tf_live": ("project", "name"),
-        "releases": ("project", "name"),
-        "workloads": ("project", "name"),
-        "clusters_defined": ("project", "name"),
-        "clusters": ("name",),
-        "integrations": ("name",),
-        "gaia_installations": ("machine",),
-        "machines": ("name",),
-    }
-    if table not in pk_columns:
+    if table not in _PK_COLUMNS:
         raise ValueError(f"unknown table for bulk_upsert: {table!r}")
-    pk = ("workspace", *pk_columns[table])
 
+    rows_list = list(rows)
     con = _connect(db_path)
     try:
         if not _is_authorized(con, table, agent):
             return {"applied": 0, "rejected": len(rows_list)}
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
             _ensure_workspace_row(con, workspace)
-            for r in rows_list:
-                row_data = dict(r)
-                cols = ["workspace"] + list(row_data.keys())
-                vals = [workspace] + list(row_data.values())
-                placeholders = ", ".join(["?"] * len(cols))
-                update_cols = [c for c in row_data.keys() if c not in pk]
-                pk_sql = ", ".join(pk)
-                if update_cols:
-                    set_clause = ", ".join(
-                        f"{c} = excluded.{c}" for c in update_cols
-                    )
-                    sql = (
-                        f"INSERT INTO {table} ({', '.join(cols)}) "
-                        f"VALUES ({placeholders}) "
-                        f"ON CONFLICT({pk_sql}) DO UPDATE SET {set_clause}"
-                    )
-                else:
-                    sql = (
-                        f"INSERT INTO {table} ({', '.join(cols)}) "
-                        f"VALUES ({placeholders}) "
-                        f"ON CONFLICT({pk_sql}) DO NOTHING"
-                    )
-                con.execute(sql, vals)
-                applied += 1
+            _upsert_rows(con, table, workspace, rows_list, _now_iso())
+            _bump_workspace_version(con, workspace)
+            con.commit()
+        except Exception:
+            con.rollback()
+            raise
+        return {"applied": len(rows_list), "rejected": 0}
+    finally:
+        con.close()
+
+
+def _upsert_rows(
+    con: sqlite3.Connection,
+    table: str,
+    workspace: str,
+    rows: list[Mapping[str, Any]],
+    now: str,
+) -> None:
+    """Run the ``bulk_upsert`` statements for *rows* inside the caller's txn."""
+    if table == "projects":
+        cols = ("workspace", "name", *_PROJECT_FIELDS, "scanner_ts", "topic_key")
+        con.executemany(_upsert_sql(table, cols), _project_params(workspace, rows, now))
+    elif table == "apps":
+        # Ensure parent project rows exist -- minimal stubs if missing
+        con.executemany(
+            "INSERT INTO projects (workspace, name, scanner_ts) VALUES (?, ?, ?) "
+            "ON CONFLICT(workspace, name) DO NOTHING",
+            [(workspace, p, now) for p in dict.fromkeys(r["project"] for r in rows)],
+        )
+        cols = ("workspace", "project", "name", *_APP_FIELDS, "topic_key", "scanner_ts")
+        con.executemany(_upsert_sql(table, cols), _app_params(workspace, rows, now))
+    else:
+        for shape, group in itertools.groupby(rows, key=lambda r: tuple(r.keys())):
+            con.executemany(
+                _upsert_sql(table, ("workspace", *shape)),
+                [(workspace, *r.values()) for r in group],
+            )
+
+
+# ---------------------------------------------------------------------------
+# Public API: bulk_apply
+# ---------------------------------------------------------------------------
+
+def bulk_apply(
+    workspace: str,
+    upserts: Iterable[tuple[str, Iterable[Mapping[str, Any]]]],
+    agent: str,
+    *,
+    prunes: Iterable[tuple[str, str, Iterable[Sequence[Any]]]] = (),
+    db_path: Path | None = None,
+    workspace_path: Path | None = None,
+) -> dict:
+    """Apply many ``bulk_upsert`` batches and project-scoped prunes at once.
+
+    Everything runs on one connection inside ONE transaction, so a whole
+    workspace scan costs a single write-lock acquisition and a single
+    workspace version bump. Permission is checked once per table; batches
+    for tables the agent cannot write are rejected without aborting the
+    rest, exactly as separate ``bulk_upsert`` calls would be.
+
+    Args:
+        workspace: Workspace name.
+        upserts: ``(table, rows)`` batches, applied in order with
+            ``bulk_upsert`` semantics.
+        agent: Agent name checked against ``agent_permissions``.
+        prunes: ``(table, project, surviving_keys)`` triples. Rows of
+            ``project`` in a project-scoped ``table`` whose PK is not in
+            ``surviving_keys`` (``[(project, name), ...]``) are deleted.
+            Like ``delete_missing_in``, prunes are not permission-gated.
+        db_path: Optional explicit DB path (used by tests).
+        workspace_path: Directory whose git remote supplies the
+            workspaces.identity value when the workspace row is created.
+
+    Returns:
+        ``{"upserts": [{"applied": int, "rejected": int}, ...],
+        "deleted": [int, ...]}`` -- one entry per batch / prune, in order.
+
+    Raises:
+        ValueError: for an unknown table, or a prune on a table without a
+            ``project`` column.
+    """
+    batches = [(table, list(rows)) for table, rows in upserts]
+    prune_list = [(table, project, list(keys)) for table, project, keys in prunes]
+    for table, _ in batches:
+        if table not in _PK_COLUMNS:
+            raise ValueError(f"unknown table for bulk_apply: {table!r}")
+    for table, _, _ in prune_list:
+        if "project" not in _PK_COLUMNS.get(table, ()):
+            raise ValueError(f"table is not project-scoped: {table!r}")
+
+    con = _connect(db_path)
+    try:
+        allowed = {t: _is_authorized(con, t, agent) for t in dict.fromkeys(t for t, _ in batches)}
+        upsert_results = []
+        deleted = []
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            _ensure_workspace_row(con, workspace, workspace_path)
+            now = _now_iso()
+            changed = False
+            for table, rows in batches:
+                if not allowed[table]:
+                    upsert_results.append({"applied": 0, "rejected": len(rows)})
+                    continue
+                _upsert_rows(con, table, workspace, rows, now)
+                upsert_results.append({"applied": len(rows), "rejected": 0})
+                changed = changed or bool(rows)
+            for table, project, keys in prune_list:
+                count = _delete_missing(con, table, workspace, keys, project=project)
+                deleted.append(count)
+                changed = changed or bool(count)
+            if changed:
+                _bump_workspace_version(con, workspace)
             con.commit()
         except Exception:
             con.rollback()
             raise
-        return {"applied": applied, "rejected": rejected}
+        return {"upserts": upsert_results, "deleted": deleted}
     finally:
         con.close()
 
@@ -564,7 +684,7 @@ def save_integration(
     """
     con = _connect(db_path)
     try:
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
             _ensure_workspace_row(con, workspace)
             con.execute(
@@ -581,6 +701,7 @@ def save_integration(
                 """,
                 (workspace, name, kind, version, install_path, topic_key, _now_iso()),
             )
+            _bump_workspace_version(con, workspace)
             con.commit()
         except Exception:
             con.rollback()
@@ -628,7 +749,7 @@ def upsert_memory(
 
     con = _connect(db_path)
     try:
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
             _ensure_workspace_row(con, workspace, workspace_path)
 
@@ -1155,7 +1276,7 @@ def wipe_workspace(workspace: str, *, db_path: Path | None = None) -> None:
     """
     con = _connect(db_path)
     try:
-        con.execute("BEGIN")
+        con.execute("BEGIN IMMEDIATE")
         try:
             con.execute("DELETE FROM workspaces WHERE name = ?", (workspace,))
             con.commit()
@@ -17,7 +17,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..agents.transcript_analyzer import TranscriptAnalysis
-from .workflow_recorder import get_workflow_memory_dir
+from .workflow_recorder import _append_jsonl, get_workflow_memory_dir
 
 logger = logging.getLogger(__name__)
 
@@ -599,13 +599,11 @@ def signal_gaia_analysis(
         logger.info(f"Gaia analysis signal created: {signal_file}")
 
         # Also log to a permanent anomaly log
-        anomaly_log = signals_dir.parent / "anomalies.jsonl"
-        with open(anomaly_log, "a") as f:
-            f.write(json.dumps({
-                "timestamp": datetime.now().isoformat(),
-                "anomalies": anomalies,
-                "metrics": metrics,
-            }) + "\n")
+        _append_jsonl(signals_dir.parent / "anomalies.jsonl", {
+            "timestamp": datetime.now().isoformat(),
+            "anomalies": anomalies,
+            "metrics": metrics,
+        })
 
     except Exception as e:
         logger.warning(f"Could not create analysis signal: {e}")
@@ -8,6 +8,7 @@ Provides:
     - record(): Build metrics dict, write to JSONL
 """
 
+import fcntl
 import json
 import logging
 import os
@@ -37,10 +38,21 @@ def get_workflow_memory_dir() -> Path:
 
 
 def _append_jsonl(path: Path, payload: Dict[str, Any]) -> None:
-    """Append one JSON record per line."""
+    """Append one JSON record per line.
+
+    Holds an exclusive lock on ``<name>.lock`` across open-append-close,
+    like EventWriter, so ``gaia cleanup`` retention (which rewrites the
+    file and renames it into place under the same lock) never loses a
+    record to the replaced inode.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a") as f:
-        f.write(json.dumps(payload) + "\n")
+    with open(path.with_name(path.name + ".lock"), "w") as lf:
+        fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+        try:
+            with open(path, "a") as f:
+                f.write(json.dumps(payload) + "\n")
+        finally:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
 
 
 def _parse_frontmatter(text: str) -> Dict[str, Any]:
@@ -284,9 +296,7 @@ def record(
         workflow_memory_dir = get_workflow_memory_dir()
         workflow_memory_dir.mkdir(parents=True, exist_ok=True)
 
-        metrics_file = workflow_memory_dir / "metrics.jsonl"
-        with open(metrics_file, "a") as f:
-            f.write(json.dumps(metrics) + "\n")
+        _append_jsonl(workflow_memory_dir / "metrics.jsonl", metrics)
 
     logger.debug(
         "Captured workflow metrics: %s (duration: %sms, exit: %s, commands: %s)",
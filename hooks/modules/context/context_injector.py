@@ -5,6 +5,7 @@ Handles:
 - check_pending_updates_threshold: warns when pending updates accumulate
 - check_recent_critical_anomalies: surfaces critical anomalies from JSONL log
 - consume_anomaly_flag: reads and deletes anomaly signal flags
+- clear_anomaly_flag: deletes the anomaly flag once its warning was emitted
 """
 
 import json
@@ -100,6 +101,9 @@ def _dict_to_yaml(d, indent: int = 0) -> str:
     - Lists are rendered as markdown bullet lists (- item).
     - Scalar values are rendered inline.
     - None/empty values are skipped.
+
+    tools/context/context_packer.render_yaml mirrors this to size contract
+    sections for the token budget; keep the two in sync.
     """
     lines = []
     prefix = "  " * indent
@@ -127,6 +131,62 @@ def _dict_to_yaml(d, indent: int = 0) -> str:
     return "\n".join(lines)
 
 
+def _load_context_packer():
+    """Import tools/context/context_packer.py, or None when unavailable."""
+    try:
+        tools_dir = Path(__file__).resolve().parents[3] / "tools" / "context"
+        if str(tools_dir) not in sys.path:
+            sys.path.insert(0, str(tools_dir))
+        import context_packer
+        return context_packer
+    except Exception as exc:
+        logger.debug("context_packer unavailable (non-fatal): %s", exc)
+        return None
+
+
+def pack_tail_blocks(tail: dict, context_budget: dict) -> tuple:
+    """Fit reminder/anomaly/event text blocks into the provider's leftover budget.
+
+    ``tail`` maps block key -> (kind, text) in render order.  ``context_budget``
+    is the provider's ``metadata.context_budget`` report; when it is missing
+    (older provider) every block is kept unchanged.
+
+    Returns ``(kept, report)`` where ``kept`` maps key -> text ("" when
+    dropped) and ``report`` is the merged budget report for telemetry.
+    """
+    if not context_budget or "remaining" not in context_budget:
+        return {key: text for key, (_kind, text) in tail.items()}, context_budget or {}
+
+    packer = _load_context_packer()
+    if packer is None:
+        return {key: text for key, (_kind, text) in tail.items()}, context_budget
+
+    priorities = {
+        "anomaly": packer.PRIORITY_ANOMALY,
+        "reminder": packer.PRIORITY_REMINDER,
+        "events": packer.PRIORITY_EVENTS,
+    }
+    blocks = [
+        packer.ContextBlock(
+            key, kind, priorities.get(kind, packer.PRIORITY_REMINDER), text,
+            required=(kind == "anomaly"),
+        )
+        for key, (kind, text) in tail.items()
+    ]
+    result = packer.pack_blocks(blocks, context_budget["remaining"])
+    kept_keys = set(result.selected_keys())
+
+    tail_report = result.to_report()
+    report = dict(context_budget)
+    report["used"] = context_budget.get("used", 0) + tail_report["used"]
+    report["remaining"] = tail_report["remaining"]
+    report["selected_count"] = context_budget.get("selected_count", 0) + tail_report["selected_count"]
+    report["dropped_count"] = context_budget.get("dropped_count", 0) + tail_report["dropped_count"]
+    report["dropped"] = list(context_budget.get("dropped", [])) + tail_report["dropped"]
+
+    return {key: (text if key in kept_keys else "") for key, (_kind, text) in tail.items()}, report
+
+
 def _prune_empty_values(data: dict) -> dict:
     """Drop keys with empty telemetry values while preserving False/0."""
     pruned = {}
@@ -147,6 +207,7 @@ def build_context_telemetry_snapshot(context_payload: dict) -> dict:
     surface_routing = context_payload.get("surface_routing") or {}
     investigation_brief = context_payload.get("investigation_brief") or {}
     write_permissions = context_payload.get("write_permissions") or {}
+    context_budget = metadata.get("context_budget") or {}
 
     contract_sections = sorted(project_knowledge.keys())
     readable_sections = sorted(write_permissions.get("readable_sections") or [])
@@ -186,6 +247,12 @@ def build_context_telemetry_snapshot(context_payload: dict) -> dict:
             "writable_sections": writable_sections,
             "writable_sections_count": len(writable_sections),
         }),
+        "context_budget": _prune_empty_values({
+            "budget": context_budget.get("budget"),
+            "used": context_budget.get("used"),
+            "dropped_count": context_budget.get("dropped_count"),
+            "dropped_keys": [d.get("key") for d in context_budget.get("dropped") or []],
+        }),
     })
 
 
@@ -280,7 +347,20 @@ def check_recent_critical_anomalies() -> str:
         return ""
 
 
-def consume_anomaly_flag(enriched_prompt: str) -> str:
+def _anomaly_flag_path() -> Path:
+    return get_plugin_data_dir() / "project-context" / "workflow-episodic-memory" / "signals" / "needs_analysis.flag"
+
+
+def clear_anomaly_flag() -> None:
+    """Delete the needs_analysis.flag after its warning has been emitted."""
+    try:
+        _anomaly_flag_path().unlink(missing_ok=True)
+        logger.info("Consumed anomaly flag and injected warning")
+    except OSError as e:
+        logger.debug(f"Failed to clear anomaly flag (non-fatal): {e}")
+
+
+def consume_anomaly_flag(enriched_prompt: str, consume: bool = True) -> str:
     """Read and delete the needs_analysis.flag if it exists, appending a warning.
 
     The flag is created by subagent_stop.py when workflow anomalies are
@@ -288,10 +368,13 @@ def consume_anomaly_flag(enriched_prompt: str) -> str:
     exactly once.  Must not slow down context injection -- returns
     immediately if the file does not exist.
 
+    With ``consume=False`` a live flag is left in place; the caller deletes
+    it with ``clear_anomaly_flag()`` once the warning actually went out.
+
     TTL enforcement: flags older than 1 hour (by created_at or file mtime)
     are auto-expired and deleted without injecting a warning.
     """
-    flag_path = get_plugin_data_dir() / "project-context" / "workflow-episodic-memory" / "signals" / "needs_analysis.flag"
+    flag_path = _anomaly_flag_path()
     if not flag_path.exists():
         return enriched_prompt
     try:
@@ -331,13 +414,35 @@ def consume_anomaly_flag(enriched_prompt: str) -> str:
                 f"Recent anomalies detected: {summary}. "
                 f"Consider investigating with /gaia.\n"
             )
-        flag_path.unlink()
-        logger.info("Consumed anomaly flag and injected warning")
+        if consume:
+            flag_path.unlink()
+            logger.info("Consumed anomaly flag and injected warning")
     except Exception as e:
         logger.debug(f"Failed to consume anomaly flag (non-fatal): {e}")
     return enriched_prompt
 
 
+def _format_recent_events() -> str:
+    """Render the last 24h of operational events as a context block (non-blocking)."""
+    try:
+        from ..events.event_writer import read_events
+        recent = read_events(hours=24, limit=20)
+        if not recent:
+            return ""
+        lines = ["\n# Recent Events (last 24h)"]
+        for evt in recent:
+            ts_short = evt.get("ts", "")[:16]
+            etype = evt.get("type", "")
+            agent_name = evt.get("agent", "")
+            result_str = evt.get("result", "")
+            label = f"{agent_name}: " if agent_name else ""
+            lines.append(f"- [{ts_short}] {etype}: {label}{result_str}")
+        return "\n".join(lines) + "\n"
+    except Exception as exc:
+        logger.debug("Event context injection failed (non-fatal): %s", exc)
+        return ""
+
+
 def build_project_context(
     parameters: dict,
     project_agents: list,
@@ -431,13 +536,35 @@ def build_project_context(
             subagent_type, project_agents, hooks_dir
         )
 
+        # Read the anomaly signal flag (cleared below once emitted) and
+        # surface recent critical anomalies
+        anomaly_alert = consume_anomaly_flag("", consume=False)
+        critical_summary = check_recent_critical_anomalies()
+        events_text = _format_recent_events()
+
+        # Fit the tail blocks into whatever budget the provider left over
+        metadata = context_payload.get("metadata", {})
+        kept, budget_report = pack_tail_blocks(
+            {
+                "pending_updates_warning": ("reminder", pending_warning),
+                "context_update_reminder": ("reminder", update_reminder),
+                "anomaly_alert": ("anomaly", anomaly_alert),
+                "critical_anomalies": ("anomaly", critical_summary),
+                "recent_events": ("events", events_text),
+            },
+            metadata.get("context_budget") or {},
+        )
+        if budget_report:
+            metadata["context_budget"] = budget_report
+        pending_warning = kept["pending_updates_warning"]
+        update_reminder = kept["context_update_reminder"]
+
         # Build context sections from payload
         project_knowledge = context_payload.get("project_knowledge", {})
         write_perms = context_payload.get("write_permissions", {})
         investigation_brief = context_payload.get("investigation_brief", {})
         rules = context_payload.get("rules", {})
         surface_routing_data = context_payload.get("surface_routing", {})
-        metadata = context_payload.get("metadata", {})
         historical = context_payload.get("historical_context", {})
 
         # Extract memory_index from historical before JSON rendering to avoid duplication
@@ -510,30 +637,10 @@ def build_project_context(
 {write_perms_mkv}
 {memory_index_section}{pending_warning}{update_reminder}{metadata_section}{historical_section}"""
 
-        # Append anomaly signal flag (consume once)
-        context_string = consume_anomaly_flag(context_string)
-
-        # Surface recent critical anomalies from the JSONL log
-        critical_summary = check_recent_critical_anomalies()
-        if critical_summary:
-            context_string += critical_summary
-
-        # Inject recent operational events (non-blocking)
-        try:
-            from ..events.event_writer import read_events
-            recent = read_events(hours=24, limit=20)
-            if recent:
-                lines = ["\n# Recent Events (last 24h)"]
-                for evt in recent:
-                    ts_short = evt.get("ts", "")[:16]
-                    etype = evt.get("type", "")
-                    agent_name = evt.get("agent", "")
-                    result_str = evt.get("result", "")
-                    label = f"{agent_name}: " if agent_name else ""
-                    lines.append(f"- [{ts_short}] {etype}: {label}{result_str}")
-                context_string += "\n".join(lines) + "\n"
-        except Exception as exc:
-            logger.debug("Event context injection failed (non-fatal): %s", exc)
+        # Append anomaly alert, critical anomaly summary and recent events
+        context_string += kept["anomaly_alert"] + kept["critical_anomalies"] + kept["recent_events"]
+        if kept["anomaly_alert"]:
+            clear_anomaly_flag()
 
         # Build telemetry snapshot
         telemetry = build_context_telemetry_snapshot(context_payload)
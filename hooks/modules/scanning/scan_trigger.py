@@ -7,6 +7,11 @@ project-context.json without significant startup delay (<3s target).
 Uses the scan engine directly (in-process) — no dependency on bin/gaia-scan.py.
 Works in both npm and plugin mode since tools/scan/ is always available.
 
+The default tools+environment subset never walks the project tree. When
+tree scanners (stack, infrastructure, orchestration) are requested, the
+orchestrator's incremental mode reuses their results from the scan
+manifest unless their inputs changed (tools/scan/manifest.py).
+
 Public API:
     - trigger_lightweight_scan(project_root: Path, scanners: list) -> bool
 """
@@ -1,50 +1,82 @@
 """
 Session Registry — track active Claude sessions by CLAUDE_SESSION_ID.
 
-Provides a user-scoped JSON registry at ~/.claude/session_registry.json
-that records which sessions are currently alive. This is the base
-infrastructure for liveness filters (T12/T13).
+Provides a user-scoped registry under ~/.claude/ that records which
+sessions are currently alive. This is the base infrastructure for
+liveness filters (T12/T13).
 
 Storage format:
-    {
-        "sessions": {
-            "<session_id>": {
-                "pid": <int or null>,
-                "pid_create_time": <float or null>,
-                "started_at": "<ISO-8601 string or null>"
-            }
+    One file per session in ~/.claude/session_registry.d/:
+
+        <session_id>.json
+        {
+            "session_id": "<session_id>",
+            "pid": <int or null>,
+            "pid_create_time": <float or null>,
+            "started_at": "<ISO-8601 string or null>"
         }
-    }
 
     pid_create_time is the process creation time (from /proc/<pid>/stat
     field 22 on Linux) used to disambiguate recycled PIDs during liveness
     checks. When the OS reuses a PID for a different process, the create
     time will differ and the session is treated as dead.
 
+    The legacy single-file registry (~/.claude/session_registry.json,
+    ``{"sessions": {...}}``) is still read; compact_registry() -- run by the
+    SessionStart hook -- moves its entries into shards and removes it.
+
 Concurrency:
-    All writes are atomic via os.rename() after writing to a .tmp file.
-    Reads are best-effort; a corrupt or absent file returns an empty set.
+    Each session only ever writes its own shard (tmp file + os.replace),
+    so concurrent sessions never contend and no update is lost. The legacy
+    file is shared, so its read-modify-write (unregister, compaction) runs
+    under an exclusive flock on session_registry.lock. Reads are
+    best-effort; a corrupt shard is skipped, a corrupt legacy file is
+    treated as empty.
+
+Liveness cost:
+    get_live_sessions() caches its answer in session_registry.live.json,
+    valid for _LIVE_SNAPSHOT_TTL_S while no shard was added or removed
+    (directory mtime unchanged). Per-pid /proc probes are memoised
+    in-process for _LIVENESS_TTL_S. Dead shards found by a full scan are
+    removed in one batch.
 
 Public API:
     register_session(session_id, pid=None, started_at=None) -> None
     unregister_session(session_id) -> None
     is_session_alive(session_id) -> bool
     get_live_sessions() -> set[str]
+    compact_registry() -> int
     get_pid_create_time(pid) -> Optional[float]
 
 Errors:
     SessionRegistryError — raised for expected failure modes (e.g., bad path).
 """
 
+import fcntl
+import hashlib
 import json
 import logging
 import os
+import re
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# How long a get_live_sessions() snapshot stays valid when no shard changed.
+_LIVE_SNAPSHOT_TTL_S = 5.0
+
+# How long an in-process /proc liveness probe is reused.
+_LIVENESS_TTL_S = 2.0
+
+_SAFE_SESSION_ID = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9._-]{0,127}")
+
+# (pid, pid_create_time) -> (checked_at, alive)
+_liveness_cache: Dict[Tuple[int, Optional[float]], Tuple[float, bool]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Public exception
@@ -59,7 +91,10 @@ class SessionRegistryError(Exception):
 # ---------------------------------------------------------------------------
 
 def _get_registry_path() -> Path:
-    """Return the path to session_registry.json under ~/.claude/.
+    """Return the path to the legacy session_registry.json under ~/.claude/.
+
+    The shard directory and the live snapshot are derived from it, so
+    redirecting this path (tests) relocates the whole registry.
 
     Returns:
         Path to ~/.claude/session_registry.json
@@ -67,6 +102,54 @@ def _get_registry_path() -> Path:
     return Path.home() / ".claude" / "session_registry.json"
 
 
+def _get_shard_dir() -> Path:
+    """Return the per-session shard directory (session_registry.d/)."""
+    path = _get_registry_path()
+    return path.with_name(f"{path.stem}.d")
+
+
+def _get_snapshot_path() -> Path:
+    """Return the cached get_live_sessions() snapshot (session_registry.live.json)."""
+    path = _get_registry_path()
+    return path.with_name(f"{path.stem}.live.json")
+
+
+@contextmanager
+def _registry_lock() -> Iterator[None]:
+    """Hold the exclusive lock guarding legacy-file rewrites.
+
+    Raises:
+        SessionRegistryError: If the lock file cannot be opened.
+    """
+    lock_path = _get_registry_path().with_suffix(".lock")
+    try:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(lock_path, "w")
+    except OSError as exc:
+        raise SessionRegistryError(
+            f"session_registry: cannot open lock {lock_path}: {exc}"
+        ) from exc
+    with lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _shard_path(session_id: str) -> Path:
+    """Return the shard file for session_id.
+
+    Ids that are not plain filenames (path separators, leading dot, very
+    long) are hashed; the real id is always stored inside the shard.
+    """
+    if _SAFE_SESSION_ID.fullmatch(session_id):
+        name = session_id
+    else:
+        name = "%" + hashlib.sha1(session_id.encode("utf-8")).hexdigest()
+    return _get_shard_dir() / f"{name}.json"
+
+
 # ---------------------------------------------------------------------------
 # Low-level I/O helpers
 # ---------------------------------------------------------------------------
@@ -137,6 +220,84 @@ def _save_registry(data: dict) -> None:
         ) from exc
 
 
+def _atomic_write_json(path: Path, data: dict) -> None:
+    """Write JSON to path via a unique sibling tmp file and os.replace.
+
+    Raises:
+        SessionRegistryError: If the directory cannot be created or the
+            write/rename fails.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise SessionRegistryError(
+            f"session_registry: cannot create directory {path.parent}: {exc}"
+        ) from exc
+
+    tmp_path = path.with_name(f".{path.name}.tmp.{os.getpid()}.{os.urandom(4).hex()}")
+    try:
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(str(tmp_path), str(path))
+    except OSError as exc:
+        try:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        except OSError:
+            pass
+        raise SessionRegistryError(
+            f"session_registry: write failed for {path}: {exc}"
+        ) from exc
+
+
+def _read_shard(path: Path) -> Optional[dict]:
+    """Return a shard's entry, or None when it vanished or is corrupt."""
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("session_registry: skipping corrupt shard %s (%s)", path, exc)
+        return None
+    if not isinstance(entry, dict) or not entry.get("session_id"):
+        logger.warning("session_registry: skipping malformed shard %s", path)
+        return None
+    return entry
+
+
+def _load_sessions() -> Dict[str, dict]:
+    """Return {session_id: entry} from the legacy file and every shard.
+
+    A shard wins over a legacy entry for the same session.
+    """
+    sessions: Dict[str, dict] = {}
+    legacy = _get_registry_path()
+    if legacy.exists():
+        for session_id, entry in _load_registry()["sessions"].items():
+            if isinstance(entry, dict):
+                sessions[session_id] = entry
+    try:
+        shard_files = [p for p in _get_shard_dir().iterdir()
+                       if p.suffix == ".json" and not p.name.startswith(".")]
+    except OSError:
+        shard_files = []
+    for shard in shard_files:
+        entry = _read_shard(shard)
+        if entry is not None:
+            sessions[entry["session_id"]] = entry
+    return sessions
+
+
+def _registry_stamp() -> list:
+    """mtimes that change whenever a session is added or removed."""
+    stamp = []
+    for path in (_get_shard_dir(), _get_registry_path()):
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
 # ---------------------------------------------------------------------------
 # PID liveness helpers
 # ---------------------------------------------------------------------------
@@ -197,13 +358,21 @@ def _is_pid_alive(pid: Optional[int], pid_create_time: Optional[float]) -> bool:
     """
     if pid is None:
         return True
+    key = (pid, pid_create_time)
+    now = time.monotonic()
+    cached = _liveness_cache.get(key)
+    if cached is not None and now - cached[0] < _LIVENESS_TTL_S:
+        return cached[1]
     current = get_pid_create_time(pid)
     if current is None:
-        return False
-    if pid_create_time is None:
+        alive = False
+    elif pid_create_time is None:
         # Legacy entry without create time — trust the pid lookup.
-        return True
-    return current == pid_create_time
+        alive = True
+    else:
+        alive = current == pid_create_time
+    _liveness_cache[key] = (now, alive)
+    return alive
 
 
 # ---------------------------------------------------------------------------
@@ -217,7 +386,7 @@ def register_session(
 ) -> None:
     """Register a session as active in the user-scoped registry.
 
-    Creates or updates the entry for session_id. If started_at is not
+    Creates or replaces the shard for session_id. If started_at is not
     provided, the current UTC time in ISO-8601 format is used. When pid
     is provided the process create time is captured alongside so that
     later liveness checks can detect PID recycling.
@@ -243,13 +412,12 @@ def register_session(
     if pid is not None:
         pid_create_time = get_pid_create_time(pid)
 
-    data = _load_registry()
-    data["sessions"][session_id] = {
+    _atomic_write_json(_shard_path(session_id), {
+        "session_id": session_id,
         "pid": pid,
         "pid_create_time": pid_create_time,
         "started_at": started_at,
-    }
-    _save_registry(data)
+    })
     logger.debug(
         "session_registry: registered session=%s pid=%s create_time=%s",
         session_id,
@@ -276,16 +444,32 @@ def unregister_session(session_id: str) -> None:
         logger.warning("unregister_session: called with empty session_id — no-op")
         return
 
-    data = _load_registry()
-    if session_id not in data["sessions"]:
+    removed = False
+    try:
+        _shard_path(session_id).unlink()
+        removed = True
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        raise SessionRegistryError(
+            f"session_registry: cannot remove shard for {session_id}: {exc}"
+        ) from exc
+
+    # Entries written before sharding live in the legacy file.
+    if _get_registry_path().exists():
+        with _registry_lock():
+            data = _load_registry()
+            if session_id in data["sessions"]:
+                del data["sessions"][session_id]
+                _save_registry(data)
+                removed = True
+
+    if not removed:
         logger.debug(
             "session_registry: unregister called for unknown session=%s (no-op)",
             session_id,
         )
         return
-
-    del data["sessions"][session_id]
-    _save_registry(data)
     logger.debug("session_registry: unregistered session=%s", session_id)
 
 
@@ -305,8 +489,11 @@ def is_session_alive(session_id: str) -> bool:
     """
     if not session_id:
         return False
-    data = _load_registry()
-    return session_id in data["sessions"]
+    if _shard_path(session_id).exists():
+        return True
+    if not _get_registry_path().exists():
+        return False
+    return session_id in _load_registry()["sessions"]
 
 
 def get_live_sessions() -> set:
@@ -317,17 +504,99 @@ def get_live_sessions() -> set:
     recycling — OS reusing a PID for a different process — is detected
     by comparing the recorded create time with the current one.
 
+    The answer is served from the live snapshot while it is younger than
+    _LIVE_SNAPSHOT_TTL_S and no session was added or removed since. A
+    full scan removes the dead shards it finds in one batch.
+
     Returns:
         set[str] of session IDs considered live. Empty set when the
         registry is absent or corrupt (after logging a warning).
     """
-    data = _load_registry()
+    stamp = _registry_stamp()
+    snapshot_path = _get_snapshot_path()
+    try:
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+        if (
+            snapshot.get("stamp") == stamp
+            and 0 <= time.time() - snapshot.get("at", 0) < _LIVE_SNAPSHOT_TTL_S
+        ):
+            return set(snapshot["live"])
+    except Exception:
+        pass
+
     live: set = set()
-    for session_id, entry in data["sessions"].items():
-        if not isinstance(entry, dict):
-            continue
-        pid = entry.get("pid")
-        pid_create_time = entry.get("pid_create_time")
-        if _is_pid_alive(pid, pid_create_time):
+    dead: Dict[str, dict] = {}
+    for session_id, entry in _load_sessions().items():
+        if _is_pid_alive(entry.get("pid"), entry.get("pid_create_time")):
             live.add(session_id)
+        else:
+            dead[session_id] = entry
+
+    if dead:
+        _remove_dead(dead)
+        stamp = _registry_stamp()
+    try:
+        _atomic_write_json(snapshot_path, {"at": time.time(), "stamp": stamp, "live": sorted(live)})
+    except SessionRegistryError as exc:
+        logger.debug("session_registry: live snapshot not written: %s", exc)
     return live
+
+
+def _remove_dead(dead: Dict[str, dict]) -> int:
+    """Delete the shards of dead sessions in one pass; return how many went.
+
+    A shard is re-read before removal and kept if it changed since the
+    liveness scan (the session re-registered in between).
+    """
+    removed = 0
+    for session_id, entry in dead.items():
+        path = _shard_path(session_id)
+        current = _read_shard(path)
+        if current is None or current != entry:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    if removed:
+        logger.debug("session_registry: compacted %d dead session(s)", removed)
+    return removed
+
+
+def compact_registry() -> int:
+    """Move legacy entries into shards and remove every dead session.
+
+    Returns:
+        Number of dead sessions removed.
+
+    Raises:
+        SessionRegistryError: If writing a migrated shard fails.
+    """
+    legacy = _get_registry_path()
+    if legacy.exists():
+        with _registry_lock():
+            for session_id, entry in _load_registry()["sessions"].items():
+                if not isinstance(entry, dict) or _shard_path(session_id).exists():
+                    continue
+                _atomic_write_json(_shard_path(session_id), {
+                    "session_id": session_id,
+                    "pid": entry.get("pid"),
+                    "pid_create_time": entry.get("pid_create_time"),
+                    "started_at": entry.get("started_at"),
+                })
+            try:
+                legacy.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                raise SessionRegistryError(
+                    f"session_registry: cannot remove legacy registry {legacy}: {exc}"
+                ) from exc
+
+    dead = {
+        session_id: entry
+        for session_id, entry in _load_sessions().items()
+        if not _is_pid_alive(entry.get("pid"), entry.get("pid_create_time"))
+    }
+    return _remove_dead(dead)
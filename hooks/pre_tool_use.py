@@ -353,59 +353,66 @@ def _run_tests():
 # STDIN HANDLER (Claude Code integration)
 # ============================================================================
 
+def handle_stdin(stdin_data: str) -> int:
+    """Process one PreToolUse payload; print the hook output and return the exit code.
+
+    Shared by the script entry point and the simulator's in-process replay
+    (tools/gaia_simulator/runner.py), so both render the same output.
+    """
+    try:
+        adapter = ClaudeCodeAdapter()
+        warn_if_dual_channel()
+
+        try:
+            event = adapter.parse_event(stdin_data)
+        except ValueError as e:
+            error_msg = str(e)
+            logger.error(f"Adapter parse failed: {error_msg}")
+            print(f"HOOK ERROR: {error_msg}", file=sys.stderr)
+            if "Empty stdin" in error_msg:
+                print(f"Error: {error_msg}")
+            return 1
+
+        response = adapter.adapt_pre_tool_use(event)
+
+        if isinstance(response.output, dict) and response.output:
+            hook_output = response.output.get("hookSpecificOutput", {})
+            decision = hook_output.get("permissionDecision")
+            if decision in ("block", "deny"):
+                reason = hook_output.get("permissionDecisionReason", "Command blocked by hook policy")
+                summary = reason.split('\n')[0]
+                print(f"BLOCKED: {summary}", file=sys.stderr)
+            elif decision == "ask":
+                reason = hook_output.get("permissionDecisionReason", "")
+                summary = reason.split('\n')[0]
+                print(f"T3: {summary}", file=sys.stderr)
+            print(json.dumps(response.output))
+            return response.exit_code
+        elif isinstance(response.output, str) and response.output:
+            summary = response.output.split('\n')[0]
+            print(f"BLOCKED: {summary}", file=sys.stderr)
+            print(response.output)
+            return response.exit_code
+        else:
+            return 0
+
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON from stdin: {e}")
+        print(f"HOOK ERROR: Invalid JSON from stdin: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        logger.error(f"Error processing hook: {e}", exc_info=True)
+        print(f"HOOK ERROR: {str(e)}", file=sys.stderr)
+        print(f"Hook error: {str(e)}")
+        return 1
+
+
 if __name__ == "__main__":
     # Check if running from CLI with arguments
     if len(sys.argv) > 1:
         main()
     elif has_stdin_data():
-        try:
-            adapter = ClaudeCodeAdapter()
-            warn_if_dual_channel()
-
-            stdin_data = sys.stdin.read()
-
-            try:
-                event = adapter.parse_event(stdin_data)
-            except ValueError as e:
-                error_msg = str(e)
-                logger.error(f"Adapter parse failed: {error_msg}")
-                print(f"HOOK ERROR: {error_msg}", file=sys.stderr)
-                if "Empty stdin" in error_msg:
-                    print(f"Error: {error_msg}")
-                sys.exit(1)
-
-            response = adapter.adapt_pre_tool_use(event)
-
-            if isinstance(response.output, dict) and response.output:
-                hook_output = response.output.get("hookSpecificOutput", {})
-                decision = hook_output.get("permissionDecision")
-                if decision in ("block", "deny"):
-                    reason = hook_output.get("permissionDecisionReason", "Command blocked by hook policy")
-                    summary = reason.split('\n')[0]
-                    print(f"BLOCKED: {summary}", file=sys.stderr)
-                elif decision == "ask":
-                    reason = hook_output.get("permissionDecisionReason", "")
-                    summary = reason.split('\n')[0]
-                    print(f"T3: {summary}", file=sys.stderr)
-                print(json.dumps(response.output))
-                sys.exit(response.exit_code)
-            elif isinstance(response.output, str) and response.output:
-                summary = response.output.split('\n')[0]
-                print(f"BLOCKED: {summary}", file=sys.stderr)
-                print(response.output)
-                sys.exit(response.exit_code)
-            else:
-                sys.exit(0)
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON from stdin: {e}")
-            print(f"HOOK ERROR: Invalid JSON from stdin: {e}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            logger.error(f"Error processing hook: {e}", exc_info=True)
-            print(f"HOOK ERROR: {str(e)}", file=sys.stderr)
-            print(f"Hook error: {str(e)}")
-            sys.exit(1)
+        sys.exit(handle_stdin(sys.stdin.read()))
     else:
         print("Usage: python pre_tool_use.py <command>")
         print("       python pre_tool_use.py --test")
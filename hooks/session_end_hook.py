@@ -4,12 +4,14 @@ SessionEnd hook for Claude Code Agent System.
 
 Fires when a Claude Code session terminates. Unregisters the session from
 the user-scoped session registry so that T12/T13 liveness filters stop
-considering it live.
+considering it live, then mirrors the session's new events.jsonl records
+into the ``harness_events`` table (gaia.store.ingest).
 
 Architecture:
 - Reads SessionEnd event via the shared run_hook() entrypoint
 - Reads CLAUDE_SESSION_ID from environment
 - Calls session_registry.unregister_session() guarded by SessionRegistryError
+- Ingests events.jsonl from the persisted cursor (only the new tail)
 - Failures are non-fatal: a missing registry entry must never block shutdown
 - Returns an empty JSON response and exits 0
 """
@@ -24,7 +26,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from modules.core.hook_entry import run_hook
-from modules.core.paths import get_logs_dir
+from modules.core.paths import get_events_dir, get_logs_dir
 from modules.session.session_registry import unregister_session, SessionRegistryError
 
 # Configure logging — file only
@@ -37,6 +39,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _ingest_events() -> None:
+    """Mirror new events.jsonl records into harness_events. Non-fatal.
+
+    events.jsonl is shared across workspaces, so rows take the workspace the
+    record names (or NULL) rather than this session's.
+    """
+    try:
+        from gaia.store.ingest import ingest_events
+
+        summary = ingest_events(get_events_dir() / "events.jsonl")
+        logger.info(
+            "SessionEnd: ingested %d events (%d duplicates)",
+            summary["inserted"], summary["duplicates"],
+        )
+    except Exception as exc:
+        logger.debug("harness_events ingest failed (non-fatal): %s", exc)
+
+
 def _handle_session_end(event) -> None:
     """Process a SessionEnd event.
 
@@ -55,6 +75,8 @@ def _handle_session_end(event) -> None:
     except SessionRegistryError as _reg_exc:
         logger.debug("session_registry unregister failed (non-fatal): %s", _reg_exc)
 
+    _ingest_events()
+
     print(json.dumps({}))
     sys.exit(0)
 
@@ -16,7 +16,7 @@ from modules.core.stdin import has_stdin_data
 from modules.core.paths import get_logs_dir
 from modules.core.plugin_mode import is_ops_mode
 from modules.core.plugin_setup import run_first_time_setup
-from modules.session.session_registry import register_session, SessionRegistryError
+from modules.session.session_registry import compact_registry, register_session, SessionRegistryError
 
 # Configure logging — file only
 _log_file = get_logs_dir() / f"hooks-{datetime.now().strftime('%Y-%m-%d')}.log"
@@ -45,6 +45,15 @@ if __name__ == "__main__":
         except SessionRegistryError as _reg_exc:
             logger.warning("session_registry register failed (non-fatal): %s", _reg_exc)
 
+        # Migrate the legacy registry file and drop shards of dead sessions
+        # once per session, so the registry does not grow without bound.
+        try:
+            _removed = compact_registry()
+            if _removed:
+                logger.info("session_registry: removed %d dead session(s)", _removed)
+        except SessionRegistryError as _reg_exc:
+            logger.warning("session_registry compact failed (non-fatal): %s", _reg_exc)
+
         # First-time setup: create project permissions if needed.
         # mark_done=False so UserPromptSubmit can detect first-run
         # and show the welcome message before marking initialized.
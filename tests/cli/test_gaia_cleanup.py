@@ -8,9 +8,11 @@ real installation files.
 import json
 import os
 import sys
+import threading
 import time
 import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -19,10 +21,13 @@ _BIN_DIR = Path(__file__).resolve().parents[2] / "bin"
 if str(_BIN_DIR) not in sys.path:
     sys.path.insert(0, str(_BIN_DIR))
 
+import cli.cleanup as cleanup_mod
 from cli.cleanup import (
     _find_project_root,
     _matches_pattern,
     _apply_retention_policy,
+    _jsonl_lock,
+    _truncate_jsonl,
     _remove_claude_md,
     _remove_settings_json,
     _remove_symlinks,
@@ -236,7 +241,8 @@ class TestApplyRetentionPolicy(unittest.TestCase):
             metrics_file = wem_dir / "metrics.jsonl"
             # One old entry, one recent
             old_entry = json.dumps({"timestamp": "2020-01-01T00:00:00Z", "data": "old"})
-            new_entry = json.dumps({"timestamp": "2026-04-15T00:00:00Z", "data": "new"})
+            recent = datetime.now(timezone.utc) - timedelta(days=1)
+            new_entry = json.dumps({"timestamp": recent.isoformat(), "data": "new"})
             metrics_file.write_text(f"{old_entry}\n{new_entry}\n")
 
             actions = _apply_retention_policy(root, dry_run=False)
@@ -248,6 +254,109 @@ class TestApplyRetentionPolicy(unittest.TestCase):
             self.assertNotIn("old", remaining)
 
 
+class TestStreamingTruncate(unittest.TestCase):
+    """_truncate_jsonl: binary-searched cut, atomic tail copy, writers' lock."""
+
+    REL = ".claude/project-context/workflow-episodic-memory/metrics.jsonl"
+
+    def _write(self, root: Path, days_ago: list, junk_at: int = None) -> Path:
+        path = root / self.REL
+        path.parent.mkdir(parents=True, exist_ok=True)
+        now = datetime.now(timezone.utc)
+        lines = []
+        for i, days in enumerate(days_ago):
+            if i == junk_at:
+                lines.append("not json")
+            ts = (now - timedelta(days=days)).isoformat()
+            lines.append(json.dumps({"timestamp": ts, "i": i}))
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def _indexes(self, path: Path) -> list:
+        return [json.loads(l)["i"] for l in path.read_text().splitlines() if l.startswith("{")]
+
+    def test_keeps_tail_verbatim_and_replaces_atomically(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = self._write(root, [200, 150, 120, 91, 89, 30, 1, 0], junk_at=6)
+            inode = path.stat().st_ino
+            tail = path.read_text().split("\n", 4)[4]
+
+            actions = _truncate_jsonl(root, self.REL, 90, "Workflow metrics", dry_run=False)
+
+            self.assertEqual(actions[0]["removed"], 4)
+            self.assertEqual(path.read_text(), tail)
+            self.assertIn("not json", path.read_text())
+            self.assertNotEqual(path.stat().st_ino, inode)
+            self.assertEqual([p.name for p in path.parent.iterdir() if p.suffix == ".tmp"], [])
+
+    def test_cut_matches_full_scan_for_every_boundary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            ages = [120 - i for i in range(60)]  # 120 .. 61 days, oldest first
+            for max_days in (130, 119, 100, 90, 75, 61, 50):
+                path = self._write(root, ages)
+                _truncate_jsonl(root, self.REL, max_days, "Workflow metrics", dry_run=False)
+                self.assertEqual(self._indexes(path), [i for i, d in enumerate(ages) if d < max_days])
+
+    def test_probes_logarithmically_many_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._write(root, [199.99 - i * 0.02 for i in range(5000)])
+            calls = []
+            real = cleanup_mod._line_timestamp
+
+            def counting(line, key="timestamp"):
+                calls.append(1)
+                return real(line, key)
+
+            with patch.object(cleanup_mod, "_line_timestamp", counting):
+                actions = _truncate_jsonl(root, self.REL, 150, "Workflow metrics", dry_run=False)
+
+            self.assertEqual(actions[0]["removed"], 2500)
+            self.assertLess(len(calls), 100)
+
+    def test_nothing_to_remove_leaves_file_untouched(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = self._write(root, [10, 5, 0])
+            inode = path.stat().st_ino
+
+            self.assertEqual(_truncate_jsonl(root, self.REL, 90, "Workflow metrics", dry_run=False), [])
+            self.assertEqual(path.stat().st_ino, inode)
+
+    def test_dry_run_reports_without_writing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = self._write(root, [100, 95, 1])
+            before = path.read_text()
+
+            actions = _truncate_jsonl(root, self.REL, 90, "Workflow metrics", dry_run=True)
+
+            self.assertEqual(actions[0]["removed"], 2)
+            self.assertEqual(path.read_text(), before)
+
+    def test_waits_for_writer_lock(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = self._write(root, [100, 1])
+            done = threading.Event()
+
+            with _jsonl_lock(path):
+                worker = threading.Thread(
+                    target=lambda: (_truncate_jsonl(root, self.REL, 90, "m", dry_run=False), done.set())
+                )
+                worker.start()
+                self.assertFalse(done.wait(0.2))
+                # A writer appending under the lock lands in the surviving file.
+                with open(path, "a") as f:
+                    f.write(json.dumps({"timestamp": datetime.now(timezone.utc).isoformat(), "i": 99}) + "\n")
+            worker.join(5)
+
+            self.assertTrue(done.is_set())
+            self.assertEqual(self._indexes(path), [1, 99])
+
+
 class TestRegisterSubcommand(unittest.TestCase):
     def test_register_creates_parser(self):
         import argparse
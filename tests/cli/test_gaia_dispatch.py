@@ -0,0 +1,123 @@
+"""
+Tests for bin/gaia -- lazy subcommand registration via bin/cli/manifest.json.
+
+Verifies:
+  - the committed manifest matches what the plugins' register() declare
+  - `gaia --help` imports no plugin; `gaia <sub>` imports only <sub>
+  - --help output is identical with and without the manifest
+  - plugins missing from the manifest are still loaded, and a missing or
+    stale manifest falls back to eager discovery
+"""
+
+import importlib.machinery
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GAIA_BIN = REPO_ROOT / "bin" / "gaia"
+
+
+def _load_gaia():
+    loader = importlib.machinery.SourceFileLoader("gaia_cli_entry", str(GAIA_BIN))
+    spec = importlib.util.spec_from_loader("gaia_cli_entry", loader)
+    mod = importlib.util.module_from_spec(spec)
+    loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture()
+def gaia(monkeypatch):
+    monkeypatch.delenv("GAIA_CLI_EAGER", raising=False)
+    mod = _load_gaia()
+    loaded = []
+    real = mod._load_plugin
+
+    def tracking(path):
+        loaded.append(path.stem)
+        return real(path)
+
+    monkeypatch.setattr(mod, "_load_plugin", tracking)
+    mod.loaded = loaded
+    return mod
+
+
+def _help(gaia, capsys) -> str:
+    with pytest.raises(SystemExit):
+        gaia.main(["--help"])
+    return capsys.readouterr().out
+
+
+def test_manifest_is_up_to_date(gaia):
+    committed = json.loads(gaia._MANIFEST_PATH.read_text())
+
+    assert committed == gaia._build_manifest(), "regenerate with: python bin/gaia --write-manifest"
+
+
+def test_help_imports_no_plugin(gaia, capsys):
+    out = _help(gaia, capsys)
+
+    assert gaia.loaded == []
+    assert "status" in out and "Run Gaia-Ops health checks" in out
+
+
+def test_subcommand_imports_only_its_module(gaia, capsys):
+    assert gaia.main(["paths"]) == 0
+
+    assert gaia.loaded == ["paths"]
+    assert "cache=" in capsys.readouterr().out
+
+
+def test_help_matches_eager_registration(gaia, capsys, monkeypatch):
+    lazy = _help(gaia, capsys)
+    monkeypatch.setenv("GAIA_CLI_EAGER", "1")
+
+    assert _help(gaia, capsys) == lazy
+
+
+def test_unknown_subcommand_still_rejected(gaia, capsys):
+    with pytest.raises(SystemExit) as exc:
+        gaia.main(["nope"])
+
+    assert exc.value.code == 2
+    assert "invalid choice" in capsys.readouterr().err
+
+
+def _fake_cli(gaia, monkeypatch, tmp_path, manifest=None) -> Path:
+    cli_dir = tmp_path / "cli"
+    cli_dir.mkdir()
+    for name in ("alpha", "beta"):
+        (cli_dir / f"{name}.py").write_text(
+            "def register(subparsers):\n"
+            f"    subparsers.add_parser('{name}', help='{name} help')\n\n\n"
+            f"def cmd_{name}(args):\n"
+            f"    print('ran {name}')\n"
+            "    return 0\n"
+        )
+    (cli_dir / "_helper.py").write_text("raise RuntimeError('helpers are not plugins')\n")
+    monkeypatch.setattr(gaia, "_CLI_DIR", cli_dir)
+    monkeypatch.setattr(gaia, "_MANIFEST_PATH", cli_dir / "manifest.json")
+    if manifest is not None:
+        (cli_dir / "manifest.json").write_text(json.dumps(manifest))
+    return cli_dir
+
+
+def test_unlisted_plugin_is_loaded_eagerly(gaia, monkeypatch, tmp_path, capsys):
+    _fake_cli(gaia, monkeypatch, tmp_path, {
+        "version": 1,
+        "subcommands": [{"name": "alpha", "module": "alpha", "help": "alpha help"}],
+    })
+
+    assert gaia.main(["beta"]) == 0
+    assert "ran beta" in capsys.readouterr().out
+    assert gaia.loaded == ["beta"]
+
+
+def test_missing_or_stale_manifest_falls_back_to_eager(gaia, monkeypatch, tmp_path, capsys):
+    _fake_cli(gaia, monkeypatch, tmp_path, {"version": 0, "subcommands": []})
+
+    assert gaia.main(["alpha"]) == 0
+    assert sorted(gaia.loaded) == ["_helper", "alpha", "beta"]
+    assert "could not load plugin _helper.py" in capsys.readouterr().err
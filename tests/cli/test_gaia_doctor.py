@@ -7,6 +7,8 @@ so each health check can be tested in isolation.
 
 import json
 import sys
+import threading
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -793,3 +795,124 @@ class TestCmdDoctorFix:
         fixes = data.get("fixes", [])
         assert len(fixes) == 1
         assert fixes[0]["status"] == "failed"
+
+
+# ---------------------------------------------------------------------------
+# Tests: concurrent runner, timing and --fast cache
+# ---------------------------------------------------------------------------
+
+class TestCheckRunner:
+    """Test the thread-pool runner and the --fast result cache."""
+
+    def _registry(self, monkeypatch, specs):
+        monkeypatch.setattr(doctor_mod, "_CHECKS", specs)
+
+    def test_results_keep_registry_order_and_timing(self, healthy_project, monkeypatch, capsys):
+        monkeypatch.chdir(healthy_project)
+        args = SimpleNamespace(json=True, fix=False, fast=False, subcommand="doctor")
+        doctor_mod.cmd_doctor(args)
+
+        data = json.loads(capsys.readouterr().out)
+        assert [c["name"] for c in data["checks"]] == [spec[1] for spec in doctor_mod._CHECKS]
+        assert all(c["duration_ms"] >= 0 for c in data["checks"])
+        assert data["duration_ms"] >= 0
+
+    def test_independent_checks_overlap(self, tmp_path, monkeypatch):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _meet(name):
+            def check():
+                barrier.wait()  # deadlocks (BrokenBarrierError) if run serially
+                return doctor_mod._result(name, "pass", "ok")
+            return check
+
+        self._registry(monkeypatch, [(10, "a", _meet("a"), (), None), (20, "b", _meet("b"), (), None)])
+        results = doctor_mod._run_checks(tmp_path)
+
+        assert [r["severity"] for r in results] == ["pass", "pass"]
+
+    def test_dependencies_finish_first(self, tmp_path, monkeypatch):
+        finished = []
+
+        def _check(name, delay=0.0):
+            def check():
+                time.sleep(delay)
+                finished.append(name)
+                return doctor_mod._result(name, "pass", "ok")
+            return check
+
+        self._registry(monkeypatch, [
+            (10, "slow", _check("slow", 0.05), (), None),
+            (20, "after", _check("after"), ("slow", "not-registered"), None),
+        ])
+        results = doctor_mod._run_checks(tmp_path)
+
+        assert finished == ["slow", "after"]
+        assert [r["name"] for r in results] == ["slow", "after"]
+
+    def test_check_exception_becomes_error(self, tmp_path, monkeypatch):
+        def boom():
+            raise RuntimeError("kaput")
+
+        self._registry(monkeypatch, [(10, "boom", boom, (), None)])
+        (result,) = doctor_mod._run_checks(tmp_path)
+
+        assert result["severity"] == "error"
+        assert "kaput" in result["detail"]
+
+    def test_fast_reuses_expensive_results_until_inputs_change(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GAIA_DOCTOR_CACHE", str(tmp_path / "cache.json"))
+        marker = tmp_path / "input.txt"
+        marker.write_text("v1")
+        calls = {"expensive": 0, "cheap": 0}
+
+        def expensive():
+            calls["expensive"] += 1
+            return doctor_mod._result("expensive", "pass", f"run {calls['expensive']}")
+
+        def cheap():
+            calls["cheap"] += 1
+            return doctor_mod._result("cheap", "pass", "ok")
+
+        self._registry(monkeypatch, [
+            (10, "expensive", expensive, (), lambda root: [marker]),
+            (20, "cheap", cheap, (), None),
+        ])
+
+        def run():
+            cache = doctor_mod._CheckCache(doctor_mod._cache_path())
+            results = doctor_mod._run_checks(tmp_path, cache)
+            cache.flush()
+            return results
+
+        first = run()
+        second = run()
+        marker.write_text("v2 -- size changes")
+        third = run()
+
+        assert calls == {"expensive": 2, "cheap": 3}
+        assert "cached" not in first[0]
+        assert second[0]["cached"] is True and second[0]["detail"] == "run 1"
+        assert third[0]["detail"] == "run 2"
+
+    def test_fast_entries_expire(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GAIA_DOCTOR_CACHE", str(tmp_path / "cache.json"))
+        cache = doctor_mod._CheckCache(doctor_mod._cache_path())
+        key = cache.key("x", tmp_path, [])
+        cache.put(key, doctor_mod._result("x", "pass", "ok"))
+
+        assert cache.get(key)["detail"] == "ok"
+        monkeypatch.setattr(doctor_mod.time, "time", lambda: 10**12)
+        assert cache.get(key) is None
+
+    def test_cache_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("GAIA_DOCTOR_CACHE", "off")
+        assert doctor_mod._cache_path() is None
+
+    def test_fast_flag_registered(self):
+        import argparse
+        parser = argparse.ArgumentParser()
+        subs = parser.add_subparsers(dest="subcommand")
+        doctor_mod.register(subs)
+
+        assert parser.parse_args(["doctor", "--fast"]).fast is True
@@ -373,5 +373,67 @@ class TestCmdHistory(unittest.TestCase):
             shutil.rmtree(root)
 
 
+class TestStreamingOutput(unittest.TestCase):
+    def _run(self, root: Path, **overrides):
+        import argparse
+        import io
+        from contextlib import redirect_stdout
+        ns = argparse.Namespace(today=False, blocked=False, agent=None, limit=20, json=False, format=None)
+        for k, v in overrides.items():
+            setattr(ns, k, v)
+        buf = io.StringIO()
+        with patch("cli.history._find_project_root", return_value=root), redirect_stdout(buf):
+            rc = cmd_history(ns)
+        self.assertEqual(rc, 0)
+        return buf.getvalue()
+
+    def _metrics_project(self, tmp: str, n: int) -> Path:
+        root = Path(tmp)
+        entries = [
+            {"agent": f"agent-{i % 3}", "timestamp": f"2026-04-{1 + i % 28:02d}T10:00:00Z",
+             "plan_status": "COMPLETE", "prompt": f"task {i}", "output_tokens_approx": i}
+            for i in range(n)
+        ]
+        _write_metrics_jsonl(root / ".claude", entries)
+        return root
+
+    def test_ndjson_newest_first_with_limit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = self._metrics_project(tmp, 50)
+            lines = self._run(root, format="ndjson", limit=5).splitlines()
+
+        stamps = [json.loads(line)["timestamp"] for line in lines]
+        self.assertEqual(len(stamps), 5)
+        self.assertEqual(stamps, sorted(stamps, reverse=True))
+        self.assertEqual(stamps[0], "2026-04-28T10:00:00Z")
+
+    def test_limit_zero_streams_all_in_recorded_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = self._metrics_project(tmp, 50)
+            lines = self._run(root, format="ndjson", limit=0, agent="agent-1").splitlines()
+
+        prompts = [json.loads(line)["prompt"] for line in lines]
+        self.assertEqual(prompts, [f"task {i}" for i in range(50) if i % 3 == 1])
+
+    def test_csv_header_and_rows(self):
+        import csv
+        with tempfile.TemporaryDirectory() as tmp:
+            root = self._metrics_project(tmp, 3)
+            out = self._run(root, format="csv")
+
+        rows = list(csv.DictReader(out.splitlines()))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(set(rows[0]), {"timestamp", "agent", "plan_status", "output_tokens_approx", "prompt"})
+
+    def test_json_format_matches_json_flag(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = self._metrics_project(tmp, 4)
+            via_format = self._run(root, format="json")
+            via_flag = self._run(root, json=True)
+
+        self.assertEqual(via_format, via_flag)
+        self.assertEqual(len(json.loads(via_flag)), 4)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@
 Root conftest.py - Shared test infrastructure for gaia-ops.
 
 Provides:
-- Custom markers: llm, e2e (auto-skipped in default test runs)
+- Custom markers: llm, e2e, perf (auto-skipped in default test runs)
 - Session fixtures: package_root, agents_dir, skills_dir, config_dir, hooks_dir
 - Frontmatter parser (manual, no PyYAML dependency)
 - Default plugin mode: ops (existing tests assume ops-mode blocking behavior)
@@ -21,6 +21,7 @@ def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "llm: LLM evaluation tests (require ANTHROPIC_API_KEY)")
     config.addinivalue_line("markers", "e2e: E2E headless tests (require claude CLI)")
+    config.addinivalue_line("markers", "perf: wall-clock timing assertions (noisy on shared runners)")
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -67,7 +68,7 @@ def _clear_plugin_mode_cache():
 
 
 def pytest_collection_modifyitems(config, items):
-    """Auto-skip llm and e2e tests unless explicitly requested via -m flag."""
+    """Auto-skip llm, e2e and perf tests unless explicitly requested via -m flag."""
     # If user explicitly passed -m, respect that
     markexpr = config.getoption("-m", default="")
     if markexpr:
@@ -75,12 +76,15 @@ def pytest_collection_modifyitems(config, items):
 
     skip_llm = pytest.mark.skip(reason="LLM tests skipped by default (use -m llm)")
     skip_e2e = pytest.mark.skip(reason="E2E tests skipped by default (use -m e2e)")
+    skip_perf = pytest.mark.skip(reason="Timing assertions skipped by default (use -m perf)")
 
     for item in items:
         if item.get_closest_marker("llm"):
             item.add_marker(skip_llm)
         if item.get_closest_marker("e2e"):
             item.add_marker(skip_e2e)
+        if item.get_closest_marker("perf"):
+            item.add_marker(skip_perf)
 
 
 # ============================================================================
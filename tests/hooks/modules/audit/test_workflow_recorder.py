@@ -6,8 +6,10 @@ Validates additive run telemetry, compact context snapshots, and runtime
 skill snapshot persistence.
 """
 
+import fcntl
 import json
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -15,7 +17,7 @@ import pytest
 HOOKS_DIR = Path(__file__).resolve().parents[4] / "hooks"
 sys.path.insert(0, str(HOOKS_DIR))
 
-from modules.audit.workflow_recorder import record, record_agent_skill_snapshot
+from modules.audit.workflow_recorder import _append_jsonl, record, record_agent_skill_snapshot
 from modules.context.context_injector import build_context_telemetry_snapshot
 from modules.core.paths import clear_path_cache
 
@@ -184,3 +186,19 @@ def test_record_agent_skill_snapshot_appends_runtime_defaults(tmp_path):
     assert len(skill_entries) == 1
     assert skill_entries[0]["session_id"] == "sess-skills-001"
     assert "agent-protocol" in skill_entries[0]["skills"]
+
+
+def test_append_jsonl_waits_for_retention_lock(tmp_path):
+    """Appends serialize with `gaia cleanup` retention on <name>.lock."""
+    path = tmp_path / "metrics.jsonl"
+    done = threading.Event()
+
+    with open(tmp_path / "metrics.jsonl.lock", "w") as lf:
+        fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+        writer = threading.Thread(target=lambda: (_append_jsonl(path, {"i": 1}), done.set()))
+        writer.start()
+        assert not done.wait(0.2)
+        fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+    writer.join(5)
+
+    assert _read_jsonl(path) == [{"i": 1}]
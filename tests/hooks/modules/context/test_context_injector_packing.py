@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for context_injector tail-block packing.
+
+Validates:
+1. Reminder/anomaly/event blocks are fitted into the provider's leftover budget
+2. Dropped tail blocks are merged into the provider's budget report
+3. Missing budget report (older provider) keeps every block
+4. Telemetry snapshot surfaces the budget report without re-measuring
+5. The packer sizes sections on the same YAML the injector renders
+"""
+
+import sys
+from pathlib import Path
+
+HOOKS_DIR = Path(__file__).resolve().parents[4] / "hooks"
+sys.path.insert(0, str(HOOKS_DIR))
+
+from modules.context.context_injector import (  # noqa: E402
+    _dict_to_yaml,
+    _load_context_packer,
+    build_context_telemetry_snapshot,
+    pack_tail_blocks,
+)
+
+
+def _tail():
+    return {
+        "pending_updates_warning": ("reminder", "p" * 200),  # 50 tokens
+        "anomaly_alert": ("anomaly", "a" * 200),              # 50 tokens
+        "recent_events": ("events", "e" * 200),               # 50 tokens
+    }
+
+
+def test_tail_blocks_packed_by_priority_into_remaining_budget():
+    provider_report = {"budget": 1000, "used": 900, "remaining": 100,
+                       "selected_count": 3, "dropped_count": 1,
+                       "dropped": [{"key": "stack", "kind": "section", "tokens": 500, "priority": 70}]}
+
+    kept, report = pack_tail_blocks(_tail(), provider_report)
+
+    assert kept["anomaly_alert"]
+    assert kept["pending_updates_warning"]
+    assert kept["recent_events"] == ""
+    assert report["used"] == 1000
+    assert report["remaining"] == 0
+    assert report["dropped_count"] == 2
+    assert [d["key"] for d in report["dropped"]] == ["stack", "recent_events"]
+
+
+def test_anomaly_blocks_survive_exhausted_budget():
+    provider_report = {"budget": 1000, "used": 1000, "remaining": 0}
+
+    kept, report = pack_tail_blocks(_tail(), provider_report)
+
+    assert kept["anomaly_alert"]
+    assert kept["pending_updates_warning"] == ""
+    assert kept["recent_events"] == ""
+    assert [d["key"] for d in report["dropped"]] == ["pending_updates_warning", "recent_events"]
+
+
+def test_missing_budget_report_keeps_all_blocks():
+    kept, report = pack_tail_blocks(_tail(), {})
+
+    assert all(kept.values())
+    assert report == {}
+
+
+def test_telemetry_includes_context_budget():
+    payload = {
+        "project_knowledge": {"stack": {}},
+        "metadata": {"context_budget": {
+            "budget": 8000, "used": 7000, "dropped_count": 1,
+            "dropped": [{"key": "ep-1", "kind": "episode", "tokens": 2000, "priority": 45}],
+        }},
+    }
+
+    snapshot = build_context_telemetry_snapshot(payload)
+
+    assert snapshot["context_budget"] == {
+        "budget": 8000, "used": 7000, "dropped_count": 1, "dropped_keys": ["ep-1"],
+    }
+
+
+def test_packer_yaml_matches_injector_rendering():
+    project_knowledge = {
+        "stack": {"languages": ["python", "go"], "empty": [], "version": None},
+        "services": [{"name": "api", "port": 8080, "tags": ["web"]}, {"name": "worker"}],
+        "region": "us-east1",
+    }
+
+    packer = _load_context_packer()
+
+    assert packer.render_yaml(project_knowledge) == _dict_to_yaml(project_knowledge)
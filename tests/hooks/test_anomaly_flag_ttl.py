@@ -19,7 +19,7 @@ import pytest
 HOOKS_DIR = Path(__file__).parent.parent.parent / "hooks"
 sys.path.insert(0, str(HOOKS_DIR))
 
-from modules.context.context_injector import consume_anomaly_flag
+from modules.context.context_injector import clear_anomaly_flag, consume_anomaly_flag
 
 
 # ============================================================================
@@ -126,6 +126,17 @@ class TestFreshFlagConsumed:
         assert "Short-lived signal" in result
         assert not flag_path.exists()
 
+    def test_peek_keeps_flag_until_cleared(self, tmp_path):
+        """consume=False reads the warning; clear_anomaly_flag() deletes it once emitted."""
+        flag_path = _write_flag(tmp_path, _fresh_flag())
+
+        result = consume_anomaly_flag("", consume=False)
+
+        assert "Anomaly Alert" in result
+        assert flag_path.exists()
+        clear_anomaly_flag()
+        assert not flag_path.exists()
+
 
 # ============================================================================
 # FLAG NOT CONSUMED WHEN EXPIRED
@@ -17,6 +17,8 @@ What this file asserts:
    must never fail loudly on a best-effort cleanup.
 4. It works across the three matcher variants Claude Code emits
    (``prompt_input_exit``, ``logout``, ``other``).
+5. It mirrors new events.jsonl records into ``harness_events`` without
+   duplicating rows on a second run.
 """
 
 import importlib
@@ -52,6 +54,16 @@ def isolated_registry(tmp_path, monkeypatch):
     return registry_file
 
 
+@pytest.fixture(autouse=True)
+def isolated_events(tmp_path, monkeypatch):
+    """Route events.jsonl and gaia.db into tmp_path (the hook ingests them)."""
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+    monkeypatch.setattr("modules.core.paths.get_events_dir", lambda: events_dir)
+    monkeypatch.setenv("GAIA_DATA_DIR", str(tmp_path / "gaia"))
+    return events_dir
+
+
 def _load_hook():
     """Import (or reload) the session_end_hook entry module.
 
@@ -183,3 +195,36 @@ class TestRobustness:
             with pytest.raises(SystemExit) as exc:
                 hook.main() if hasattr(hook, "main") else hook._run()
         assert exc.value.code == 0
+
+
+# ---------------------------------------------------------------------------
+# harness_events ingestion
+# ---------------------------------------------------------------------------
+
+class TestIngestsEvents:
+    def test_events_are_mirrored_once(self, isolated_registry, isolated_events, monkeypatch):
+        from gaia.paths import db_path
+        from gaia.store import connection as pool
+        from gaia.store.writer import _connect
+
+        (isolated_events / "events.jsonl").write_text(json.dumps({
+            "ts": "2026-05-07T10:00:00+00:00", "type": "session.end",
+            "source": "hook", "agent": "", "result": "ok", "severity": "info",
+        }) + "\n")
+        monkeypatch.delenv("CLAUDE_SESSION_ID", raising=False)
+
+        for _ in range(2):
+            _feed_stdin(monkeypatch, {"hook_event_name": "SessionEnd", "reason": "other"})
+            hook = _load_hook()
+            with redirect_stdout(io.StringIO()):
+                with pytest.raises(SystemExit):
+                    hook.main()
+
+        con = _connect(db_path())
+        try:
+            rows = con.execute("SELECT type, workspace FROM harness_events").fetchall()
+        finally:
+            con.close()
+            pool.close_all(db_path())
+        # The shared log says nothing about the workspace: NULL, not this session's.
+        assert [tuple(r) for r in rows] == [("session.end", None)]
@@ -13,6 +13,9 @@ Covers:
   * --command-like uses SQL LIKE against harness_events.result
   * --format=count emits a single integer
   * --since=<garbage> raises a clear error and exits non-zero
+  * --sync ingests new events.jsonl records before querying, idempotently
+  * --count / --group-by are exact over the window regardless of --last
+  * --format=ndjson / csv stream rows (--last=0 = whole window)
 """
 
 from __future__ import annotations
@@ -139,6 +142,7 @@ def _make_args(**overrides) -> argparse.Namespace:
         group_by=None,
         count=False,
         snippets=False,
+        sync=False,
     )
     base.update(overrides)
     return argparse.Namespace(**base)
@@ -312,6 +316,23 @@ def test_query_count_without_group_by_returns_total(tmp_db, tmp_path,
     assert out == [{"count": 3}]
 
 
+def test_query_count_is_not_capped_by_last(tmp_db, tmp_path, monkeypatch, capsys):
+    """--count / --group-by aggregate the whole window, not the --last rows."""
+    from cli.query import cmd_query
+
+    monkeypatch.chdir(tmp_path)
+    for i in range(5):
+        _seed_episode(tmp_db, f"ep_w{i}", agent="developer",
+                      timestamp=f"2026-05-0{i + 1}T00:00:00Z")
+
+    assert cmd_query(_make_args(surface="episodes", last=2, format="count")) == 0
+    assert capsys.readouterr().out.strip() == "5"
+
+    args = _make_args(surface="episodes", last=2, group_by="agent", format="json")
+    assert cmd_query(args) == 0
+    assert json.loads(capsys.readouterr().out) == [{"agent": "developer", "count": 5}]
+
+
 def test_query_group_by_day_truncates_timestamp(tmp_db, tmp_path,
                                                 monkeypatch, capsys):
     """--group-by=day buckets by YYYY-MM-DD prefix of timestamp."""
@@ -400,6 +421,57 @@ def test_query_group_by_agent_buckets(tmp_db, tmp_path, monkeypatch, capsys):
     assert by_agent == {"developer": 2, "orchestrator": 1}
 
 
+def test_query_sync_ingests_events_jsonl(tmp_db, tmp_path, monkeypatch, capsys):
+    """--sync mirrors the hooks' events.jsonl into harness_events first."""
+    from cli.query import cmd_query
+
+    from modules.core.paths import clear_path_cache
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CLAUDE_PLUGIN_DATA", str(tmp_path / "plugin"))
+    clear_path_cache()
+    events = tmp_path / "plugin" / "events" / "events.jsonl"
+    events.parent.mkdir(parents=True)
+    events.write_text(json.dumps({
+        "ts": "2026-05-07T07:00:00+00:00", "type": "command.executed",
+        "source": "hook", "agent": "developer", "result": "ok: git push",
+        "severity": "info",
+    }) + "\n")
+
+    args = _make_args(surface="harness_events", format="json")
+    assert cmd_query(args) == 0
+    assert json.loads(capsys.readouterr().out) == []
+
+    for _ in range(2):
+        assert cmd_query(_make_args(surface="harness_events", format="json", sync=True)) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert [r["summary"] for r in out] == ["ok: git push"]
+    clear_path_cache()
+
+
+def test_query_streams_ndjson_and_csv(tmp_db, tmp_path, monkeypatch, capsys):
+    """--format=ndjson/csv stream every row of the window with --last=0."""
+    import csv
+    from cli.query import cmd_query
+
+    monkeypatch.chdir(tmp_path)
+    for i in range(30):
+        _seed_harness_event(tmp_db, type_="command.executed",
+                            ts=f"2026-05-07T10:{i:02d}:00Z", result=f"ok: cmd {i}")
+    _seed_episode(tmp_db, "ep_s", agent="developer", timestamp="2026-05-07T10:15:30Z")
+
+    assert cmd_query(_make_args(last=0, format="ndjson")) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 31
+    assert lines[0]["summary"] == "ok: cmd 29"
+    assert [r["surface"] for r in lines].index("episodes") == 14
+
+    assert cmd_query(_make_args(surface="harness_events", last=3, format="csv")) == 0
+    rows = list(csv.DictReader(capsys.readouterr().out.splitlines()))
+    assert [r["summary"] for r in rows] == ["ok: cmd 29", "ok: cmd 28", "ok: cmd 27"]
+    assert list(rows[0]) == ["surface", "timestamp", "type", "agent", "summary"]
+
+
 def test_query_registers_subcommand_choice():
     """``gaia query`` is wired into the argparse tree."""
     import cli.query as query_mod
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the bin/gaia dispatcher.
+
+Compares lazy registration (bin/cli/manifest.json: only the subcommand being
+run is imported) with eager discovery (GAIA_CLI_EAGER=1: every bin/cli
+plugin is imported to call register).
+
+Validates:
+  - `gaia --help` imports no bin/cli plugin lazily; `gaia status --json`
+    imports only cli.status (checked in a subprocess, runs by default)
+  NFR-005: `gaia --help` starts at least 2x faster lazily than eagerly.
+  NFR-006: `gaia status --json` starts at least 1.5x faster lazily.
+
+The wall-clock ratios are marked ``perf`` and skipped by default (they are
+noisy on shared CI runners); run them with ``pytest -m perf``.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+GAIA_BIN = Path(__file__).resolve().parents[2] / "bin" / "gaia"
+CLI_DIR = GAIA_BIN.parent / "cli"
+
+# Best-of-N wall time smooths out scheduler noise.
+RUNS = 5
+
+# Runs bin/gaia in a fresh interpreter and records every plugin it loads
+# (bin/gaia imports plugins through spec_from_file_location as cli.<stem>).
+_PROBE = """
+import importlib.util, json, runpy, sys
+
+gaia, out, *args = sys.argv[1:]
+loaded = []
+_spec_from_file_location = importlib.util.spec_from_file_location
+
+def _record(name, *a, **kw):
+    loaded.append(name)
+    return _spec_from_file_location(name, *a, **kw)
+
+importlib.util.spec_from_file_location = _record
+sys.argv = [gaia, *args]
+try:
+    runpy.run_path(gaia, run_name="__main__")
+except SystemExit:
+    pass
+finally:
+    with open(out, "w") as f:
+        json.dump({"plugins": loaded, "modules": sorted(sys.modules)}, f)
+"""
+
+
+def _env(tmp_path, eager=False):
+    env = {k: v for k, v in os.environ.items() if k != "GAIA_CLI_EAGER"}
+    env["GAIA_DATA_DIR"] = str(tmp_path / "gaia")
+    if eager:
+        env["GAIA_CLI_EAGER"] = "1"
+    return env
+
+
+def _imports(tmp_path, args, eager=False) -> dict:
+    out = tmp_path / "imports.json"
+    subprocess.run(
+        [sys.executable, "-c", _PROBE, str(GAIA_BIN), str(out), *args],
+        env=_env(tmp_path, eager), capture_output=True, check=False,
+    )
+    return json.loads(out.read_text())
+
+
+def _best_of(args, env) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(GAIA_BIN), *args], env=env, capture_output=True, check=False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("args, expected", [
+    (["--help"], []),
+    (["status", "--json"], ["cli.status"]),
+])
+def test_lazy_startup_imports_only_the_requested_plugin(tmp_path, args, expected):
+    lazy = _imports(tmp_path, args)
+    eager = _imports(tmp_path, args, eager=True)
+
+    assert lazy["plugins"] == expected
+    assert "cli._install_helpers" not in lazy["modules"]
+    # Sanity check on the probe: eager discovery loads every plugin.
+    assert len(eager["plugins"]) == len([p for p in CLI_DIR.glob("*.py") if p.stem != "__init__"])
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("args, min_speedup", [
+    (["--help"], 2.0),
+    (["status", "--json"], 1.5),
+])
+def test_lazy_startup_faster_than_eager(tmp_path, args, min_speedup):
+    lazy_s = _best_of(args, _env(tmp_path))
+    eager_s = _best_of(args, _env(tmp_path, eager=True))
+
+    speedup = eager_s / lazy_s
+    print(f"\ngaia {' '.join(args)}: lazy {lazy_s * 1000:.0f} ms, eager {eager_s * 1000:.0f} ms, "
+          f"speedup {speedup:.1f}x")
+    assert speedup >= min_speedup
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Performance benchmark for the process-pool scanner executor (ScanConfig.executor).
+
+Builds a synthetic multi-repo workspace whose repos carry a parse-heavy mix
+of Terraform, Kubernetes YAML and package manifests, then runs the CPU-bound
+tree scanners with the thread executor and with the process executor.
+
+Validates:
+  - with the process executor every CPU_BOUND scanner runs in the process
+    pool (none falls back to a thread) and both executors produce
+    identical sections
+  NFR-005: on a machine with at least MIN_CPUS cores the process executor
+           is at least MIN_SPEEDUP x faster than the GIL-bound thread executor.
+
+The wall-clock ratio is marked ``perf`` and skipped by default (it is noisy
+on shared CI runners); run it with ``pytest -m perf``.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import tools.scan.orchestrator as orchestrator_module
+from tools.scan.config import ScanConfig
+from tools.scan.orchestrator import ScanOrchestrator
+from tools.scan.registry import ScannerRegistry
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+REPOS = 12
+SERVICES_PER_REPO = 40
+MIN_CPUS = 4
+MIN_SPEEDUP = 1.3
+TREE_SCANNERS = ["infrastructure", "orchestration", "stack"]
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def workspace(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("multi-repo")
+    for r in range(REPOS):
+        repo = root / f"repo-{r:02d}"
+        (repo / ".git").mkdir(parents=True)
+        (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        for i in range(SERVICES_PER_REPO):
+            svc = repo / "services" / f"svc-{i:03d}"
+            (svc / "k8s").mkdir(parents=True)
+            (svc / "infra").mkdir()
+            (svc / "package.json").write_text(json.dumps({
+                "name": f"svc-{r}-{i}",
+                "dependencies": {"express": "^4.18.0", "react": "^18.2.0"},
+                "devDependencies": {"jest": "^29.0.0", "typescript": "^5.0.0"},
+            }))
+            (svc / "infra" / "main.tf").write_text(
+                'provider "google" {}\n'
+                + "".join(
+                    f'module "m{j}" {{\n  source = "./modules/m{j}"\n  version = "1.{j}.0"\n}}\n'
+                    for j in range(10)
+                )
+                + 'resource "google_container_cluster" "primary" {\n  name = "gke"\n}\n'
+            )
+            (svc / "k8s" / "deploy.yaml").write_text(
+                "\n---\n".join(
+                    f"apiVersion: apps/v1\nkind: Deployment\nmetadata:\n"
+                    f"  name: svc-{i}-{j}\n  namespace: ns-{r}\nspec:\n  replicas: 2\n"
+                    for j in range(10)
+                )
+            )
+    return root
+
+
+def _scan(root: Path, executor: str):
+    config = ScanConfig(
+        project_root=root,
+        scanners=TREE_SCANNERS,
+        incremental=False,
+        executor=executor,
+    )
+    orchestrator = ScanOrchestrator(registry=ScannerRegistry(), config=config)
+    start = time.perf_counter()
+    output = orchestrator.run(write_output=False)
+    return output, time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+class TestProcessExecutor:
+
+    def test_cpu_bound_scanners_run_in_process_pool(self, workspace, monkeypatch):
+        pooled_names: list[str] = []
+        in_thread: list[str] = []
+
+        class _RecordingPool(orchestrator_module.ProcessPoolExecutor):
+            def submit(self, fn, scanner_cls, *args, **kwargs):
+                pooled_names.append(scanner_cls().SCANNER_NAME)
+                return super().submit(fn, scanner_cls, *args, **kwargs)
+
+        run_scanner = ScanOrchestrator._run_scanner
+
+        def _record_run_scanner(self, scanner, root):
+            in_thread.append(scanner.SCANNER_NAME)
+            return run_scanner(self, scanner, root)
+
+        threaded, _ = _scan(workspace, "thread")
+        monkeypatch.setattr(orchestrator_module, "ProcessPoolExecutor", _RecordingPool)
+        monkeypatch.setattr(ScanOrchestrator, "_run_scanner", _record_run_scanner)
+        pooled, _ = _scan(workspace, "process")
+
+        assert sorted(pooled_names) == sorted(TREE_SCANNERS)
+        assert in_thread == []
+        assert pooled.errors == []
+        assert pooled.context["sections"] == threaded.context["sections"]
+
+    @pytest.mark.perf
+    def test_process_executor_vs_threads(self, workspace):
+        _scan(workspace, "thread")  # warm imports and the page cache
+        threaded, thread_s = _scan(workspace, "thread")
+        pooled, process_s = _scan(workspace, "process")
+
+        speedup = thread_s / process_s if process_s else float("inf")
+        cpus = os.cpu_count() or 1
+        print(
+            f"\n{REPOS}-repo workspace on {cpus} CPU(s): threads {thread_s * 1000:,.0f} ms, "
+            f"processes {process_s * 1000:,.0f} ms, speedup {speedup:.2f}x"
+        )
+
+        assert pooled.errors == []
+        assert pooled.context["sections"] == threaded.context["sections"]
+        if cpus >= MIN_CPUS:
+            assert speedup >= MIN_SPEEDUP
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Performance benchmark for incremental rescans (tools/scan/manifest.py).
+
+Builds a synthetic 20k-file repo (services with package.json, Terraform
+modules, Helm charts and k8s manifests, plus plain source files) and
+compares a full scan of the tree scanners against a no-op rescan that is
+served from the scan manifest.
+
+Validates:
+  - a no-op rescan of a 20k-file repo reuses every tree scanner's result
+    without listing a directory or hashing a file
+  NFR-005: the no-op rescan is at least 3x faster than a full scan.
+
+The wall-clock ratio is marked ``perf`` and skipped by default (it is noisy
+on shared CI runners); run it with ``pytest -m perf``.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tools.scan.config import ScanConfig
+from tools.scan.manifest import ScanManifest
+from tools.scan.orchestrator import ScanOrchestrator
+from tools.scan.registry import ScannerRegistry
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+SERVICES = 200
+FILES_PER_SERVICE = 100  # 200 x 100 = 20,000 files
+MIN_SPEEDUP = 3.0
+TREE_SCANNERS = ["stack", "infrastructure", "orchestration"]
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def big_repo(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("big-repo")
+    for i in range(SERVICES):
+        svc = root / "services" / f"svc-{i:03d}"
+        (svc / "src").mkdir(parents=True)
+        (svc / "k8s").mkdir()
+        (svc / "infra").mkdir()
+        (svc / "package.json").write_text(
+            json.dumps({"name": f"svc-{i}", "dependencies": {"express": "^4.18.0"}})
+        )
+        (svc / "infra" / "main.tf").write_text(
+            f'provider "google" {{}}\nmodule "svc{i}" {{\n  source = "./m"\n}}\n'
+        )
+        (svc / "k8s" / "deploy.yaml").write_text(
+            f"apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: svc-{i}\n"
+        )
+        (svc / "k8s" / "Chart.yaml").write_text(f"apiVersion: v2\nname: svc-{i}\n")
+        for j in range(FILES_PER_SERVICE - 4):
+            (svc / "src" / f"mod_{j:03d}.js").write_text(f"export const v{j} = {j};\n")
+
+    # Backdate the tree like a checkout that predates the scans, so the
+    # manifest's racy-timestamp guard does not force re-listing.
+    past = time.time() - 3600
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+        os.utime(dirpath, (past, past))
+    return root
+
+
+def _scan(root: Path, incremental: bool):
+    config = ScanConfig(
+        project_root=root,
+        scanners=TREE_SCANNERS,
+        output_path=root.parent / f"{root.name}-out" / "project-context.json",
+        incremental=incremental,
+    )
+    start = time.perf_counter()
+    output = ScanOrchestrator(registry=ScannerRegistry(), config=config).run()
+    return output, time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+class TestIncrementalRescan:
+
+    def test_noop_rescan_reuses_every_scanner(self, big_repo, monkeypatch):
+        _scan(big_repo, incremental=True)  # seed the manifest
+        full, _ = _scan(big_repo, incremental=False)
+
+        manifests = []
+        save = ScanManifest.save
+
+        def _record(self, path):
+            manifests.append(self)
+            save(self, path)
+
+        monkeypatch.setattr(ScanManifest, "save", _record)
+        noop, _ = _scan(big_repo, incremental=True)
+
+        assert noop.reused_scanners == sorted(TREE_SCANNERS)
+        assert noop.context["sections"] == full.context["sections"]
+        assert [(m.dirs_listed, m.files_hashed) for m in manifests] == [(0, 0)]
+
+    @pytest.mark.perf
+    def test_noop_rescan_faster_than_full_scan(self, big_repo):
+        _scan(big_repo, incremental=True)  # seed the manifest
+        full, full_s = _scan(big_repo, incremental=False)
+        noop, noop_s = _scan(big_repo, incremental=True)
+
+        speedup = full_s / noop_s if noop_s else float("inf")
+        print(
+            f"\n20k-file repo: full scan {full_s * 1000:,.0f} ms, "
+            f"no-op rescan {noop_s * 1000:,.0f} ms, speedup {speedup:.1f}x"
+        )
+
+        assert noop.reused_scanners == sorted(TREE_SCANNERS)
+        assert speedup >= MIN_SPEEDUP
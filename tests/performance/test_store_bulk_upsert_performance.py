@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Performance benchmark for gaia.store.writer.bulk_upsert.
+
+Compares the legacy per-row path (one upsert_project/upsert_app call per
+row: own connection, own permission check, own commit) with the set-based
+bulk_upsert (one connection, one check, one transaction, executemany).
+
+Validates:
+  - bulk_upsert writes every row of a 300-row batch in one transaction
+  NFR-003: bulk_upsert of 300 project rows is at least 5x faster than
+           300 upsert_project calls.
+  NFR-004: bulk_upsert of 300 app rows is at least 5x faster than
+           300 upsert_app calls.
+
+The wall-clock ratios are marked ``perf`` and skipped by default (they are
+noisy on shared CI runners); run them with ``pytest -m perf``.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+import gaia.store.writer as writer
+from gaia.store import bulk_upsert, upsert_app, upsert_project
+from gaia.store.writer import _connect
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ROW_COUNT = 300
+MIN_SPEEDUP = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def perf_db(tmp_path: Path) -> Path:
+    db = tmp_path / "gaia.db"
+    con = _connect(db)
+    for table in ("projects", "apps"):
+        con.execute(
+            "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+            "VALUES (?, 'developer', 1)",
+            (table,),
+        )
+    con.commit()
+    con.close()
+    return db
+
+
+def _project_rows() -> list[dict]:
+    return [{"name": f"repo-{i}", "role": "application"} for i in range(ROW_COUNT)]
+
+
+def _app_rows() -> list[dict]:
+    return [
+        {"project": f"repo-{i % 20}", "name": f"app-{i}", "kind": "service"}
+        for i in range(ROW_COUNT)
+    ]
+
+
+def _report(label: str, per_row_s: float, bulk_s: float) -> float:
+    speedup = per_row_s / bulk_s if bulk_s else float("inf")
+    print(
+        f"\n{label}: per-row {ROW_COUNT / per_row_s:,.0f} rows/s, "
+        f"bulk {ROW_COUNT / bulk_s:,.0f} rows/s, speedup {speedup:.1f}x"
+    )
+    return speedup
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+class TestBulkUpsertBatch:
+
+    @pytest.mark.parametrize("table, rows", [
+        ("projects", _project_rows()),
+        ("apps", _app_rows()),
+    ])
+    def test_bulk_upsert_writes_batch_in_one_transaction(self, perf_db, monkeypatch, table, rows):
+        statements: list[str] = []
+        original = writer._connect
+
+        def _tracing_connect(db_path=None):
+            con = original(db_path)
+            con.set_trace_callback(statements.append)
+            return con
+
+        monkeypatch.setattr(writer, "_connect", _tracing_connect)
+        res = bulk_upsert(table, "ws-bulk", rows, "developer", db_path=perf_db)
+
+        assert res == {"applied": ROW_COUNT, "rejected": 0}
+        assert sum(1 for s in statements if s.strip().upper().startswith("BEGIN")) == 1
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 1
+
+        con = _connect(perf_db)
+        count = con.execute(f"SELECT COUNT(*) FROM {table} WHERE workspace = 'ws-bulk'").fetchone()[0]
+        con.close()
+        assert count == ROW_COUNT
+
+
+@pytest.mark.perf
+class TestBulkUpsertThroughput:
+
+    def test_projects_bulk_faster_than_per_row(self, perf_db):
+        rows = _project_rows()
+
+        start = time.perf_counter()
+        for r in rows:
+            upsert_project("ws-legacy", r["name"], r, "developer", db_path=perf_db)
+        per_row_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        res = bulk_upsert("projects", "ws-bulk", rows, "developer", db_path=perf_db)
+        bulk_s = time.perf_counter() - start
+
+        assert res == {"applied": ROW_COUNT, "rejected": 0}
+        assert _report("projects", per_row_s, bulk_s) >= MIN_SPEEDUP
+
+    def test_apps_bulk_faster_than_per_row(self, perf_db):
+        rows = _app_rows()
+
+        start = time.perf_counter()
+        for r in rows:
+            upsert_app("ws-legacy", r["project"], r["name"], r, "developer", db_path=perf_db)
+        per_row_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        res = bulk_upsert("apps", "ws-bulk", rows, "developer", db_path=perf_db)
+        bulk_s = time.perf_counter() - start
+
+        assert res == {"applied": ROW_COUNT, "rejected": 0}
+        assert _report("apps", per_row_s, bulk_s) >= MIN_SPEEDUP
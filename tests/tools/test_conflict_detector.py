@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for memory conflict detection (tools/memory/conflict_detector.py).
+
+PRIORITY: MEDIUM - Backs `gaia memory conflicts`.
+
+Validates:
+1. Polarity contradictions (use/do not use, enabled/disabled, always/never,
+   Windows/WSL, version mismatches)
+2. Prefix-filtered candidate generation finds exactly the pairs an
+   all-pairs Jaccard comparison finds
+3. Per-file features are cached by (mtime, size): unchanged files are not
+   re-read, edited and deleted files are refreshed
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools to path
+TOOLS_DIR = Path(__file__).parent.parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR))
+
+import memory.conflict_detector as cd
+from memory.conflict_detector import (
+    _check_polarity_contradictions,
+    _jaccard,
+    _tokenize,
+    detect_conflicts,
+)
+
+
+@pytest.fixture(autouse=True)
+def feature_cache(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "features.json"
+    monkeypatch.setenv("GAIA_MEMORY_CONFLICT_CACHE", str(path))
+    return path
+
+
+def _reasons(conflicts):
+    return [c["reason"] for c in conflicts]
+
+
+class TestPolarity:
+    def test_use_vs_do_not_use(self):
+        conflicts = _check_polarity_contradictions(
+            ["Always use terragrunt for stacks"], ["Never use terragrunt here"]
+        )
+        assert "'use terragrunt' contradicts 'do not use terragrunt'" in _reasons(conflicts)
+
+    def test_enabled_vs_disabled_needs_shared_topic(self):
+        shared = _check_polarity_contradictions(["autoscaling enabled"], ["autoscaling disabled"])
+        unrelated = _check_polarity_contradictions(["autoscaling enabled"], ["logging disabled"])
+
+        assert _reasons(shared) == ["enabled vs disabled on shared topic"]
+        assert unrelated == []
+
+    def test_lines_b_reported_in_order(self):
+        conflicts = _check_polarity_contradictions(
+            ["never restart pods manually"],
+            ["always restart gateway", "always check pods", "always restart pods"],
+        )
+        assert [c["line_b"] for c in conflicts] == [
+            "always restart gateway", "always check pods", "always restart pods",
+        ]
+
+    def test_version_mismatch(self):
+        conflicts = _check_polarity_contradictions(["argocd v2 chart"], ["argocd v3 chart"])
+        assert _reasons(conflicts) == ["version mismatch: v2 vs v3 on shared topic"]
+
+    def test_windows_vs_wsl(self):
+        conflicts = _check_polarity_contradictions(["dev shell is Windows"], ["dev shell is WSL"])
+        assert _reasons(conflicts) == ["Windows vs WSL/Linux on shared topic"]
+
+
+def _write_corpus(memory_dir: Path, n: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    topics = [[f"t{k}w{i}" for i in range(12)] for k in range(n // 4 + 1)]
+    common = ["deploy", "cluster", "config"]
+    memory_dir.mkdir()
+    for i in range(n):
+        words = rng.sample(topics[i % len(topics)], 8) + common + [f"uniq{i}"]
+        (memory_dir / f"m{i:03d}.md").write_text(" ".join(words) + "\nuse helm\n")
+
+
+def test_candidates_match_all_pairs(tmp_path):
+    memory_dir = tmp_path / "memory"
+    _write_corpus(memory_dir, 40)
+    texts = {str(p): p.read_text() for p in sorted(memory_dir.glob("*.md"))}
+    paths = sorted(texts)
+    expected = {
+        (a, b)
+        for i, a in enumerate(paths) for b in paths[i + 1:]
+        if _jaccard(_tokenize(texts[a]), _tokenize(texts[b])) > 0.3
+    }
+
+    found = {(r["file_a"], r["file_b"]) for r in detect_conflicts(memory_dir=memory_dir)}
+
+    assert found == expected
+    assert expected  # the corpus has similar pairs
+
+
+def test_similar_pairs_threshold_is_exclusive_and_exact():
+    word_sets = [{f"w{i}_{k}" for k in range(19)} | {"shared"} for i in range(50)]
+
+    with_shared = [{f"w{i}_{k}" for k in range(5)} | {"x", "y", "z"} for i in range(3)]
+
+    assert cd._similar_pairs(word_sets, 0.3) == []
+    assert cd._similar_pairs(with_shared, 0.3) == []
+    assert cd._similar_pairs(with_shared, 0.2) == [(0, 1, 3 / 13), (0, 2, 3 / 13), (1, 2, 3 / 13)]
+
+
+def test_rank_mask_sets_one_bit_per_rank():
+    ranks = [0, 1, 7, 8, 63, 64, 999]
+
+    assert cd._rank_mask(ranks, 1000) == sum(1 << r for r in ranks)
+    assert cd._rank_mask([], 1000) == 0
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.1, 0.3, 0.5, 0.8])
+def test_similar_pairs_match_brute_force(threshold):
+    rng = random.Random(threshold)
+    vocab = [f"v{i}" for i in range(40)]
+    word_sets = [set(rng.sample(vocab, rng.randint(0, 15))) for _ in range(60)]
+    expected = [
+        (i, j, _jaccard(a, b))
+        for i, a in enumerate(word_sets) for j, b in enumerate(word_sets)
+        if i < j and _jaccard(a, b) > threshold
+    ]
+
+    assert cd._similar_pairs(word_sets, threshold) == expected
+
+
+class TestFeatureCache:
+    def test_unchanged_files_are_not_reread(self, tmp_path, monkeypatch):
+        memory_dir = tmp_path / "memory"
+        _write_corpus(memory_dir, 6)
+        first = detect_conflicts(memory_dir=memory_dir)
+
+        calls = []
+        real = cd._features
+        monkeypatch.setattr(cd, "_features", lambda text: calls.append(text) or real(text))
+        assert detect_conflicts(memory_dir=memory_dir) == first
+        assert calls == []
+
+        (memory_dir / "m000.md").write_text("something else entirely\n")
+        (memory_dir / "m001.md").unlink()
+        detect_conflicts(memory_dir=memory_dir)
+        assert calls == ["something else entirely\n"]
+
+    def test_cache_disabled(self, tmp_path, monkeypatch, feature_cache):
+        monkeypatch.setenv("GAIA_MEMORY_CONFLICT_CACHE", "off")
+        memory_dir = tmp_path / "memory"
+        _write_corpus(memory_dir, 4)
+
+        detect_conflicts(memory_dir=memory_dir)
+
+        assert not feature_cache.exists()
@@ -0,0 +1,153 @@
+import json
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parents[2] / "tools"
+sys.path.insert(0, str(TOOLS_DIR))
+sys.path.insert(0, str(TOOLS_DIR / "context"))
+
+from context_packer import (  # noqa: E402
+    DEFAULT_TOKEN_BUDGET,
+    ContextBlock,
+    estimate_tokens,
+    pack_blocks,
+    render_yaml,
+    resolve_token_budget,
+)
+from context_provider import pack_context  # noqa: E402
+
+
+def test_block_tokens_computed_once_on_creation():
+    block = ContextBlock("stack", "section", 70, {"languages": ["python"] * 20})
+    assert block.tokens > 0
+
+    # Mutating content afterwards does not re-measure: size is cached.
+    cached = block.tokens
+    block.content["languages"].append("go")
+    assert block.tokens == cached
+
+
+def test_precomputed_tokens_are_respected():
+    block = ContextBlock("x", "episode", 40, "a" * 400, tokens=7)
+    assert block.tokens == 7
+
+
+def test_block_measured_on_rendered_text():
+    content = {"clusters": [{"name": "gke", "nodes": 3}], "region": "us-east1"}
+
+    section = ContextBlock("infra", "section", 70, content, text=render_yaml({"infra": content}))
+    assert section.tokens == estimate_tokens(render_yaml({"infra": content}))
+
+    # Without text, structured content is measured as the injector's indent=2 JSON.
+    episode = ContextBlock("ep1", "episode", 40, content)
+    assert episode.tokens == estimate_tokens(json.dumps(content, indent=2))
+
+
+def test_pack_keeps_highest_priority_and_reports_dropped():
+    blocks = [
+        ContextBlock("low", "episode", 10, "x" * 400),   # 100 tokens
+        ContextBlock("high", "section", 100, "x" * 400),  # 100 tokens
+        ContextBlock("mid", "section", 50, "x" * 400),   # 100 tokens
+    ]
+    result = pack_blocks(blocks, budget=200)
+
+    assert result.selected_keys() == ["high", "mid"]
+    assert [b.key for b in result.dropped] == ["low"]
+    assert result.tokens_used == 200
+    report = result.to_report()
+    assert report["dropped"][0]["key"] == "low"
+    assert report["remaining"] == 0
+
+
+def test_pack_skips_oversized_block_and_fills_with_smaller_one():
+    blocks = [
+        ContextBlock("huge", "section", 100, "x" * 4000),  # 1000 tokens
+        ContextBlock("small", "episode", 10, "x" * 40),    # 10 tokens
+    ]
+    result = pack_blocks(blocks, budget=50)
+
+    assert result.selected_keys() == ["small"]
+    assert [b.key for b in result.dropped] == ["huge"]
+
+
+def test_required_blocks_always_kept_and_empty_blocks_ignored():
+    blocks = [
+        ContextBlock("must", "section", 1, "x" * 400, required=True),
+        ContextBlock("empty", "reminder", 50, ""),
+        ContextBlock("extra", "reminder", 50, "x" * 40),
+    ]
+    result = pack_blocks(blocks, budget=50)
+
+    assert result.selected_keys() == ["must"]
+    assert [b.key for b in result.dropped] == ["extra"]
+
+
+def test_selected_blocks_preserve_input_order():
+    blocks = [
+        ContextBlock("a", "section", 10, "x"),
+        ContextBlock("b", "section", 90, "x"),
+        ContextBlock("c", "section", 50, "x"),
+    ]
+    assert pack_blocks(blocks, budget=100).selected_keys() == ["a", "b", "c"]
+
+
+def test_resolve_token_budget_precedence(monkeypatch):
+    monkeypatch.delenv("GAIA_CONTEXT_TOKEN_BUDGET", raising=False)
+    monkeypatch.delenv("GAIA_CONTEXT_TOKEN_BUDGET_DEVELOPER", raising=False)
+    assert resolve_token_budget("unknown-agent") == DEFAULT_TOKEN_BUDGET
+
+    monkeypatch.setenv("GAIA_CONTEXT_TOKEN_BUDGET", "3000")
+    assert resolve_token_budget("developer") == 3000
+
+    monkeypatch.setenv("GAIA_CONTEXT_TOKEN_BUDGET_DEVELOPER", "1500")
+    assert resolve_token_budget("developer") == 1500
+
+    assert resolve_token_budget("developer", explicit=900) == 900
+
+
+def test_pack_context_keeps_every_section_and_trims_episodes():
+    contract_context = {
+        "stack": {"notes": "x" * 2000},
+        "git": {"notes": "x" * 400},
+    }
+    historical = {
+        "memory_index": "m" * 40,
+        "episodes": [{"id": "ep1"}, {"id": "ep2"}],
+        "summary": "Found 2 relevant historical episodes",
+    }
+    memory_blocks = [
+        ContextBlock("memory_index", "memory_index", 60, historical["memory_index"]),
+        ContextBlock("ep1", "episode", 45, "e" * 400),
+        ContextBlock("ep2", "episode", 41, "e" * 400),
+    ]
+
+    packed = pack_context(
+        contract_context, historical, memory_blocks, budget=720, anchored_sections=["git"],
+    )
+
+    assert list(packed["project_knowledge"]) == ["stack", "git"]
+    assert historical["memory_index"]
+    assert [ep["id"] for ep in historical["episodes"]] == ["ep1"]
+    dropped = {d["key"] for d in packed["result"].to_report()["dropped"]}
+    assert dropped == {"ep2"}
+
+
+def test_pack_context_measures_sections_as_yaml():
+    contract_context = {"stack": {"languages": ["python", "go"], "services": [{"name": "api"}]}}
+
+    packed = pack_context(contract_context, {}, [], budget=1000)
+
+    assert packed["result"].tokens_used == estimate_tokens(render_yaml(contract_context))
+
+
+def test_pack_context_never_drops_sections_over_budget():
+    contract_context = {"stack": {"notes": "x" * 2000}}
+    historical = {"episodes": [{"id": "ep1"}], "summary": "Found 1 relevant historical episode"}
+    memory_blocks = [ContextBlock("ep1", "episode", 45, "e" * 400)]
+
+    packed = pack_context(contract_context, historical, memory_blocks, budget=100)
+
+    assert list(packed["project_knowledge"]) == ["stack"]
+    assert "episodes" not in historical
+    assert packed["result"].remaining == 0
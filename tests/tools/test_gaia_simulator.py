@@ -7,6 +7,7 @@ Tests cover:
 3. ReplayReporter: formatting results
 4. Regression detection: mocked hook returning different decisions
 5. CLI: argument parsing and wiring
+6. Bench: baseline vs candidate hook trees
 
 Run: python3 -m pytest tests/tools/test_gaia_simulator.py -v
 """
@@ -14,8 +15,12 @@ Run: python3 -m pytest tests/tools/test_gaia_simulator.py -v
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import subprocess
 import sys
 import textwrap
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -29,9 +34,10 @@ sys.path.insert(0, str(TOOLS_DIR))
 
 # Module under test
 from gaia_simulator.cli import main as gaia_simulator_cli_main  # noqa: E402
-from gaia_simulator.extractor import LogExtractor, ReplayEvent  # noqa: E402
+from gaia_simulator.extractor import LogExtractor, ReplayEvent, dedupe_events  # noqa: E402
 from gaia_simulator.runner import HookRunner, ReplayResult, _parse_decision_from_output, _classify_regression  # noqa: E402
 from gaia_simulator.reporter import ReplayReporter  # noqa: E402
+from gaia_simulator.bench import BenchRun, run_bench, weighted_percentile  # noqa: E402
 
 
 # ============================================================================
@@ -278,6 +284,82 @@ class TestLogExtractorMerge:
         assert timestamps == sorted(timestamps)
 
 
+class TestStreamingExtraction:
+    """iter_all: per-day-file parsing in worker processes, k-way merged."""
+
+    @pytest.fixture
+    def multi_day_logs(self, tmp_path: Path) -> Path:
+        d = tmp_path / "logs"
+        d.mkdir()
+        for day in ("2026-03-10", "2026-03-11", "2026-03-12"):
+            (d / f"hooks-{day}.log").write_text(SAMPLE_HOOKS_LOG.replace("2026-03-11", day))
+            # Audit lines out of order inside the file; the merge must still be sorted.
+            audit_lines = SAMPLE_AUDIT_JSONL.replace("2026-03-11", day).splitlines()
+            (d / f"audit-{day}.jsonl").write_text("\n".join(reversed(audit_lines)) + "\n")
+        return d
+
+    def _keys(self, events: list[ReplayEvent]) -> list[tuple]:
+        return [(e.timestamp, e.hook_name, e.tool_name, e.source_file, e.expected_decision) for e in events]
+
+    def test_parallel_matches_serial(self, multi_day_logs: Path):
+        extractor = LogExtractor()
+
+        serial = extractor.extract_all(multi_day_logs, workers=1)
+        parallel = extractor.extract_all(multi_day_logs, workers=3)
+
+        assert len(serial) == 33
+        assert self._keys(parallel) == self._keys(serial)
+        timestamps = [e.timestamp for e in serial]
+        assert timestamps == sorted(timestamps)
+
+    def test_iter_all_is_lazy(self, multi_day_logs: Path):
+        stream = LogExtractor().iter_all(multi_day_logs, hook_filter="pre_tool_use", workers=1)
+
+        first = next(stream)
+        (multi_day_logs / "hooks-2026-03-12.log").unlink()
+        rest = list(stream)
+
+        assert first.timestamp.startswith("2026-03-10")
+        assert {e.timestamp[:10] for e in rest} == {"2026-03-10", "2026-03-11"}
+
+    def test_hooks_log_streams_pairs_across_lines(self, logs_dir: Path):
+        extractor = LogExtractor()
+        path = logs_dir / "hooks-2026-03-11.log"
+
+        streamed = sorted(extractor.iter_hooks_log(path), key=lambda e: e.timestamp)
+
+        assert self._keys(streamed) == self._keys(extractor.extract_from_hooks_log(path))
+
+    def test_dedupe_events_counts_identical_payloads(self, multi_day_logs: Path):
+        events = LogExtractor().extract_all(multi_day_logs, workers=1)
+
+        unique = dedupe_events(events)
+
+        assert len(unique) == 11
+        assert sum(e.count for e in unique) == len(events)
+        assert all(e.count == 3 for e in unique)
+        assert unique[0].timestamp.startswith("2026-03-10")  # first occurrence kept
+
+    def test_dedupe_keeps_different_expectations_apart(self):
+        base = dict(
+            timestamp="2026-03-11 10:00:00,000",
+            hook_name="pre_tool_use",
+            tool_name="Bash",
+            stdin_payload={"tool_name": "Bash", "tool_input": {"command": "ls"}},
+            expected_exit_code=0,
+            expected_tier="T0",
+            source_file="hooks-2026-03-11.log",
+        )
+
+        unique = dedupe_events([
+            ReplayEvent(expected_decision="ALLOW", **base),
+            ReplayEvent(expected_decision="BLOCK", **base),
+            ReplayEvent(expected_decision="ALLOW", **{**base, "timestamp": "2026-03-11 10:00:05,000"}),
+        ])
+
+        assert [(e.expected_decision, e.count) for e in unique] == [("ALLOW", 2), ("BLOCK", 1)]
+
+
 # ============================================================================
 # Test ReplayEvent (frozen dataclass)
 # ============================================================================
@@ -553,6 +635,161 @@ class TestHookRunner:
         assert progress_calls == [(1, 1)]
 
 
+def _bash_event(command: str, timestamp: str = "2026-03-11 10:00:00,000") -> ReplayEvent:
+    return ReplayEvent(
+        timestamp=timestamp,
+        hook_name="pre_tool_use",
+        tool_name="Bash",
+        stdin_payload={
+            "tool_name": "Bash",
+            "tool_input": {"command": command},
+            "hook_event_name": "PreToolUse",
+            "session_id": "replay-test",
+        },
+        expected_decision="ALLOW",
+        expected_exit_code=0,
+        expected_tier="T0",
+        source_file="test",
+    )
+
+
+def _observed(result: ReplayResult) -> tuple:
+    return (
+        result.actual_exit_code,
+        result.actual_stdout,
+        result.actual_stderr,
+        result.actual_decision,
+        result.actual_tier,
+        result.actual_metadata,
+    )
+
+
+class TestParallelAndInProcessReplay:
+    """run_batch(workers=N) and HookRunner(in_process=True) match the serial subprocess replay."""
+
+    COMMANDS = [
+        "ls /tmp",
+        " ".join(["terraform", "destroy"]),
+        "",
+        "cat notes.txt | grep todo",
+        "echo hello",
+        "kubectl get pods",
+    ]
+
+    def test_in_process_matches_subprocess(self, hooks_dir: Path, tmp_path: Path):
+        events = [_bash_event(cmd) for cmd in self.COMMANDS]
+        events.append(ReplayEvent(
+            timestamp="2026-03-11 10:00:09,000",
+            hook_name="pre_tool_use",
+            tool_name="Agent",
+            stdin_payload={
+                "tool_name": "Agent",
+                "tool_input": {"subagent_type": "general-purpose", "prompt": "x", "description": "d"},
+                "hook_event_name": "PreToolUse",
+                "session_id": "replay-test",
+            },
+            expected_decision="ALLOW",
+            expected_exit_code=0,
+            expected_tier="",
+            source_file="test",
+        ))
+        cwd = Path.cwd()
+
+        subprocess_results = HookRunner(hooks_dir, project_root=tmp_path / "sub").run_batch(events)
+        in_process_results = HookRunner(hooks_dir, project_root=tmp_path / "inp", in_process=True).run_batch(events)
+
+        assert [_observed(r) for r in in_process_results] == [_observed(r) for r in subprocess_results]
+        assert {r.actual_decision for r in in_process_results} == {"ALLOW", "BLOCK"}
+        assert Path.cwd() == cwd
+        assert list((tmp_path / "inp" / ".claude" / "logs").glob("hooks-*.log"))
+
+    def test_in_process_shares_the_script_stdin_handler(self, hooks_dir: Path, tmp_path: Path):
+        from gaia_simulator.runner import _in_process_hook
+
+        work_dir = tmp_path / "inp"
+        (work_dir / ".claude" / "logs").mkdir(parents=True)
+        script = subprocess.run(
+            [sys.executable, str(hooks_dir / "pre_tool_use.py")],
+            input="{not json", capture_output=True, text=True, cwd=work_dir,
+        )
+
+        hook = _in_process_hook(hooks_dir)
+        exit_code, stdout, stderr = hook("{not json", work_dir)
+
+        assert hook._handle_stdin is sys.modules["pre_tool_use"].handle_stdin
+        assert (exit_code, stdout, stderr) == (script.returncode, script.stdout, script.stderr)
+        log = next((work_dir / ".claude" / "logs").glob("hooks-*.log")).read_text()
+        assert log.count("Invalid JSON from stdin") == 2  # script run + in-process run
+
+    def test_in_process_falls_back_to_subprocess_for_other_hooks(self, hooks_dir: Path, tmp_path: Path):
+        event = ReplayEvent(
+            timestamp="2026-03-11 10:00:08,000",
+            hook_name="stop_hook",
+            tool_name="Stop",
+            stdin_payload={"hook_event_name": "Stop", "session_id": "replay-test", "stop_hook_active": False},
+            expected_decision="PASS",
+            expected_exit_code=0,
+            expected_tier="",
+            source_file="test",
+        )
+
+        result = HookRunner(hooks_dir, project_root=tmp_path, in_process=True).run(event)
+
+        assert result.actual_decision == "PASS"
+
+    def test_in_process_refuses_a_second_hooks_tree(self, hooks_dir: Path, tmp_path: Path):
+        from gaia_simulator.runner import _InProcessPreToolUse
+
+        _InProcessPreToolUse(hooks_dir)  # the real tree is loaded (or already was)
+        with pytest.raises(RuntimeError, match="workers"):
+            _InProcessPreToolUse(tmp_path)
+
+    def test_workers_keep_input_order_and_isolate_shards(self, hooks_dir: Path, tmp_path: Path):
+        events = [_bash_event(cmd, f"2026-03-11 10:00:0{i},000") for i, cmd in enumerate(self.COMMANDS)]
+        progress_calls = []
+
+        serial = HookRunner(hooks_dir, project_root=tmp_path / "serial").run_batch(events)
+        parallel = HookRunner(hooks_dir, project_root=tmp_path / "par").run_batch(
+            events,
+            progress_callback=lambda c, t: progress_calls.append((c, t)),
+            workers=3,
+        )
+
+        assert [r.event for r in parallel] == events
+        assert [_observed(r) for r in parallel] == [_observed(r) for r in serial]
+        assert sorted(p.name for p in (tmp_path / "par").iterdir()) == ["shard-0", "shard-1", "shard-2"]
+        assert len(progress_calls) == 3
+        assert max(progress_calls) == (6, 6)
+
+    def test_workers_capped_by_event_count(self, hooks_dir: Path, tmp_path: Path):
+        results = HookRunner(hooks_dir, project_root=tmp_path).run_batch([_bash_event("echo hi")], workers=8)
+
+        assert [r.actual_decision for r in results] == ["ALLOW"]
+        assert (tmp_path / ".claude").is_dir()
+
+    def test_warmup_runs_once_per_worker_and_is_discarded(self, hooks_dir: Path, tmp_path: Path):
+        events = [_bash_event(f"echo {i}", timestamp=f"2026-03-11 10:00:0{i},000") for i in range(4)]
+        runner = _WarmupRecordingRunner(hooks_dir, project_root=tmp_path / "par", in_process=True)
+        runner.marker_dir = tmp_path / "warmups"
+        runner.marker_dir.mkdir()
+
+        results = runner.run_batch(events, workers=2, warmup=[_bash_event("ls")])
+
+        assert [r.event for r in results] == events
+        assert len(list(runner.marker_dir.iterdir())) == 2  # one marker per worker process
+
+
+class _WarmupRecordingRunner(HookRunner):
+    """Leaves one marker per process that replays a warm-up batch."""
+
+    marker_dir: Path
+
+    def _run_serial(self, events, work_dir, progress_callback=None):
+        if work_dir.name.startswith("replay_warmup_"):
+            (self.marker_dir / str(os.getpid())).touch()
+        return super()._run_serial(events, work_dir, progress_callback)
+
+
 # ============================================================================
 # Test ReplayReporter
 # ============================================================================
@@ -623,6 +860,20 @@ class TestReplayReporter:
         assert "Regressions:   1" in text
         assert "allow_to_block" in text
 
+    def test_summary_weights_deduplicated_events(self):
+        reporter = ReplayReporter()
+        weighted = _make_result(matched=False, regression_type="allow_to_block")
+        weighted = replace(weighted, event=replace(weighted.event, count=4))
+        results = [_make_result(matched=True), weighted]
+
+        text = reporter.summary(results)
+
+        assert "Total events:  5" in text
+        assert "Unique:        2" in text
+        assert "Regressions:   4" in text
+        assert "allow_to_block: 4" in text
+        assert reporter.results_payload(results)[1]["count"] == 4
+
     def test_regressions_only_no_regressions(self):
         reporter = ReplayReporter()
         results = [_make_result(matched=True)]
@@ -818,3 +1069,142 @@ class TestGaiaSimulatorCli:
         assert len(parsed) == 1
         assert parsed[0]["actual"]["decision"] == "ALLOW"
         assert "Replay complete:" in captured.err
+
+    def test_parallel_in_process_replay(self, logs_dir: Path, hooks_dir: Path, capsys):
+        exit_code = gaia_simulator_cli_main([
+            "--logs-dir", str(logs_dir),
+            "--hooks-dir", str(hooks_dir),
+            "--report-format", "json",
+            "--hook", "pre_tool_use",
+            "--limit", "2",
+            "--workers", "2",
+            "--in-process",
+        ])
+        captured = capsys.readouterr()
+
+        assert exit_code == 0
+        assert [r["actual"]["decision"] for r in json.loads(captured.out)] == ["ALLOW", "ALLOW"]
+
+    def test_dedupe_replays_unique_payloads(self, logs_dir: Path, hooks_dir: Path, capsys):
+        hooks_log = logs_dir / "hooks-2026-03-11.log"
+        echo_lines = [
+            line.replace("10:00:07", "10:00:09")
+            for line in SAMPLE_HOOKS_LOG.splitlines()
+            if "echo hello" in line
+        ]
+        hooks_log.write_text(hooks_log.read_text() + "\n".join(echo_lines) + "\n")
+
+        exit_code = gaia_simulator_cli_main([
+            "--logs-dir", str(logs_dir),
+            "--hooks-dir", str(hooks_dir),
+            "--report-format", "json",
+            "--hook", "pre_tool_use",
+            "--dedupe",
+            "--in-process",
+        ])
+        captured = capsys.readouterr()
+
+        payload = json.loads(captured.out)
+        echo = [r for r in payload if r.get("command") == "echo hello"]
+        assert exit_code in (0, 1)
+        assert [r["count"] for r in echo] == [2]
+        assert "Deduplicated to " + str(len(payload)) + " unique payloads" in captured.err
+
+
+# ============================================================================
+# Bench: baseline vs candidate
+# ============================================================================
+
+
+@pytest.fixture
+def candidate_hooks(hooks_dir: Path, tmp_path: Path) -> Path:
+    """Copy of the real hooks tree whose validator blocks every echo."""
+    tree = tmp_path / "candidate" / "hooks"
+    shutil.copytree(hooks_dir, tree, ignore=shutil.ignore_patterns("__pycache__"))
+    validator = tree / "modules" / "tools" / "bash_validator.py"
+    source = validator.read_text()
+    marker = "    def validate(\n"
+    body = source.index('"""', source.index('"""', source.index(marker)) + 3) + 3
+    validator.write_text(
+        source[:body]
+        + '\n        if command.startswith("echo"):\n'
+        + '            return self.validate("rm -rf /")\n'
+        + source[body:]
+    )
+    return tree.parent
+
+
+class TestBench:
+    """gaia-sim bench: paired replay through two trees, diffs and latency tables."""
+
+    def test_weighted_percentile(self):
+        samples = [(1.0, 1), (2.0, 1), (10.0, 8)]
+
+        assert weighted_percentile(samples, 10) == 1.0
+        assert weighted_percentile(samples, 20) == 2.0
+        assert weighted_percentile(samples, 50) == 10.0
+        assert weighted_percentile([], 50) == 0.0
+
+    def test_same_tree_has_no_decision_diffs(self, hooks_dir: Path):
+        events = [_bash_event("ls /tmp"), _bash_event("echo hello")]
+
+        bench = run_bench(events, hooks_dir.parent, hooks_dir, in_process=True)
+
+        assert bench.baseline_dir == bench.candidate_dir == hooks_dir.resolve()
+        assert bench.decision_diffs() == []
+        assert [r.event for r in bench.candidate] == events
+        assert all(r.duration_ms > 0 for r in bench.baseline + bench.candidate)
+
+    def test_candidate_decision_change_is_reported(self, hooks_dir: Path, candidate_hooks: Path):
+        events = [_bash_event("ls /tmp"), replace(_bash_event("echo hello"), count=3)]
+
+        bench = run_bench(events, hooks_dir, candidate_hooks, in_process=True)
+        report = ReplayReporter().bench_report(bench)
+        payload = ReplayReporter().bench_payload(bench)
+
+        [(base, cand)] = bench.decision_diffs()
+        assert (base.actual_decision, cand.actual_decision) == ("ALLOW", "BLOCK")
+        assert "Decision diffs:  3" in report
+        assert "echo hello (x3)" in report
+        assert payload["events"] == 4 and payload["unique"] == 2
+        assert payload["decision_diffs"][0]["candidate"]["decision"] == "BLOCK"
+
+    def test_report_tables_show_speedup_and_slowdown(self):
+        def timed(tool: str, tier: str, ms: float):
+            return replace(_make_result(tool_name=tool, tier=tier), duration_ms=ms)
+
+        bench = BenchRun(
+            baseline_dir=Path("/old/hooks"),
+            candidate_dir=Path("/new/hooks"),
+            baseline=[timed("Bash", "T0", 10.0), timed("Agent", "T3", 4.0)],
+            candidate=[timed("Bash", "T0", 5.0), timed("Agent", "T3", 8.0)],
+        )
+
+        report = ReplayReporter().bench_report(bench)
+
+        assert "LATENCY BY TOOL (ms):" in report and "LATENCY BY TIER (ms):" in report
+        bash_row = next(line for line in report.splitlines() if line.strip().startswith("Bash"))
+        agent_row = next(line for line in report.splitlines() if line.strip().startswith("Agent"))
+        assert bash_row.endswith("2.00x faster")
+        assert agent_row.endswith("2.00x slower")
+        assert "DECISION DIFFS" not in report
+
+    def test_cli_bench_exit_codes(self, logs_dir: Path, hooks_dir: Path, candidate_hooks: Path, capsys):
+        common = [
+            "--logs-dir", str(logs_dir), "--hook", "pre_tool_use",
+            "--in-process", "--dedupe", "--report-format", "json",
+        ]
+
+        same = gaia_simulator_cli_main(["bench", "--baseline", str(hooks_dir), "--candidate", str(hooks_dir), *common])
+        same_out = json.loads(capsys.readouterr().out)
+        changed = gaia_simulator_cli_main(
+            ["bench", "--baseline", str(hooks_dir), "--candidate", str(candidate_hooks), *common]
+        )
+        changed_out = json.loads(capsys.readouterr().out)
+        missing = gaia_simulator_cli_main(["bench", "--baseline", str(logs_dir), "--candidate", str(hooks_dir)])
+
+        assert same == 0 and same_out["decision_diffs"] == []
+        assert changed == 1
+        assert [d["detail"] for d in changed_out["decision_diffs"]] == ["echo hello"]
+        assert missing == 2
+
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the git invalidator (tools/memory/git_invalidator.py).
+
+PRIORITY: MEDIUM - Keeps stale episodic memories from ranking high.
+
+Validates:
+1. The combined regex picks the same pattern and terms as trying each
+   pattern in order
+2. TermIndex resolves terms to the same episodes as a linear scan
+3. The commit cursor: a second run only mines new commits, dry runs do not
+   advance it, an unknown cursor falls back to the commit window
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools to path
+TOOLS_DIR = Path(__file__).parent.parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR))
+
+from memory.git_invalidator import (
+    CURSOR_FILENAME,
+    TermIndex,
+    _PATTERNS,
+    _match_message,
+    check_recent_commits,
+)
+
+
+MESSAGES = [
+    "remove deprecated foo",
+    "migrate from helm2 and remove tiller",
+    "chore: bump v3 to v4",
+    "replace Flux with ArgoCD",
+    "drop support for python2",
+    "upgraded from node14 to node18",
+    "Deprecates old-api endpoint",
+    "rm: x",
+    "nothing interesting here",
+    "removes ab then deprecate cdef",
+]
+
+
+def _sequential(message):
+    for source, extractor in _PATTERNS:
+        m = re.search(source, message, re.IGNORECASE)
+        if m:
+            return extractor(m.groups())
+    return None
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_combined_regex_matches_sequential_patterns(message):
+    assert _match_message(message) == _sequential(message)
+
+
+def test_term_index_matches_linear_scan():
+    episodes = [
+        {"id": "e1", "title": "Deploy (v2) with helm", "tags": ["k8s"]},
+        {"id": "e2", "keywords": ["terraform-aws"], "title": "VPC"},
+        {"id": "e3", "tags": ["tf"], "title": "Flux bootstrap"},
+        {"id": "e4", "title": "Unrelated notes"},
+    ]
+    terms = {"helm2", "terraform", "flux", "v2"}
+
+    def linear(ep):
+        words = [str(k).lower() for k in ep.get("keywords", []) + ep.get("tags", [])]
+        words += [w for w in re.split(r"\W+", ep.get("title", "").lower()) if w]
+        return any(t in w or w in t for w in words for t in terms)
+
+    expected = {i for i, ep in enumerate(episodes) if linear(ep)}
+    assert TermIndex(episodes).lookup(terms) == expected == {0, 1, 2}
+
+
+# ---------------------------------------------------------------------------
+# Commit cursor
+# ---------------------------------------------------------------------------
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo, message):
+    _git(repo, "commit", "--allow-empty", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    if shutil.which("git") is None:
+        pytest.skip("git binary not available")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    mem = tmp_path / ".claude" / "project-context" / "episodic-memory"
+    mem.mkdir(parents=True)
+    (mem / "index.json").write_text(json.dumps({"episodes": [
+        {"id": "ep-helm", "title": "Helm release notes", "relevance_score": 1.0},
+        {"id": "ep-flux", "tags": ["flux"], "relevance_score": 1.0},
+    ]}))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _scores(repo):
+    index = repo / ".claude" / "project-context" / "episodic-memory" / "index.json"
+    return {e["id"]: e["relevance_score"] for e in json.loads(index.read_text())["episodes"]}
+
+
+def test_cursor_limits_second_run_to_new_commits(repo):
+    _commit(repo, "migrate from helm")
+    first = check_recent_commits(dry_run=False)
+    assert first["affected_episodes"] == ["ep-helm"]
+    assert first["cursor"]
+
+    _commit(repo, "replace flux with argocd")
+    second = check_recent_commits(dry_run=False)
+
+    assert second["commits_scanned"] == 1
+    assert second["affected_episodes"] == ["ep-flux"]
+    # The helm commit was not reapplied.
+    assert _scores(repo) == {"ep-helm": 0.5, "ep-flux": 0.5}
+
+
+def test_dry_run_does_not_advance_cursor(repo):
+    _commit(repo, "migrate from helm")
+    check_recent_commits(dry_run=True)
+    cursor = repo / ".claude" / "project-context" / "episodic-memory" / CURSOR_FILENAME
+
+    assert not cursor.exists()
+    assert check_recent_commits(dry_run=True)["commits_scanned"] == 1
+
+
+def test_unknown_cursor_falls_back_to_window(repo):
+    _commit(repo, "migrate from helm")
+    cursor = repo / ".claude" / "project-context" / "episodic-memory" / CURSOR_FILENAME
+    cursor.write_text(json.dumps({"last_commit": "f" * 40}))
+
+    result = check_recent_commits(dry_run=True)
+
+    assert result["commits_scanned"] == 1
+    assert result["affected_episodes"] == ["ep-helm"]
@@ -0,0 +1,140 @@
+"""
+test_context_snapshot.py -- versioned get_context() snapshot in gaia.db.
+
+Verifies:
+  - a repeated get_context() with no write in between is served from the
+    snapshot (no entity-table SELECTs)
+  - every writer entry point bumps workspace_versions and invalidates it
+  - delete_missing_in only bumps when rows were actually deleted
+  - wipe_workspace drops version + snapshot via FK cascade
+  - a DB created before the snapshot tables is upgraded in place
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from gaia.store import bulk_upsert, get_context, upsert_project
+from gaia.store import connection as pool
+from gaia.store.writer import _connect, delete_missing_in, save_integration, wipe_workspace
+
+WS = "ws"
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> Path:
+    path = tmp_path / "gaia.db"
+    con = _connect(path)
+    con.execute(
+        "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+        "VALUES ('projects', 'developer', 1)"
+    )
+    con.commit()
+    con.close()
+    yield path
+    pool.close_all(path)
+
+
+def _version(db: Path) -> int:
+    con = _connect(db)
+    try:
+        row = con.execute(
+            "SELECT version FROM workspace_versions WHERE workspace = ?", (WS,)
+        ).fetchone()
+        return row["version"] if row else 0
+    finally:
+        con.close()
+
+
+def _traced_get_context(db: Path) -> tuple[dict, list[str]]:
+    """Run get_context on a pooled connection while recording its SQL."""
+    statements: list[str] = []
+    con = _connect(db)
+    con.set_trace_callback(statements.append)
+    # Park it back in the idle pool without _release (which clears the
+    # trace callback) so get_context picks up this exact connection.
+    con._checked_out = False
+    pool._idle_pools()[str(db)].append(con)
+    return get_context(WS, db_path=db), statements
+
+
+def test_repeated_read_is_single_snapshot_lookup(db):
+    bulk_upsert("projects", WS, [{"name": "api"}], agent="developer", db_path=db)
+    first = get_context(WS, db_path=db)
+
+    second, statements = _traced_get_context(db)
+
+    assert second == first
+    assert len(statements) == 1
+    assert "context_snapshots" in statements[0]
+
+
+def test_writes_bump_version_and_invalidate_snapshot(db):
+    upsert_project(WS, "api", {"role": "service"}, agent="developer", db_path=db)
+    assert _version(db) == 1
+    assert [p["name"] for p in get_context(WS, db_path=db)["workspace"]["projects"]] == ["api"]
+
+    bulk_upsert("projects", WS, [{"name": "web"}], agent="developer", db_path=db)
+    save_integration(WS, "gaia", kind="plugin", db_path=db)
+    assert _version(db) == 3
+
+    ctx = get_context(WS, db_path=db)
+    assert [p["name"] for p in ctx["workspace"]["projects"]] == ["api", "web"]
+    assert [i["name"] for i in ctx["workspace"]["integrations"]] == ["gaia"]
+
+
+def test_delete_missing_in_bumps_only_when_rows_removed(db):
+    bulk_upsert("projects", WS, [{"name": "api"}, {"name": "web"}], agent="developer", db_path=db)
+    get_context(WS, db_path=db)
+    before = _version(db)
+
+    assert delete_missing_in("projects", WS, [("api",), ("web",)], db_path=db) == 0
+    assert _version(db) == before
+
+    assert delete_missing_in("projects", WS, [("api",)], db_path=db) == 1
+    assert _version(db) == before + 1
+    assert [p["name"] for p in get_context(WS, db_path=db)["workspace"]["projects"]] == ["api"]
+
+
+def test_wipe_workspace_drops_version_and_snapshot(db):
+    bulk_upsert("projects", WS, [{"name": "api"}], agent="developer", db_path=db)
+    get_context(WS, db_path=db)
+
+    wipe_workspace(WS, db_path=db)
+
+    assert get_context(WS, db_path=db) is None
+    con = _connect(db)
+    try:
+        assert con.execute("SELECT COUNT(*) FROM context_snapshots").fetchone()[0] == 0
+        assert con.execute("SELECT COUNT(*) FROM workspace_versions").fetchone()[0] == 0
+    finally:
+        con.close()
+
+
+def test_missing_workspace_is_not_cached(db):
+    assert get_context("nope", db_path=db) is None
+    con = _connect(db)
+    try:
+        assert con.execute("SELECT COUNT(*) FROM context_snapshots").fetchone()[0] == 0
+    finally:
+        con.close()
+
+
+def test_pre_snapshot_db_is_upgraded(tmp_path):
+    db = tmp_path / "legacy.db"
+    raw = sqlite3.connect(db)
+    raw.execute("CREATE TABLE workspaces (name TEXT PRIMARY KEY, identity TEXT, created_at TEXT)")
+    raw.commit()
+    raw.close()
+
+    con = _connect(db)
+    try:
+        tables = {r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert {"workspace_versions", "context_snapshots"} <= tables
+        assert con.execute("PRAGMA user_version").fetchone()[0] == pool.SCHEMA_VERSION
+    finally:
+        con.close()
+        pool.close_all(db)
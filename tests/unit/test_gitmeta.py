@@ -0,0 +1,137 @@
+"""
+test_gitmeta.py -- in-process git metadata reader (gaia/gitmeta.py).
+
+Verifies:
+  - remotes, insteadOf rewrites, HEAD and branches (loose + packed refs)
+  - detached HEAD, linked worktrees (gitdir file + commondir), upward discovery
+  - the per-repo cache is reused until a source file changes
+  - parity with ``git remote get-url origin`` and no subprocess spawned
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gaia import gitmeta
+from gaia.gitmeta import find_git_dir, read_git_dir, remote_origin, repo_metadata
+
+
+def _make_repo(root: Path, config: str, head: str = "ref: refs/heads/main\n") -> Path:
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "config").write_text(config)
+    (git_dir / "HEAD").write_text(head)
+    return git_dir
+
+
+_CONFIG = """\
+[core]
+\tbare = false
+[remote "origin"]
+\turl = gh:acme/api.git
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+[remote "upstream"]
+\turl = "https://gitlab.com/acme/api.git" ; trailing comment
+[url "git@github.com:"]
+\tinsteadOf = gh:
+"""
+
+
+def test_config_remotes_and_insteadof(tmp_path: Path) -> None:
+    git_dir = _make_repo(tmp_path, _CONFIG)
+
+    meta = read_git_dir(git_dir)
+
+    assert meta.remotes == (("origin", "gh:acme/api.git"), ("upstream", "https://gitlab.com/acme/api.git"))
+    assert meta.remote_url("origin") == "git@github.com:acme/api.git"
+    assert meta.remote_url("upstream") == "https://gitlab.com/acme/api.git"
+    assert meta.remote_url("missing") is None
+
+
+def test_loose_and_packed_refs(tmp_path: Path) -> None:
+    git_dir = _make_repo(tmp_path, _CONFIG)
+    (git_dir / "refs" / "heads" / "feature").mkdir()
+    (git_dir / "refs" / "heads" / "feature" / "login").write_text("a" * 40 + "\n")
+    (git_dir / "refs" / "remotes" / "origin").mkdir(parents=True)
+    (git_dir / "refs" / "remotes" / "origin" / "HEAD").write_text("ref: refs/remotes/origin/main\n")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{'b' * 40} refs/heads/main\n"
+        f"{'c' * 40} refs/remotes/origin/develop\n"
+        f"{'d' * 40} refs/tags/v1\n"
+        f"^{'e' * 40}\n"
+    )
+
+    meta = read_git_dir(git_dir)
+
+    assert meta.branch == "main"
+    assert meta.branches == ("feature/login", "main")
+    assert meta.remote_branches == ("origin/develop",)
+
+
+def test_detached_head(tmp_path: Path) -> None:
+    meta = read_git_dir(_make_repo(tmp_path, _CONFIG, head="f" * 40 + "\n"))
+
+    assert meta.head is None
+    assert meta.branch is None
+
+
+def test_worktree_gitdir_file_uses_common_dir(tmp_path: Path) -> None:
+    main = tmp_path / "main"
+    common = _make_repo(main, _CONFIG)
+    wt_git = common / "worktrees" / "wt"
+    wt_git.mkdir(parents=True)
+    (wt_git / "HEAD").write_text("ref: refs/heads/hotfix\n")
+    (wt_git / "commondir").write_text("../..\n")
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {wt_git}\n")
+
+    meta = repo_metadata(worktree)
+
+    assert meta is not None
+    assert meta.git_dir == wt_git
+    assert meta.common_dir == common.resolve()
+    assert meta.branch == "hotfix"
+    assert remote_origin(worktree) == "git@github.com:acme/api.git"
+
+
+def test_discovery_walks_upward(tmp_path: Path) -> None:
+    git_dir = _make_repo(tmp_path, _CONFIG)
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+
+    assert find_git_dir(nested) == git_dir.resolve()
+
+
+def test_cache_reused_until_config_changes(tmp_path: Path) -> None:
+    git_dir = _make_repo(tmp_path, _CONFIG)
+    first = read_git_dir(git_dir)
+
+    with patch.object(gitmeta, "_read", wraps=gitmeta._read) as spy:
+        assert read_git_dir(git_dir) is first
+        spy.assert_not_called()
+
+        (git_dir / "config").write_text('[remote "origin"]\n\turl = https://github.com/acme/web.git\n')
+        assert read_git_dir(git_dir).remote_url() == "https://github.com/acme/web.git"
+        spy.assert_called_once()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git binary not available")
+def test_parity_with_git_cli(tmp_path: Path) -> None:
+    subprocess.run(["git", "init", "--quiet"], cwd=tmp_path, check=True)
+    subprocess.run(
+        ["git", "remote", "add", "origin", "git@github.com:acme/infra.git"], cwd=tmp_path, check=True
+    )
+    expected = subprocess.run(
+        ["git", "-C", str(tmp_path), "remote", "get-url", "origin"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+    with patch("subprocess.run", side_effect=AssertionError("subprocess spawned")):
+        assert remote_origin(tmp_path) == expected
@@ -0,0 +1,230 @@
+"""
+test_harness_ingest.py -- gaia.store.ingest mirrors events.jsonl into harness_events.
+
+Verifies:
+  - a second run with no new lines inserts nothing; appended lines are
+    picked up from the cursor without re-reading the head
+  - a partial trailing line waits for its newline
+  - one transaction per batch: a failing batch leaves earlier batches and
+    their cursor committed
+  - a rewritten / rotated file is re-read from the start without duplicates
+  - rows already loaded by migrate_04 (same event_hash) are not duplicated
+  - a DB created before event_hash is upgraded in place
+  - each row takes the workspace its record names, else NULL
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from gaia.store import connection as pool
+from gaia.store import ingest
+from gaia.store.ingest import event_hash, event_row, ingest_events
+from gaia.store.writer import _connect
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> Path:
+    path = tmp_path / "gaia.db"
+    yield path
+    pool.close_all(path)
+
+
+@pytest.fixture()
+def events(tmp_path: Path) -> Path:
+    return tmp_path / "events" / "events.jsonl"
+
+
+def _record(i: int, **extra) -> dict:
+    return {"ts": f"2026-05-07T10:00:{i:02d}+00:00", "type": "command.executed",
+            "source": "hook", "agent": "developer", "result": f"ok: cmd {i}",
+            "severity": "info", **extra}
+
+
+def _append(path: Path, records, *, raw: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for r in records:
+            f.write(json.dumps(r, separators=(",", ":")) + "\n")
+        f.write(raw)
+
+
+def _results(db: Path) -> list[str]:
+    con = _connect(db)
+    try:
+        return [r[0] for r in con.execute("SELECT result FROM harness_events ORDER BY ts")]
+    finally:
+        con.close()
+
+
+def test_incremental_runs_only_read_new_lines(db, events):
+    _append(events, [_record(i) for i in range(3)])
+
+    first = ingest_events(events, workspace="me", db_path=db)
+    again = ingest_events(events, workspace="me", db_path=db)
+    _append(events, [_record(3)])
+    third = ingest_events(events, workspace="me", db_path=db)
+
+    assert first["inserted"] == 3
+    assert again["read"] == 0 and again["inserted"] == 0
+    assert third["read"] == 1 and third["inserted"] == 1
+    assert third["offset"] == events.stat().st_size
+    assert _results(db) == [f"ok: cmd {i}" for i in range(4)]
+
+
+def test_partial_trailing_line_waits_for_newline(db, events):
+    line = json.dumps(_record(1), separators=(",", ":"))
+    _append(events, [_record(0)], raw=line[:20])
+
+    first = ingest_events(events, db_path=db)
+    with open(events, "a") as f:
+        f.write(line[20:] + "\n")
+    second = ingest_events(events, db_path=db)
+
+    assert first["inserted"] == 1
+    assert second["inserted"] == 1
+    assert _results(db) == ["ok: cmd 0", "ok: cmd 1"]
+
+
+def test_malformed_lines_are_skipped_and_consumed(db, events):
+    _append(events, [_record(0), {"type": "no.ts"}], raw="not json\n\n")
+
+    summary = ingest_events(events, db_path=db)
+
+    assert summary["inserted"] == 1
+    assert summary["skipped"] == 2
+    assert ingest_events(events, db_path=db)["read"] == 0
+
+
+def test_failed_batch_keeps_earlier_batches(db, events, monkeypatch):
+    _append(events, [_record(i) for i in range(5)])
+    real = ingest._commit_batch
+    calls = []
+
+    def flaky(con, rows, *args):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("disk I/O error")
+        return real(con, rows, *args)
+
+    monkeypatch.setattr(ingest, "_commit_batch", flaky)
+    with pytest.raises(sqlite3.OperationalError):
+        ingest_events(events, db_path=db, batch_size=2)
+    assert _results(db) == ["ok: cmd 0", "ok: cmd 1"]
+
+    monkeypatch.setattr(ingest, "_commit_batch", real)
+    resumed = ingest_events(events, db_path=db, batch_size=2)
+
+    assert resumed["read"] == 3
+    assert resumed["duplicates"] == 0
+    assert _results(db) == [f"ok: cmd {i}" for i in range(5)]
+
+
+def test_rewritten_file_is_reread_without_duplicates(db, events):
+    _append(events, [_record(i) for i in range(4)])
+    ingest_events(events, db_path=db)
+
+    # cleanup_old_events-style rewrite in place: drop the two oldest lines,
+    # then a writer appends before the next ingest.
+    events.write_text("".join(
+        json.dumps(_record(i), separators=(",", ":")) + "\n" for i in (2, 3, 4, 5, 6)
+    ))
+    summary = ingest_events(events, db_path=db)
+
+    assert summary["reset"] is True
+    assert summary["inserted"] == 3
+    assert summary["duplicates"] == 2
+    assert _results(db) == [f"ok: cmd {i}" for i in range(7)]
+
+
+def test_rotated_file_is_reread(db, events):
+    _append(events, [_record(0)])
+    ingest_events(events, db_path=db)
+    rotated = events.with_name("events.jsonl.1")
+    os.replace(events, rotated)
+    _append(events, [_record(1)])
+
+    summary = ingest_events(events, db_path=db)
+
+    assert summary["inserted"] == 1
+    assert _results(db) == ["ok: cmd 0", "ok: cmd 1"]
+
+
+def test_missing_file(db, events):
+    assert ingest_events(events, db_path=db)["status"] == "missing"
+
+
+def test_hash_ignores_key_order_and_escaping(db, events):
+    record = _record(0, meta={"note": "café"})
+    reordered = dict(reversed(list(record.items())))
+
+    assert event_hash(record) == event_hash(reordered)
+
+    # A row loaded by migrate_04 (ensure_ascii=False payload, same hash)
+    # is recognised by the live ingester.
+    con = _connect(db)
+    con.execute(
+        f"INSERT INTO harness_events ({', '.join(ingest.COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in ingest.COLUMNS)})",
+        event_row(reordered, "me"),
+    )
+    con.commit()
+    con.close()
+    events.parent.mkdir(parents=True)
+    events.write_text(json.dumps(record) + "\n")
+
+    summary = ingest_events(events, workspace="me", db_path=db)
+
+    assert summary["inserted"] == 0
+    assert summary["duplicates"] == 1
+
+
+def test_pre_hash_db_is_upgraded(tmp_path, events):
+    db = tmp_path / "legacy.db"
+    raw = sqlite3.connect(db)
+    raw.execute(
+        "CREATE TABLE harness_events (id INTEGER PRIMARY KEY AUTOINCREMENT, workspace TEXT, "
+        "ts TEXT NOT NULL, type TEXT NOT NULL, source TEXT, agent TEXT, result TEXT, "
+        "severity TEXT, payload TEXT)"
+    )
+    raw.execute("INSERT INTO harness_events (ts, type) VALUES ('2026-01-01', 'legacy')")
+    raw.execute("PRAGMA user_version = 2")
+    raw.commit()
+    raw.close()
+    _append(events, [_record(0)])
+
+    try:
+        assert ingest_events(events, db_path=db)["inserted"] == 1
+        con = _connect(db)
+        try:
+            assert con.execute("SELECT COUNT(*) FROM harness_events").fetchone()[0] == 2
+            assert con.execute("PRAGMA user_version").fetchone()[0] == pool.SCHEMA_VERSION
+        finally:
+            con.close()
+    finally:
+        pool.close_all(db)
+
+
+def test_workspace_comes_from_each_record(db, events):
+    _append(events, [
+        _record(0, workspace="alpha"),
+        _record(1, project="beta"),
+        _record(2),
+        _record(3, workspace="global"),
+    ])
+
+    ingest_events(events, db_path=db)
+
+    con = _connect(db)
+    try:
+        rows = con.execute("SELECT result, workspace FROM harness_events ORDER BY ts").fetchall()
+    finally:
+        con.close()
+    assert [tuple(r) for r in rows] == [
+        ("ok: cmd 0", "alpha"), ("ok: cmd 1", "beta"), ("ok: cmd 2", None), ("ok: cmd 3", None),
+    ]
@@ -0,0 +1,147 @@
+"""
+test_query_aggregate.py -- SQL pushdown for ``gaia query --count/--group-by``.
+
+Verifies:
+  - aggregate_query returns exactly what group_and_count computes over an
+    uncapped cross_surface_query, for every group_by and filter mix
+  - counts are exact over the window, not over the per-surface cap
+  - bucketed harness_events / episodes scans are served by covering indexes
+  - a v3 DB gets the new indexes on upgrade
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from gaia.store import connection as pool
+from gaia.store.reader import aggregate_query, cross_surface_query, group_and_count
+from gaia.store.writer import _connect
+
+AGENTS = ["developer", "orchestrator", None, ""]
+TYPES = ["command.executed", "agent.dispatch", "session.end"]
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> Path:
+    path = tmp_path / "gaia.db"
+    rng = random.Random(42)
+    con = _connect(path)
+    for ws in ("me", "other"):
+        con.execute("INSERT INTO workspaces (name, identity) VALUES (?, ?)", (ws, ws))
+    for i in range(60):
+        day = f"2026-05-{1 + i % 9:02d}"
+        ws = rng.choice(["me", "other"])
+        con.execute(
+            "INSERT INTO memory (workspace, name, type, body, updated_at) VALUES (?, ?, ?, 'b', ?)",
+            (ws, f"m{i}", rng.choice(["project", "user", "feedback"]),
+             None if i % 7 == 0 else f"{day}T10:00:00Z"),
+        )
+        con.execute(
+            "INSERT INTO episodes (episode_id, workspace, timestamp, agent, type, plan_status, outcome) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (f"e{i}", ws, f"{day}T11:{i % 60:02d}:00Z", rng.choice(AGENTS),
+             rng.choice(["task", None]), rng.choice(["COMPLETE", "BLOCKED", None]),
+             rng.choice(["success", "failed", None])),
+        )
+        con.execute(
+            "INSERT INTO harness_events (workspace, ts, type, agent, result, severity) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (rng.choice(["me", "other", None]), f"{day}T12:{i % 60:02d}:00Z", rng.choice(TYPES),
+             rng.choice(AGENTS), rng.choice(["ok: git push", "error: boom", "ok: ls"]),
+             rng.choice(["info", "error"])),
+        )
+    con.commit()
+    con.close()
+    yield path
+    pool.close_all(path)
+
+
+FILTERS = [
+    {},
+    {"workspace": "me"},
+    {"since": "2026-05-03", "until": "2026-05-07T23:59:59"},
+    {"agent": "developer", "failed": True},
+    {"type": "command.executed", "command_like": "%git%"},
+]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("group_by", [None, "surface", "agent", "type", "day"])
+@pytest.mark.parametrize("surface", ["all", "episodes", "harness_events", "memory"])
+def test_matches_python_aggregation(db, surface, group_by, filters):
+    rows = cross_surface_query(surface=surface, last=10_000, db_path=db, **filters)
+
+    expected = group_and_count(rows, group_by=group_by)
+
+    assert aggregate_query(surface=surface, group_by=group_by, db_path=db, **filters) == expected
+
+
+def test_counts_whole_window_not_capped_rows(db):
+    capped = group_and_count(cross_surface_query(surface="episodes", last=5, db_path=db), group_by=None)
+
+    assert capped == [{"count": 5}]
+    assert aggregate_query(surface="episodes", db_path=db) == [{"count": 60}]
+
+
+def test_invalid_group_by(db):
+    with pytest.raises(ValueError):
+        aggregate_query(group_by="severity", db_path=db)
+
+
+def _plan(db: Path, sql: str, params=()) -> str:
+    con = _connect(db)
+    try:
+        return " | ".join(r[3] for r in con.execute("EXPLAIN QUERY PLAN " + sql, params))
+    finally:
+        con.close()
+
+
+def test_bucketed_scans_use_covering_indexes(db):
+    by_type = _plan(
+        db,
+        "SELECT COALESCE(type, ''), COUNT(*) FROM harness_events WHERE type = ? AND ts >= ? GROUP BY 1",
+        ("command.executed", "2026-05-03"),
+    )
+    by_day = _plan(
+        db,
+        "SELECT substr(ts, 1, 10), COUNT(*) FROM harness_events "
+        "WHERE (workspace = ? OR workspace IS NULL) AND ts >= ? GROUP BY 1",
+        ("me", "2026-05-03"),
+    )
+    episodes = _plan(
+        db,
+        "SELECT COALESCE(agent, ''), COUNT(*) FROM episodes WHERE workspace = ? AND timestamp >= ? GROUP BY 1",
+        ("me", "2026-05-03"),
+    )
+
+    assert "COVERING INDEX idx_harness_events_type_ts" in by_type
+    assert "COVERING INDEX" in by_day
+    assert "COVERING INDEX idx_episodes_workspace_bucket" in episodes
+
+
+def test_v3_db_gets_aggregate_indexes(tmp_path):
+    db = tmp_path / "v3.db"
+    raw = sqlite3.connect(db)
+    raw.execute(
+        "CREATE TABLE harness_events (id INTEGER PRIMARY KEY AUTOINCREMENT, workspace TEXT, "
+        "ts TEXT NOT NULL, type TEXT NOT NULL, source TEXT, agent TEXT, result TEXT, "
+        "severity TEXT, payload TEXT, event_hash TEXT)"
+    )
+    raw.execute("CREATE INDEX idx_harness_events_type ON harness_events(type)")
+    raw.execute("PRAGMA user_version = 3")
+    raw.commit()
+    raw.close()
+
+    con = _connect(db)
+    try:
+        indexes = {r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    finally:
+        con.close()
+        pool.close_all(db)
+
+    assert {"idx_harness_events_type_ts", "idx_harness_events_ts_bucket"} <= indexes
+    assert "idx_harness_events_type" not in indexes
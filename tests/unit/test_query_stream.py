@@ -0,0 +1,106 @@
+"""
+test_query_stream.py -- keyset-paginated, k-way merged ``iter_query``.
+
+Verifies:
+  - the merged stream is newest first across surfaces and matches sorting
+    the per-surface results, whatever the page size
+  - timestamp ties across page boundaries are neither skipped nor repeated
+  - the per-surface ``last`` cap still applies; ``None`` streams everything
+  - pages are fetched lazily: reading the head of a large window issues
+    one page per surface, not the whole window
+  - invalid arguments raise at call time
+"""
+
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+
+import pytest
+
+from gaia.store import connection as pool
+from gaia.store import reader
+from gaia.store.reader import iter_query
+from gaia.store.writer import _connect
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> Path:
+    path = tmp_path / "gaia.db"
+    con = _connect(path)
+    con.execute("INSERT INTO workspaces (name, identity) VALUES ('me', 'me')")
+    for i in range(40):
+        # Few distinct timestamps -> many ties, also across page boundaries.
+        ts = f"2026-05-0{1 + i % 4}T10:00:00Z"
+        con.execute(
+            "INSERT INTO episodes (episode_id, workspace, timestamp, agent) VALUES (?, 'me', ?, 'dev')",
+            (f"e{i:02d}", ts),
+        )
+        con.execute(
+            "INSERT INTO harness_events (workspace, ts, type, result) VALUES ('me', ?, 'command.executed', ?)",
+            (ts, f"ok: {i}"),
+        )
+        if i % 5 == 0:
+            con.execute(
+                "INSERT INTO memory (workspace, name, type, body, updated_at) VALUES ('me', ?, 'project', 'b', ?)",
+                (f"m{i}", None if i == 0 else ts),
+            )
+    con.commit()
+    con.close()
+    yield path
+    pool.close_all(path)
+
+
+def _ident(row: dict) -> tuple:
+    raw = row["raw"]
+    return row["surface"], raw.get("episode_id") or raw.get("id") or raw.get("name")
+
+
+@pytest.mark.parametrize("page_size", [1, 3, 7, 500])
+def test_merge_is_ordered_and_complete(db, page_size):
+    rows = list(iter_query(db_path=db, page_size=page_size))
+
+    assert len(rows) == 40 + 40 + 8
+    assert len({_ident(r) for r in rows}) == len(rows)
+    stamps = [r["timestamp"] for r in rows]
+    assert stamps == sorted(stamps, reverse=True)
+    assert rows[-1]["timestamp"] == ""  # memory row without updated_at sinks
+
+
+@pytest.mark.parametrize("surface", ["episodes", "harness_events", "memory"])
+def test_pages_match_single_query(db, surface):
+    paged = [_ident(r) for r in iter_query(surface=surface, db_path=db, page_size=3)]
+    whole = [_ident(r) for r in iter_query(surface=surface, db_path=db, page_size=1000)]
+
+    assert paged == whole
+
+
+def test_last_caps_each_surface(db):
+    rows = list(iter_query(last=5, db_path=db, page_size=2))
+
+    by_surface = {s: sum(r["surface"] == s for r in rows) for s in ("memory", "episodes", "harness_events")}
+    assert by_surface == {"memory": 5, "episodes": 5, "harness_events": 5}
+    assert reader.cross_surface_query(last=5, db_path=db) == rows
+
+
+def test_pages_are_fetched_lazily(db, monkeypatch):
+    statements: list[str] = []
+    real_connect = reader._connect
+
+    def traced(db_path=None):
+        con = real_connect(db_path)
+        con.set_trace_callback(statements.append)
+        return con
+
+    monkeypatch.setattr(reader, "_connect", traced)
+    head = list(itertools.islice(iter_query(surface="all", db_path=db, page_size=4), 3))
+
+    assert len(head) == 3
+    assert len([s for s in statements if s.startswith("SELECT")]) == 3  # one page per surface
+
+
+def test_invalid_arguments_raise_eagerly(db):
+    with pytest.raises(ValueError):
+        iter_query(surface="nope", db_path=db)
+    with pytest.raises(ValueError):
+        iter_query(since="garbage", db_path=db)
@@ -0,0 +1,145 @@
+"""
+test_scan_workspace_parallel.py -- parallel scan engine in store_populator.
+
+Verifies:
+  - a multi-project workspace scanned with a process pool writes the same
+    rows as a serial scan
+  - the whole workspace lands in one write transaction (one version bump)
+  - stale rows are pruned per project without touching sibling projects
+  - walk.index_project prunes noise dirs and serves both *.tf scanners
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gaia.store import connection as pool
+from gaia.store.writer import _connect
+from tools.scan.store_populator import _scan_tf_modules, scan_workspace_to_store
+from tools.scan.walk import index_project
+
+TABLES = ("projects", "apps", "tf_modules", "clusters_defined", "workloads", "features", "services")
+
+
+@pytest.fixture()
+def tmp_db(tmp_path: Path) -> Path:
+    db = tmp_path / "gaia.db"
+    con = _connect(db)
+    for table in TABLES:
+        con.execute(
+            "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+            "VALUES (?, 'developer', 1)",
+            (table,),
+        )
+    con.commit()
+    con.close()
+    yield db
+    pool.close_all(db)
+
+
+def _make_repo(root: Path, name: str) -> Path:
+    repo = root / name
+    (repo / ".git").mkdir(parents=True)
+    (repo / "infra").mkdir()
+    (repo / "infra" / "main.tf").write_text(
+        f'module "{name}-vpc" {{\n  source = "x/vpc"\n  version = "1.0"\n}}\n'
+        f'resource "google_container_cluster" "{name}-gke" {{}}\n'
+    )
+    # node_modules is pruned: this module must never be picked up.
+    (repo / "node_modules" / "dep").mkdir(parents=True)
+    (repo / "node_modules" / "dep" / "x.tf").write_text('module "vendored" {\n}\n')
+    (repo / "k8s").mkdir()
+    (repo / "k8s" / "deploy.yaml").write_text(
+        f"kind: Deployment\nmetadata:\n  name: {name}-api\n  namespace: prod\n"
+    )
+    (repo / "services" / "auth").mkdir(parents=True)
+    return repo
+
+
+def _dump(db: Path) -> dict:
+    con = _connect(db)
+    try:
+        return {
+            t: sorted(
+                tuple(v for k, v in dict(r).items() if k != "scanner_ts")
+                for r in con.execute(f"SELECT * FROM {t}")
+            )
+            for t in TABLES
+        }
+    finally:
+        con.close()
+
+
+def _version(db: Path, workspace: str) -> int:
+    con = _connect(db)
+    try:
+        row = con.execute(
+            "SELECT version FROM workspace_versions WHERE workspace = ?", (workspace,)
+        ).fetchone()
+        return row["version"] if row else 0
+    finally:
+        con.close()
+
+
+def test_parallel_scan_matches_serial(tmp_db, tmp_path):
+    ws_root = tmp_path / "ws"
+    for name in ("alpha", "beta", "gamma"):
+        _make_repo(ws_root, name)
+
+    serial_db = tmp_path / "serial.db"
+    con = _connect(serial_db)
+    con.executemany(
+        "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+        "VALUES (?, 'developer', 1)",
+        [(t,) for t in TABLES],
+    )
+    con.commit()
+    con.close()
+
+    try:
+        serial = scan_workspace_to_store("ws", ws_root, "developer", db_path=serial_db, workers=1)
+        parallel = scan_workspace_to_store("ws", ws_root, "developer", db_path=tmp_db, workers=3)
+        assert _dump(tmp_db) == _dump(serial_db)
+    finally:
+        pool.close_all(serial_db)
+
+    assert serial == parallel
+    assert parallel["beta"]["infrastructure"]["tf_modules"]["upsert"] == {"applied": 1, "rejected": 0}
+    assert {r[2] for r in _dump(tmp_db)["tf_modules"]} == {"alpha-vpc", "beta-vpc", "gamma-vpc"}
+
+
+def test_workspace_written_in_one_transaction(tmp_db, tmp_path):
+    ws_root = tmp_path / "ws"
+    for name in ("alpha", "beta"):
+        _make_repo(ws_root, name)
+
+    scan_workspace_to_store("ws", ws_root, "developer", db_path=tmp_db, workers=1)
+
+    assert _version(tmp_db, "ws") == 1
+
+
+def test_stale_rows_pruned_per_project(tmp_db, tmp_path):
+    ws_root = tmp_path / "ws"
+    alpha = _make_repo(ws_root, "alpha")
+    _make_repo(ws_root, "beta")
+    scan_workspace_to_store("ws", ws_root, "developer", db_path=tmp_db, workers=1)
+
+    (alpha / "k8s" / "deploy.yaml").unlink()
+    results = scan_workspace_to_store("ws", ws_root, "developer", db_path=tmp_db, workers=1)
+
+    assert results["alpha"]["orchestration"]["workloads"]["deleted"] == 1
+    assert [r[2] for r in _dump(tmp_db)["workloads"]] == ["beta-api"]
+
+
+def test_index_project_prunes_and_is_shared(tmp_path):
+    repo = _make_repo(tmp_path, "alpha")
+    files = index_project(repo)
+
+    assert [p.name for p in files.with_ext(".tf")] == ["main.tf"]
+    assert files.named("deploy.yaml") == [repo / "k8s" / "deploy.yaml"]
+    assert [m["name"] for m in _scan_tf_modules(repo, files)] == ["alpha-vpc"]
+    # The second scanner reuses the cached content instead of re-reading.
+    (repo / "infra" / "main.tf").unlink()
+    assert [m["name"] for m in _scan_tf_modules(repo, files)] == ["alpha-vpc"]
@@ -0,0 +1,125 @@
+"""
+test_store_bulk_upsert.py -- set-based bulk_upsert in gaia.store.writer.
+
+Verifies:
+  - projects/apps rows go through one permission check and one transaction
+  - apps rows create missing parent projects as stubs
+  - generic tables only update the columns each row provides, even when
+    rows of different column shapes are mixed
+  - unauthorized agents get every row rejected and nothing written
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gaia.store import bulk_upsert
+from gaia.store.writer import _connect
+
+
+@pytest.fixture()
+def tmp_db(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("GAIA_DATA_DIR", str(tmp_path))
+    from gaia.paths import db_path
+    db = db_path()
+    con = _connect(db)
+    for table in ("projects", "apps", "tf_modules"):
+        con.execute(
+            "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+            "VALUES (?, 'developer', 1)",
+            (table,),
+        )
+    con.commit()
+    con.close()
+    return db
+
+
+def test_projects_bulk_upsert_single_transaction(tmp_db):
+    statements: list[str] = []
+    rows = [{"name": f"repo-{i}", "role": "application"} for i in range(50)]
+
+    import gaia.store.writer as writer
+    original = writer._connect
+
+    def _tracing_connect(db_path=None):
+        con = original(db_path)
+        con.set_trace_callback(statements.append)
+        return con
+
+    writer._connect = _tracing_connect
+    try:
+        res = bulk_upsert("projects", "ws", rows, "developer", db_path=tmp_db)
+    finally:
+        writer._connect = original
+
+    assert res == {"applied": 50, "rejected": 0}
+    assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 1
+    assert sum(1 for s in statements if "agent_permissions" in s) == 1
+
+    con = _connect(tmp_db)
+    count = con.execute("SELECT COUNT(*) FROM projects WHERE workspace = 'ws'").fetchone()[0]
+    con.close()
+    assert count == 50
+
+
+def test_apps_bulk_upsert_creates_parent_stubs(tmp_db):
+    rows = [
+        {"project": "mono", "name": "web", "kind": "service"},
+        {"project": "mono", "name": "api", "kind": "service"},
+        {"project": "other", "name": "cli", "kind": "app"},
+    ]
+    res = bulk_upsert("apps", "ws", rows, "developer", db_path=tmp_db)
+    assert res == {"applied": 3, "rejected": 0}
+
+    con = _connect(tmp_db)
+    projects = {r[0] for r in con.execute("SELECT name FROM projects WHERE workspace = 'ws'")}
+    apps = {(r[0], r[1]) for r in con.execute("SELECT project, name FROM apps WHERE workspace = 'ws'")}
+    con.close()
+    assert projects == {"mono", "other"}
+    assert apps == {("mono", "web"), ("mono", "api"), ("other", "cli")}
+
+
+def test_generic_mixed_shapes_only_update_provided_columns(tmp_db):
+    bulk_upsert("projects", "ws", [{"name": "iac"}], "developer", db_path=tmp_db)
+    bulk_upsert(
+        "tf_modules", "ws",
+        [{"project": "iac", "name": "vpc", "source": "./vpc", "version": "1.0"}],
+        "developer", db_path=tmp_db,
+    )
+
+    res = bulk_upsert(
+        "tf_modules", "ws",
+        [
+            {"project": "iac", "name": "vpc", "version": "2.0"},
+            {"project": "iac", "name": "gke", "source": "./gke", "version": "3.0"},
+            {"project": "iac", "name": "vpc", "version": "2.1"},
+        ],
+        "developer", db_path=tmp_db,
+    )
+    assert res == {"applied": 3, "rejected": 0}
+
+    con = _connect(tmp_db)
+    vpc = con.execute(
+        "SELECT source, version FROM tf_modules WHERE workspace='ws' AND name='vpc'"
+    ).fetchone()
+    con.close()
+    assert vpc["source"] == "./vpc"
+    assert vpc["version"] == "2.1"
+
+
+def test_unauthorized_rejects_every_row(tmp_db):
+    rows = [{"name": "a"}, {"name": "b"}]
+    res = bulk_upsert("projects", "ws", rows, "nobody", db_path=tmp_db)
+    assert res == {"applied": 0, "rejected": 2}
+
+    con = _connect(tmp_db)
+    count = con.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+    con.close()
+    assert count == 0
+
+
+def test_unknown_table_raises(tmp_db):
+    with pytest.raises(ValueError):
+        bulk_upsert("nope", "ws", [{"name": "x"}], "developer", db_path=tmp_db)
@@ -0,0 +1,162 @@
+"""
+test_store_connection.py -- pooled connections for the gaia.db substrate.
+
+Verifies:
+  - close() returns the connection to the pool and the next call reuses it
+  - nested acquires never share a checked-out connection
+  - pragmas (WAL, synchronous=NORMAL, busy_timeout, temp_store) are applied
+  - an uncommitted transaction is rolled back on release
+  - GAIA_DB_POOL=0 disables pooling; close_all() forgets pooled state
+  - a deleted or replaced DB file is re-opened and re-bootstrapped
+  - concurrent writers from several threads all land without lock errors
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from gaia.store import bulk_upsert
+from gaia.store import connection as pool
+from gaia.store.writer import _connect
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> Path:
+    path = tmp_path / "gaia.db"
+    yield path
+    pool.close_all(path)
+
+
+def test_close_returns_connection_to_pool(db):
+    con = _connect(db)
+    con.close()
+    again = _connect(db)
+    try:
+        assert again is con
+        assert again.execute("SELECT 1").fetchone()[0] == 1
+    finally:
+        again.close()
+
+
+def test_nested_acquire_gets_distinct_connections(db):
+    outer = _connect(db)
+    inner = _connect(db)
+    try:
+        assert inner is not outer
+    finally:
+        inner.close()
+        outer.close()
+
+
+def test_pragmas_applied(db):
+    con = _connect(db)
+    try:
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert con.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert con.execute("PRAGMA busy_timeout").fetchone()[0] >= 1000
+        assert con.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert con.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    finally:
+        con.close()
+
+
+def test_schema_bootstrapped_once(db):
+    con = _connect(db)
+    try:
+        tables = {r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    finally:
+        con.close()
+    assert {"workspaces", "projects", "apps"} <= tables
+    assert str(db) in pool._schema_ready
+
+
+def test_release_rolls_back_open_transaction(db):
+    con = _connect(db)
+    con.execute("BEGIN IMMEDIATE")
+    con.execute("INSERT INTO workspaces (name, identity) VALUES ('ws', 'ws')")
+    con.close()
+
+    con = _connect(db)
+    try:
+        assert not con.in_transaction
+        assert con.execute("SELECT COUNT(*) FROM workspaces").fetchone()[0] == 0
+    finally:
+        con.close()
+
+
+def test_pool_disabled_by_env(db, monkeypatch):
+    monkeypatch.setenv("GAIA_DB_POOL", "0")
+    con = _connect(db)
+    con.close()
+    again = _connect(db)
+    try:
+        assert again is not con
+    finally:
+        again.close()
+
+
+def test_close_all_drops_idle_connections(db):
+    con = _connect(db)
+    con.close()
+    pool.close_all(db)
+    assert str(db) not in pool._schema_ready
+    again = _connect(db)
+    try:
+        assert again is not con
+    finally:
+        again.close()
+
+
+def test_concurrent_thread_writers(db):
+    con = _connect(db)
+    con.execute(
+        "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+        "VALUES ('projects', 'developer', 1)"
+    )
+    con.commit()
+    con.close()
+
+    errors: list[BaseException] = []
+
+    def _writer(n: int) -> None:
+        try:
+            for i in range(20):
+                bulk_upsert("projects", "ws", [{"name": f"t{n}-{i}"}], "developer", db_path=db)
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+        finally:
+            pool.close_all(db)
+
+    threads = [threading.Thread(target=_writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    con = _connect(db)
+    try:
+        assert con.execute("SELECT COUNT(*) FROM projects").fetchone()[0] == 80
+    finally:
+        con.close()
+
+
+def test_replaced_db_file_is_reopened_and_bootstrapped(db):
+    con = _connect(db)
+    con.close()
+    db.unlink()
+    for suffix in ("-wal", "-shm"):
+        Path(f"{db}{suffix}").unlink(missing_ok=True)
+
+    again = _connect(db)
+    try:
+        assert again is not con
+        assert again.execute("PRAGMA user_version").fetchone()[0] == pool.SCHEMA_VERSION
+        assert again.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects'"
+        ).fetchone()
+    finally:
+        again.close()
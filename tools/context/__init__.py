@@ -10,9 +10,11 @@ Main functions:
 - get_contract_context(): Get context for an agent based on its contract
 - get_context_update_contract(): Get readable/writable write permissions
 - load_provider_contracts(): Load cloud provider-specific contracts
+- pack_blocks(): Fit candidate context blocks into a per-agent token budget
 """
 
 from . import context_provider
+from .context_packer import ContextBlock, pack_blocks, resolve_token_budget
 from .context_section_reader import ContextSectionReader
 
 # Re-export key functions for convenience
@@ -31,6 +33,9 @@ from .surface_router import (
 __all__ = [
     "context_provider",  # module
     "ContextSectionReader",
+    "ContextBlock",
+    "pack_blocks",
+    "resolve_token_budget",
     # Main functions
     "load_project_context",
     "get_contract_context",
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Token-budget context packer.
+
+Takes every candidate block that could be injected into an agent's context
+(contract sections, memory index, episodes, anomaly alerts, pending-update
+reminders) and fills a per-agent token budget with a greedy knapsack pass.
+
+Sizes are computed exactly once, when a ``ContextBlock`` is created; every
+later stage (provider packing, injector tail packing, telemetry) reuses the
+cached ``tokens`` value instead of re-serializing and re-measuring.  A block
+is measured on the text the injector emits for it: contract sections are
+passed pre-rendered as YAML (``render_yaml``), other structured content is
+measured as the indent=2 JSON the injector prints.
+
+Selection order:
+  1. ``required`` blocks are always kept (they still consume budget).
+  2. Remaining blocks are sorted by priority (desc), then by size (asc) so
+     that, within a priority tier, more small blocks fit than one large one.
+  3. A block that does not fit is skipped -- not a stop condition -- so a
+     smaller lower-priority block can still use the leftover budget.
+
+Budget resolution (first match wins):
+  1. explicit argument (``--context-token-budget``)
+  2. ``GAIA_CONTEXT_TOKEN_BUDGET_<AGENT>`` (agent upper-cased, ``-`` -> ``_``)
+  3. ``GAIA_CONTEXT_TOKEN_BUDGET``
+  4. ``AGENT_TOKEN_BUDGETS[agent]`` or ``DEFAULT_TOKEN_BUDGET``
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_TOKEN_BUDGET = 8000
+
+# Per-agent defaults. Agents whose contracts read many large sections
+# (terraform layouts, cluster topology) get more headroom.
+AGENT_TOKEN_BUDGETS: Dict[str, int] = {
+    "terraform-architect": 10000,
+    "gitops-operator": 10000,
+    "cloud-troubleshooter": 10000,
+    "developer": 8000,
+    "gaia-system": 6000,
+    "gaia-operator": 6000,
+}
+
+# Priority tiers -- higher is kept first.
+PRIORITY_REQUIRED = 1000
+PRIORITY_ANCHORED_SECTION = 100
+PRIORITY_ANOMALY = 90
+PRIORITY_SECTION = 70
+PRIORITY_MEMORY_INDEX = 60
+PRIORITY_REMINDER = 50
+PRIORITY_EPISODE = 40
+PRIORITY_EVENTS = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate: 1 token ~= 4 characters."""
+    return len(text) // 4
+
+
+def _render(content: Any) -> str:
+    """Render block content to the text whose size is budgeted."""
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, indent=2, default=str)
+
+
+def render_yaml(d: Dict[str, Any], indent: int = 0) -> str:
+    """Render *d* as the injector renders project knowledge.
+
+    Mirrors ``_dict_to_yaml`` in hooks/modules/context/context_injector.py
+    (the hook cannot rely on tools/ being importable, so it keeps its own copy).
+    """
+    lines = []
+    prefix = "  " * indent
+    for key, value in d.items():
+        if value is None or value == "" or value == [] or value == {}:
+            continue
+        if isinstance(value, dict):
+            lines.append(f"{prefix}{key}:")
+            lines.append(render_yaml(value, indent + 1))
+        elif isinstance(value, list):
+            lines.append(f"{prefix}{key}:")
+            for item in value:
+                if isinstance(item, dict):
+                    item_lines = render_yaml(item, indent + 1).splitlines()
+                    if item_lines:
+                        lines.append(f"{prefix}  - {item_lines[0].lstrip()}")
+                        for il in item_lines[1:]:
+                            lines.append(f"{prefix}  {il}")
+                else:
+                    lines.append(f"{prefix}  - {item}")
+        else:
+            lines.append(f"{prefix}{key}: {value}")
+    return "\n".join(lines)
+
+
+@dataclass
+class ContextBlock:
+    """One candidate unit of injected context.
+
+    ``tokens`` is computed once in ``__post_init__`` unless supplied by a
+    caller that has already measured the block.  ``text`` is the rendered
+    form of ``content`` when the caller emits it differently from the
+    default JSON rendering; it is what gets measured.
+    """
+
+    key: str
+    kind: str
+    priority: int
+    content: Any
+    required: bool = False
+    tokens: Optional[int] = None
+    text: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.tokens is None:
+            rendered = self.text if self.text is not None else _render(self.content)
+            self.tokens = estimate_tokens(rendered)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.content in (None, "", [], {})
+
+
+@dataclass
+class PackResult:
+    """Outcome of a packing pass."""
+
+    budget: int
+    selected: List[ContextBlock] = field(default_factory=list)
+    dropped: List[ContextBlock] = field(default_factory=list)
+    tokens_used: int = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(self.budget - self.tokens_used, 0)
+
+    def selected_keys(self, kind: Optional[str] = None) -> List[str]:
+        return [b.key for b in self.selected if kind is None or b.kind == kind]
+
+    def to_report(self) -> Dict[str, Any]:
+        """Compact, JSON-serializable summary for metadata and telemetry."""
+        return {
+            "budget": self.budget,
+            "used": self.tokens_used,
+            "remaining": self.remaining,
+            "selected_count": len(self.selected),
+            "dropped_count": len(self.dropped),
+            "dropped": [
+                {"key": b.key, "kind": b.kind, "tokens": b.tokens, "priority": b.priority}
+                for b in self.dropped
+            ],
+        }
+
+
+def pack_blocks(blocks: Iterable[ContextBlock], budget: int) -> PackResult:
+    """Greedy knapsack selection of *blocks* within *budget* tokens.
+
+    Empty blocks are ignored entirely (neither selected nor dropped).
+    Selected blocks are returned in their original input order so callers
+    can render them without re-sorting.
+    """
+    candidates = [b for b in blocks if not b.is_empty]
+    result = PackResult(budget=budget)
+
+    order = {id(b): i for i, b in enumerate(candidates)}
+    chosen: List[ContextBlock] = []
+
+    for block in candidates:
+        if block.required:
+            chosen.append(block)
+            result.tokens_used += block.tokens
+
+    optional = sorted(
+        (b for b in candidates if not b.required),
+        key=lambda b: (-b.priority, b.tokens, order[id(b)]),
+    )
+    for block in optional:
+        if result.tokens_used + block.tokens <= budget:
+            chosen.append(block)
+            result.tokens_used += block.tokens
+        else:
+            result.dropped.append(block)
+
+    result.selected = sorted(chosen, key=lambda b: order[id(b)])
+    return result
+
+
+def resolve_token_budget(agent_name: str, explicit: Optional[int] = None) -> int:
+    """Resolve the context token budget for *agent_name* (see module docstring)."""
+    if explicit is not None:
+        return explicit
+
+    agent_var = "GAIA_CONTEXT_TOKEN_BUDGET_" + agent_name.upper().replace("-", "_")
+    for var in (agent_var, "GAIA_CONTEXT_TOKEN_BUDGET"):
+        raw = os.environ.get(var)
+        if raw:
+            try:
+                return int(raw)
+            except ValueError:
+                pass
+
+    return AGENT_TOKEN_BUDGETS.get(agent_name, DEFAULT_TOKEN_BUDGET)
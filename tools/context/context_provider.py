@@ -27,6 +27,17 @@ if _PACKAGE_ROOT not in sys.path:
 
 try:
     from ._paths import resolve_config_dir
+    from .context_packer import (
+        PRIORITY_ANCHORED_SECTION,
+        PRIORITY_EPISODE,
+        PRIORITY_MEMORY_INDEX,
+        PRIORITY_SECTION,
+        ContextBlock,
+        estimate_tokens,
+        pack_blocks,
+        render_yaml,
+        resolve_token_budget,
+    )
     from .surface_router import (
         build_investigation_brief,
         classify_surfaces,
@@ -34,6 +45,17 @@ try:
     )
 except ImportError:
     from _paths import resolve_config_dir
+    from context_packer import (
+        PRIORITY_ANCHORED_SECTION,
+        PRIORITY_EPISODE,
+        PRIORITY_MEMORY_INDEX,
+        PRIORITY_SECTION,
+        ContextBlock,
+        estimate_tokens,
+        pack_blocks,
+        render_yaml,
+        resolve_token_budget,
+    )
     from surface_router import (
         build_investigation_brief,
         classify_surfaces,
@@ -348,7 +370,7 @@ except ImportError:
 
 def _estimate_tokens(text: str) -> int:
     """Rough token estimate: 1 token ≈ 4 characters."""
-    return len(text) // 4
+    return estimate_tokens(text)
 
 
 def _build_memory_index_table(index_episodes: List[Dict[str, Any]]) -> str:
@@ -393,6 +415,7 @@ def load_relevant_episodes(
     user_task: str,
     max_episodes: int = 2,
     max_tokens: Optional[int] = None,
+    blocks_out: Optional[List[ContextBlock]] = None,
 ) -> Dict[str, Any]:
     """Load relevant historical episodes using 2-layer progressive disclosure.
 
@@ -413,6 +436,11 @@ def load_relevant_episodes(
         Total token budget for the episodic memory block.  Reads from
         ``GAIA_MEMORY_TOKEN_BUDGET`` env var when not supplied explicitly.
         Defaults to 2000.
+    blocks_out:
+        Optional list that receives the ``ContextBlock`` for the memory
+        index and for every selected episode, with token sizes already
+        computed.  ``main()`` passes these to the context packer so the
+        payload is measured only once.
     """
     import os as _os
 
@@ -440,7 +468,8 @@ def load_relevant_episodes(
 
         # --- Layer 1: Memory Index -- compact markdown table (~200 tokens, always included) ---
         layer1_text = _build_memory_index_table(all_index_episodes)
-        layer1_tokens = _estimate_tokens(layer1_text)
+        layer1_block = ContextBlock("memory_index", "memory_index", PRIORITY_MEMORY_INDEX, layer1_text)
+        layer1_tokens = layer1_block.tokens
         remaining_budget = max_tokens - layer1_tokens
 
         # --- Score and rank episodes: hybrid FTS5 + keyword fallback ---
@@ -494,6 +523,7 @@ def load_relevant_episodes(
 
         # --- Layer 2: full content of top episodes within remaining budget ---
         full_episodes = []
+        episode_blocks: List[ContextBlock] = []
         tokens_used = 0
         for ep in ranked:
             if len(full_episodes) >= max_episodes:
@@ -516,18 +546,27 @@ def load_relevant_episodes(
                 "lessons_learned": full_ep.get("lessons_learned", [])[:2],
                 "resolution": full_ep.get("resolution", "")[:200],
             }
-            entry_text = json.dumps(episode_entry)
-            entry_tokens = _estimate_tokens(entry_text)
+            # Scale the priority by relevance so the packer keeps the best
+            # episodes first when the overall agent budget is tight.
+            entry_block = ContextBlock(
+                episode_entry["id"], "episode",
+                PRIORITY_EPISODE + int(min(score, 1.0) * 10),
+                episode_entry,
+            )
 
-            if tokens_used + entry_tokens > remaining_budget:
+            if tokens_used + entry_block.tokens > remaining_budget:
                 break
 
             full_episodes.append(episode_entry)
-            tokens_used += entry_tokens
+            episode_blocks.append(entry_block)
+            tokens_used += entry_block.tokens
 
         result: Dict[str, Any] = {
             "memory_index": layer1_text,
         }
+        if blocks_out is not None:
+            blocks_out.append(layer1_block)
+            blocks_out.extend(episode_blocks)
 
         if full_episodes:
             result["episodes"] = full_episodes
@@ -612,6 +651,69 @@ def load_full_episode(episode_id: str, memory_dir: Path) -> Optional[Dict[str, A
     return None
 
 
+# ============================================================================
+# CONTEXT PACKING
+# ============================================================================
+
+def pack_context(
+    contract_context: Dict[str, Any],
+    historical_context: Dict[str, Any],
+    memory_blocks: List[ContextBlock],
+    budget: int,
+    anchored_sections: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Fit contract sections and episodic memory into *budget* tokens.
+
+    Contract sections are required: they are always kept and only episodic
+    memory competes for the remaining budget.  Sections listed in
+    *anchored_sections* (the brief's ``contract_sections_to_anchor``) keep
+    their higher priority in the budget report.  ``memory_blocks``
+    come pre-measured from ``load_relevant_episodes(blocks_out=...)``.
+
+    Mutates *historical_context* in place to drop unselected episodes (or
+    the memory index) and returns the filtered contract context together
+    with the ``PackResult`` under ``"result"``.
+    """
+    anchored = set(anchored_sections or [])
+    blocks = [
+        ContextBlock(
+            name, "section",
+            PRIORITY_ANCHORED_SECTION if name in anchored else PRIORITY_SECTION,
+            content,
+            required=True,
+            text=render_yaml({name: content}),
+        )
+        for name, content in contract_context.items()
+    ]
+    blocks.extend(memory_blocks)
+
+    result = pack_blocks(blocks, budget)
+
+    kept_sections = set(result.selected_keys("section"))
+    packed_sections = {k: v for k, v in contract_context.items() if k in kept_sections}
+
+    if historical_context:
+        kept_episodes = set(result.selected_keys("episode"))
+        if "episodes" in historical_context:
+            historical_context["episodes"] = [
+                ep for ep in historical_context["episodes"] if ep.get("id") in kept_episodes
+            ]
+            if not historical_context["episodes"]:
+                historical_context.pop("episodes")
+                historical_context.pop("summary", None)
+        if "memory_index" not in result.selected_keys("memory_index"):
+            historical_context.pop("memory_index", None)
+
+    if result.dropped:
+        print(
+            f"Context packing: {result.tokens_used}/{budget} tokens used, dropped "
+            f"{len(result.dropped)} block(s) ({', '.join(b.key for b in result.dropped)})",
+            file=sys.stderr,
+        )
+
+    return {"project_knowledge": packed_sections, "result": result}
+
+
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
@@ -641,6 +743,15 @@ def main():
             "Overrides GAIA_MEMORY_TOKEN_BUDGET env var. Default: 2000."
         ),
     )
+    parser.add_argument(
+        "--context-token-budget",
+        type=int,
+        default=None,
+        help=(
+            "Total token budget for the injected context (sections + memory). "
+            "Overrides GAIA_CONTEXT_TOKEN_BUDGET[_<AGENT>] env vars."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -680,7 +791,10 @@ def main():
     context_update_contract = get_context_update_contract(args.agent_name, provider_contracts)
 
     # Load historical episodes (2-layer progressive disclosure)
-    historical_context = load_relevant_episodes(args.user_task, max_tokens=memory_token_budget)
+    memory_blocks: List[ContextBlock] = []
+    historical_context = load_relevant_episodes(
+        args.user_task, max_tokens=memory_token_budget, blocks_out=memory_blocks,
+    )
 
     # Load universal rules
     rules_context = load_universal_rules(args.agent_name)
@@ -692,6 +806,17 @@ def main():
         routing=surface_routing,
     )
 
+    # Fit sections + memory into the agent's token budget (sizes computed once)
+    packed = pack_context(
+        contract_context,
+        historical_context,
+        memory_blocks,
+        resolve_token_budget(args.agent_name, args.context_token_budget),
+        anchored_sections=investigation_brief.get("contract_sections_to_anchor"),
+    )
+    contract_context = packed["project_knowledge"]
+    pack_result = packed["result"]
+
     # Build final payload
     final_payload = {
         "project_knowledge": contract_context,
@@ -707,6 +832,7 @@ def main():
             "surface_routing_version": surface_routing_config.get("version", "unknown"),
             "active_surfaces_count": len(surface_routing.get("active_surfaces", [])),
             "surface_routing_confidence": surface_routing.get("confidence", 0.0),
+            "context_budget": pack_result.to_report(),
         }
     }
 
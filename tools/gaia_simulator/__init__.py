@@ -8,6 +8,7 @@ Modules:
     extractor          - Log parser: ReplayEvent + LogExtractor
     runner             - Hook executor: ReplayResult + HookRunner
     reporter           - Results formatter: ReplayReporter
+    bench              - Baseline vs candidate hook trees: BenchRun + run_bench
     routing_simulator  - Surface routing simulation: RoutingSimulator
     skills_mapper      - Agent/skill/surface mapping: SkillsMapper
     cli                - Command-line entry point
@@ -16,6 +17,7 @@ Modules:
 from gaia_simulator.extractor import LogExtractor, ReplayEvent
 from gaia_simulator.runner import HookRunner, ReplayResult
 from gaia_simulator.reporter import ReplayReporter
+from gaia_simulator.bench import BenchRun, run_bench
 from gaia_simulator.routing_simulator import RoutingSimulator, RoutingResult
 from gaia_simulator.skills_mapper import SkillsMapper, SkillMapping, AgentProfile
 
@@ -25,6 +27,8 @@ __all__ = [
     "HookRunner",
     "ReplayResult",
     "ReplayReporter",
+    "BenchRun",
+    "run_bench",
     "RoutingSimulator",
     "RoutingResult",
     "SkillsMapper",
@@ -0,0 +1,183 @@
+"""
+Differential benchmark for gaia-ops hook trees.
+
+Replays one event corpus through a baseline and a candidate hooks tree and
+pairs the results event by event, so a security-rule change can be checked
+for decision drift and latency cost before release.
+
+Each tree is replayed in its own freshly spawned interpreter, one after the
+other: the in-process mode imports hook modules by package name
+(``adapters``, ``modules``), so two trees cannot share a process, and
+running them back to back keeps them from competing for the CPU.
+
+Latency is the wall time of each hook call as measured by ``HookRunner``.
+In subprocess mode that includes interpreter start-up and imports (what
+Claude Code pays per call); with ``in_process=True`` it is the validation
+logic alone. Percentiles are weighted by ``ReplayEvent.count``.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from gaia_simulator.extractor import ReplayEvent
+from gaia_simulator.runner import HookRunner, ReplayResult
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Weighted latency distribution of a group of replayed events."""
+
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True)
+class BenchRun:
+    """Paired replay results of one corpus through two hooks trees."""
+
+    baseline_dir: Path
+    candidate_dir: Path
+    baseline: list[ReplayResult]
+    candidate: list[ReplayResult]
+
+    def pairs(self) -> list[tuple[ReplayResult, ReplayResult]]:
+        """(baseline, candidate) result for each event, in corpus order."""
+        return list(zip(self.baseline, self.candidate))
+
+    def decision_diffs(self) -> list[tuple[ReplayResult, ReplayResult]]:
+        """Pairs whose decision, exit code or tier differ between the trees."""
+        return [(b, c) for b, c in self.pairs() if _outcome(b) != _outcome(c)]
+
+    def latency(self) -> tuple[LatencyStats, LatencyStats]:
+        """(baseline, candidate) latency over the whole corpus."""
+        return latency_stats(self.baseline), latency_stats(self.candidate)
+
+    def latency_by_tool(self) -> dict[str, tuple[LatencyStats, LatencyStats]]:
+        """(baseline, candidate) latency per tool name."""
+        return self._grouped(lambda r: r.event.tool_name or "n/a")
+
+    def latency_by_tier(self) -> dict[str, tuple[LatencyStats, LatencyStats]]:
+        """Grouped by the tier the baseline assigned (falling back to the logged one)."""
+        return self._grouped(lambda r: r.actual_tier or r.event.expected_tier or "n/a")
+
+    def _grouped(
+        self,
+        key: Callable[[ReplayResult], str],
+    ) -> dict[str, tuple[LatencyStats, LatencyStats]]:
+        """Pair up per-group latency; groups are keyed on the baseline result."""
+        groups: dict[str, tuple[list[ReplayResult], list[ReplayResult]]] = {}
+        for baseline, candidate in self.pairs():
+            base_group, cand_group = groups.setdefault(key(baseline), ([], []))
+            base_group.append(baseline)
+            cand_group.append(candidate)
+        return {
+            name: (latency_stats(base_group), latency_stats(cand_group))
+            for name, (base_group, cand_group) in sorted(groups.items())
+        }
+
+
+def _outcome(result: ReplayResult) -> tuple[str, int, str]:
+    # stdout is not compared: T3 denials embed a random approval_id.
+    return result.actual_decision, result.actual_exit_code, result.actual_tier
+
+
+def resolve_hooks_dir(path: Path) -> Path:
+    """Accept a checkout root (with hooks/) or the hooks directory itself."""
+    path = Path(path).resolve()
+    if (path / "hooks" / "pre_tool_use.py").exists():
+        return path / "hooks"
+    return path
+
+
+def weighted_percentile(samples: list[tuple[float, int]], q: int) -> float:
+    """Nearest-rank percentile *q* (0-100) of (value, weight) samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    total = sum(weight for _, weight in ordered)
+    rank = max(1, -(-q * total // 100))  # integer ceil(q% of total)
+    seen = 0
+    for value, weight in ordered:
+        seen += weight
+        if seen >= rank:
+            return value
+    return ordered[-1][0]
+
+
+def latency_stats(results: list[ReplayResult]) -> LatencyStats:
+    """Latency distribution of *results*, weighted by event count."""
+    samples = [(r.duration_ms, r.event.count) for r in results]
+    total = sum(weight for _, weight in samples)
+    if not total:
+        return LatencyStats(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    return LatencyStats(
+        count=total,
+        mean_ms=sum(value * weight for value, weight in samples) / total,
+        p50_ms=weighted_percentile(samples, 50),
+        p90_ms=weighted_percentile(samples, 90),
+        p99_ms=weighted_percentile(samples, 99),
+        max_ms=max(value for value, _ in samples),
+    )
+
+
+def _replay_tree(
+    hooks_dir: Path,
+    events: list[ReplayEvent],
+    in_process: bool,
+    workers: int,
+) -> list[ReplayResult]:
+    """Spawned-process entry point: replay the corpus through one tree."""
+    runner = HookRunner(hooks_dir=hooks_dir, in_process=in_process)
+    warmup = None
+    if in_process:
+        # The adapter imports validators lazily on first use; pay that once
+        # per tool and worker outside the timed run so it does not land in p90/p99.
+        warmup = list({e.tool_name: e for e in events if e.hook_name == "pre_tool_use"}.values())
+    return runner.run_batch(events, workers=workers, warmup=warmup)
+
+
+def run_bench(
+    events: list[ReplayEvent],
+    baseline: Path,
+    candidate: Path,
+    in_process: bool = False,
+    workers: int = 1,
+    progress_callback: Optional[Callable[[str], None]] = None,
+) -> BenchRun:
+    """Replay *events* through the baseline, then the candidate hooks tree.
+
+    Args:
+        events: Corpus to replay (typically deduplicated).
+        baseline: Baseline checkout root or hooks directory.
+        candidate: Candidate checkout root or hooks directory.
+        in_process: Replay pre_tool_use through the imported adapter.
+        workers: Worker processes per tree.
+        progress_callback: Optional callable(label) called before each tree.
+
+    Returns:
+        BenchRun with results for both trees in corpus order.
+    """
+    baseline_dir = resolve_hooks_dir(baseline)
+    candidate_dir = resolve_hooks_dir(candidate)
+    context = multiprocessing.get_context("spawn")
+    results: dict[str, list[ReplayResult]] = {}
+    for label, hooks_dir in (("baseline", baseline_dir), ("candidate", candidate_dir)):
+        if progress_callback:
+            progress_callback(label)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[label] = pool.submit(_replay_tree, hooks_dir, events, in_process, workers).result()
+    return BenchRun(
+        baseline_dir=baseline_dir,
+        candidate_dir=candidate_dir,
+        baseline=results["baseline"],
+        candidate=results["candidate"],
+    )
@@ -10,15 +10,19 @@ Usage:
     python3 tools/gaia_simulator/cli.py --regressions-only       # show only failures
     python3 tools/gaia_simulator/cli.py --output results.json    # save results
     python3 tools/gaia_simulator/cli.py --extract-only           # extract without running
+    python3 tools/gaia_simulator/cli.py --workers 4 --in-process # fast parallel replay
+    python3 tools/gaia_simulator/cli.py --dedupe                 # replay each unique payload once
     python3 tools/gaia_simulator/cli.py --simulate "prompt"       # simulate routing
     python3 tools/gaia_simulator/cli.py --simulate-logs --date D  # simulate from logs
     python3 tools/gaia_simulator/cli.py --skills-map             # show skills map
     python3 tools/gaia_simulator/cli.py --agent-profiles         # show agent profiles
+    python3 tools/gaia_simulator/cli.py bench --baseline OLD --candidate NEW  # compare two trees
 """
 
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import sys
 from pathlib import Path
@@ -140,6 +144,97 @@ def _handle_agent_profiles(plugin_root: Path) -> int:
     return 0
 
 
+def _handle_bench(argv: list[str], logs_dir_default: Path) -> int:
+    """Handle the bench subcommand: replay one corpus through two hook trees.
+
+    Returns:
+        0 if the trees agree (and stay within --max-slowdown), 1 on decision
+        diffs or a p50 slowdown beyond it, 2 on error.
+    """
+    parser = argparse.ArgumentParser(
+        prog="gaia-sim bench",
+        description="Compare decisions and hook latency of two gaia-ops checkouts on the same log corpus.",
+    )
+    parser.add_argument("--baseline", type=Path, required=True,
+                        help="Baseline checkout root or hooks directory")
+    parser.add_argument("--candidate", type=Path, required=True,
+                        help="Candidate checkout root or hooks directory")
+    parser.add_argument("--logs-dir", type=Path, default=logs_dir_default,
+                        help="Directory containing log files (default: " + str(logs_dir_default) + ")")
+    parser.add_argument("--date", type=str, default=None, help="Filter by date (YYYY-MM-DD format)")
+    parser.add_argument("--hook", type=str, default=None, help="Filter by hook name (e.g. pre_tool_use)")
+    parser.add_argument("--limit", type=int, default=0, help="Limit number of events to replay (0 = all)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for log parsing and for replay, per tree (default: 1)")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Time the pre_tool_use adapter directly, without interpreter start-up")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="Replay identical payloads once and weight the report by their count")
+    parser.add_argument("--max-slowdown", type=float, default=None, metavar="FACTOR",
+                        help="Exit 1 if the candidate's overall p50 is more than FACTOR times the baseline's")
+    parser.add_argument("--report-format", choices=("text", "json"), default="text",
+                        help="Emit text for humans or JSON for machines")
+    parser.add_argument("--output", type=Path, default=None, help="Save the JSON report to a file")
+    args = parser.parse_args(argv)
+
+    from gaia_simulator.bench import resolve_hooks_dir, run_bench
+    from gaia_simulator.extractor import LogExtractor, dedupe_events
+    from gaia_simulator.reporter import ReplayReporter
+
+    def status(message: str = "") -> None:
+        target = sys.stderr if args.report_format == "json" else sys.stdout
+        print(message, file=target)
+
+    if not args.logs_dir.is_dir():
+        print("Error: Logs directory not found: " + str(args.logs_dir), file=sys.stderr)
+        return 2
+    for label, path in (("Baseline", args.baseline), ("Candidate", args.candidate)):
+        if not (resolve_hooks_dir(path) / "pre_tool_use.py").exists():
+            print("Error: " + label + " has no hooks/pre_tool_use.py: " + str(path), file=sys.stderr)
+            return 2
+
+    stream = LogExtractor().iter_all(
+        args.logs_dir, date_filter=args.date, hook_filter=args.hook, workers=args.workers,
+    )
+    events = list(itertools.islice(stream, args.limit) if args.limit > 0 else stream)
+    status("Extracted " + str(len(events)) + " events")
+    if args.dedupe:
+        events = dedupe_events(events)
+        status("Deduplicated to " + str(len(events)) + " unique payloads")
+    if not events:
+        status("No events found matching the criteria.")
+        return 0
+
+    bench = run_bench(
+        events,
+        args.baseline,
+        args.candidate,
+        in_process=args.in_process,
+        workers=args.workers,
+        progress_callback=lambda label: status("Replaying through " + label + "..."),
+    )
+
+    reporter = ReplayReporter()
+    payload = reporter.bench_payload(bench)
+    if args.report_format == "json":
+        print(json.dumps(payload, indent=2, default=str))
+    else:
+        print(reporter.bench_report(bench))
+    if args.output:
+        args.output.write_text(json.dumps(payload, indent=2, default=str))
+        status("Results saved to: " + str(args.output))
+
+    baseline_latency, candidate_latency = bench.latency()
+    too_slow = (
+        args.max_slowdown is not None
+        and baseline_latency.p50_ms > 0
+        and candidate_latency.p50_ms / baseline_latency.p50_ms > args.max_slowdown
+    )
+    if too_slow:
+        status("Candidate p50 slowdown exceeds " + str(args.max_slowdown) + "x")
+    return 1 if bench.decision_diffs() or too_slow else 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the gaia simulator CLI.
 
@@ -151,8 +246,14 @@ def main(argv: list[str] | None = None) -> int:
     """
     hooks_dir_default, logs_dir_default, plugin_root = _find_defaults()
 
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "bench":
+        return _handle_bench(argv[1:], logs_dir_default)
+
     parser = argparse.ArgumentParser(
         description="Replay gaia-ops hook events from production logs to detect regressions.",
+        epilog="Compare two checkouts: gaia-sim bench --baseline OLD --candidate NEW (see bench --help)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
@@ -206,6 +307,22 @@ def main(argv: list[str] | None = None) -> int:
         default=0,
         help="Limit number of events to replay (0 = all)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for log parsing and replay (default: 1)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Call the pre_tool_use adapter directly instead of spawning a subprocess per event",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Replay identical payloads once and weight the report by their count",
+    )
     parser.add_argument(
         "--report-format",
         choices=("text", "json"),
@@ -268,7 +385,7 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     # Lazy module loading to keep CLI fast for --help
-    from gaia_simulator.extractor import LogExtractor
+    from gaia_simulator.extractor import LogExtractor, dedupe_events
     from gaia_simulator.runner import HookRunner
     from gaia_simulator.reporter import ReplayReporter
 
@@ -282,17 +399,21 @@ def main(argv: list[str] | None = None) -> int:
     if args.hook:
         status("Hook filter: " + args.hook)
 
-    events = extractor.extract_all(
+    stream = extractor.iter_all(
         args.logs_dir,
         date_filter=args.date,
         hook_filter=args.hook,
+        workers=args.workers,
     )
-
-    if args.limit > 0:
-        events = events[: args.limit]
+    # The stream is timestamp-ordered: --limit stops parsing early.
+    events = list(itertools.islice(stream, args.limit) if args.limit > 0 else stream)
 
     status("Extracted " + str(len(events)) + " events")
 
+    if args.dedupe:
+        events = dedupe_events(events)
+        status("Deduplicated to " + str(len(events)) + " unique payloads")
+
     if not events:
         if args.report_format == "json":
             print("[]")
@@ -321,13 +442,13 @@ def main(argv: list[str] | None = None) -> int:
 
     # Step 2: Run hooks
     def progress(current: int, total: int) -> None:
-        if total > 10 and current % 10 == 0:
+        if total > 10 and (current % 10 == 0 or current == total):
             print("  Replayed " + str(current) + "/" + str(total) + " events...", file=sys.stderr)
 
     nl = chr(10)
     status(nl + "Replaying against hooks in: " + str(args.hooks_dir))
-    runner = HookRunner(hooks_dir=args.hooks_dir)
-    results = runner.run_batch(events, progress_callback=progress)
+    runner = HookRunner(hooks_dir=args.hooks_dir.resolve(), in_process=args.in_process)
+    results = runner.run_batch(events, progress_callback=progress, workers=args.workers)
     status("Replay complete: " + str(len(results)) + " results" + nl)
 
     # Step 3: Report
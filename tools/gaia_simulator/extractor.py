@@ -7,15 +7,25 @@ Completely decoupled from hooks -- only understands log formats.
 Supported log formats:
     hooks-YYYY-MM-DD.log  - Human-readable hook execution logs
     audit-YYYY-MM-DD.jsonl - Structured JSON audit trail (post_tool_use events)
+
+Files are read line by line. ``LogExtractor.iter_all`` parses day-files in
+a process pool (one task per file, a bounded number in flight) and yields
+events day by day, k-way merged by timestamp, so months of logs never sit
+in memory at once. ``dedupe_events`` folds identical payloads into one
+event with a ``count`` so replay runs each unique invocation once.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
 import re
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 
 @dataclass(frozen=True)
@@ -33,6 +43,7 @@ class ReplayEvent:
     expected_metadata: dict[str, Any] = field(default_factory=dict)
     compare_tier: bool = False
     limitations: tuple[str, ...] = field(default_factory=tuple)
+    count: int = 1  # Identical occurrences this event stands for (see dedupe_events)
 
 
 # ---------------------------------------------------------------------------
@@ -149,193 +160,210 @@ class LogExtractor:
         Returns:
             List of ReplayEvent instances, ordered by timestamp.
         """
+        # Stop results sort ahead of invocations logged in the same instant.
+        return sorted(
+            self.iter_hooks_log(path),
+            key=lambda event: (event.timestamp, event.hook_name != "stop_hook"),
+        )
+
+    def iter_hooks_log(self, path: Path) -> Iterator[ReplayEvent]:
+        """Stream the events of a hooks log in the order they complete.
+
+        An invocation is emitted once its outcome line has been read, so
+        events are *nearly* but not strictly timestamp-ordered; use
+        ``extract_from_hooks_log`` for a sorted list.
+        """
         if not path.exists():
-            return []
+            return
 
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
         source = path.name
-        events: list[ReplayEvent] = []
-
-        # Two-pass approach:
-        # Pass 1: collect all "Hook invoked" entries with their params
-        # Pass 2: match them to ALLOWED/BLOCKED outcomes
-
-        pending_invocations: list[dict] = []
-        outcomes: list[dict] = []
-
-        for line in lines:
-            # Hook invoked line
-            m = _RE_HOOK_INVOKED.match(line)
-            if m:
-                params = _try_parse_params(m.group("params"))
-                pending_invocations.append({
-                    "ts": m.group("ts"),
-                    "hook": m.group("hook"),
-                    "tool": m.group("tool"),
-                    "params": params,
-                })
-                continue
-
-            # ALLOWED bash command
-            m = _RE_ALLOWED_BASH.match(line)
-            if m:
-                outcomes.append({
-                    "ts": m.group("ts"),
-                    "hook": m.group("hook"),
-                    "decision": "ALLOW",
-                    "exit_code": 0,
-                    "tier": m.group("tier"),
-                    "type": "bash",
-                })
-                continue
-
-            # ALLOWED task (agent)
-            m = _RE_ALLOWED_TASK.match(line)
-            if m:
-                outcomes.append({
-                    "ts": m.group("ts"),
-                    "hook": m.group("hook"),
-                    "decision": "ALLOW",
-                    "exit_code": 0,
-                    "tier": "",
-                    "type": "task",
-                    "agent": m.group("agent"),
-                })
-                continue
 
-            # BLOCKED bash command
-            m = _RE_BLOCKED.match(line)
-            if m:
-                reason = m.group("reason")
-                # The hook logs "BLOCKED:" for both permanent blocks (exit 2,
-                # plain string) and structured deny responses (exit 0, JSON
-                # with permissionDecision: "deny").  Distinguish them by
-                # reason text:
-                #
-                # Exit 0 DENY (block_response is set):
-                #   - "Dangerous ..." -- mutative verb T3 nonce flow
-                #   - "Command-execution rule violated ..." -- cloud pipe
-                #   - "Failed to persist pending approval ..." -- T3 nonce write error
-                #   - Compound wrappers that propagate a component's block_response
-                #
-                # Exit 2 BLOCK (block_response is None):
-                #   - "Command blocked by security policy ..." -- permanent deny list
-                #   - "Commit message validation failed ..." -- validation error
-                #   - "GitOps policy violation ..." -- GitOps validation
-                #   - "Empty command not allowed"
-                if (
-                    reason.startswith("Dangerous")
-                    or reason.startswith("Command-execution rule violated")
-                    or reason.startswith("Failed to persist pending approval")
-                    or (reason.startswith("Compound command blocked") and "Dangerous" in reason)
-                ):
-                    decision = "DENY"
-                    exit_code = 0
+        # Each "Hook invoked" line is followed by exactly one ALLOWED or
+        # BLOCKED line: pair them sequentially as both queues fill up.
+        pending_invocations: deque[dict] = deque()
+        outcomes: deque[dict] = deque()
+
+        with path.open(encoding="utf-8", errors="replace") as fh:
+            for raw_line in fh:
+                parsed = self._parse_hooks_line(raw_line.rstrip("\r\n"), source)
+                if parsed is None:
+                    continue
+                kind, item = parsed
+                if kind == "invocation":
+                    pending_invocations.append(item)
+                elif kind == "outcome":
+                    outcomes.append(item)
                 else:
-                    decision = "BLOCK"
-                    exit_code = 2
-                outcomes.append({
-                    "ts": m.group("ts"),
-                    "hook": m.group("hook"),
-                    "decision": decision,
-                    "exit_code": exit_code,
-                    "tier": "",
-                    "type": "bash",
-                    "reason": reason,
-                })
-                continue
-
-            # BLOCKED task
-            m = _RE_BLOCKED_TASK.match(line)
-            if m:
-                outcomes.append({
-                    "ts": m.group("ts"),
-                    "hook": m.group("hook"),
-                    "decision": "BLOCK",
-                    "exit_code": 2,
-                    "tier": "",
-                    "type": "task",
-                    "agent": m.group("agent"),
-                    "reason": m.group("reason"),
-                })
-                continue
+                    yield item
+                while pending_invocations and outcomes:
+                    event = self._paired_event(pending_invocations.popleft(), outcomes.popleft(), source)
+                    if event is not None:
+                        yield event
 
-            # Stop hook result (minimal replayable payload)
-            m = _RE_STOP_RESULT.match(line)
-            if m:
-                quality_sufficient = m.group("quality") == "True"
-                events.append(ReplayEvent(
-                    timestamp=m.group("ts"),
-                    hook_name="stop_hook",
-                    tool_name="Stop",
-                    stdin_payload={
-                        "hook_event_name": "Stop",
-                        "session_id": "replay",
-                        "stop_reason": m.group("reason"),
-                    },
-                    expected_decision="PASS",
-                    expected_exit_code=0,
-                    expected_tier="",
-                    source_file=source,
-                    expected_metadata={
-                        "quality_sufficient": quality_sufficient,
-                        "score": float(m.group("score")),
-                    },
-                    limitations=(
-                        "hooks log captures stop reason and quality summary, but not last_assistant_message",
-                    ),
-                ))
-                continue
-
-        # Match invocations to outcomes by sequential pairing
-        # Each Hook invoked is followed by exactly one ALLOWED or BLOCKED
-        outcome_idx = 0
-        for inv in pending_invocations:
-            if outcome_idx >= len(outcomes):
-                break
+    def _parse_hooks_line(self, line: str, source: str) -> Optional[tuple[str, Any]]:
+        """Classify one hooks log line.
 
-            outcome = outcomes[outcome_idx]
-            outcome_idx += 1
+        Returns:
+            ("invocation", dict), ("outcome", dict), ("event", ReplayEvent)
+            for a self-contained stop result, or None for other lines.
+        """
+        # Hook invoked line
+        m = _RE_HOOK_INVOKED.match(line)
+        if m:
+            params = _try_parse_params(m.group("params"))
+            return "invocation", {
+                "ts": m.group("ts"),
+                "hook": m.group("hook"),
+                "tool": m.group("tool"),
+                "params": params,
+            }
 
-            # Build the stdin_payload that the hook expects
-            tool = inv["tool"]
-            params = inv["params"]
+        # ALLOWED bash command
+        m = _RE_ALLOWED_BASH.match(line)
+        if m:
+            return "outcome", {
+                "ts": m.group("ts"),
+                "hook": m.group("hook"),
+                "decision": "ALLOW",
+                "exit_code": 0,
+                "tier": m.group("tier"),
+                "type": "bash",
+            }
 
-            # Skip events with truncated/unparseable params -- they cannot
-            # be replayed meaningfully. The log line was cut off before the
-            # JSON closed, so we don't have the full payload.
-            if params is None:
-                continue
+        # ALLOWED task (agent)
+        m = _RE_ALLOWED_TASK.match(line)
+        if m:
+            return "outcome", {
+                "ts": m.group("ts"),
+                "hook": m.group("hook"),
+                "decision": "ALLOW",
+                "exit_code": 0,
+                "tier": "",
+                "type": "task",
+                "agent": m.group("agent"),
+            }
 
-            # Validate minimum payload: Bash needs "command", Agent needs
-            # at least "subagent_type" or "description"
-            if tool == "Bash" and "command" not in params:
-                continue
-            if tool == "Agent" and not any(
-                k in params for k in ("subagent_type", "description", "prompt")
+        # BLOCKED bash command
+        m = _RE_BLOCKED.match(line)
+        if m:
+            reason = m.group("reason")
+            # The hook logs "BLOCKED:" for both permanent blocks (exit 2,
+            # plain string) and structured deny responses (exit 0, JSON
+            # with permissionDecision: "deny").  Distinguish them by
+            # reason text:
+            #
+            # Exit 0 DENY (block_response is set):
+            #   - "Dangerous ..." -- mutative verb T3 nonce flow
+            #   - "Command-execution rule violated ..." -- cloud pipe
+            #   - "Failed to persist pending approval ..." -- T3 nonce write error
+            #   - Compound wrappers that propagate a component's block_response
+            #
+            # Exit 2 BLOCK (block_response is None):
+            #   - "Command blocked by security policy ..." -- permanent deny list
+            #   - "Commit message validation failed ..." -- validation error
+            #   - "GitOps policy violation ..." -- GitOps validation
+            #   - "Empty command not allowed"
+            if (
+                reason.startswith("Dangerous")
+                or reason.startswith("Command-execution rule violated")
+                or reason.startswith("Failed to persist pending approval")
+                or (reason.startswith("Compound command blocked") and "Dangerous" in reason)
             ):
-                continue
+                decision = "DENY"
+                exit_code = 0
+            else:
+                decision = "BLOCK"
+                exit_code = 2
+            return "outcome", {
+                "ts": m.group("ts"),
+                "hook": m.group("hook"),
+                "decision": decision,
+                "exit_code": exit_code,
+                "tier": "",
+                "type": "bash",
+                "reason": reason,
+            }
 
-            stdin_payload = {
-                "tool_name": tool,
-                "tool_input": params,
-                "hook_event_name": "PreToolUse",
-                "session_id": "replay",
+        # BLOCKED task
+        m = _RE_BLOCKED_TASK.match(line)
+        if m:
+            return "outcome", {
+                "ts": m.group("ts"),
+                "hook": m.group("hook"),
+                "decision": "BLOCK",
+                "exit_code": 2,
+                "tier": "",
+                "type": "task",
+                "agent": m.group("agent"),
+                "reason": m.group("reason"),
             }
 
-            events.append(ReplayEvent(
-                timestamp=inv["ts"],
-                hook_name=inv["hook"],
-                tool_name=tool,
-                stdin_payload=stdin_payload,
-                expected_decision=outcome["decision"],
-                expected_exit_code=outcome["exit_code"],
-                expected_tier=outcome.get("tier", ""),
+        # Stop hook result (minimal replayable payload)
+        m = _RE_STOP_RESULT.match(line)
+        if m:
+            quality_sufficient = m.group("quality") == "True"
+            return "event", ReplayEvent(
+                timestamp=m.group("ts"),
+                hook_name="stop_hook",
+                tool_name="Stop",
+                stdin_payload={
+                    "hook_event_name": "Stop",
+                    "session_id": "replay",
+                    "stop_reason": m.group("reason"),
+                },
+                expected_decision="PASS",
+                expected_exit_code=0,
+                expected_tier="",
                 source_file=source,
-                compare_tier=tool in {"Bash", "Task", "Agent"} and inv["hook"] == "pre_tool_use",
-            ))
-
-        return sorted(events, key=lambda event: event.timestamp)
+                expected_metadata={
+                    "quality_sufficient": quality_sufficient,
+                    "score": float(m.group("score")),
+                },
+                limitations=(
+                    "hooks log captures stop reason and quality summary, but not last_assistant_message",
+                ),
+            )
+        return None
+
+    def _paired_event(self, inv: dict, outcome: dict, source: str) -> Optional[ReplayEvent]:
+        """Build the ReplayEvent for an invocation and its outcome, if replayable."""
+        # Build the stdin_payload that the hook expects
+        tool = inv["tool"]
+        params = inv["params"]
+
+        # Skip events with truncated/unparseable params -- they cannot
+        # be replayed meaningfully. The log line was cut off before the
+        # JSON closed, so we don't have the full payload.
+        if params is None:
+            return None
+
+        # Validate minimum payload: Bash needs "command", Agent needs
+        # at least "subagent_type" or "description"
+        if tool == "Bash" and "command" not in params:
+            return None
+        if tool == "Agent" and not any(
+            k in params for k in ("subagent_type", "description", "prompt")
+        ):
+            return None
+
+        stdin_payload = {
+            "tool_name": tool,
+            "tool_input": params,
+            "hook_event_name": "PreToolUse",
+            "session_id": "replay",
+        }
+
+        return ReplayEvent(
+            timestamp=inv["ts"],
+            hook_name=inv["hook"],
+            tool_name=tool,
+            stdin_payload=stdin_payload,
+            expected_decision=outcome["decision"],
+            expected_exit_code=outcome["exit_code"],
+            expected_tier=outcome.get("tier", ""),
+            source_file=source,
+            compare_tier=tool in {"Bash", "Task", "Agent"} and inv["hook"] == "pre_tool_use",
+        )
 
     def extract_from_audit_jsonl(self, path: Path) -> list[ReplayEvent]:
         """Parse audit-YYYY-MM-DD.jsonl for structured event data.
@@ -351,13 +379,21 @@ class LogExtractor:
         Returns:
             List of ReplayEvent instances, ordered by timestamp.
         """
+        return list(self.iter_audit_jsonl(path))
+
+    def iter_audit_jsonl(self, path: Path) -> Iterator[ReplayEvent]:
+        """Stream the events of an audit JSONL file in file order."""
         if not path.exists():
-            return []
+            return
 
         source = path.name
-        events: list[ReplayEvent] = []
 
-        for line_text in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        with path.open(encoding="utf-8", errors="replace") as fh:
+            yield from self._audit_events(fh, source)
+
+    def _audit_events(self, lines: Iterable[str], source: str) -> Iterator[ReplayEvent]:
+        """Build a post_tool_use ReplayEvent from each audit record line."""
+        for line_text in lines:
             line_text = line_text.strip()
             if not line_text:
                 continue
@@ -392,7 +428,7 @@ class LogExtractor:
 
             tier = record.get("tier", "")
 
-            events.append(ReplayEvent(
+            yield ReplayEvent(
                 timestamp=record.get("timestamp", ""),
                 hook_name="post_tool_use",
                 tool_name=tool_name,
@@ -408,15 +444,14 @@ class LogExtractor:
                 limitations=(
                     "audit JSONL does not persist tool output, so post_tool_use replay cannot validate output-dependent critical-event detection",
                 ),
-            ))
-
-        return events
+            )
 
     def extract_all(
         self,
         logs_dir: Path,
         date_filter: Optional[str] = None,
         hook_filter: Optional[str] = None,
+        workers: int = 1,
     ) -> list[ReplayEvent]:
         """Extract from all log files in a directory, merge by timestamp.
 
@@ -424,34 +459,149 @@ class LogExtractor:
             logs_dir: Directory containing hooks-*.log and audit-*.jsonl files.
             date_filter: Optional YYYY-MM-DD string to filter by date.
             hook_filter: Optional hook name to filter (e.g. "pre_tool_use").
+            workers: Parser processes (default: 1 = parse in this process).
 
         Returns:
             Merged list of ReplayEvent instances, sorted by timestamp.
         """
-        events: list[ReplayEvent] = []
+        return list(self.iter_all(logs_dir, date_filter, hook_filter, workers=workers))
 
-        # Process hooks logs
-        pattern = f"hooks-{date_filter}.log" if date_filter else "hooks-*.log"
-        for log_path in sorted(logs_dir.glob(pattern)):
-            events.extend(self.extract_from_hooks_log(log_path))
+    def iter_all(
+        self,
+        logs_dir: Path,
+        date_filter: Optional[str] = None,
+        hook_filter: Optional[str] = None,
+        workers: int = 1,
+    ) -> Iterator[ReplayEvent]:
+        """Stream the events of every log file in *logs_dir* in timestamp order.
 
-        # Process audit JSONL
-        pattern = f"audit-{date_filter}.jsonl" if date_filter else "audit-*.jsonl"
-        for jsonl_path in sorted(logs_dir.glob(pattern)):
-            events.extend(self.extract_from_audit_jsonl(jsonl_path))
+        Each day-file is parsed by one worker task; at most ``2 * workers``
+        files are in flight, and results are consumed in day order. The
+        files of one day are k-way merged by timestamp, so the stream is
+        globally ordered as long as each file only holds its own day.
+        Events logged by both sources (same timestamp, tool and decision)
+        are yielded once, preferring the richer hooks-log version.
 
-        # Apply hook filter
-        if hook_filter:
-            events = [e for e in events if e.hook_name == hook_filter]
+        Args:
+            logs_dir: Directory containing hooks-*.log and audit-*.jsonl files.
+            date_filter: Optional YYYY-MM-DD string to filter by date.
+            hook_filter: Optional hook name to filter (e.g. "pre_tool_use").
+            workers: Parser processes (default: 1 = parse in this process).
+        """
+        files = self._day_files(logs_dir, date_filter)
+        workers = max(1, min(workers, len(files)))
+
+        if workers == 1:
+            parsed: Iterable[list[ReplayEvent]] = (_extract_file(kind, path) for _, kind, path in files)
+            yield from self._merge_days(files, parsed, hook_filter)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight: deque = deque()
+            queue = iter(files)
+            for _, kind, path in itertools.islice(queue, 2 * workers):
+                in_flight.append(pool.submit(_extract_file, kind, path))
+
+            def results() -> Iterator[list[ReplayEvent]]:
+                while in_flight:
+                    events = in_flight.popleft().result()
+                    for _, kind, path in itertools.islice(queue, 1):
+                        in_flight.append(pool.submit(_extract_file, kind, path))
+                    yield events
+
+            yield from self._merge_days(files, results(), hook_filter)
+
+    def _day_files(self, logs_dir: Path, date_filter: Optional[str]) -> list[tuple[str, int, Path]]:
+        """List (day, kind, path) for every log file, in day then hooks-before-audit order."""
+        files: list[tuple[str, int, Path]] = []
+        pattern = f"hooks-{date_filter}.log" if date_filter else "hooks-*.log"
+        for log_path in logs_dir.glob(pattern):
+            files.append((log_path.name[len("hooks-"):-len(".log")], _HOOKS_LOG, log_path))
+        pattern = f"audit-{date_filter}.jsonl" if date_filter else "audit-*.jsonl"
+        for jsonl_path in logs_dir.glob(pattern):
+            files.append((jsonl_path.name[len("audit-"):-len(".jsonl")], _AUDIT_JSONL, jsonl_path))
+        return sorted(files)
 
+    def _merge_days(
+        self,
+        files: list[tuple[str, int, Path]],
+        parsed: Iterable[list[ReplayEvent]],
+        hook_filter: Optional[str],
+    ) -> Iterator[ReplayEvent]:
+        """Merge the per-file event lists of each day, one day at a time."""
+        day_lists: list[list[ReplayEvent]] = []
+        current_day = None
+        for (day, _, _), events in zip(files, parsed):
+            if day != current_day and day_lists:
+                yield from self._merge_one_day(day_lists, hook_filter)
+                day_lists = []
+            current_day = day
+            day_lists.append(events)
+        if day_lists:
+            yield from self._merge_one_day(day_lists, hook_filter)
+
+    def _merge_one_day(
+        self,
+        day_lists: list[list[ReplayEvent]],
+        hook_filter: Optional[str],
+    ) -> Iterator[ReplayEvent]:
         # Deduplicate: same timestamp + same tool_name + same expected_decision
-        # Keep the hooks-log version (richer data) over audit version
-        seen: dict[tuple, ReplayEvent] = {}
-        for ev in events:
-            key = (ev.timestamp, ev.tool_name, ev.expected_decision)
-            if key not in seen or ev.source_file.startswith("hooks-"):
-                seen[key] = ev
-
-        # Sort by timestamp
-        result = sorted(seen.values(), key=lambda e: e.timestamp)
-        return result
+        # Keep the hooks-log version (richer data) over audit version.
+        # Duplicates share a timestamp, so only the current run is tracked.
+        run: dict[tuple, ReplayEvent] = {}
+        run_ts = None
+        for ev in heapq.merge(*day_lists, key=lambda e: e.timestamp):
+            if hook_filter and ev.hook_name != hook_filter:
+                continue
+            if ev.timestamp != run_ts:
+                yield from run.values()
+                run = {}
+                run_ts = ev.timestamp
+            key = (ev.tool_name, ev.expected_decision)
+            if key not in run or ev.source_file.startswith("hooks-"):
+                run[key] = ev
+        yield from run.values()
+
+
+_HOOKS_LOG = 0
+_AUDIT_JSONL = 1
+
+
+def _extract_file(kind: int, path: Path) -> list[ReplayEvent]:
+    """Worker entry point: all events of one day-file, sorted by timestamp."""
+    extractor = LogExtractor()
+    if kind == _HOOKS_LOG:
+        return extractor.extract_from_hooks_log(path)
+    return sorted(extractor.iter_audit_jsonl(path), key=lambda event: event.timestamp)
+
+
+def _payload_key(event: ReplayEvent) -> tuple:
+    return (
+        event.hook_name,
+        event.tool_name,
+        json.dumps(event.stdin_payload, sort_keys=True, default=str),
+        event.expected_decision,
+        event.expected_exit_code,
+        event.expected_tier,
+        json.dumps(event.expected_metadata, sort_keys=True, default=str),
+        event.compare_tier,
+    )
+
+
+def dedupe_events(events: Iterable[ReplayEvent]) -> list[ReplayEvent]:
+    """Fold events with identical payload and expectations into one.
+
+    The first occurrence is kept (with its timestamp and source) and its
+    ``count`` becomes the sum of the folded counts, so replaying the result
+    runs each unique invocation once while reports stay weighted by how
+    often it really happened.
+
+    Returns:
+        Unique events in first-occurrence order.
+    """
+    unique: dict[tuple, ReplayEvent] = {}
+    for event in events:
+        key = _payload_key(event)
+        first = unique.get(key)
+        unique[key] = event if first is None else replace(first, count=first.count + event.count)
+    return list(unique.values())
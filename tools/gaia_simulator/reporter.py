@@ -3,6 +3,9 @@ Results reporter for gaia-ops replay testing.
 
 Formats and presents ReplayResult data for human consumption and
 programmatic analysis. Completely decoupled from execution.
+
+Counts are weighted by ``ReplayEvent.count``: a deduplicated event that
+stood for 40 identical invocations counts as 40 events.
 """
 
 from __future__ import annotations
@@ -11,11 +14,42 @@ import json
 from collections import Counter
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from gaia_simulator.extractor import ReplayEvent
 from gaia_simulator.runner import ReplayResult
 
+if TYPE_CHECKING:
+    from gaia_simulator.bench import BenchRun, LatencyStats
+
+
+def _weight(results: list[ReplayResult]) -> int:
+    """Number of logged events *results* stand for."""
+    return sum(r.event.count for r in results)
+
+
+def _change(baseline_ms: float, candidate_ms: float) -> str:
+    """Describe candidate vs baseline latency as a speedup or slowdown."""
+    if baseline_ms <= 0 or candidate_ms <= 0:
+        return "n/a"
+    ratio = baseline_ms / candidate_ms
+    if round(ratio, 2) == 1:
+        return "no change"
+    if ratio > 1:
+        return f"{ratio:.2f}x faster"
+    return f"{1 / ratio:.2f}x slower"
+
+
+def _describe(result: ReplayResult) -> str:
+    """Command, agent or hook name of a result, for one-line listings."""
+    tool_input = result.event.stdin_payload.get("tool_input", {})
+    if result.event.tool_name == "Bash":
+        cmd = tool_input.get("command", "")
+        return cmd if len(cmd) <= 80 else cmd[:80] + "..."
+    if result.event.tool_name == "Agent":
+        return tool_input.get("subagent_type", tool_input.get("description", ""))
+    return result.event.hook_name
+
 
 class ReplayReporter:
     """Formats replay results for human consumption and export."""
@@ -33,6 +67,7 @@ class ReplayReporter:
                 "hook_name": r.event.hook_name,
                 "tool_name": r.event.tool_name,
                 "source_file": r.event.source_file,
+                "count": r.event.count,
                 "limitations": list(r.event.limitations),
                 "expected": {
                     "decision": r.event.expected_decision,
@@ -45,6 +80,7 @@ class ReplayReporter:
                     "exit_code": r.actual_exit_code,
                     "tier": r.actual_tier,
                     "metadata": r.actual_metadata,
+                    "duration_ms": round(r.duration_ms, 3),
                 },
                 "matched": r.matched,
                 "regression_type": r.regression_type,
@@ -71,8 +107,8 @@ class ReplayReporter:
         if not results:
             return "No events replayed."
 
-        total = len(results)
-        matched = sum(1 for r in results if r.matched)
+        total = _weight(results)
+        matched = _weight([r for r in results if r.matched])
         regressions = total - matched
 
         lines = [
@@ -80,6 +116,10 @@ class ReplayReporter:
             "REPLAY SUMMARY",
             "=" * 60,
             f"Total events:  {total}",
+        ]
+        if total != len(results):
+            lines.append(f"Unique:        {len(results)}")
+        lines += [
             f"Matched:       {matched}",
             f"Regressions:   {regressions}",
         ]
@@ -87,15 +127,18 @@ class ReplayReporter:
         if regressions > 0:
             lines.append("")
             lines.append("Regression breakdown:")
-            reg_types = Counter(
-                r.regression_type for r in results if not r.matched
-            )
+            reg_types: Counter = Counter()
+            for r in results:
+                if not r.matched:
+                    reg_types[r.regression_type] += r.event.count
             for rtype, count in reg_types.most_common():
                 lines.append(f"  {rtype}: {count}")
 
         # Quick stats by decision
         lines.append("")
-        decision_counts = Counter(r.event.expected_decision for r in results)
+        decision_counts: Counter = Counter()
+        for r in results:
+            decision_counts[r.event.expected_decision] += r.event.count
         lines.append("Events by expected decision:")
         for dec, count in decision_counts.most_common():
             lines.append(f"  {dec}: {count}")
@@ -130,6 +173,8 @@ class ReplayReporter:
             lines.append(f"  Hook:       {r.event.hook_name}")
             lines.append(f"  Tool:       {r.event.tool_name}")
             lines.append(f"  Source:     {r.event.source_file}")
+            if r.event.count > 1:
+                lines.append(f"  Occurrences: {r.event.count}")
 
             # Show the command or agent name
             tool_input = r.event.stdin_payload.get("tool_input", {})
@@ -179,8 +224,8 @@ class ReplayReporter:
         lines.append("BREAKDOWN BY HOOK:")
         lines.append("-" * 40)
         for hook_name, hook_results in sorted(hooks.items()):
-            total = len(hook_results)
-            matched = sum(1 for r in hook_results if r.matched)
+            total = _weight(hook_results)
+            matched = _weight([r for r in hook_results if r.matched])
             lines.append(f"  {hook_name}: {total} events, {matched} matched, "
                          f"{total - matched} regressions")
 
@@ -194,8 +239,8 @@ class ReplayReporter:
         lines.append("BREAKDOWN BY TIER:")
         lines.append("-" * 40)
         for tier_name, tier_results in sorted(tiers.items()):
-            total = len(tier_results)
-            matched = sum(1 for r in tier_results if r.matched)
+            total = _weight(tier_results)
+            matched = _weight([r for r in tier_results if r.matched])
             lines.append(f"  {tier_name}: {total} events, {matched} matched, "
                          f"{total - matched} regressions")
 
@@ -208,8 +253,8 @@ class ReplayReporter:
         lines.append("BREAKDOWN BY TOOL:")
         lines.append("-" * 40)
         for tool_name, tool_results in sorted(tools.items()):
-            total = len(tool_results)
-            matched = sum(1 for r in tool_results if r.matched)
+            total = _weight(tool_results)
+            matched = _weight([r for r in tool_results if r.matched])
             lines.append(f"  {tool_name}: {total} events, {matched} matched, "
                          f"{total - matched} regressions")
 
@@ -222,8 +267,8 @@ class ReplayReporter:
         lines.append("BREAKDOWN BY SOURCE:")
         lines.append("-" * 40)
         for source_name, source_results in sorted(sources.items()):
-            total = len(source_results)
-            matched = sum(1 for r in source_results if r.matched)
+            total = _weight(source_results)
+            matched = _weight([r for r in source_results if r.matched])
             lines.append(f"  {source_name}: {total} events, {matched} matched, "
                          f"{total - matched} regressions")
 
@@ -256,3 +301,106 @@ class ReplayReporter:
             path: Output file path.
         """
         path.write_text(json.dumps(self.results_payload(results), indent=2, default=str))
+
+    def _latency_table(
+        self,
+        title: str,
+        rows: dict[str, tuple[LatencyStats, LatencyStats]],
+    ) -> list[str]:
+        """Speedup/slowdown table: p50 and p90 of both trees per group."""
+        lines = [
+            "",
+            title,
+            "-" * 86,
+            f"  {'group':<16} {'events':>7} {'base p50':>9} {'cand p50':>9} "
+            f"{'base p90':>9} {'cand p90':>9}  change (p50)",
+        ]
+        for name, (base, cand) in rows.items():
+            lines.append(
+                f"  {name[:16]:<16} {base.count:>7} {base.p50_ms:>9.1f} {cand.p50_ms:>9.1f} "
+                f"{base.p90_ms:>9.1f} {cand.p90_ms:>9.1f}  {_change(base.p50_ms, cand.p50_ms)}"
+            )
+        return lines
+
+    def bench_report(self, bench: BenchRun) -> str:
+        """Decision diffs and latency comparison of a baseline/candidate bench run.
+
+        Args:
+            bench: BenchRun from gaia_simulator.bench.run_bench.
+
+        Returns:
+            Formatted report with speedup/slowdown tables overall, per tool
+            and per tier (latencies in ms).
+        """
+        if not bench.baseline:
+            return "No events replayed."
+
+        diffs = bench.decision_diffs()
+        total = _weight(bench.baseline)
+        lines = [
+            "=" * 60,
+            "HOOK BENCHMARK",
+            "=" * 60,
+            f"Baseline:        {bench.baseline_dir}",
+            f"Candidate:       {bench.candidate_dir}",
+            f"Events:          {total}",
+        ]
+        if total != len(bench.baseline):
+            lines.append(f"Unique:          {len(bench.baseline)}")
+        lines.append(f"Decision diffs:  {sum(b.event.count for b, _ in diffs)}")
+
+        lines += self._latency_table("LATENCY (ms):", {"overall": bench.latency()})
+        lines += self._latency_table("LATENCY BY TOOL (ms):", bench.latency_by_tool())
+        lines += self._latency_table("LATENCY BY TIER (ms):", bench.latency_by_tier())
+
+        if diffs:
+            lines.append("")
+            lines.append("DECISION DIFFS:")
+            lines.append("-" * 40)
+            for i, (base, cand) in enumerate(diffs, 1):
+                lines.append(f"  #{i} [{base.event.tool_name}] {_describe(base)}"
+                             + (f" (x{base.event.count})" if base.event.count > 1 else ""))
+                lines.append(f"     baseline:  decision={base.actual_decision}, "
+                             f"exit_code={base.actual_exit_code}, tier={base.actual_tier or 'n/a'}")
+                lines.append(f"     candidate: decision={cand.actual_decision}, "
+                             f"exit_code={cand.actual_exit_code}, tier={cand.actual_tier or 'n/a'}")
+
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+    def bench_payload(self, bench: BenchRun) -> dict[str, Any]:
+        """Convert a bench run to a JSON-serializable dict."""
+
+        def table(rows: dict[str, tuple[LatencyStats, LatencyStats]]) -> dict[str, Any]:
+            return {
+                name: {
+                    "baseline": asdict(base),
+                    "candidate": asdict(cand),
+                    "p50_speedup": round(base.p50_ms / cand.p50_ms, 3) if base.p50_ms > 0 and cand.p50_ms > 0 else None,
+                }
+                for name, (base, cand) in rows.items()
+            }
+
+        return {
+            "baseline_dir": str(bench.baseline_dir),
+            "candidate_dir": str(bench.candidate_dir),
+            "events": _weight(bench.baseline),
+            "unique": len(bench.baseline),
+            "latency": table({"overall": bench.latency()})["overall"],
+            "latency_by_tool": table(bench.latency_by_tool()),
+            "latency_by_tier": table(bench.latency_by_tier()),
+            "decision_diffs": [
+                {
+                    "timestamp": base.event.timestamp,
+                    "hook_name": base.event.hook_name,
+                    "tool_name": base.event.tool_name,
+                    "detail": _describe(base),
+                    "count": base.event.count,
+                    "baseline": {"decision": base.actual_decision, "exit_code": base.actual_exit_code,
+                                 "tier": base.actual_tier},
+                    "candidate": {"decision": cand.actual_decision, "exit_code": cand.actual_exit_code,
+                                  "tier": cand.actual_tier},
+                }
+                for base, cand in bench.decision_diffs()
+            ],
+        }
@@ -3,17 +3,34 @@ Hook executor for gaia-ops replay testing.
 
 Runs hooks as subprocesses with ReplayEvent payloads and compares results
 against expected outcomes. Completely decoupled from log parsing.
+
+Two knobs trade isolation for throughput:
+
+  - ``run_batch(workers=N)`` shards the events into N contiguous slices and
+    replays each slice in its own worker process and project directory.
+  - ``HookRunner(in_process=True)`` imports ``pre_tool_use.py`` once per
+    process and calls its ``handle_stdin`` -- the function the script's own
+    entry point runs -- instead of paying an interpreter start-up per event,
+    so exit code, stdout and stderr match the subprocess mode. Other hooks
+    still run as subprocesses.
 """
 
 from __future__ import annotations
 
+import importlib
+import io
 import json
+import logging
 import os
 import re
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
@@ -33,6 +50,7 @@ class ReplayResult:
     matched: bool  # expected_decision == actual_decision
     regression_type: Optional[str]  # None, "allow_to_block", "block_to_allow", "tier_change", "exit_code_change"
     actual_metadata: dict[str, Any] = field(default_factory=dict)
+    duration_ms: float = 0.0  # wall time of the hook call (subprocess or in-process)
 
 
 _RE_TIER = re.compile(r"\bT[0-3]\b")
@@ -143,6 +161,118 @@ def _classify_regression(
     return "decision_change"
 
 
+class _InProcessPreToolUse:
+    """``pre_tool_use.handle_stdin`` from a hooks tree imported once.
+
+    The hook modules resolve ``.claude/`` from the working directory and keep
+    process-global caches, so each call chdirs into the replay project, clears
+    the path caches, and routes logging to that project's hooks log like the
+    hook's own ``logging.basicConfig`` does. Everything is restored afterwards.
+    ``pre_tool_use`` itself is imported on the first call, inside the replay
+    project, and the log handler its import installs is dropped.
+    No timeout applies: a hung validator hangs the caller.
+    """
+
+    def __init__(self, hooks_dir: Path):
+        hooks = Path(hooks_dir).resolve()
+        loaded = sys.modules.get("adapters")
+        loaded_file = getattr(loaded, "__file__", None)
+        if loaded_file and Path(loaded_file).resolve().parent.parent != hooks:
+            raise RuntimeError(
+                "In-process replay needs a fresh interpreter: hook modules are already "
+                f"imported from {Path(loaded_file).resolve().parent.parent}, not {hooks}. "
+                "Use workers to replay a second hooks tree."
+            )
+        # First on sys.path: a spawned worker inherits the parent's path, which
+        # may already list another tree with its own pre_tool_use/modules.
+        if str(hooks) in sys.path:
+            sys.path.remove(str(hooks))
+        sys.path.insert(0, str(hooks))
+        self._hooks = hooks
+        self._paths = importlib.import_module("modules.core.paths")
+        self._handle_stdin = None
+
+    def __call__(self, stdin_data: str, work_dir: Path) -> tuple[int, str, str]:
+        """Run one payload in *work_dir*; return (exit_code, stdout, stderr)."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        log_file = work_dir / ".claude" / "logs" / f"hooks-{datetime.now().strftime('%Y-%m-%d')}.log"
+        handler = logging.FileHandler(log_file)
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s [pre_tool_use] %(name)s - %(levelname)s - %(message)s"
+        ))
+        root = logging.getLogger()
+        prev_level = root.level
+        prev_cwd = os.getcwd()
+        plugin_root = os.environ.pop("CLAUDE_PLUGIN_ROOT", None)
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        try:
+            os.chdir(work_dir)
+            self._paths.clear_path_cache()
+            handle_stdin = self._handle_stdin or self._load(root, handler)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                exit_code = handle_stdin(stdin_data)
+        finally:
+            os.chdir(prev_cwd)
+            self._paths.clear_path_cache()
+            if plugin_root is not None:
+                os.environ["CLAUDE_PLUGIN_ROOT"] = plugin_root
+            root.removeHandler(handler)
+            root.setLevel(prev_level)
+            handler.close()
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def _load(self, root: logging.Logger, keep: logging.Handler):
+        """Import pre_tool_use (cwd is the replay project) and return its handle_stdin."""
+        before = set(root.handlers)
+        module = importlib.import_module("pre_tool_use")
+        for extra in [h for h in root.handlers if h not in before and h is not keep]:
+            root.removeHandler(extra)  # installed by the hook's logging.basicConfig
+            extra.close()
+        if Path(module.__file__).resolve().parent != self._hooks:
+            raise RuntimeError(f"pre_tool_use was imported from {module.__file__}, not {self._hooks}")
+        handle_stdin = getattr(module, "handle_stdin", None)
+        if handle_stdin is None:
+            raise RuntimeError(
+                f"{module.__file__} has no handle_stdin(); replay this tree without in-process mode."
+            )
+        self._handle_stdin = handle_stdin
+        return handle_stdin
+
+
+# One in-process hook per hooks tree per process ("import once").
+_IN_PROCESS_HOOKS: dict[Path, _InProcessPreToolUse] = {}
+
+
+def _in_process_hook(hooks_dir: Path) -> _InProcessPreToolUse:
+    key = Path(hooks_dir).resolve()
+    hook = _IN_PROCESS_HOOKS.get(key)
+    if hook is None:
+        hook = _IN_PROCESS_HOOKS[key] = _InProcessPreToolUse(key)
+    return hook
+
+
+def _warm_up(runner: HookRunner, events: Optional[list[ReplayEvent]]) -> None:
+    """Replay *events* untimed in a scratch project dir and discard the results.
+
+    Also the worker-pool initializer, so every worker process warms up once.
+    """
+    if events:
+        with tempfile.TemporaryDirectory(prefix="replay_warmup_") as tmp:
+            runner._run_serial(events, Path(tmp))
+
+
+def _replay_shard(
+    runner: HookRunner,
+    events: list[ReplayEvent],
+    work_dir: Optional[Path],
+) -> list[ReplayResult]:
+    """Worker entry point: replay one shard serially in its own project dir."""
+    if work_dir is None:
+        work_dir = Path(tempfile.mkdtemp(prefix="replay_shard_"))
+    return runner._run_serial(events, work_dir)
+
+
 class HookRunner:
     """Executes hooks as subprocesses for replay testing.
 
@@ -150,16 +280,24 @@ class HookRunner:
     mimicking the .claude/ directory structure that hooks expect.
     """
 
-    def __init__(self, hooks_dir: Path, project_root: Optional[Path] = None):
+    def __init__(
+        self,
+        hooks_dir: Path,
+        project_root: Optional[Path] = None,
+        in_process: bool = False,
+    ):
         """Initialize the runner.
 
         Args:
             hooks_dir: Path to the directory containing hook .py files.
             project_root: Optional path to use as the simulated project root.
                          If None, a temporary directory is created per batch.
+            in_process: Replay pre_tool_use events through the adapter
+                        imported into this process instead of a subprocess.
         """
         self.hooks_dir = hooks_dir
         self.project_root = project_root
+        self.in_process = in_process
         self._timeout = 30
 
     def _state_file_path(self, work_dir: Path) -> Path:
@@ -432,7 +570,20 @@ class HookRunner:
 
         if event.hook_name == "post_tool_use":
             self._prime_post_tool_use_state(event, work_dir)
-
+        elif event.hook_name == "pre_tool_use":
+            # The tier is read back from this file; a stale one from the
+            # previous event would make results depend on replay order.
+            self._state_file_path(work_dir).unlink(missing_ok=True)
+
+        if self.in_process and event.hook_name == "pre_tool_use":
+            hook = _in_process_hook(self.hooks_dir)
+            payload = self._prepare_payload(event)
+            started = time.perf_counter()
+            returncode, stdout, stderr = hook(payload, work_dir)
+            duration_ms = (time.perf_counter() - started) * 1000
+            return self._compare(event, returncode, stdout, stderr, work_dir, duration_ms)
+
+        started = time.perf_counter()
         try:
             result = subprocess.run(
                 [sys.executable, str(script_path)],
@@ -466,11 +617,24 @@ class HookRunner:
                 regression_type="os_error",
             )
 
+        duration_ms = (time.perf_counter() - started) * 1000
+        return self._compare(event, result.returncode, result.stdout, result.stderr, work_dir, duration_ms)
+
+    def _compare(
+        self,
+        event: ReplayEvent,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        work_dir: Path,
+        duration_ms: float = 0.0,
+    ) -> ReplayResult:
+        """Parse a finished hook run and compare it with the event's expectations."""
         actual_decision, actual_tier, actual_metadata = self._parse_result(
             event,
-            result.returncode,
-            result.stdout,
-            result.stderr,
+            returncode,
+            stdout,
+            stderr,
             work_dir,
         )
 
@@ -478,7 +642,7 @@ class HookRunner:
             event.expected_decision,
             actual_decision,
             event.expected_exit_code,
-            result.returncode,
+            returncode,
             event.expected_tier,
             actual_tier,
             expected_metadata=event.expected_metadata,
@@ -490,42 +654,93 @@ class HookRunner:
 
         return ReplayResult(
             event=event,
-            actual_exit_code=result.returncode,
-            actual_stdout=result.stdout,
-            actual_stderr=result.stderr,
+            actual_exit_code=returncode,
+            actual_stdout=stdout,
+            actual_stderr=stderr,
             actual_decision=actual_decision,
             actual_tier=actual_tier,
             matched=matched,
             regression_type=regression,
             actual_metadata=actual_metadata,
+            duration_ms=duration_ms,
         )
 
     def run_batch(
         self,
         events: list[ReplayEvent],
         progress_callback=None,
+        workers: int = 1,
+        warmup: Optional[list[ReplayEvent]] = None,
     ) -> list[ReplayResult]:
         """Run all events and return all results.
 
         Creates a single isolated project directory for the batch to
-        share session state across sequential hook calls.
+        share session state across sequential hook calls. With
+        ``workers > 1`` the events are split into contiguous shards, one
+        per worker process, each with its own project directory
+        (``project_root/shard-N`` when a project root is set).
 
         Args:
             events: List of ReplayEvents to replay.
             progress_callback: Optional callable(current, total) for progress.
+                In parallel mode it is called as each shard completes.
+            workers: Number of worker processes (1 = replay serially here).
+            warmup: Events replayed first, untimed and discarded, once in
+                each process that replays (lazy imports land there instead
+                of in the first timed calls).
 
         Returns:
             List of ReplayResult instances in the same order as events.
         """
+        workers = max(1, min(workers, len(events)))
+        if workers == 1:
+            # Create a shared project directory for the batch
+            if self.project_root:
+                work_dir = self.project_root
+            else:
+                tmp = tempfile.mkdtemp(prefix="replay_batch_")
+                work_dir = Path(tmp)
+            _warm_up(self, warmup)
+            return self._run_serial(events, work_dir, progress_callback)
+
+        size, extra = divmod(len(events), workers)
+        shards: list[list[ReplayEvent]] = []
+        start = 0
+        for i in range(workers):
+            end = start + size + (1 if i < extra else 0)
+            shards.append(events[start:end])
+            start = end
+
+        results: list[Optional[list[ReplayResult]]] = [None] * workers
+        total = len(events)
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up, initargs=(self, warmup)) as pool:
+            futures = {
+                pool.submit(
+                    _replay_shard,
+                    self,
+                    shard,
+                    self.project_root / f"shard-{i}" if self.project_root else None,
+                ): i
+                for i, shard in enumerate(shards)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                done += len(shards[i])
+                if progress_callback:
+                    progress_callback(done, total)
+
+        return [result for shard in results for result in shard or []]
+
+    def _run_serial(
+        self,
+        events: list[ReplayEvent],
+        work_dir: Path,
+        progress_callback=None,
+    ) -> list[ReplayResult]:
+        """Replay *events* one after another in *work_dir*."""
         results: list[ReplayResult] = []
-
-        # Create a shared project directory for the batch
-        if self.project_root:
-            work_dir = self.project_root
-        else:
-            tmp = tempfile.mkdtemp(prefix="replay_batch_")
-            work_dir = Path(tmp)
-
         self._setup_project_dir(work_dir)
 
         total = len(events)
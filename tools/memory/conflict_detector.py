@@ -8,13 +8,31 @@ Scans memory .md files for contradictions by:
 3. For similar file pairs (Jaccard > threshold), checking for polarity contradictions
 4. Returning structured conflict reports
 
+Scaling:
+- Candidate pairs come from an inverted token index with prefix filtering
+  (each file only indexes its rarest tokens; two files can exceed the
+  threshold only if those prefixes overlap), so only plausibly similar
+  pairs get an exact Jaccard check (a bitmask AND + popcount) -- the result
+  is the same as comparing every pair.
+- Each file's word set and polarity term maps (use / do-not-use terms,
+  enabled/disabled, always/never, Windows/WSL lines, versions) are computed
+  once and cached by (mtime, size) in ``gaia.paths.cache_dir() /
+  "memory-conflict-features.json"``; unchanged files are not even read.
+  Override with GAIA_MEMORY_CONFLICT_CACHE=<path>, disable with
+  GAIA_MEMORY_CONFLICT_CACHE=off.
+
 Inspired by hippo-memory's conflict detection heuristics.
 """
 
+import json
+import math
 import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_FILENAME = "memory-conflict-features.json"
+_CACHE_VERSION = 1
 
 
 # 50-word stopword list
@@ -27,6 +45,28 @@ STOPWORDS = frozenset([
     "all", "any", "each", "both", "more",
 ])
 
+_USE_RE = re.compile(r"\buse\s+(\w+)", re.IGNORECASE)
+_NO_USE_RE = re.compile(r"\b(?:do\s+not|don\'t|never\s+use)\s+(\w+)", re.IGNORECASE)
+_VERSION_RE = re.compile(r"\bv(\d+)\b", re.IGNORECASE)
+
+# Line classes checked pairwise across files: (class_a, class_b, reason).
+_LINE_CLASSES = {
+    "enabled": re.compile(r"\benabled\b", re.IGNORECASE),
+    "disabled": re.compile(r"\bdisabled\b", re.IGNORECASE),
+    "always": re.compile(r"\balways\b", re.IGNORECASE),
+    "never": re.compile(r"\bnever\b", re.IGNORECASE),
+    "windows": re.compile(r"\bWindows\b"),
+    "wsl": re.compile(r"\b(?:WSL|Linux)\b"),
+}
+_OPPOSITES = [
+    ("enabled", "disabled", "enabled vs disabled on shared topic"),
+    ("disabled", "enabled", "disabled vs enabled on shared topic"),
+    ("always", "never", "always vs never on shared topic"),
+    ("never", "always", "never vs always on shared topic"),
+    ("windows", "wsl", "Windows vs WSL/Linux on shared topic"),
+    ("wsl", "windows", "WSL/Linux vs Windows on shared topic"),
+]
+
 
 def _tokenize(text: str) -> set:
     """Tokenize text into lowercase words, removing stopwords."""
@@ -48,162 +88,104 @@ def _extract_lines(text: str) -> list:
     return [line.strip() for line in text.splitlines() if line.strip()]
 
 
-def _check_polarity_contradictions(lines_a: list, lines_b: list) -> list:
-    """
-    Check for polarity contradictions between two sets of lines.
+def _features(text: str) -> Dict[str, Any]:
+    """Precompute everything the pairwise checks need from one file.
 
-    Patterns checked:
-    - "use X" vs "do not use X" / "don't use X"
-    - "enabled" vs "disabled"
-    - "always" vs "never"
-    - "Windows" vs "WSL" / "Linux" in same context
-    - Version mismatches (e.g., "v4" vs "v5")
+    JSON-serializable (persisted in the feature cache):
+        words:    sorted token list of the whole file
+        uses:     {term: line} for "use X" (last line per term wins)
+        no_uses:  {term: line} for "do not / don't / never use X"
+        classes:  {class: [[line, tokens], ...]} for each _LINE_CLASSES hit
+        versions: {"N": [line, context tokens]} (last line per version wins)
     """
+    lines = _extract_lines(text)
+    uses: Dict[str, str] = {}
+    no_uses: Dict[str, str] = {}
+    classes: Dict[str, List[List[Any]]] = {name: [] for name in _LINE_CLASSES}
+    versions: Dict[str, List[Any]] = {}
+    for line in lines:
+        m = _USE_RE.search(line)
+        if m:
+            uses[m.group(1).lower()] = line
+        m = _NO_USE_RE.search(line)
+        if m:
+            no_uses[m.group(1).lower()] = line
+        tokens = None
+        for name, pattern in _LINE_CLASSES.items():
+            if pattern.search(line):
+                if tokens is None:
+                    tokens = sorted(_tokenize(line))
+                classes[name].append([line, tokens])
+        context = None
+        for m in _VERSION_RE.finditer(line):
+            if context is None:
+                context = sorted(_tokenize(_VERSION_RE.sub("", line)))
+            versions[str(int(m.group(1)))] = [line, context]
+    return {
+        "words": sorted(_tokenize(text)),
+        "uses": uses,
+        "no_uses": no_uses,
+        "classes": {k: v for k, v in classes.items() if v},
+        "versions": versions,
+    }
+
+
+def _line_postings(entries: List[List[Any]]) -> Dict[str, List[int]]:
+    """token -> indexes of the (line, tokens) entries containing it."""
+    postings: Dict[str, List[int]] = {}
+    for i, (_line, tokens) in enumerate(entries):
+        for token in tokens:
+            postings.setdefault(token, []).append(i)
+    return postings
+
+
+def _conflicts_between(fa: Dict[str, Any], fb: Dict[str, Any]) -> list:
+    """Polarity contradictions between two files' precomputed features."""
     conflicts = []
 
     # Pattern 1: "use X" vs "do not use X" / "don't use X"
-    use_pattern = re.compile(r"\buse\s+(\w+)", re.IGNORECASE)
-    no_use_pattern = re.compile(r"\b(?:do\s+not|don\'t|never\s+use)\s+(\w+)", re.IGNORECASE)
-
-    uses_a = {m.group(1).lower(): line for line in lines_a for m in [use_pattern.search(line)] if m}
-    uses_b = {m.group(1).lower(): line for line in lines_b for m in [use_pattern.search(line)] if m}
-    no_uses_a = {m.group(1).lower(): line for line in lines_a for m in [no_use_pattern.search(line)] if m}
-    no_uses_b = {m.group(1).lower(): line for line in lines_b for m in [no_use_pattern.search(line)] if m}
-
-    for term, line_a in uses_a.items():
-        if term in no_uses_b:
+    for term, line_a in fa["uses"].items():
+        if term in fb["no_uses"]:
             conflicts.append({
                 "line_a": line_a,
-                "line_b": no_uses_b[term],
+                "line_b": fb["no_uses"][term],
                 "reason": f"'use {term}' contradicts 'do not use {term}'",
             })
-
-    for term, line_b in uses_b.items():
-        if term in no_uses_a:
+    for term, line_b in fb["uses"].items():
+        if term in fa["no_uses"]:
             conflicts.append({
-                "line_a": no_uses_a[term],
+                "line_a": fa["no_uses"][term],
                 "line_b": line_b,
                 "reason": f"'use {term}' contradicts 'do not use {term}'",
             })
 
-    # Pattern 2: "enabled" vs "disabled"
-    enabled_pattern = re.compile(r"\benabled\b", re.IGNORECASE)
-    disabled_pattern = re.compile(r"\bdisabled\b", re.IGNORECASE)
-
-    enabled_lines_a = [l for l in lines_a if enabled_pattern.search(l)]
-    disabled_lines_a = [l for l in lines_a if disabled_pattern.search(l)]
-    enabled_lines_b = [l for l in lines_b if enabled_pattern.search(l)]
-    disabled_lines_b = [l for l in lines_b if disabled_pattern.search(l)]
-
-    for line_a in enabled_lines_a:
-        for line_b in disabled_lines_b:
-            # Only flag if they share a common significant keyword
-            shared = _tokenize(line_a) & _tokenize(line_b)
-            if shared:
-                conflicts.append({
-                    "line_a": line_a,
-                    "line_b": line_b,
-                    "reason": "enabled vs disabled on shared topic",
-                })
-
-    for line_a in disabled_lines_a:
-        for line_b in enabled_lines_b:
-            shared = _tokenize(line_a) & _tokenize(line_b)
-            if shared:
-                conflicts.append({
-                    "line_a": line_a,
-                    "line_b": line_b,
-                    "reason": "disabled vs enabled on shared topic",
-                })
-
-    # Pattern 3: "always" vs "never"
-    always_pattern = re.compile(r"\balways\b", re.IGNORECASE)
-    never_pattern = re.compile(r"\bnever\b", re.IGNORECASE)
-
-    always_lines_a = [l for l in lines_a if always_pattern.search(l)]
-    never_lines_a = [l for l in lines_a if never_pattern.search(l)]
-    always_lines_b = [l for l in lines_b if always_pattern.search(l)]
-    never_lines_b = [l for l in lines_b if never_pattern.search(l)]
-
-    for line_a in always_lines_a:
-        for line_b in never_lines_b:
-            shared = _tokenize(line_a) & _tokenize(line_b)
-            if shared:
-                conflicts.append({
-                    "line_a": line_a,
-                    "line_b": line_b,
-                    "reason": "always vs never on shared topic",
-                })
-
-    for line_a in never_lines_a:
-        for line_b in always_lines_b:
-            shared = _tokenize(line_a) & _tokenize(line_b)
-            if shared:
-                conflicts.append({
-                    "line_a": line_a,
-                    "line_b": line_b,
-                    "reason": "never vs always on shared topic",
-                })
-
-    # Pattern 4: "Windows" vs "WSL/Linux" in same context
-    windows_pattern = re.compile(r"\bWindows\b")
-    wsl_pattern = re.compile(r"\b(?:WSL|Linux)\b")
+    # Patterns 2-4: opposite line classes sharing a significant keyword.
+    # Lines of file_b are reached through a token index, in line order.
+    postings_b: Dict[str, Dict[str, List[int]]] = {}
+    for class_a, class_b, reason in _OPPOSITES:
+        lines_a = fa["classes"].get(class_a)
+        lines_b = fb["classes"].get(class_b)
+        if not lines_a or not lines_b:
+            continue
+        if class_b not in postings_b:
+            postings_b[class_b] = _line_postings(lines_b)
+        index = postings_b[class_b]
+        for line_a, tokens_a in lines_a:
+            hits = sorted({i for t in tokens_a for i in index.get(t, ())})
+            for i in hits:
+                conflicts.append({"line_a": line_a, "line_b": lines_b[i][0], "reason": reason})
 
-    windows_lines_a = [l for l in lines_a if windows_pattern.search(l)]
-    wsl_lines_a = [l for l in lines_a if wsl_pattern.search(l)]
-    windows_lines_b = [l for l in lines_b if windows_pattern.search(l)]
-    wsl_lines_b = [l for l in lines_b if wsl_pattern.search(l)]
-
-    # Cross-file: file_a says Windows, file_b says WSL for same context
-    for line_a in windows_lines_a:
-        for line_b in wsl_lines_b:
-            shared = _tokenize(line_a) & _tokenize(line_b)
-            if shared:
-                conflicts.append({
-                    "line_a": line_a,
-                    "line_b": line_b,
-                    "reason": "Windows vs WSL/Linux on shared topic",
-                })
-
-    for line_a in wsl_lines_a:
-        for line_b in windows_lines_b:
-            shared = _tokenize(line_a) & _tokenize(line_b)
-            if shared:
+    # Pattern 5: Version mismatches (e.g., "v4" vs "v5")
+    for va, (line_a, tokens_a) in fa["versions"].items():
+        set_a = set(tokens_a)
+        for vb, (line_b, tokens_b) in fb["versions"].items():
+            if va != vb and not set_a.isdisjoint(tokens_b):
                 conflicts.append({
                     "line_a": line_a,
                     "line_b": line_b,
-                    "reason": "WSL/Linux vs Windows on shared topic",
+                    "reason": f"version mismatch: v{va} vs v{vb} on shared topic",
                 })
 
-    # Pattern 5: Version mismatches (e.g., "v4" vs "v5")
-    version_pattern = re.compile(r"\bv(\d+)\b", re.IGNORECASE)
-
-    def extract_versions(lines: list) -> dict:
-        """Map version number -> line for lines containing a version."""
-        result = {}
-        for line in lines:
-            for m in version_pattern.finditer(line):
-                v = int(m.group(1))
-                result[v] = line
-        return result
-
-    versions_a = extract_versions(lines_a)
-    versions_b = extract_versions(lines_b)
-
-    for va, line_a in versions_a.items():
-        for vb, line_b in versions_b.items():
-            if va != vb:
-                # Only flag if the context words (excluding the version itself) overlap
-                tokens_a = _tokenize(re.sub(r"\bv\d+\b", "", line_a, flags=re.IGNORECASE))
-                tokens_b = _tokenize(re.sub(r"\bv\d+\b", "", line_b, flags=re.IGNORECASE))
-                shared = tokens_a & tokens_b
-                if shared:
-                    conflicts.append({
-                        "line_a": line_a,
-                        "line_b": line_b,
-                        "reason": f"version mismatch: v{va} vs v{vb} on shared topic",
-                    })
-
     # Deduplicate: remove identical (line_a, line_b, reason) triples
     seen = set()
     deduped = []
@@ -216,23 +198,188 @@ def _check_polarity_contradictions(lines_a: list, lines_b: list) -> list:
     return deduped
 
 
-def _load_memory_files(memory_dir: Path) -> dict:
+def _check_polarity_contradictions(lines_a: list, lines_b: list) -> list:
+    """
+    Check for polarity contradictions between two sets of lines.
+
+    Patterns checked:
+    - "use X" vs "do not use X" / "don't use X"
+    - "enabled" vs "disabled"
+    - "always" vs "never"
+    - "Windows" vs "WSL" / "Linux" in same context
+    - Version mismatches (e.g., "v4" vs "v5")
+    """
+    text_a = "\n".join(lines_a)
+    text_b = "\n".join(lines_b)
+    return _conflicts_between(_features(text_a), _features(text_b))
+
+
+def _cache_path() -> Optional[Path]:
+    """Resolve the feature cache file from the environment (None = disabled)."""
+    override = os.environ.get("GAIA_MEMORY_CONFLICT_CACHE", "")
+    if override.lower() in ("off", "0", "false", "no"):
+        return None
+    if override:
+        return Path(override)
+    try:
+        from gaia.paths import cache_dir
+    except ImportError:
+        return None
+    return cache_dir() / CACHE_FILENAME
+
+
+def _read_cache(path: Optional[Path]) -> Dict[str, Any]:
+    if path is None:
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_cache(path: Optional[Path], files: Dict[str, Any]) -> None:
+    if path is None:
+        return
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"version": _CACHE_VERSION, "files": files}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _load_memory_features(memory_dir: Path) -> Dict[str, Dict[str, Any]]:
     """
-    Load all .md files from memory_dir.
-    Returns dict mapping filename -> file content string.
+    Precomputed features of every .md file in memory_dir, keyed by path.
+
+    Files whose (mtime, size) match the cache are not read. Cache entries of
+    other directories are kept; entries of deleted files in memory_dir are
+    dropped.
     """
-    files = {}
+    cache_path = _cache_path()
+    cache = _read_cache(cache_path)
+    prefix = str(memory_dir) + os.sep
+    features: Dict[str, Dict[str, Any]] = {}
+    dirty = False
     try:
-        for entry in memory_dir.iterdir():
-            if entry.is_file() and entry.suffix == ".md":
-                try:
-                    content = entry.read_text(encoding="utf-8", errors="replace")
-                    files[str(entry)] = content
-                except (PermissionError, OSError):
-                    pass
+        entries = list(os.scandir(memory_dir))
     except (PermissionError, OSError, FileNotFoundError):
-        pass
-    return files
+        entries = []
+    for entry in entries:
+        if not entry.name.endswith(".md"):
+            continue
+        try:
+            if not entry.is_file():
+                continue
+            st = entry.stat()
+        except OSError:
+            continue
+        path = str(memory_dir / entry.name)
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = cache.get(path)
+        if isinstance(cached, dict) and cached.get("stamp") == stamp:
+            features[path] = cached["features"]
+            continue
+        try:
+            content = Path(path).read_text(encoding="utf-8", errors="replace")
+        except (PermissionError, OSError):
+            continue
+        features[path] = _features(content)
+        cache[path] = {"stamp": stamp, "features": features[path]}
+        dirty = True
+    for path in [p for p in cache if p.startswith(prefix) and p not in features]:
+        del cache[path]
+        dirty = True
+    if dirty:
+        _write_cache(cache_path, cache)
+    return features
+
+
+if hasattr(int, "bit_count"):  # Python 3.10+
+    _popcount = int.bit_count
+else:  # pragma: no cover
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+def _rank_mask(ranks: List[int], vocab_size: int) -> int:
+    """Bitmask with bit r set for every r in *ranks*, built in one from_bytes.
+
+    Summing ``1 << r`` would re-allocate a vocabulary-wide int per token.
+    """
+    buf = bytearray((vocab_size + 7) // 8)
+    for r in ranks:
+        buf[r >> 3] |= 1 << (r & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _similar_pairs(word_sets: List[set], threshold: float) -> List[Tuple[int, int, float]]:
+    """(i, j, jaccard) for every pair i < j with Jaccard similarity > threshold.
+
+    Same pairs as comparing every two sets, without doing so:
+
+    - Candidates (prefix filtering, as in PPJoin): with tokens ordered
+      rarest first and sets visited shortest first, a set x and a longer
+      set y can only reach J >= t if y's first ``|y| - ceil(t*|y|) + 1``
+      tokens meet x's first ``|x| - ceil(2t/(1+t)*|x|) + 1`` tokens. Only
+      those prefixes go into the inverted index, so common tokens rarely
+      produce candidates; a size filter (``|x| >= t*|y|``) drops the rest.
+    - Verification: each set is also a bitmask over the token ranks, so
+      the exact overlap of a candidate pair is one AND plus a popcount.
+    """
+    n = len(word_sets)
+    df: Dict[str, int] = {}
+    for words in word_sets:
+        for w in words:
+            df[w] = df.get(w, 0) + 1
+    rank = {w: r for r, w in enumerate(sorted(df, key=lambda w: (df[w], w)))}
+    ordered = [sorted(rank[w] for w in words) for words in word_sets]
+    masks = [_rank_mask(ranks, len(rank)) for ranks in ordered]
+
+    sizes = [len(ranks) for ranks in ordered]
+    pairs: List[Tuple[int, int, float]] = []
+
+    if threshold < 0:
+        # Every pair qualifies, even disjoint ones.
+        return [
+            (i, j, _jaccard(word_sets[i], word_sets[j]))
+            for i in range(n) for j in range(i + 1, n)
+        ]
+
+    eps = 1e-9
+    mid = 2 * threshold / (1 + threshold)
+    index: Dict[int, List[int]] = {}
+    for i in sorted(range(n), key=sizes.__getitem__):
+        ranks = ordered[i]
+        size = sizes[i]
+        if not size:
+            continue
+        seen = set()
+        for r in ranks[:size - math.ceil(threshold * size - eps) + 1]:
+            seen.update(index.get(r, ()))
+        min_size = threshold * size - eps
+        mask = masks[i]
+        for j in seen:
+            sj = sizes[j]
+            if sj >= min_size:
+                inter = _popcount(mask & masks[j])
+                if inter:
+                    sim = inter / (size + sj - inter)
+                    if sim > threshold:
+                        pairs.append((min(i, j), max(i, j), sim))
+        for r in ranks[:size - math.ceil(mid * size - eps) + 1]:
+            index.setdefault(r, []).append(i)
+
+    pairs.sort()
+    return pairs
 
 
 def detect_conflicts(
@@ -261,35 +408,26 @@ def detect_conflicts(
 
     memory_dir = Path(memory_dir)
 
-    file_contents = _load_memory_files(memory_dir)
-    if not file_contents:
+    features = _load_memory_features(memory_dir)
+    if not features:
         return []
 
-    file_paths = sorted(file_contents.keys())
-    word_sets = {fp: _tokenize(file_contents[fp]) for fp in file_paths}
-    file_lines = {fp: _extract_lines(file_contents[fp]) for fp in file_paths}
+    file_paths = sorted(features.keys())
+    word_sets = [set(features[fp]["words"]) for fp in file_paths]
 
     results = []
 
-    for i in range(len(file_paths)):
-        for j in range(i + 1, len(file_paths)):
-            fp_a = file_paths[i]
-            fp_b = file_paths[j]
-
-            sim = _jaccard(word_sets[fp_a], word_sets[fp_b])
-            if sim <= threshold:
-                continue
+    for i, j, sim in _similar_pairs(word_sets, threshold):
+        fp_a = file_paths[i]
+        fp_b = file_paths[j]
 
-            conflicts = _check_polarity_contradictions(
-                file_lines[fp_a],
-                file_lines[fp_b],
-            )
+        conflicts = _conflicts_between(features[fp_a], features[fp_b])
 
-            results.append({
-                "file_a": fp_a,
-                "file_b": fp_b,
-                "similarity": round(sim, 4),
-                "conflicts": conflicts,
-            })
+        results.append({
+            "file_a": fp_a,
+            "file_b": fp_b,
+            "similarity": round(sim, 4),
+            "conflicts": conflicts,
+        })
 
     return results
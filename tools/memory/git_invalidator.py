@@ -5,73 +5,116 @@ Git Invalidation Module for GAIA-OPS Episodic Memory
 Scans recent git commits for migration/deprecation patterns and weakens
 matching episodic memories by reducing their relevance_score.
 
+Each run only mines commits it has not seen: the last processed commit is
+persisted next to index.json (git-invalidator-cursor.json) and the next
+run reads ``<cursor>..HEAD``. All patterns are matched in one pass of a
+single compiled regex, and affected terms are resolved to episodes through
+an inverted index of episode words instead of scanning every episode per
+term.
+
 Inspired by hippo-memory's invalidation.ts patterns.
 """
 
 import json
 import re
 import subprocess
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, List, Any, Optional, Set, Tuple
+
+CURSOR_FILENAME = "git-invalidator-cursor.json"
+
+# N-gram length of the vocabulary index used for "term in word" lookups.
+_NGRAM = 3
 
 
 # Patterns that signal a tool/library/concept has changed or been removed.
-# Each entry is a (compiled_regex, group_extractor_fn) tuple.
-# The extractor receives a re.Match and returns a list of affected term strings.
-_PATTERNS: List[tuple] = []
-
-def _build_patterns() -> List[tuple]:
-    """Build compiled pattern list once."""
-    raw = [
-        # "migrate from X" / "migrated from X to Y"
-        (
-            re.compile(r'\bmigrate(?:d)?\s+from\s+([\w\-./]+)', re.IGNORECASE),
-            lambda m: [m.group(1)],
-        ),
-        # "deprecate X" / "deprecated X"
-        (
-            re.compile(r'\bdeprecate[sd]?\s+([\w\-./]+)', re.IGNORECASE),
-            lambda m: [m.group(1)],
-        ),
-        # "remove X" (at least 3-char word to skip noise)
-        (
-            re.compile(r'\bremove[sd]?\s+([\w\-./]{3,})', re.IGNORECASE),
-            lambda m: [m.group(1)],
-        ),
-        # "replace X with Y"
-        (
-            re.compile(r'\breplace\s+([\w\-./]+)\s+with\s+([\w\-./]+)', re.IGNORECASE),
-            lambda m: [m.group(1), m.group(2)],
-        ),
-        # "upgrade from X" / "upgraded from X to Y"
-        (
-            re.compile(r'\bupgrade[sd]?\s+from\s+([\w\-./]+)', re.IGNORECASE),
-            lambda m: [m.group(1)],
-        ),
-        # "drop support for X" / "drop X"
-        (
-            re.compile(r'\bdrop(?:\s+support(?:\s+for)?)?\s+([\w\-./]{3,})', re.IGNORECASE),
-            lambda m: [m.group(1)],
-        ),
-        # version bump: "v3 to v4" or "3.x to 4.x"
-        (
-            re.compile(r'\bv?(\d+)(?:\.\w+)?\s+to\s+v?(\d+)(?:\.\w+)?\b', re.IGNORECASE),
-            lambda m: [f"v{m.group(1)}", f"v{m.group(2)}"],
-        ),
-    ]
-    return raw
-
-
-_COMPILED_PATTERNS = _build_patterns()
-
-
-def _get_git_log(commit_count: int, cwd: Optional[Path] = None) -> Optional[str]:
+# Each entry is a (regex_source, group_extractor_fn) tuple, in priority
+# order. The extractor receives the pattern's own capture groups and returns
+# a list of affected term strings.
+_PATTERNS: List[Tuple[str, Callable[[Tuple[str, ...]], List[str]]]] = [
+    # "migrate from X" / "migrated from X to Y"
+    (r'\bmigrate(?:d)?\s+from\s+([\w\-./]+)', lambda g: [g[0]]),
+    # "deprecate X" / "deprecated X"
+    (r'\bdeprecate[sd]?\s+([\w\-./]+)', lambda g: [g[0]]),
+    # "remove X" (at least 3-char word to skip noise)
+    (r'\bremove[sd]?\s+([\w\-./]{3,})', lambda g: [g[0]]),
+    # "replace X with Y"
+    (r'\breplace\s+([\w\-./]+)\s+with\s+([\w\-./]+)', lambda g: [g[0], g[1]]),
+    # "upgrade from X" / "upgraded from X to Y"
+    (r'\bupgrade[sd]?\s+from\s+([\w\-./]+)', lambda g: [g[0]]),
+    # "drop support for X" / "drop X"
+    (r'\bdrop(?:\s+support(?:\s+for)?)?\s+([\w\-./]{3,})', lambda g: [g[0]]),
+    # version bump: "v3 to v4" or "3.x to 4.x"
+    (r'\bv?(\d+)(?:\.\w+)?\s+to\s+v?(\d+)(?:\.\w+)?\b', lambda g: [f"v{g[0]}", f"v{g[1]}"]),
+]
+
+
+def _build_combined() -> Tuple["re.Pattern[str]", List[Tuple[int, int]]]:
+    """Compile all _PATTERNS into one regex.
+
+    Each pattern becomes one alternative wrapped in a capture group, inside
+    a lookahead so that ``finditer`` reports a match at every position
+    without consuming text (a "remove deprecated foo" message still sees
+    the "deprecated foo" match). At a given position the alternation picks
+    the earliest-listed pattern, so the lowest pattern index over all
+    positions is exactly the first pattern, in list order, that matches
+    anywhere -- the same winner as searching the patterns one by one.
+
+    Returns:
+        (regex, spans) where spans[i] is (outer_group, inner_group_count)
+        of pattern i.
     """
-    Run git log and return stdout, or None if not in a git repo.
+    parts: List[str] = []
+    spans: List[Tuple[int, int]] = []
+    group = 1
+    for source, _extractor in _PATTERNS:
+        inner = re.compile(source).groups
+        spans.append((group, inner))
+        parts.append(f"({source})")
+        group += 1 + inner
+    return re.compile("(?=" + "|".join(parts) + ")", re.IGNORECASE), spans
+
+
+_COMBINED, _SPANS = _build_combined()
+_OUTER_GROUP = {outer: i for i, (outer, _inner) in enumerate(_SPANS)}
+
+
+def _match_message(message: str) -> Optional[List[str]]:
+    """Affected terms of the highest-priority pattern matching *message*."""
+    best: Optional[int] = None
+    best_groups: Tuple[str, ...] = ()
+    for m in _COMBINED.finditer(message):
+        # The matched alternative's outer group closes last.
+        index = _OUTER_GROUP[m.lastindex]
+        if best is None or index < best:
+            outer, inner = _SPANS[index]
+            best, best_groups = index, m.groups()[outer:outer + inner]
+            if best == 0:
+                break
+    if best is None:
+        return None
+    return _PATTERNS[best][1](best_groups)
+
+
+def _get_git_log(
+    commit_count: int,
+    cwd: Optional[Path] = None,
+    since: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Run git log and return stdout (``<sha> <subject>`` lines, newest first),
+    or None if not in a git repo or *since* is not a known commit.
+
+    With *since*, only commits after it (``since..HEAD``) are listed, still
+    capped at *commit_count*.
     """
+    cmd = ["git", "log", "--format=%H %s", f"-{commit_count}", "--no-merges"]
+    if since:
+        cmd.append(f"{since}..HEAD")
     try:
         result = subprocess.run(
-            ["git", "log", "--oneline", f"-{commit_count}", "--no-merges"],
+            cmd,
             capture_output=True,
             text=True,
             cwd=str(cwd) if cwd else None,
@@ -84,6 +127,31 @@ def _get_git_log(commit_count: int, cwd: Optional[Path] = None) -> Optional[str]
         return None
 
 
+def _load_cursor(cursor_path: Optional[Path]) -> Optional[str]:
+    """Return the last processed commit sha, or None."""
+    if cursor_path is None:
+        return None
+    try:
+        data = json.loads(cursor_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    sha = data.get("last_commit") if isinstance(data, dict) else None
+    return sha if isinstance(sha, str) and re.fullmatch(r"[0-9a-f]{7,64}", sha) else None
+
+
+def _save_cursor(cursor_path: Path, sha: str) -> None:
+    """Persist *sha* as the last processed commit (atomic replace)."""
+    tmp = cursor_path.with_name(f"{cursor_path.name}.tmp")
+    tmp.write_text(
+        json.dumps({
+            "last_commit": sha,
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }),
+        encoding="utf-8",
+    )
+    tmp.replace(cursor_path)
+
+
 def _scan_commits(log_output: str) -> tuple:
     """
     Scan git log output for migration/deprecation patterns.
@@ -97,19 +165,17 @@ def _scan_commits(log_output: str) -> tuple:
     affected_terms: set = set()
 
     for line in log_output.splitlines():
-        # Strip the short SHA prefix (7-char hex + space)
+        # Strip the SHA prefix (short or full hex + space)
         message = re.sub(r'^[0-9a-f]{7,}\s+', '', line).strip()
         if not message:
             continue
 
-        for regex, extractor in _COMPILED_PATTERNS:
-            match = regex.search(message)
-            if match:
-                terms = extractor(match)
-                patterns_detected.append(message)
-                for term in terms:
-                    affected_terms.add(term.lower())
-                break  # one pattern per commit line is enough
+        # One pattern per commit line is enough: the first listed that matches.
+        terms = _match_message(message)
+        if terms is not None:
+            patterns_detected.append(message)
+            for term in terms:
+                affected_terms.add(term.lower())
 
     return patterns_detected, affected_terms
 
@@ -125,47 +191,105 @@ def _find_index_json() -> Optional[Path]:
     return None
 
 
-def _episode_mentions_terms(episode: Dict[str, Any], terms: set) -> bool:
-    """
-    Return True if the episode's searchable text overlaps with any affected term.
-    Checks: keywords, tags, title.
-    """
-    if not terms:
-        return False
-
-    searchable: List[str] = []
+def _episode_words(episode: Dict[str, Any]) -> Set[str]:
+    """Searchable words of an episode: keywords, tags and title words."""
+    words: Set[str] = set()
 
     keywords = episode.get("keywords", [])
     if isinstance(keywords, list):
-        searchable.extend(str(k).lower() for k in keywords)
+        words.update(str(k).lower() for k in keywords)
 
     tags = episode.get("tags", [])
     if isinstance(tags, list):
-        searchable.extend(str(t).lower() for t in tags)
+        words.update(str(t).lower() for t in tags)
 
     title = episode.get("title", "")
     if title:
-        searchable.extend(re.split(r'\W+', title.lower()))
+        words.update(re.split(r'\W+', title.lower()))
+
+    # An empty word is a substring of every term; it must not match.
+    words.discard("")
+    return words
+
+
+class TermIndex:
+    """Inverted index from episode words to the episodes containing them.
+
+    Resolves an affected term to episodes with the same rule as a linear
+    scan -- a word matches when ``term in word`` or ``word in term`` --
+    without visiting every episode:
+
+      - ``word in term``: every substring of the term is looked up directly
+        (terms are short, so that is a handful of dict probes);
+      - ``term in word``: candidate words come from an n-gram index of the
+        vocabulary and are then verified (terms shorter than the n-gram
+        length fall back to scanning the vocabulary, not the episodes).
+    """
 
-    for word in searchable:
+    def __init__(self, episodes: Iterable[Dict[str, Any]]) -> None:
+        self.postings: Dict[str, Set[int]] = {}
+        for i, episode in enumerate(episodes):
+            for word in _episode_words(episode):
+                self.postings.setdefault(word, set()).add(i)
+        self._grams: Dict[str, Set[str]] = {}
+        for word in self.postings:
+            for j in range(len(word) - _NGRAM + 1):
+                self._grams.setdefault(word[j:j + _NGRAM], set()).add(word)
+
+    def _words_containing(self, term: str) -> Iterable[str]:
+        if len(term) < _NGRAM:
+            return (w for w in self.postings if term in w)
+        candidates: Optional[Set[str]] = None
+        for j in range(len(term) - _NGRAM + 1):
+            words = self._grams.get(term[j:j + _NGRAM])
+            if not words:
+                return ()
+            candidates = set(words) if candidates is None else candidates & words
+        return (w for w in candidates or () if term in w)
+
+    def lookup(self, terms: Iterable[str]) -> Set[int]:
+        """Indexes of the episodes matching any of *terms*."""
+        hits: Set[int] = set()
         for term in terms:
-            # term could be "v3" etc — use substring match for flexibility
-            if term and (term in word or word in term):
-                return True
-    return False
+            if not term:
+                continue
+            for start in range(len(term)):
+                for end in range(start + 1, len(term) + 1):
+                    hits |= self.postings.get(term[start:end], set())
+            for word in self._words_containing(term):
+                hits |= self.postings[word]
+        return hits
+
+
+def _episode_mentions_terms(episode: Dict[str, Any], terms: set) -> bool:
+    """
+    Return True if the episode's searchable text overlaps with any affected term.
+    Checks: keywords, tags, title.
+    """
+    if not terms:
+        return False
+    return bool(TermIndex([episode]).lookup(terms))
 
 
 def check_recent_commits(
     dry_run: bool = True,
     commit_count: int = 20,
+    use_cursor: bool = True,
 ) -> Dict[str, Any]:
     """
     Scan recent git commits for migration/deprecation patterns and weaken
     matching episodic memories.
 
+    Only commits newer than the persisted cursor are scanned (at most
+    *commit_count*); without a cursor, or when the cursor commit is no
+    longer known to git (rebased away), the last *commit_count* commits
+    are. The cursor advances to HEAD after a non-dry run.
+
     Args:
-        dry_run: If True, identify affected episodes but do NOT modify index.json.
-        commit_count: Number of recent commits to scan (default 20).
+        dry_run: If True, identify affected episodes but do NOT modify
+            index.json or the cursor.
+        commit_count: Max number of commits to scan (default 20).
+        use_cursor: Read/advance the commit cursor (False rescans the window).
 
     Returns:
         dict with keys:
@@ -173,71 +297,69 @@ def check_recent_commits(
             patterns_detected: list of commit message strings that matched a pattern
             would_modify: count of episodes that would be (or were) modified
             commits_scanned: number of commits examined
+            cursor: last processed commit after this run (None without one)
     """
-    empty_result: Dict[str, Any] = {
+    index_path = _find_index_json()
+    cursor_path = index_path.parent / CURSOR_FILENAME if index_path and use_cursor else None
+    cursor = _load_cursor(cursor_path)
+
+    result: Dict[str, Any] = {
         "affected_episodes": [],
         "patterns_detected": [],
         "would_modify": 0,
         "commits_scanned": 0,
+        "cursor": cursor,
     }
 
-    # Step 1: get git log
-    log_output = _get_git_log(commit_count)
+    # Step 1: get git log (new commits only when a cursor is known)
+    log_output = _get_git_log(commit_count, since=cursor) if cursor else None
+    if log_output is None:
+        log_output = _get_git_log(commit_count)
     if log_output is None:
-        return empty_result
+        return result
+
+    lines = [line for line in log_output.splitlines() if line.strip()]
+    result["commits_scanned"] = len(lines)
+    head = lines[0].split()[0] if lines else None
 
-    commits_scanned = len([l for l in log_output.splitlines() if l.strip()])
+    def _advance() -> None:
+        if not dry_run and cursor_path is not None and head and head != cursor:
+            _save_cursor(cursor_path, head)
+            result["cursor"] = head
 
-    # Step 2: detect patterns
+    # Step 2: detect patterns (one combined regex pass per commit)
     patterns_detected, affected_terms = _scan_commits(log_output)
+    result["patterns_detected"] = patterns_detected
 
-    # If nothing matched, short-circuit
-    if not affected_terms:
-        return {
-            "affected_episodes": [],
-            "patterns_detected": patterns_detected,
-            "would_modify": 0,
-            "commits_scanned": commits_scanned,
-        }
+    # If nothing matched, or there is no index, short-circuit
+    if not affected_terms or index_path is None:
+        _advance()
+        return result
 
     # Step 3: load index.json
-    index_path = _find_index_json()
-    if index_path is None:
-        return {
-            "affected_episodes": [],
-            "patterns_detected": patterns_detected,
-            "would_modify": 0,
-            "commits_scanned": commits_scanned,
-        }
-
     try:
         index_data = json.loads(index_path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
-        return {
-            "affected_episodes": [],
-            "patterns_detected": patterns_detected,
-            "would_modify": 0,
-            "commits_scanned": commits_scanned,
-        }
+        return result
 
     episodes: List[Dict[str, Any]] = index_data.get("episodes", [])
 
-    # Step 4: find matching episodes
+    # Step 4: find matching episodes via the inverted index
+    hits = TermIndex(episodes).lookup(affected_terms)
     affected_ids: List[str] = []
-    for ep in episodes:
-        if _episode_mentions_terms(ep, affected_terms):
-            ep_id = ep.get("id") or ep.get("episode_id", "")
-            if ep_id:
-                affected_ids.append(ep_id)
+    for i in sorted(hits):
+        ep_id = episodes[i].get("id") or episodes[i].get("episode_id", "")
+        if ep_id:
+            affected_ids.append(ep_id)
 
-    would_modify = len(affected_ids)
+    result["affected_episodes"] = affected_ids
+    result["would_modify"] = len(affected_ids)
 
     # Step 5: apply changes if not dry_run
     if not dry_run and affected_ids:
-        affected_set = set(affected_ids)
-        for ep in episodes:
-            ep_id = ep.get("id") or ep.get("episode_id", "")
-            if ep_id in affected_set:
+        for i in hits:
+            ep = episodes[i]
+            if ep.get("id") or ep.get("episode_id", ""):
                 current_score = ep.get("relevance_score", 1.0)
                 ep["relevance_score"] = current_score * 0.5
 
@@ -247,16 +369,12 @@ def check_recent_commits(
             encoding="utf-8",
         )
 
-    return {
-        "affected_episodes": affected_ids,
-        "patterns_detected": patterns_detected,
-        "would_modify": would_modify,
-        "commits_scanned": commits_scanned,
-    }
+    _advance()
+    return result
 
 
 if __name__ == "__main__":
     import sys
     dry = "--apply" not in sys.argv
-    result = check_recent_commits(dry_run=dry)
+    result = check_recent_commits(dry_run=dry, use_cursor="--no-cursor" not in sys.argv)
     print(json.dumps(result, indent=2))
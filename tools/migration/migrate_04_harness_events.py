@@ -9,8 +9,10 @@ Reglas:
   - NO importa sqlite3.
   - `id` es AUTOINCREMENT en la tabla; NO lo insertamos.
   - `payload` = json.dumps(record) entero -- preserva todos los campos.
-  - Idempotencia: harness_events NO tiene UNIQUE constraint útil.
-    Aplicar una sola vez. Re-ejecuciones requieren DELETE WHERE project=...
+  - Idempotencia: `event_hash` (gaia.store.ingest.event_hash) tiene UNIQUE
+    index y se inserta con INSERT OR IGNORE. Re-ejecutar no duplica filas, y
+    gaia.store.ingest (ingesta continua) reconoce las filas ya migradas.
+    Requiere schema v3 (columna event_hash): abrir la DB una vez con gaia.
 
 CLI args (parametrización cross-workspace):
   --project   workspace name (default: 'me')
@@ -25,12 +27,18 @@ import json
 import sys
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from gaia.store.ingest import event_hash, parse_line  # noqa: E402
+
 DEFAULT_PROJECT = "me"
 DEFAULT_SRC = Path("/home/jorge/ws/me/.claude/events/events.jsonl")
 DEFAULT_OUT = Path("/tmp/migrate_04_harness_events.sql")
 BATCH_SIZE = 200
 
-COLUMNS = ["project", "ts", "type", "source", "agent", "result", "severity", "payload"]
+COLUMNS = ["project", "ts", "type", "source", "agent", "result", "severity", "payload", "event_hash"]
 
 
 def sql_quote(value) -> str:
@@ -56,6 +64,7 @@ def extract_row(record: dict, project: str) -> dict:
         "result": record.get("result"),
         "severity": record.get("severity"),
         "payload": json.dumps(record, ensure_ascii=False, separators=(",", ":")),
+        "event_hash": event_hash(record),
     }
 
 
@@ -90,18 +99,14 @@ def main() -> int:
             s = line.strip()
             if not s:
                 continue
-            try:
-                rec = json.loads(s)
-            except json.JSONDecodeError:
-                skipped += 1
-                continue
-            if not rec.get("ts") or not rec.get("type"):
+            rec = parse_line(s)
+            if rec is None:
                 skipped += 1
                 continue
             rows.append(extract_row(rec, project))
 
     cols_csv = ",".join(COLUMNS)
-    insert_prefix = f"INSERT INTO harness_events ({cols_csv}) VALUES\n"
+    insert_prefix = f"INSERT OR IGNORE INTO harness_events ({cols_csv}) VALUES\n"
 
     with out.open("w", encoding="utf-8") as fh:
         fh.write(f"-- Generated by migrate_04_harness_events.py\n")
@@ -111,9 +116,10 @@ def main() -> int:
         fh.write(f"-- Records to insert:  {len(rows)}\n")
         fh.write(f"-- Skipped:            {skipped}\n")
         fh.write("--\n")
-        fh.write("-- WARNING: harness_events sin PK natural; aplicar 2 veces duplica filas.\n")
+        fh.write("-- Idempotente: UNIQUE(event_hash) + INSERT OR IGNORE.\n")
         if not fragment:
             fh.write("BEGIN TRANSACTION;\n")
+        fh.write("CREATE UNIQUE INDEX IF NOT EXISTS idx_harness_events_hash ON harness_events(event_hash);\n")
 
         for i in range(0, len(rows), BATCH_SIZE):
             batch = rows[i : i + BATCH_SIZE]
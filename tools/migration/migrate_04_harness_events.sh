@@ -2,9 +2,8 @@
 # migrate_04_harness_events.sh
 # Wrapper: regenera el .sql desde events.jsonl y lo carga en ~/.gaia/gaia.db.
 #
-# OJO: harness_events no tiene PK natural. Re-ejecutar este wrapper duplica
-# filas. Si necesitas re-ejecutar limpio, primero elimina las filas con:
-#   sqlite3 ~/.gaia/gaia.db "DELETE FROM harness_events WHERE project='me';"
+# Idempotente: cada fila lleva event_hash (UNIQUE) y se inserta con
+# INSERT OR IGNORE, así que re-ejecutar este wrapper no duplica filas.
 set -euo pipefail
 
 HERE="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
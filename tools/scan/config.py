@@ -4,7 +4,8 @@ Scanner Configuration Module
 Provides ScanConfig for scanner orchestration settings, ToolCategory enum,
 ToolDefinition dataclass, and the default tool definitions list.
 
-Staleness threshold is overridable via GAIA_SCAN_STALENESS_HOURS env var.
+Staleness threshold is overridable via GAIA_SCAN_STALENESS_HOURS env var,
+the scanner executor via GAIA_SCAN_EXECUTOR ("thread" or "process").
 """
 
 import json
@@ -14,6 +15,9 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Optional
 
+# Valid ScanConfig.executor values.
+SCAN_EXECUTORS = ("thread", "process")
+
 
 class ToolCategory(Enum):
     """Tool categories for classification during environment scanning."""
@@ -66,6 +70,11 @@ class ScanConfig:
         verbose: Print detailed output (default False).
         output_path: Path to write project-context.json (None = default location).
         staleness_hours: Hours before a scan is considered stale (default 24).
+        incremental: Reuse unchanged tree-scanner results recorded in the
+            scan manifest (default True). False forces a full rescan.
+        executor: "thread" (default) runs every scanner in a thread pool;
+            "process" runs CPU-bound scanners (BaseScanner.CPU_BOUND) in a
+            process pool next to the threaded ones. Only used when parallel.
     """
 
     project_root: Path = field(default_factory=lambda: Path.cwd())
@@ -75,15 +84,28 @@ class ScanConfig:
     verbose: bool = False
     output_path: Optional[Path] = None
     staleness_hours: int = 24
+    incremental: bool = True
+    executor: str = "thread"
 
     def __post_init__(self) -> None:
-        """Apply environment variable overrides after init."""
+        """Apply environment variable overrides after init.
+
+        Raises:
+            ValueError: If executor is not one of SCAN_EXECUTORS.
+        """
         env_staleness = os.environ.get("GAIA_SCAN_STALENESS_HOURS")
         if env_staleness is not None:
             try:
                 self.staleness_hours = int(env_staleness)
             except ValueError:
                 pass  # Keep default if env var is not a valid integer
+        env_executor = os.environ.get("GAIA_SCAN_EXECUTOR")
+        if env_executor in SCAN_EXECUTORS:
+            self.executor = env_executor
+        if self.executor not in SCAN_EXECUTORS:
+            raise ValueError(
+                f"executor must be one of {SCAN_EXECUTORS}, got {self.executor!r}"
+            )
 
 
 # Default tool definitions per data-model.md section 5.3
@@ -0,0 +1,273 @@
+"""
+Scan Manifest
+
+Persisted record of the previous scan that lets a rescan skip unchanged
+work. Stored as JSON next to project-context.json (scan-manifest.json).
+
+What it records:
+  - dirs: per indexed directory, (mtime_ns, inode) plus its pruned listing.
+    Adding, removing or renaming an entry changes the directory's mtime, so
+    a directory whose stat is unchanged is rebuilt into the FileIndex from
+    the stored listing instead of being listed again.
+  - files: per parsed manifest file (package.json, pyproject.toml, *.tf,
+    Chart.yaml, kustomization.yaml, compose files, ...), (size, mtime_ns,
+    sha1). Contents are re-hashed only when the stat changes.
+  - results: per scanner, a fingerprint of its inputs and the ScanResult
+    sections it produced. When the fingerprint is unchanged the scanner is
+    not run and its previous sections are reused.
+
+Scanners opt in by declaring a WatchSpec (BaseScanner.WATCH). Their inputs
+are the tree structure, the contents of the files the spec names, any extra
+paths outside the index (hidden CI dirs, ~/.kube/config) and environment
+variables. Scanners without a WatchSpec (tools, environment, git) always run.
+
+Stat-based shortcuts follow git's racy-timestamp rule: an entry is only
+trusted when its mtime is older than the whole second in which the scan
+that recorded it started, so an edit that lands in the same timestamp tick
+as the previous scan is still detected.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.scan import profile as scan_profile
+from tools.scan.scanners.base import ScanResult, WatchSpec
+from tools.scan.walk import SKIP_DIRS, FileIndex
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "scan-manifest.json"
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+def _list_dir(directory: Path) -> Tuple[List[str], List[str]]:
+    """Return (subdirs, files) of *directory*, pruned and sorted like index_project."""
+    subdirs: List[str] = []
+    files: List[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+            elif (
+                not entry.is_symlink()
+                and entry.name not in SKIP_DIRS
+                and not entry.name.startswith(".")
+            ):
+                subdirs.append(entry.name)
+    subdirs.sort()
+    files.sort()
+    return subdirs, files
+
+
+class ScanManifest:
+    """Previous-scan state for one project root. See module docstring."""
+
+    def __init__(self, root: Path, data: Optional[Dict[str, Any]] = None) -> None:
+        data = data or {}
+        self.root = root
+        self._trusted_before = (data.get("started_ns", 0) // _NS_PER_SECOND) * _NS_PER_SECOND
+        self._prev_dirs: Dict[str, list] = data.get("dirs", {})
+        self._prev_files: Dict[str, list] = data.get("files", {})
+        self.dirs: Dict[str, list] = dict(self._prev_dirs)
+        self.files: Dict[str, list] = {}
+        self.results: Dict[str, Dict[str, Any]] = data.get("results", {})
+        self.started_ns = time.time_ns()
+        self.dirs_listed = 0
+        self.files_hashed = 0
+        self._structure: Optional[str] = None
+        self._dirty = not data
+
+    @classmethod
+    def load(cls, path: Path, root: Path) -> "ScanManifest":
+        """Load the manifest at *path*; empty when missing, corrupt or foreign."""
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(root)
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_VERSION
+            or data.get("root") != str(root)
+        ):
+            return cls(root)
+        return cls(root, data)
+
+    def save(self, path: Path) -> None:
+        """Atomically write the manifest (temp file + rename). Best effort.
+
+        A no-op rescan (nothing re-listed, re-hashed or re-scanned) leaves
+        the previous manifest in place.
+        """
+        if not (self._dirty or self.dirs_listed or self.files_hashed):
+            return
+        data = {
+            "version": MANIFEST_VERSION,
+            "root": str(self.root),
+            "started_ns": self.started_ns,
+            "dirs": self.dirs,
+            "files": self.files or self._prev_files,
+            "results": self.results,
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to write scan manifest: %s", exc)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------ #
+    # Tree
+    # ------------------------------------------------------------------ #
+
+    def _trusted(self, mtime_ns: int, recorded_mtime_ns: int) -> bool:
+        return mtime_ns == recorded_mtime_ns and mtime_ns < self._trusted_before
+
+    def build_index(self) -> FileIndex:
+        """Build the FileIndex, re-listing only directories whose stat changed.
+
+        Visits directories in the same pre-order as walk.index_project, so
+        the resulting index is identical to a fresh walk.
+        """
+        index = FileIndex(self.root)
+        dirs: Dict[str, list] = {}
+        pending = [self.root]
+        while pending:
+            directory = pending.pop()
+            rel = directory.relative_to(self.root).as_posix()
+            try:
+                st = os.stat(directory)
+            except OSError:
+                continue
+            prev = self._prev_dirs.get(rel)
+            if prev and prev[1] == st.st_ino and self._trusted(st.st_mtime_ns, prev[0]):
+                subdirs, files = prev[2], prev[3]
+            else:
+                start = time.perf_counter()
+                try:
+                    subdirs, files = _list_dir(directory)
+                except OSError:
+                    continue
+                self.dirs_listed += 1
+                profile = scan_profile.active()
+                if profile is not None:
+                    profile.record_dir(str(directory), time.perf_counter() - start)
+            dirs[rel] = [st.st_mtime_ns, st.st_ino, subdirs, files]
+            index.add_dir(directory, files)
+            pending.extend(directory / d for d in reversed(subdirs))
+        self.dirs = dirs
+        self._structure = None
+        return index
+
+    def structure_digest(self) -> str:
+        """Digest of every indexed directory and filename (no stats)."""
+        if self._structure is None:
+            h = hashlib.sha1()
+            for rel in sorted(self.dirs):
+                _mtime, _ino, subdirs, files = self.dirs[rel]
+                h.update(json.dumps([rel, subdirs, files]).encode())
+            self._structure = h.hexdigest()
+        return self._structure
+
+    # ------------------------------------------------------------------ #
+    # File contents
+    # ------------------------------------------------------------------ #
+
+    def file_digest(self, path: Path) -> str:
+        """sha1 of *path*'s content, reusing the recorded hash when the stat matches."""
+        rel = path.relative_to(self.root).as_posix()
+        known = self.files.get(rel)
+        if known is not None:
+            return known[2]
+        try:
+            st = os.stat(path)
+        except OSError:
+            return "-"
+        prev = self._prev_files.get(rel)
+        if prev and prev[0] == st.st_size and self._trusted(st.st_mtime_ns, prev[1]):
+            digest = prev[2]
+        else:
+            try:
+                with open(path, "rb") as f:
+                    digest = hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                return "-"
+            self.files_hashed += 1
+        self.files[rel] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def _path_signature(self, spec: str) -> list:
+        """Stat signature of an extra path (and its direct children if a dir)."""
+        path = Path(spec).expanduser() if spec.startswith("~") else self.root / spec
+        try:
+            st = os.stat(path)
+        except OSError:
+            return [spec, None]
+        signature: list = [spec, st.st_mtime_ns, st.st_size]
+        if os.path.isdir(path):
+            try:
+                with os.scandir(path) as entries:
+                    for entry in sorted(entries, key=lambda e: e.name):
+                        est = entry.stat()
+                        signature.append([entry.name, est.st_mtime_ns, est.st_size])
+            except OSError:
+                pass
+        return signature
+
+    # ------------------------------------------------------------------ #
+    # Scanner fragments
+    # ------------------------------------------------------------------ #
+
+    def fingerprint(self, watch: WatchSpec, index: FileIndex, salt: str) -> str:
+        """Digest of everything a scanner with *watch* reads from the project."""
+        h = hashlib.sha1(salt.encode())
+        h.update(self.structure_digest().encode())
+        watched = set(index.named(*watch.names)) if watch.names else set()
+        if watch.extensions:
+            watched.update(index.with_ext(*watch.extensions))
+        if watch.prefixes:
+            watched.update(index.with_prefix(*watch.prefixes))
+        for path in sorted(watched):
+            h.update(f"{path}\0{self.file_digest(path)}\n".encode())
+        for spec in watch.extra_paths:
+            h.update(json.dumps(self._path_signature(spec)).encode())
+        for var in watch.env:
+            h.update(f"{var}={os.environ.get(var, '')}\n".encode())
+        return h.hexdigest()
+
+    def cached_result(self, scanner: str, fingerprint: str) -> Optional[ScanResult]:
+        """Return the stored ScanResult for *scanner* if *fingerprint* matches."""
+        entry = self.results.get(scanner)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        # Copies both ways: the merge step mutates sections in place.
+        return ScanResult(scanner=scanner, sections=copy.deepcopy(entry.get("sections", {})))
+
+    def store_result(self, scanner: str, fingerprint: str, result: ScanResult) -> None:
+        """Record *result*; results with warnings are never reused."""
+        self._dirty = True
+        if result.warnings:
+            self.results.pop(scanner, None)
+            return
+        self.results[scanner] = {
+            "fingerprint": fingerprint,
+            "sections": copy.deepcopy(result.sections),
+        }
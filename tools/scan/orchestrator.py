@@ -7,7 +7,13 @@ and performs an atomic write.
 
 Pipeline:
   1. Load existing project-context.json (if present)
-  2. Run all scanners in parallel (ThreadPoolExecutor)
+  2. Run all scanners in parallel (ThreadPoolExecutor) over one shared
+     FileIndex (a single pruned walk of the project tree). With
+     config.incremental, tree scanners whose inputs are unchanged since the
+     last scan are skipped and their recorded sections reused
+     (tools/scan/manifest.py). With config.executor == "process", CPU-bound
+     scanners run in a ProcessPoolExecutor instead and return their
+     ScanResult as a plain dict
   3. Collect and combine scanner sections (handling environment sub-keys)
   4. Merge with existing context (section ownership model)
   5. Update metadata (last_updated, last_scan, scanner_version)
@@ -22,14 +28,17 @@ import json
 import logging
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 
 from tools.scan import __version__ as scanner_package_version
+from tools.scan import profile as scan_profile
 from tools.scan.config import CONTRACT_CONFIG_PATH, ScanConfig
+from tools.scan.manifest import MANIFEST_FILENAME, ScanManifest
 from tools.scan.merge import (
     AGENT_ENRICHED_SECTIONS,
     collect_scanner_sections,
@@ -37,11 +46,51 @@ from tools.scan.merge import (
 )
 from tools.scan.registry import ScannerRegistry
 from tools.scan.scanners.base import BaseScanner, ScanResult
+from tools.scan.version_cache import get_cache as get_version_cache
+from tools.scan.walk import FileIndex, index_project
 from tools.scan.workspace import WorkspaceInfo, detect_workspace_type
 
 logger = logging.getLogger(__name__)
 
 
+def _guarded_scan(scanner: BaseScanner, project_root: Path) -> ScanResult:
+    """Run *scanner* with fault isolation (errors become a warning result)."""
+    start_ms = time.monotonic() * 1000
+    try:
+        with scan_profile.scope(f"scanner:{scanner.SCANNER_NAME}"):
+            return scanner.scan(project_root)
+    except Exception as exc:
+        elapsed_ms = (time.monotonic() * 1000) - start_ms
+        error_msg = (
+            f"Scanner '{scanner.SCANNER_NAME}' failed: "
+            f"{type(exc).__name__}: {exc}"
+        )
+        logger.warning(error_msg)
+        return ScanResult(
+            scanner=scanner.SCANNER_NAME,
+            sections={},
+            warnings=[error_msg],
+            duration_ms=elapsed_ms,
+        )
+
+
+def _scan_in_worker(
+    scanner_cls: Type[BaseScanner],
+    project_root: Path,
+    workspace_info: Optional[WorkspaceInfo],
+    file_index: Optional[FileIndex],
+) -> Dict[str, Any]:
+    """Process-pool entry point: scan with a fresh *scanner_cls* instance.
+
+    Returns:
+        ScanResult.to_dict() of the scan (rebuilt with from_dict by the parent).
+    """
+    scanner = scanner_cls()
+    scanner.workspace_info = workspace_info
+    scanner.file_index = file_index
+    return _guarded_scan(scanner, project_root).to_dict()
+
+
 @dataclass(frozen=True)
 class ScanOutput:
     """Aggregated output from all scanners.
@@ -55,6 +104,8 @@ class ScanOutput:
         errors: Aggregated errors from all scanners.
         duration_ms: Total scan time in milliseconds.
         scanner_results: Per-scanner ScanResult mapping.
+        reused_scanners: Scanners skipped because their inputs were
+                 unchanged; their results come from the scan manifest.
     """
 
     context: Dict[str, Any] = field(default_factory=dict)
@@ -64,6 +115,7 @@ class ScanOutput:
     errors: List[str] = field(default_factory=list)
     duration_ms: float = 0.0
     scanner_results: Dict[str, ScanResult] = field(default_factory=dict)
+    reused_scanners: List[str] = field(default_factory=list)
 
 
 class ScanOrchestrator:
@@ -101,23 +153,7 @@ class ScanOrchestrator:
         Returns:
             ScanResult from the scanner, or an error result on failure.
         """
-        start_ms = time.monotonic() * 1000
-        try:
-            result = scanner.scan(project_root)
-            return result
-        except Exception as exc:
-            elapsed_ms = (time.monotonic() * 1000) - start_ms
-            error_msg = (
-                f"Scanner '{scanner.SCANNER_NAME}' failed: "
-                f"{type(exc).__name__}: {exc}"
-            )
-            logger.warning(error_msg)
-            return ScanResult(
-                scanner=scanner.SCANNER_NAME,
-                sections={},
-                warnings=[error_msg],
-                duration_ms=elapsed_ms,
-            )
+        return _guarded_scan(scanner, project_root)
 
     def _load_existing_context(self, output_path: Path) -> Dict[str, Any]:
         """Load existing project-context.json if present.
@@ -211,21 +247,23 @@ class ScanOrchestrator:
     def _atomic_write(self, output_path: Path, data: Dict[str, Any]) -> None:
         """Atomically write data to JSON file.
 
-        Writes to a temp file in the same directory, then renames.
-        This prevents corruption from concurrent reads or crashes.
+        Writes to a per-process temp file in the same directory, then
+        renames. This prevents corruption from concurrent reads or crashes,
+        and concurrent writers (a `gaia scan --watch` process and a hook
+        scan) never share a temp file.
 
         Args:
             output_path: Target file path.
             data: Dict to serialize as JSON.
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = output_path.with_suffix(".tmp")
+        tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
 
         try:
             with open(tmp_path, "w") as f:
                 json.dump(data, f, indent=2, sort_keys=False)
                 f.write("\n")
-            os.rename(str(tmp_path), str(output_path))
+            os.replace(str(tmp_path), str(output_path))
         except OSError as exc:
             logger.error("Atomic write failed: %s", exc)
             # Clean up temp file if rename failed
@@ -282,24 +320,71 @@ class ScanOrchestrator:
             requested = set(self.config.scanners)
             scanners = [s for s in scanners if s.SCANNER_NAME in requested]
 
-        # Pass workspace info to each scanner instance
+        # One pruned walk of the tree, shared by every tree scanner (each used
+        # to walk the tree on its own, several times over). Scans without a
+        # tree scanner (e.g. the SessionStart tools+environment scan) skip it.
+        tree_scanners = [s for s in scanners if s.WATCH is not None]
+        manifest_path = output_path.parent / MANIFEST_FILENAME
+        manifest: Optional[ScanManifest] = None
+        file_index = None
+        if tree_scanners:
+            with scan_profile.phase("index"):
+                if self.config.incremental:
+                    manifest = ScanManifest.load(manifest_path, root)
+                    file_index = manifest.build_index()
+                else:
+                    file_index = index_project(root)
+
+        # Reuse recorded results of tree scanners whose inputs are unchanged.
+        fingerprints: Dict[str, str] = {}
+        reused: Dict[str, ScanResult] = {}
+        if manifest is not None:
+            salt = f"{scanner_package_version}|{root}|{workspace_info}"
+            for scanner in tree_scanners:
+                name = scanner.SCANNER_NAME
+                fingerprints[name] = manifest.fingerprint(
+                    scanner.WATCH, file_index, f"{salt}|{name}|{scanner.SCANNER_VERSION}"
+                )
+                cached = manifest.cached_result(name, fingerprints[name])
+                if cached is not None:
+                    reused[name] = cached
+            scanners = [s for s in scanners if s.SCANNER_NAME not in reused]
+
+        # Pass workspace info and the file index to each scanner instance
         for scanner in scanners:
             scanner.workspace_info = workspace_info
+            scanner.file_index = file_index
 
         scanner_results: Dict[str, ScanResult] = {}
         all_warnings: List[str] = []
         all_errors: List[str] = []
 
-        if scanners and self.config.parallel:
-            scanner_results, all_warnings, all_errors = self._run_parallel(
-                scanners, root
-            )
-        else:
-            scanner_results, all_warnings, all_errors = self._run_sequential(
-                scanners, root
-            )
+        try:
+            with scan_profile.phase("scanners"):
+                if scanners and self.config.parallel:
+                    scanner_results, all_warnings, all_errors = self._run_parallel(
+                        scanners, root
+                    )
+                else:
+                    scanner_results, all_warnings, all_errors = self._run_sequential(
+                        scanners, root
+                    )
+        finally:
+            # Registry instances outlive this run; never serve a stale index.
+            for scanner in scanners:
+                scanner.file_index = None
+            # Scanners only fill the tool-version cache in memory; persist
+            # it here so they keep their no-file-writes contract.
+            get_version_cache().flush()
+
+        if manifest is not None:
+            for name, fingerprint in fingerprints.items():
+                if name in scanner_results:
+                    manifest.store_result(name, fingerprint, scanner_results[name])
+            scanner_results.update(reused)
 
         # Step 3: Collect and combine scanner sections
+        merge_start = time.perf_counter()
         scan_sections = collect_scanner_sections(scanner_results)
 
         # Step 4: Merge with existing context
@@ -354,10 +439,16 @@ class ScanOrchestrator:
             "metadata": metadata,
             "sections": merged_sections,
         }
+        profile = scan_profile.active()
+        if profile is not None:
+            profile.add_phase("merge", time.perf_counter() - merge_start)
 
         # Step 7: Atomic write
         if write_output:
-            self._atomic_write(output_path, full_context)
+            with scan_profile.phase("write"):
+                self._atomic_write(output_path, full_context)
+                if manifest is not None:
+                    manifest.save(manifest_path)
 
         elapsed_ms = (time.monotonic() * 1000) - start_ms
 
@@ -369,6 +460,7 @@ class ScanOrchestrator:
             errors=all_errors,
             duration_ms=elapsed_ms,
             scanner_results=scanner_results,
+            reused_scanners=sorted(reused),
         )
 
     @staticmethod
@@ -480,6 +572,11 @@ class ScanOrchestrator:
     ) -> tuple:
         """Run scanners in parallel using ThreadPoolExecutor.
 
+        With config.executor == "process", CPU_BOUND scanners run in a
+        ProcessPoolExecutor alongside the threaded ones. If the process pool
+        cannot be used (no multiprocessing support, broken pool, unpicklable
+        input), those scanners are run in the calling thread instead.
+
         Args:
             scanners: List of scanner instances to run.
             root: Project root path.
@@ -491,35 +588,81 @@ class ScanOrchestrator:
         all_warnings: List[str] = []
         all_errors: List[str] = []
 
-        with ThreadPoolExecutor(
-            max_workers=min(len(scanners), 8)
-        ) as executor:
-            future_to_scanner = {
-                executor.submit(self._run_scanner, scanner, root): scanner
-                for scanner in scanners
-            }
-            for future in as_completed(future_to_scanner):
-                scanner = future_to_scanner[future]
-                try:
-                    result = future.result(
-                        timeout=self.config.timeout_per_scanner
+        process_scanners: List[BaseScanner] = []
+        if self.config.executor == "process":
+            process_scanners = [s for s in scanners if getattr(s, "CPU_BOUND", False) is True]
+        thread_scanners = [s for s in scanners if s not in process_scanners]
+
+        future_to_scanner: Dict[Future, BaseScanner] = {}
+        process_futures = set()
+        process_pool: Optional[ProcessPoolExecutor] = None
+        if process_scanners:
+            try:
+                process_pool = ProcessPoolExecutor(
+                    max_workers=min(len(process_scanners), os.cpu_count() or 1)
+                )
+                for scanner in process_scanners:
+                    future = process_pool.submit(
+                        _scan_in_worker,
+                        type(scanner),
+                        root,
+                        scanner.workspace_info,
+                        scanner.file_index,
                     )
-                except Exception as exc:
-                    error_msg = (
-                        f"Scanner '{scanner.SCANNER_NAME}' timed out or "
-                        f"failed in executor: {type(exc).__name__}: {exc}"
-                    )
-                    logger.warning(error_msg)
-                    result = ScanResult(
-                        scanner=scanner.SCANNER_NAME,
-                        sections={},
-                        warnings=[error_msg],
-                        duration_ms=0.0,
-                    )
-                    all_errors.append(error_msg)
+                    future_to_scanner[future] = scanner
+                    process_futures.add(future)
+            except (OSError, NotImplementedError, BrokenProcessPool) as exc:
+                # No usable multiprocessing here (sandbox, missing /dev/shm).
+                logger.debug("Process pool unavailable, using threads: %s", exc)
+                if process_pool is not None:
+                    process_pool.shutdown(cancel_futures=True)
+                    process_pool = None
+                for future in process_futures:
+                    del future_to_scanner[future]
+                process_futures.clear()
+                thread_scanners = list(scanners)
 
-                scanner_results[scanner.SCANNER_NAME] = result
-                all_warnings.extend(result.warnings)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(len(thread_scanners), 8))
+            ) as executor:
+                for scanner in thread_scanners:
+                    future_to_scanner[executor.submit(self._run_scanner, scanner, root)] = scanner
+                for future in as_completed(future_to_scanner):
+                    scanner = future_to_scanner[future]
+                    try:
+                        result = future.result(
+                            timeout=self.config.timeout_per_scanner
+                        )
+                        if future in process_futures:
+                            result = ScanResult.from_dict(result)
+                    except Exception as exc:
+                        if future in process_futures:
+                            # The worker never raises: this is the pool itself.
+                            logger.debug(
+                                "Scanner '%s' failed in process pool (%s), rerunning in-process",
+                                scanner.SCANNER_NAME, exc,
+                            )
+                            result = self._run_scanner(scanner, root)
+                        else:
+                            error_msg = (
+                                f"Scanner '{scanner.SCANNER_NAME}' timed out or "
+                                f"failed in executor: {type(exc).__name__}: {exc}"
+                            )
+                            logger.warning(error_msg)
+                            result = ScanResult(
+                                scanner=scanner.SCANNER_NAME,
+                                sections={},
+                                warnings=[error_msg],
+                                duration_ms=0.0,
+                            )
+                            all_errors.append(error_msg)
+
+                    scanner_results[scanner.SCANNER_NAME] = result
+                    all_warnings.extend(result.warnings)
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
 
         return scanner_results, all_warnings, all_errors
 
@@ -0,0 +1,402 @@
+"""
+Scan Profiling
+
+Answers "where does ``gaia scan`` spend its time" for ``gaia scan --profile``:
+index walk vs. scanners vs. merge/write, with the file, byte and subprocess
+counts behind each. ``--profile-store`` additionally runs and profiles the
+store populators (the gaia.db resync ``gaia scan --watch`` performs).
+
+Profiling is off unless a ScanProfile is activated, and every hook in the
+scan path costs one ``active()`` check when it is off. While active:
+
+  - ``phase(name)`` times a pipeline stage (index, scanners, merge, write,
+    store.collect, store.write);
+  - ``scope(name)`` attributes wall time, files opened, bytes and
+    subprocesses to a scanner (``scanner:<name>``) or a store populator
+    (``populator:<table>``) -- scopes are per thread, so parallel scanners
+    are attributed correctly;
+  - directory listings and FileIndex reads/parses are timed per directory
+    (the "slowest directories" table);
+  - file opens and subprocess launches are counted through a
+    ``sys.addaudithook`` hook (``open`` and ``subprocess.Popen`` events), so
+    scanners that read files or run tools directly are covered too. Only
+    files under the profiled root are counted. The hook is installed by the
+    first ``activate()`` -- i.e. only in a ``--profile`` run -- and returns
+    on its first check once the profile is deactivated (audit hooks cannot
+    be removed).
+
+Work done in worker processes (``--executor process``, the store
+populator's process pool) is not visible to the hooks: scanner wall times
+are taken from ScanResult.duration_ms instead, and profile_scan collects
+the store projects serially.
+
+Public API::
+
+    from tools.scan.profile import ScanProfile, profile_scan, format_profile
+"""
+
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+PROFILE_FILENAME = "scan-profile.json"
+PROFILE_FORMAT_VERSION = 1
+TOP_DIRS = 10
+
+_active: Optional["ScanProfile"] = None
+_local = threading.local()
+_hook_installed = False
+_hook_lock = threading.Lock()
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_RDWR
+
+
+@dataclass
+class ScopeStats:
+    """Counters of one scanner or populator."""
+
+    ms: float = 0.0
+    calls: int = 0
+    files: int = 0
+    bytes: int = 0
+    subprocesses: int = 0
+
+
+@dataclass
+class DirStats:
+    """Time spent listing and reading one directory."""
+
+    ms: float = 0.0
+    files: int = 0
+    bytes: int = 0
+
+
+class ScanProfile:
+    """Accumulates timings and counters while activated.
+
+    Args:
+        root: Profiled root; only files under it are counted.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._prefix = str(root).rstrip(os.sep) + os.sep
+        self.phases: Dict[str, float] = {}
+        self.scopes: Dict[str, ScopeStats] = {}
+        self.dirs: Dict[str, DirStats] = {}
+        self.commands: Dict[str, int] = {}
+        self.files = 0
+        self.bytes = 0
+        self.dirs_listed = 0
+        self.scanners: Dict[str, Dict[str, Any]] = {}
+        self.errors: List[str] = []
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # Recording
+    # ------------------------------------------------------------------ #
+
+    def add_phase(self, name: str, elapsed_s: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed_s * 1000
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        previous = getattr(_local, "scope", None)
+        _local.scope = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            _local.scope = previous
+            with self._lock:
+                stats = self.scopes.setdefault(name, ScopeStats())
+                stats.ms += elapsed
+                stats.calls += 1
+
+    def _current(self) -> Optional[ScopeStats]:
+        # Caller holds self._lock.
+        name = getattr(_local, "scope", None)
+        return self.scopes.setdefault(name, ScopeStats()) if name else None
+
+    def record_dir(self, directory: str, elapsed_s: float) -> None:
+        """Record the listing of *directory* (index walk / manifest re-list)."""
+        with self._lock:
+            self.dirs_listed += 1
+            self.dirs.setdefault(directory, DirStats()).ms += elapsed_s * 1000
+
+    def record_read(self, path: Path, elapsed_s: float) -> None:
+        """Record time spent reading or parsing *path* (FileIndex cache miss)."""
+        with self._lock:
+            self.dirs.setdefault(str(path.parent), DirStats()).ms += elapsed_s * 1000
+
+    def _record_open(self, path: str) -> None:
+        if not path.startswith(self._prefix):
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        if not (st.st_mode & 0o170000 == 0o100000):  # regular files only
+            return
+        with self._lock:
+            self.files += 1
+            self.bytes += st.st_size
+            d = self.dirs.setdefault(os.path.dirname(path), DirStats())
+            d.files += 1
+            d.bytes += st.st_size
+            scope = self._current()
+            if scope is not None:
+                scope.files += 1
+                scope.bytes += st.st_size
+
+    def _record_subprocess(self, argv: Any) -> None:
+        if isinstance(argv, (str, bytes)):
+            argv = os.fsdecode(argv).split()  # shell=True command line
+        command = argv[0] if argv else None
+        name = os.path.basename(os.fsdecode(command)) if command else "?"
+        with self._lock:
+            self.commands[name] = self.commands.get(name, 0) + 1
+            scope = self._current()
+            if scope is not None:
+                scope.subprocesses += 1
+
+    def add_scan_output(self, output: Any) -> None:
+        """Take per-scanner wall times from a ScanOutput.
+
+        ScanResult.duration_ms also covers scanners that ran in a process
+        pool, where the scope hooks do not reach.
+        """
+        reused = set(getattr(output, "reused_scanners", ()))
+        for name, result in sorted(output.scanner_results.items()):
+            stats = self.scopes.get(f"scanner:{name}", ScopeStats())
+            self.scanners[name] = {
+                "ms": round(0.0 if name in reused else result.duration_ms, 1),
+                "files": stats.files,
+                "bytes": stats.bytes,
+                "subprocesses": stats.subprocesses,
+                "reused": name in reused,
+            }
+
+    # ------------------------------------------------------------------ #
+    # Reporting
+    # ------------------------------------------------------------------ #
+
+    def to_dict(self, top_dirs: int = TOP_DIRS) -> Dict[str, Any]:
+        """JSON-serializable report (the scan-profile.json artifact)."""
+        populators = {
+            name.split(":", 1)[1]: {k: round(v, 1) if isinstance(v, float) else v
+                                    for k, v in asdict(stats).items()}
+            for name, stats in sorted(self.scopes.items())
+            if name.startswith("populator:")
+        }
+        slowest = sorted(self.dirs.items(), key=lambda kv: kv[1].ms, reverse=True)[:top_dirs]
+        return {
+            "format_version": PROFILE_FORMAT_VERSION,
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "root": str(self.root),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count() or 1,
+            "total_ms": round(self.total_ms, 1),
+            "phases": {name: round(ms, 1) for name, ms in self.phases.items()},
+            "scanners": self.scanners,
+            "populators": populators,
+            "io": {"files": self.files, "bytes": self.bytes, "dirs_listed": self.dirs_listed},
+            "subprocesses": {
+                "total": sum(self.commands.values()),
+                "commands": dict(sorted(self.commands.items(), key=lambda kv: (-kv[1], kv[0]))),
+            },
+            "slowest_dirs": [
+                {"path": self._relative(path), "ms": round(stats.ms, 2),
+                 "files": stats.files, "bytes": stats.bytes}
+                for path, stats in slowest
+            ],
+            "errors": list(self.errors),
+        }
+
+    def _relative(self, path: str) -> str:
+        if path == str(self.root):
+            return "."
+        return path[len(self._prefix):] if path.startswith(self._prefix) else path
+
+
+# ---------------------------------------------------------------------------
+# Activation + hooks used by the scan pipeline
+# ---------------------------------------------------------------------------
+
+def active() -> Optional[ScanProfile]:
+    """The ScanProfile being recorded, or None (the common case)."""
+    return _active
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Time a pipeline stage when profiling; no-op otherwise."""
+    return _active.phase(name) if _active is not None else nullcontext()
+
+
+def scope(name: str) -> ContextManager[None]:
+    """Attribute work in this thread to *name* when profiling; no-op otherwise."""
+    return _active.scope(name) if _active is not None else nullcontext()
+
+
+def _audit(event: str, args: Tuple[Any, ...]) -> None:
+    profile = _active
+    if profile is None:
+        return  # profiling ended: the installed hook is a no-op
+    if getattr(_local, "busy", False):
+        return
+    if event == "open":
+        path, mode, flags = args
+        if isinstance(path, int) or (mode and any(c in mode for c in "wax+")):
+            return
+        if mode is None and flags & _WRITE_FLAGS:
+            return
+        _local.busy = True  # our own os.stat must not recurse
+        try:
+            profile._record_open(os.fsdecode(path))
+        finally:
+            _local.busy = False
+    elif event == "subprocess.Popen":
+        executable, argv = args[0], args[1]
+        profile._record_subprocess(argv if argv else executable)
+
+
+@contextmanager
+def activate(profile: ScanProfile) -> Iterator[ScanProfile]:
+    """Record into *profile* for the duration of the block.
+
+    The audit hook is installed on first use, never at import time, and
+    stays (audit hooks cannot be removed); it returns immediately while no
+    profile is active.
+    """
+    global _active, _hook_installed
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit)
+            _hook_installed = True
+    previous, _active = _active, profile
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_ms += (time.perf_counter() - start) * 1000
+        _active = previous
+
+
+def profile_scan(
+    root: Path,
+    config: Any = None,
+    *,
+    sync_store: bool = False,
+    agent: str = "developer",
+    db_path: Optional[Path] = None,
+    registry: Any = None,
+) -> Tuple[Any, ScanProfile]:
+    """Run a scan under a ScanProfile.
+
+    Profiles the same pipeline as plain ``gaia scan``: the orchestrator
+    scans and writes project-context.json, and nothing else. gaia.db is
+    only touched with ``sync_store=True`` (``--profile-store``), which adds
+    the store_populator resync of one ``gaia scan --watch`` refresh; a
+    failed store sync is recorded in ``profile.errors``.
+
+    Returns:
+        (ScanOutput, ScanProfile)
+    """
+    from tools.scan.orchestrator import ScanOrchestrator
+    from tools.scan.registry import ScannerRegistry
+
+    profile = ScanProfile(root)
+    with activate(profile):
+        orchestrator = ScanOrchestrator(registry=registry or ScannerRegistry(), config=config)
+        output = orchestrator.run(project_root=root)
+        if sync_store:
+            try:
+                from tools.scan.store_populator import resolve_identity, scan_workspace_to_store
+
+                scan_workspace_to_store(
+                    workspace=resolve_identity(root),
+                    root=root,
+                    agent=agent,
+                    db_path=db_path,
+                )
+            except Exception as exc:
+                profile.errors.append(f"store sync failed: {type(exc).__name__}: {exc}")
+    profile.add_scan_output(output)
+    profile.errors.extend(output.errors)
+    return output, profile
+
+
+# ---------------------------------------------------------------------------
+# Display (RailUI sections)
+# ---------------------------------------------------------------------------
+
+def _size(n: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def _row(name: str, stats: Dict[str, Any], width: int) -> str:
+    text = f"{name:<{width}} {stats['ms']:>8,.0f} ms  {stats['files']:>5} files  {_size(stats['bytes']):>9}"
+    if stats.get("subprocesses"):
+        text += f"  {stats['subprocesses']} subprocesses"
+    if stats.get("reused"):
+        text += "  (reused)"
+    return text
+
+
+def format_profile(report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Turn a profile report into ``{"name", "lines"}`` sections for RailUI."""
+    sections: List[Dict[str, Any]] = []
+    phases = report.get("phases", {})
+    if phases:
+        sections.append({
+            "name": "Phases",
+            "lines": [" · ".join(f"{name} {ms:,.0f} ms" for name, ms in phases.items())],
+        })
+    for key, title in (("scanners", "Scanners"), ("populators", "Populators")):
+        rows = report.get(key, {})
+        if rows:
+            width = max(len(name) for name in rows)
+            ordered = sorted(rows.items(), key=lambda kv: kv[1]["ms"], reverse=True)
+            sections.append({"name": title, "lines": [_row(n, s, width) for n, s in ordered]})
+    io = report.get("io", {})
+    subs = report.get("subprocesses", {})
+    line = (
+        f"{io.get('files', 0):,} files · {_size(io.get('bytes', 0))} read · "
+        f"{io.get('dirs_listed', 0):,} dirs listed · {subs.get('total', 0)} subprocesses"
+    )
+    if subs.get("commands"):
+        line += " (" + ", ".join(f"{c} ×{n}" for c, n in subs["commands"].items()) + ")"
+    sections.append({"name": "I/O", "lines": [line]})
+    dirs = report.get("slowest_dirs", [])
+    if dirs:
+        width = max(len(d["path"]) for d in dirs)
+        sections.append({
+            "name": "Slowest directories",
+            "lines": [
+                f"{d['path']:<{width}} {d['ms']:>8,.1f} ms  {d['files']:>5} files  {_size(d['bytes']):>9}"
+                for d in dirs
+            ],
+        })
+    return sections
@@ -11,7 +11,9 @@ Contract: contracts/scanner-interface.md
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from tools.scan.walk import FileIndex, index_project
 
 
 @dataclass(frozen=True)
@@ -30,6 +32,45 @@ class ScanResult:
     warnings: List[str] = field(default_factory=list)
     duration_ms: float = 0.0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form (JSON-compatible sections), e.g. to cross a process boundary."""
+        return {
+            "scanner": self.scanner,
+            "sections": self.sections,
+            "warnings": list(self.warnings),
+            "duration_ms": self.duration_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanResult":
+        """Inverse of to_dict."""
+        return cls(
+            scanner=data.get("scanner", ""),
+            sections=data.get("sections", {}),
+            warnings=list(data.get("warnings", [])),
+            duration_ms=float(data.get("duration_ms", 0.0)),
+        )
+
+
+@dataclass(frozen=True)
+class WatchSpec:
+    """Inputs of a tree scanner beyond the tree structure itself.
+
+    Attributes:
+        names: Basenames whose content the scanner parses.
+        extensions: File suffixes whose content the scanner parses.
+        prefixes: Basename prefixes whose content the scanner parses.
+        extra_paths: Paths the FileIndex does not cover: root-relative
+            (hidden dirs like ".github/workflows") or home-relative ("~/...").
+        env: Environment variables the scanner reads.
+    """
+
+    names: FrozenSet[str] = frozenset()
+    extensions: FrozenSet[str] = frozenset()
+    prefixes: Tuple[str, ...] = ()
+    extra_paths: Tuple[str, ...] = ()
+    env: Tuple[str, ...] = ()
+
 
 class BaseScanner(ABC):
     """Abstract base class for all scanner modules.
@@ -58,10 +99,54 @@ class BaseScanner(ABC):
     - Set by the orchestrator before scan() when workspace type has been
       pre-detected. Scanners can check self.workspace_info for multi-repo
       awareness. Defaults to None (single-repo assumed).
+
+    Optional file_index attribute:
+    - Set by the orchestrator to a FileIndex built from one pruned walk of
+      the scan root. Scanners query it through files_for(root) instead of
+      walking the tree themselves.
+
+    Optional WATCH class attribute:
+    - A WatchSpec naming the file contents, extra paths and environment
+      variables the scanner reads. Scanners that declare one are "tree
+      scanners": on a rescan the orchestrator reuses their previous result
+      when none of those inputs (nor the tree structure) changed. See
+      tools/scan/manifest.py. None (the default) means always run.
+
+    Optional CPU_BOUND class attribute:
+    - True for scanners whose time goes into pure-Python parsing rather
+      than subprocesses or I/O waits. With ScanConfig.executor == "process"
+      the orchestrator runs them in a process pool (a fresh instance of the
+      class per run, so they must be constructible without arguments and
+      keep no state outside workspace_info/file_index).
     """
 
+    WATCH: Optional[WatchSpec] = None
+    CPU_BOUND: bool = False
+
     def __init__(self) -> None:
         self.workspace_info = None  # Set by orchestrator if available
+        self.file_index: Optional[FileIndex] = None  # Set by orchestrator if available
+        self._own_index: Optional[FileIndex] = None
+
+    def files_for(self, root: Path) -> FileIndex:
+        """Return a FileIndex covering root; query it with ``under=root``.
+
+        Prefers the orchestrator's shared index. Standalone (or when root
+        lies in a pruned subtree) an index of root is built on first use;
+        scanners drop it at the start of each scan() via reset_files().
+        """
+        shared = getattr(self, "file_index", None)
+        if shared is not None and shared.covers(root):
+            return shared
+        own = getattr(self, "_own_index", None)
+        if own is None or own.root != root:
+            own = index_project(root)
+            self._own_index = own
+        return own
+
+    def reset_files(self) -> None:
+        """Forget the on-demand index so the next scan() sees fresh files."""
+        self._own_index = None
 
     @property
     @abstractmethod
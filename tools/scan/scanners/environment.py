@@ -11,6 +11,9 @@ Pure Function Contract:
 - No network calls
 - NEVER reads .env file contents (FR-043) -- only Path.exists() and Path.name
 - Only reads: /proc/version (for WSL detection), runtime --version output
+
+Runtime --version probes are served from the persistent probe cache
+(tools/scan/version_cache.py) while the binary is unchanged.
 """
 
 import logging
@@ -23,6 +26,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from tools.scan.scanners.base import BaseScanner, ScanResult
+from tools.scan.version_cache import Probe, get_cache
 
 logger = logging.getLogger(__name__)
 
@@ -243,16 +247,28 @@ class EnvironmentScanner(BaseScanner):
         Returns:
             Version string or None on failure.
         """
+        cache = get_cache()
+        key = cache.key(binary, [flag])
         try:
-            result = subprocess.run(
-                [binary, flag],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-
-            # Some tools output version to stderr (e.g., java --version)
-            output = result.stdout.strip() or result.stderr.strip()
+            probe = cache.get(key)
+            if probe is None:
+                try:
+                    result = subprocess.run(
+                        [binary, flag],
+                        capture_output=True,
+                        text=True,
+                        timeout=2,
+                    )
+                except subprocess.TimeoutExpired:
+                    cache.put(key, Probe(None, ""))
+                    raise
+                # Some tools output version to stderr (e.g., java --version)
+                probe = Probe(result.returncode, result.stdout.strip() or result.stderr.strip())
+                cache.put(key, probe)
+
+            if probe.returncode is None:
+                raise subprocess.TimeoutExpired(binary, 2)
+            output = probe.output
 
             if not output:
                 return "unknown"
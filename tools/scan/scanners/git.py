@@ -10,10 +10,10 @@ Pure Function Contract:
 - No file writes
 - No state modification
 - No network calls
-- Only reads: filesystem reads (`.git/config`, `.git/HEAD`, manifest files)
+- Only reads: filesystem reads (`.git/config`, `.git/HEAD`, refs, manifest
+  files) via gaia.gitmeta -- no git subprocess
 """
 
-import configparser
 import json
 import logging
 import re
@@ -21,6 +21,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from gaia.gitmeta import read_git_dir, resolve_git_dir
 from tools.scan.scanners.base import BaseScanner, ScanResult
 
 logger = logging.getLogger(__name__)
@@ -72,8 +73,7 @@ def _detect_platform_from_url(url: str) -> Optional[str]:
 def _parse_git_config(git_dir: Path) -> Dict[str, Any]:
     """Parse .git/config to extract remotes.
 
-    Uses configparser which handles the INI-like git config format.
-    Falls back gracefully on parse errors.
+    Reads through gaia.gitmeta (shared, mtime-cached, no subprocess).
 
     Args:
         git_dir: Path to the .git directory.
@@ -81,31 +81,10 @@ def _parse_git_config(git_dir: Path) -> Dict[str, Any]:
     Returns:
         Dict with 'remotes' list of {name, url, platform}.
     """
-    config_path = git_dir / "config"
-    remotes: List[Dict[str, Any]] = []
-
-    if not config_path.is_file():
-        return {"remotes": remotes}
-
-    try:
-        parser = configparser.ConfigParser(strict=False)
-        parser.read(str(config_path))
-
-        for section in parser.sections():
-            # Git config remote sections look like: [remote "origin"]
-            if section.startswith('remote "') and section.endswith('"'):
-                remote_name = section[8:-1]  # Strip 'remote "' and '"'
-                url = parser.get(section, "url", fallback="")
-                platform = _detect_platform_from_url(url)
-                remotes.append({
-                    "name": remote_name,
-                    "url": url,
-                    "platform": platform,
-                })
-
-    except (configparser.Error, OSError) as exc:
-        logger.debug("Failed to parse git config at %s: %s", config_path, exc)
-
+    remotes: List[Dict[str, Any]] = [
+        {"name": name, "url": url, "platform": _detect_platform_from_url(url)}
+        for name, url in read_git_dir(git_dir).remotes
+    ]
     return {"remotes": remotes}
 
 
@@ -122,19 +101,7 @@ def _detect_default_branch(git_dir: Path) -> Optional[str]:
     Returns:
         Branch name string or None if HEAD is detached or unreadable.
     """
-    head_path = git_dir / "HEAD"
-
-    if not head_path.is_file():
-        return None
-
-    try:
-        content = head_path.read_text().strip()
-        if content.startswith("ref: refs/heads/"):
-            return content[len("ref: refs/heads/"):]
-    except OSError as exc:
-        logger.debug("Failed to read HEAD at %s: %s", head_path, exc)
-
-    return None
+    return read_git_dir(git_dir).branch
 
 
 def _detect_branch_strategy(git_dir: Path) -> Dict[str, Any]:
@@ -160,43 +127,11 @@ def _detect_branch_strategy(git_dir: Path) -> Dict[str, Any]:
         "indicators": [],
     }
 
-    branches: List[str] = []
-
-    # Collect local branches
-    refs_heads = git_dir / "refs" / "heads"
-    if refs_heads.is_dir():
-        branches.extend(_collect_branch_names(refs_heads, ""))
-
-    # Collect remote branches
-    refs_remotes = git_dir / "refs" / "remotes"
-    if refs_remotes.is_dir():
-        for remote_dir in refs_remotes.iterdir():
-            if remote_dir.is_dir():
-                branches.extend(
-                    _collect_branch_names(remote_dir, "")
-                )
-
-    # Also check packed-refs for branches not yet unpacked
-    packed_refs = git_dir / "packed-refs"
-    if packed_refs.is_file():
-        try:
-            for line in packed_refs.read_text().splitlines():
-                line = line.strip()
-                if line.startswith("#") or not line:
-                    continue
-                parts = line.split()
-                if len(parts) >= 2:
-                    ref = parts[1]
-                    if ref.startswith("refs/heads/"):
-                        branches.append(ref[len("refs/heads/"):])
-                    elif ref.startswith("refs/remotes/"):
-                        # Strip remote name prefix (e.g., origin/)
-                        remainder = ref[len("refs/remotes/"):]
-                        slash_idx = remainder.find("/")
-                        if slash_idx >= 0:
-                            branches.append(remainder[slash_idx + 1:])
-        except OSError:
-            pass
+    # Local branches plus remote-tracking ones (remote prefix stripped),
+    # loose and packed.
+    meta = read_git_dir(git_dir)
+    branches: List[str] = list(meta.branches)
+    branches.extend(r.split("/", 1)[1] for r in meta.remote_branches if "/" in r)
 
     if not branches:
         return result
@@ -256,31 +191,6 @@ def _detect_branch_strategy(git_dir: Path) -> Dict[str, Any]:
     return result
 
 
-def _collect_branch_names(directory: Path, prefix: str) -> List[str]:
-    """Recursively collect branch names from refs directory.
-
-    Args:
-        directory: Path to scan for ref files.
-        prefix: Current path prefix for nested refs (e.g., 'feature/').
-
-    Returns:
-        List of branch name strings.
-    """
-    names: List[str] = []
-    try:
-        for entry in directory.iterdir():
-            name = f"{prefix}{entry.name}" if prefix else entry.name
-            if entry.is_file():
-                # Skip HEAD files in remote dirs
-                if entry.name != "HEAD":
-                    names.append(name)
-            elif entry.is_dir():
-                names.extend(_collect_branch_names(entry, f"{name}/"))
-    except OSError:
-        pass
-    return names
-
-
 def _detect_monorepo(root: Path) -> Dict[str, Any]:
     """Detect monorepo workspace configuration.
 
@@ -394,10 +304,10 @@ class GitScanner(BaseScanner):
             )
 
         # Single-repo mode (original behavior)
-        git_dir = root / ".git"
+        git_dir = resolve_git_dir(root / ".git")
         git_root = root
 
-        if not git_dir.is_dir():
+        if git_dir is None:
             # Look in immediate subdirectories for .git
             git_dir, git_root = self._find_git_in_subdirs(root)
 
@@ -482,8 +392,8 @@ class GitScanner(BaseScanner):
         primary_platform: Optional[str] = None
 
         for repo_dir in self.workspace_info.repo_dirs:
-            git_dir = repo_dir / ".git"
-            if not git_dir.is_dir():
+            git_dir = resolve_git_dir(repo_dir / ".git")
+            if git_dir is None:
                 continue
 
             git_config = _parse_git_config(git_dir)
@@ -542,8 +452,8 @@ class GitScanner(BaseScanner):
                     continue
                 if entry.name in ("node_modules", "vendor", "__pycache__"):
                     continue
-                candidate = entry / ".git"
-                if candidate.is_dir():
+                candidate = resolve_git_dir(entry / ".git")
+                if candidate is not None:
                     return candidate, entry
         except OSError:
             pass
@@ -17,8 +17,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from tools.scan.scanners.base import BaseScanner, ScanResult
-from tools.scan.walk import walk_project, walk_project_named
+from tools.scan.scanners.base import BaseScanner, ScanResult, WatchSpec
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +101,23 @@ class InfrastructureScanner(BaseScanner):
     - Only reads: filesystem paths, file contents, environment variables
     """
 
+    # Inputs for incremental rescans (tools/scan/manifest.py).
+    WATCH = WatchSpec(
+        names=frozenset({".gitlab-ci.yml"}),
+        extensions=frozenset({".tf"}),
+        extra_paths=(
+            ".github/workflows",
+            ".circleci",
+            ".gitlab/ci",
+            ".ci-local",
+            "~/.config/gcloud/properties",
+            "~/.aws/config",
+            "~/.azure/azureProfile.json",
+        ),
+        env=tuple(var for names in _CLOUD_ENV_VARS.values() for var in names),
+    )
+    CPU_BOUND = True
+
     @property
     def SCANNER_NAME(self) -> str:
         return "infrastructure"
@@ -130,6 +146,7 @@ class InfrastructureScanner(BaseScanner):
         """
         start = time.monotonic()
         warnings: List[str] = []
+        self.reset_files()
 
         try:
             cloud_providers = self._detect_cloud_providers(root, warnings)
@@ -267,9 +284,10 @@ class InfrastructureScanner(BaseScanner):
         warnings: List[str],
     ) -> None:
         """Scan .tf files for provider blocks."""
-        for tf_file in walk_project(root, [".tf"]):
+        files = self.files_for(root)
+        for tf_file in files.with_ext(".tf", under=root):
             try:
-                content = tf_file.read_text(encoding="utf-8", errors="replace")
+                content = files.read_text(tf_file)
                 for cloud_name, pattern in _TF_PROVIDER_PATTERNS.items():
                     if re.search(pattern, content):
                         if cloud_name not in providers:
@@ -340,15 +358,16 @@ class InfrastructureScanner(BaseScanner):
         paths actually exist on disk (Fix 3: ghost references).
         """
         results: List[Dict[str, Any]] = []
+        files = self.files_for(root)
 
         for marker in _IAC_MARKERS:
             try:
                 rglob_pattern = marker["rglob"]
                 if rglob_pattern.startswith("*."):
                     ext = rglob_pattern[1:]
-                    found_files = sorted(walk_project(root, [ext]))
+                    found_files = sorted(files.with_ext(ext, under=root))
                 else:
-                    found_files = sorted(walk_project_named(root, [rglob_pattern]))
+                    found_files = sorted(files.named(rglob_pattern, under=root))
 
                 if not found_files:
                     continue
@@ -433,6 +452,7 @@ class InfrastructureScanner(BaseScanner):
         Validates that all reported paths actually exist (Fix 3: ghost refs).
         """
         results: List[Dict[str, Any]] = []
+        files = self.files_for(root)
 
         for container_def in _CONTAINER_GLOBS:
             found: List[str] = []
@@ -447,14 +467,13 @@ class InfrastructureScanner(BaseScanner):
                     else:
                         exact_names.append(pattern)
 
-                for match in walk_project_named(root, exact_names):
+                for match in files.named(*exact_names, under=root):
                     if match.exists():
                         found.append(str(match.relative_to(root)))
 
-                # Handle prefix patterns (e.g., "Dockerfile.*") via walk
+                # Handle prefix patterns (e.g., "Dockerfile.*")
                 if prefixes:
-                    from tools.scan.walk import walk_project_prefix
-                    for match in walk_project_prefix(root, prefixes):
+                    for match in files.with_prefix(*prefixes, under=root):
                         if match.exists():
                             found.append(str(match.relative_to(root)))
             except OSError as exc:
@@ -578,20 +597,13 @@ class InfrastructureScanner(BaseScanner):
         }
 
         try:
-            for dirpath, dirnames, filenames in os.walk(str(root)):
-                dirnames[:] = [
-                    d for d in dirnames
-                    if d not in ("node_modules", ".git", "__pycache__",
-                                 ".terraform", "vendor", "dist", "build",
-                                 ".venv", "venv")
-                    and not d.startswith(".")
-                ]
-                dir_name = os.path.basename(dirpath).lower()
+            for dirpath in self.files_for(root).directories(under=root):
+                dir_name = dirpath.name.lower()
                 for indicator, platform in cicd_manifest_indicators.items():
                     if platform in detected_platforms:
                         continue
                     if indicator in dir_name:
-                        rel_path = str(Path(dirpath).relative_to(root))
+                        rel_path = str(dirpath.relative_to(root))
                         results.append(
                             {
                                 "platform": platform,
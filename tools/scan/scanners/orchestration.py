@@ -14,8 +14,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from tools.scan.scanners.base import BaseScanner, ScanResult
-from tools.scan.walk import walk_project, walk_project_named
+from tools.scan.scanners.base import BaseScanner, ScanResult, WatchSpec
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +105,14 @@ class OrchestrationScanner(BaseScanner):
     - Only filesystem reads
     """
 
+    # Inputs for incremental rescans (tools/scan/manifest.py).
+    WATCH = WatchSpec(
+        extensions=frozenset({".yaml", ".yml"}),
+        extra_paths=("~/.kube/config",),
+        env=("KUBECONFIG",),
+    )
+    CPU_BOUND = True
+
     @property
     def SCANNER_NAME(self) -> str:
         return "orchestration"
@@ -130,6 +137,7 @@ class OrchestrationScanner(BaseScanner):
         """
         start_ms = time.monotonic() * 1000
         warnings: List[str] = []
+        self.reset_files()
 
         try:
             kubernetes = self._detect_kubernetes(root, warnings)
@@ -393,8 +401,8 @@ class OrchestrationScanner(BaseScanner):
         gitops_dirs: List[str] = []
 
         try:
-            for kust_file in walk_project_named(
-                root, ["kustomization.yaml", "kustomization.yml", "Kustomization"]
+            for kust_file in self.files_for(root).named(
+                "kustomization.yaml", "kustomization.yml", "Kustomization", under=root
             ):
                 rel = kust_file.relative_to(root)
                 # Walk up the path parts looking for a gitops-related directory name
@@ -423,7 +431,7 @@ class OrchestrationScanner(BaseScanner):
         charts: List[str] = []
 
         try:
-            for chart_yaml in walk_project_named(root, ["Chart.yaml"]):
+            for chart_yaml in self.files_for(root).named("Chart.yaml", under=root):
                 rel_path = str(chart_yaml.relative_to(root))
                 charts.append(rel_path)
         except Exception:
@@ -445,7 +453,9 @@ class OrchestrationScanner(BaseScanner):
         files: List[str] = []
 
         try:
-            for kust_file in walk_project_named(root, ["kustomization.yaml", "kustomization.yml", "Kustomization"]):
+            for kust_file in self.files_for(root).named(
+                "kustomization.yaml", "kustomization.yml", "Kustomization", under=root
+            ):
                 rel_path = str(kust_file.relative_to(root))
                 if rel_path not in files:
                     files.append(rel_path)
@@ -529,38 +539,13 @@ class OrchestrationScanner(BaseScanner):
     def _find_yaml_files(self, root: Path) -> List[Path]:
         """Find YAML files in the project, respecting scan limits.
 
-        Uses walk_project for filtered os.walk (skips node_modules, .git, etc.)
-        instead of rglob which traverses all directories.
-
-        Caches results on the instance for reuse across detection methods
-        within the same scan() call.
+        Served from the shared FileIndex (one pruned walk per scan), so
+        repeated calls across detection methods cost no extra traversal.
         """
-        cache_attr = "_yaml_files_cache"
-        cache_root_attr = "_yaml_files_root"
-
-        cached_root = getattr(self, cache_root_attr, None)
-        if cached_root == root:
-            cached = getattr(self, cache_attr, None)
-            if cached is not None:
-                return cached
-
-        yaml_files: List[Path] = []
-        count = 0
-
         try:
-            for p in walk_project(root, [".yaml", ".yml"]):
-                yaml_files.append(p)
-                count += 1
-                if count >= _MAX_YAML_FILES:
-                    break
-        except Exception:
-            pass
-
-        # Cache on instance
-        object.__setattr__(self, cache_attr, yaml_files)
-        object.__setattr__(self, cache_root_attr, root)
-
-        return yaml_files
+            return self.files_for(root).with_ext(".yaml", ".yml", under=root)[:_MAX_YAML_FILES]
+        except OSError:
+            return []
 
     def _safe_read(self, path: Path) -> Optional[str]:
         """Read a file safely, returning None on failure or if too large."""
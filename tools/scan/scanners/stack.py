@@ -15,7 +15,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from tools.scan.scanners.base import BaseScanner, ScanResult
+from tools.scan.scanners.base import BaseScanner, ScanResult, WatchSpec
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +121,15 @@ class StackScanner(BaseScanner):
     Owned sections: project_identity, stack
     """
 
+    # Content inputs for incremental rescans (tools/scan/manifest.py).
+    WATCH = WatchSpec(
+        names=frozenset({
+            "package.json", "pyproject.toml", "requirements.txt", "setup.py",
+            "go.mod", "Cargo.toml", "composer.json",
+        }),
+    )
+    CPU_BOUND = True
+
     @property
     def SCANNER_NAME(self) -> str:
         return "stack"
@@ -144,6 +153,7 @@ class StackScanner(BaseScanner):
         """
         start_ms = time.monotonic() * 1000
         warnings: List[str] = []
+        self.reset_files()
 
         try:
             languages = self._detect_languages(root, warnings)
@@ -250,24 +260,12 @@ class StackScanner(BaseScanner):
 
         Searches root and subdirectories (for monorepo support).
         """
-        # Check for tsconfig*.json at root
-        for f in root.iterdir() if root.is_dir() else []:
-            if f.is_file() and f.name.startswith("tsconfig") and f.name.endswith(".json"):
+        # tsconfig*.json at root or in subdirectories (monorepo workspace roots)
+        files = self.files_for(root)
+        for path in files.with_prefix("tsconfig", under=root, max_depth=MONOREPO_SCAN_DEPTH):
+            if path.name.endswith(".json"):
                 return True
 
-        # Check subdirectories for tsconfig*.json (monorepo workspace roots)
-        for path in self._find_files(root, "tsconfig.json"):
-            return True
-
-        # Also check for tsconfig.*.json patterns in subdirectories
-        try:
-            for entry in self._iter_subdirs(root, depth=0):
-                for f in entry.iterdir():
-                    if f.is_file() and f.name.startswith("tsconfig") and f.name.endswith(".json"):
-                        return True
-        except (PermissionError, OSError):
-            pass
-
         # Check for .ts or .tsx file extensions
         for ext in (".ts", ".tsx"):
             if self._find_files_by_extension(root, ext):
@@ -275,20 +273,6 @@ class StackScanner(BaseScanner):
 
         return False
 
-    def _iter_subdirs(self, root: Path, depth: int) -> List[Path]:
-        """Iterate subdirectories respecting MONOREPO_SCAN_DEPTH and SKIP_DIRS."""
-        if depth >= MONOREPO_SCAN_DEPTH:
-            return []
-        results: List[Path] = []
-        try:
-            for entry in sorted(root.iterdir()):
-                if entry.is_dir() and entry.name not in SKIP_DIRS and not entry.name.startswith("."):
-                    results.append(entry)
-                    results.extend(self._iter_subdirs(entry, depth + 1))
-        except PermissionError:
-            pass
-        return results
-
     # ------------------------------------------------------------------
     # Framework detection
     # ------------------------------------------------------------------
@@ -938,81 +922,19 @@ class StackScanner(BaseScanner):
     def _find_files(self, root: Path, filename: str) -> List[Path]:
         """Find files matching filename in root and subdirectories.
 
-        Respects MONOREPO_SCAN_DEPTH and SKIP_DIRS. Returns root-level
-        matches first, then subdirectory matches.
+        Respects MONOREPO_SCAN_DEPTH and the walk's pruned directories.
+        Returns root-level matches first, then subdirectory matches
+        (sorted pre-order).
         """
-        results: List[Path] = []
-
-        # Check root first
-        root_file = root / filename
-        if root_file.is_file():
-            results.append(root_file)
-
-        # Scan subdirectories up to MONOREPO_SCAN_DEPTH
-        self._find_files_recursive(root, filename, results, 0)
-
-        return results
-
-    def _find_files_recursive(
-        self, directory: Path, filename: str, results: List[Path], depth: int
-    ) -> None:
-        """Recursively search for files, respecting depth and skip dirs."""
-        if depth >= MONOREPO_SCAN_DEPTH:
-            return
-
-        try:
-            for entry in sorted(directory.iterdir()):
-                if not entry.is_dir():
-                    continue
-                if entry.name in SKIP_DIRS or entry.name.startswith("."):
-                    continue
-
-                target = entry / filename
-                if target.is_file():
-                    results.append(target)
-
-                self._find_files_recursive(entry, filename, results, depth + 1)
-        except PermissionError:
-            pass
+        return self.files_for(root).named(
+            filename, under=root, max_depth=MONOREPO_SCAN_DEPTH
+        )
 
     def _find_files_by_extension(self, root: Path, ext: str) -> List[Path]:
-        """Find files with a given extension in root and subdirectories."""
-        results: List[Path] = []
-
-        # Check root
-        try:
-            for entry in root.iterdir():
-                if entry.is_file() and entry.name.endswith(ext):
-                    results.append(entry)
-                    return results  # One match is enough
-        except PermissionError:
-            pass
-
-        # Check subdirectories
-        self._find_ext_recursive(root, ext, results, 0)
-        return results
-
-    def _find_ext_recursive(
-        self, directory: Path, ext: str, results: List[Path], depth: int
-    ) -> None:
-        """Recursively search for files by extension."""
-        if depth >= MONOREPO_SCAN_DEPTH or results:
-            return
-
-        try:
-            for entry in sorted(directory.iterdir()):
-                if entry.is_dir() and entry.name not in SKIP_DIRS and not entry.name.startswith("."):
-                    # Check for matching files in this directory
-                    try:
-                        for child in entry.iterdir():
-                            if child.is_file() and child.name.endswith(ext):
-                                results.append(child)
-                                return
-                    except PermissionError:
-                        pass
-                    self._find_ext_recursive(entry, ext, results, depth + 1)
-        except PermissionError:
-            pass
+        """Find the first file with a given extension in root and subdirectories."""
+        return self.files_for(root).with_ext(
+            ext, under=root, max_depth=MONOREPO_SCAN_DEPTH
+        )[:1]
 
     # ------------------------------------------------------------------
     # TOML parsing helpers (no external dependency)
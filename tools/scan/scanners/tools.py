@@ -8,6 +8,9 @@ and builds the tool_preferences map based on preference_priority.
 Performance: Uses shutil.which (pure Python) instead of subprocess for path
 detection, and ThreadPoolExecutor for parallel version probing.
 
+Version probes are served from the persistent probe cache
+(tools/scan/version_cache.py) while the binary is unchanged.
+
 Safety constraints:
 - Uses `shutil.which` for detection (pure Python, no subprocess)
 - Uses `subprocess.run(timeout=2)` for --version
@@ -35,6 +38,7 @@ def get_tool_definitions(full: bool = False) -> list:
         return TOOL_DEFINITIONS
     return [td for td in TOOL_DEFINITIONS if not td.extended]
 from tools.scan.scanners.base import BaseScanner, ScanResult
+from tools.scan.version_cache import Probe, get_cache
 
 logger = logging.getLogger(__name__)
 
@@ -228,19 +232,31 @@ class ToolScanner(BaseScanner):
         Returns:
             Version string, or "unknown" on failure/timeout.
         """
+        # Split version_flag to support multi-word flags like "version --client"
+        args = version_flag.split()
+        cache = get_cache()
+        key = cache.key(tool_path, args)
         try:
-            # Split version_flag to support multi-word flags like "version --client"
-            cmd = [tool_path] + version_flag.split()
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=_VERSION_TIMEOUT,
-            )
-            # Accept both stdout and stderr (many tools print version to stderr)
-            output = result.stdout.strip() or result.stderr.strip()
-
-            if result.returncode != 0 or not output:
+            probe = cache.get(key)
+            if probe is None:
+                try:
+                    result = subprocess.run(
+                        [tool_path] + args,
+                        capture_output=True,
+                        text=True,
+                        timeout=_VERSION_TIMEOUT,
+                    )
+                except subprocess.TimeoutExpired:
+                    cache.put(key, Probe(None, ""))
+                    raise
+                # Accept both stdout and stderr (many tools print version to stderr)
+                probe = Probe(result.returncode, result.stdout.strip() or result.stderr.strip())
+                cache.put(key, probe)
+
+            output = probe.output
+            if probe.returncode is None:
+                raise subprocess.TimeoutExpired(tool_path, _VERSION_TIMEOUT)
+            if probe.returncode != 0 or not output:
                 return "unknown"
 
             if version_regex:
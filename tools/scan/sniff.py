@@ -0,0 +1,175 @@
+"""
+Streaming header sniffers for YAML manifests and Terraform (HCL) files.
+
+Classifying a manifest only needs a handful of keys (``kind``,
+``metadata.name``, ``metadata.namespace``; ``module``/``resource`` block
+labels and a few attributes). These helpers stream a file line by line as
+bytes in one pass instead of reading it into a string and re-splitting it
+per lookup:
+
+- YAML: each document (separated by ``---``) is parsed only until its
+  header is complete; the rest of the document is skipped with a cheap
+  prefix check per line, without decoding it. Every document of a
+  multi-document file is reported.
+- HCL: only lines that open a ``module``/``resource`` block are decoded and
+  matched; module bodies are followed by brace depth just far enough to
+  pick up their top-level string attributes.
+
+Neither is a full parser; they are the fast path for the scanners'
+existing line-oriented heuristics.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class YamlHeader(NamedTuple):
+    """Identity of one YAML document (None for keys it does not set)."""
+
+    kind: Optional[str]
+    name: Optional[str]
+    namespace: Optional[str]
+
+
+class HclBlock(NamedTuple):
+    """One top-level HCL block header with its top-level string attributes.
+
+    Attributes:
+        type: Block type (``module``, ``resource``).
+        labels: Quoted labels, e.g. ``("google_container_cluster", "main")``.
+        attributes: ``key = "value"`` pairs directly inside the block
+            (collected for ``module`` blocks only).
+    """
+
+    type: str
+    labels: Tuple[str, ...]
+    attributes: Dict[str, str]
+
+
+def _scalar(raw: bytes) -> str:
+    """Decode a YAML scalar value: strip quotes and a trailing comment."""
+    value = raw.decode("utf-8", errors="replace").strip()
+    if value[:1] in ("'", '"'):
+        return value.strip("'\"")
+    hash_idx = value.find(" #")
+    if hash_idx >= 0:
+        value = value[:hash_idx].rstrip()
+    return value
+
+
+def iter_yaml_headers(path: Path) -> Iterator[YamlHeader]:
+    """Yield a YamlHeader per document in *path* that sets kind or metadata.name.
+
+    ``kind`` is read from the document's top level only; ``name`` and
+    ``namespace`` only from the first indentation level under ``metadata:``
+    (so ``metadata.labels.name`` is not mistaken for the object name).
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(path, "rb") as f:
+        kind = name = namespace = None
+        in_meta = False
+        meta_indent = -1
+        done = False
+        for raw in f:
+            if raw.startswith(b"---") or raw.startswith(b"..."):
+                if kind or name:
+                    yield YamlHeader(kind, name, namespace)
+                kind = name = namespace = None
+                in_meta = False
+                meta_indent = -1
+                done = False
+                continue
+            if done:
+                continue
+            stripped = raw.lstrip()
+            if not stripped or stripped.startswith(b"#"):
+                continue
+            indent = len(raw) - len(stripped)
+            if indent == 0:
+                if in_meta and kind:
+                    # metadata block closed and kind is known: header complete
+                    done = True
+                    continue
+                in_meta = False
+                if raw.startswith(b"kind:"):
+                    kind = _scalar(raw[5:])
+                elif raw.startswith(b"metadata:"):
+                    in_meta = True
+                    meta_indent = -1
+            elif in_meta:
+                if meta_indent < 0:
+                    meta_indent = indent
+                if indent != meta_indent:
+                    continue
+                if stripped.startswith(b"name:") and name is None:
+                    name = _scalar(stripped[5:])
+                elif stripped.startswith(b"namespace:") and namespace is None:
+                    namespace = _scalar(stripped[10:])
+            if kind and name and namespace:
+                done = True
+        if kind or name:
+            yield YamlHeader(kind, name, namespace)
+
+
+def yaml_headers(path: Path) -> List[YamlHeader]:
+    """List form of iter_yaml_headers (memoizable via FileIndex.parsed)."""
+    return list(iter_yaml_headers(path))
+
+
+_HCL_HEADER_RE = re.compile(r'^\s*(module|resource)((?:\s+"[^"]*")+)\s*\{')
+_HCL_LABEL_RE = re.compile(r'"([^"]*)"')
+_HCL_ATTR_RE = re.compile(r'^\s*([A-Za-z_][\w-]*)\s*=\s*"([^"]*)"')
+
+
+def iter_hcl_blocks(path: Path) -> Iterator[HclBlock]:
+    """Yield the ``module`` and ``resource`` blocks declared in *path*.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(path, "rb") as f:
+        current: Optional[HclBlock] = None
+        depth = 0
+        for raw in f:
+            if current is not None:
+                # Inside a module body: collect depth-1 string attributes.
+                if depth == 1:
+                    m = _HCL_ATTR_RE.match(raw.decode("utf-8", errors="replace"))
+                    if m and m.group(1) not in current.attributes:
+                        current.attributes[m.group(1)] = m.group(2)
+                depth += raw.count(b"{") - raw.count(b"}")
+                if depth <= 0:
+                    yield current
+                    current = None
+                continue
+            if b"module" not in raw and b"resource" not in raw:
+                continue
+            line = raw.decode("utf-8", errors="replace")
+            m = _HCL_HEADER_RE.match(line)
+            if not m:
+                continue
+            block = HclBlock(m.group(1), tuple(_HCL_LABEL_RE.findall(m.group(2))), {})
+            if block.type != "module":
+                yield block
+                continue
+            # Attributes may share the header line: module "x" { source = "y" }
+            body = line[m.end():]
+            for part in body.split(";"):
+                am = _HCL_ATTR_RE.match(part)
+                if am:
+                    block.attributes.setdefault(am.group(1), am.group(2))
+            depth = 1 + body.count("{") - body.count("}")
+            if depth <= 0:
+                yield block
+            else:
+                current = block
+        if current is not None:
+            yield current
+
+
+def hcl_blocks(path: Path) -> List[HclBlock]:
+    """List form of iter_hcl_blocks (memoizable via FileIndex.parsed)."""
+    return list(iter_hcl_blocks(path))
@@ -21,7 +21,8 @@ Public API::
     populate_infrastructure(workspace, project, project_path, agent, *, db_path=None) -> dict
     populate_orchestration(workspace, project, project_path, agent, *, db_path=None) -> dict
     populate_features(workspace, project, project_path, agent, *, db_path=None) -> dict
-    scan_workspace_to_store(workspace, root, agent, *, db_path=None) -> dict
+    collect_project(project_path) -> dict
+    scan_workspace_to_store(workspace, root, agent, *, db_path=None, workers=None) -> dict
 
 Each function returns ``{"applied": int, "rejected": int, "deleted": int,
 "identity": str}`` so callers can audit the effect.
@@ -33,10 +34,16 @@ to mutate the SQLite store directly.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
+from tools.scan import profile as scan_profile
 from tools.scan.role_detector import detect_role
+from tools.scan.sniff import hcl_blocks, yaml_headers
+from tools.scan.walk import FileIndex, index_project
 
 
 # ---------------------------------------------------------------------------
@@ -136,9 +143,10 @@ def populate_infrastructure(
     """
     from gaia.store import bulk_upsert, delete_missing_in
 
-    tf_modules = _scan_tf_modules(project_path)
-    tf_live = _scan_tf_live(project_path)
-    clusters_defined = _scan_clusters_defined(project_path)
+    files = index_project(project_path) if project_path.is_dir() else None
+    tf_modules = _scan_tf_modules(project_path, files)
+    tf_live = _scan_tf_live(project_path, files)
+    clusters_defined = _scan_clusters_defined(project_path, files)
 
     out = {"tf_modules": {}, "tf_live": {}, "clusters_defined": {}}
 
@@ -205,8 +213,9 @@ def populate_orchestration(
     """Persist GitOps / workload discoveries for a project into the store."""
     from gaia.store import bulk_upsert
 
-    releases = _scan_releases(project_path)
-    workloads = _scan_workloads(project_path)
+    files = index_project(project_path) if project_path.is_dir() else None
+    releases = _scan_releases(project_path, files)
+    workloads = _scan_workloads(project_path, files)
 
     out = {"releases": {}, "workloads": {}}
 
@@ -549,15 +558,113 @@ def populate_gaia_installations(
 # Workspace scan loop
 # ---------------------------------------------------------------------------
 
+# Project-scoped tables written by the workspace scan, grouped the way
+# scan_workspace_to_store reports per-project results. Each table maps to the
+# scanner-owned columns copied from its scanner's output (besides project,
+# name and scanner_ts). Write order matters: apps create stub parent projects.
+_RESULT_GROUPS: dict[str, dict[str, tuple[str, ...]]] = {
+    "apps": {"apps": ("kind",)},
+    "infrastructure": {
+        "tf_modules": ("source", "version"),
+        "tf_live": ("kind", "attributes"),
+        "clusters_defined": ("provider", "region"),
+    },
+    "orchestration": {
+        "releases": ("released_at",),
+        "workloads": ("kind", "namespace", "cluster"),
+    },
+    "features": {"features": ()},
+    "services": {"services": ("kind",)},
+    "libraries": {"libraries": ("version", "language")},
+}
+
+
+def collect_project(project_path: Path, project_name: str | None = None) -> dict:
+    """Scan one project without touching the store.
+
+    One pruned directory walk (``walk.index_project``) feeds every
+    tree-walking scanner. The result holds only plain data so it can be
+    produced in a worker process.
+
+    Returns:
+        Dict with ``name``, ``identity``, ``fields`` (``projects`` columns,
+        including ``role``) and ``tables`` mapping each table in
+        ``_RESULT_GROUPS`` to the scanner's discoveries.
+    """
+    with scan_profile.scope("populator:projects"):
+        files = index_project(project_path) if project_path.is_dir() else None
+        remote_url = _git_remote_origin(project_path)
+        collected = {
+            "name": project_name or project_path.name,
+            "identity": resolve_identity(project_path),
+            "fields": {
+                "role": detect_role(project_path),
+                "remote_url": remote_url,
+                "platform": _platform_from_remote(remote_url),
+                "primary_language": _detect_primary_language(project_path),
+            },
+        }
+    collected["tables"] = {
+        "apps": _populator("apps", _scan_apps, project_path),
+        "tf_modules": _populator("tf_modules", _scan_tf_modules, project_path, files),
+        "tf_live": _populator("tf_live", _scan_tf_live, project_path, files),
+        "clusters_defined": _populator("clusters_defined", _scan_clusters_defined, project_path, files),
+        "releases": _populator("releases", _scan_releases, project_path, files),
+        "workloads": _populator("workloads", _scan_workloads, project_path, files),
+        "features": _populator("features", _scan_features, project_path, files),
+        "services": _populator("services", _scan_services, project_path),
+        "libraries": _populator("libraries", _scan_libraries, project_path),
+    }
+    return collected
+
+
+def _populator(table: str, scan: Callable[..., list[dict]], *args: Any) -> list[dict]:
+    """Run one table scanner, attributed to ``populator:<table>`` under --profile."""
+    with scan_profile.scope(f"populator:{table}"):
+        return scan(*args)
+
+
+def _scan_workers(project_count: int, workers: int | None) -> int:
+    """Resolve the worker count: explicit > GAIA_SCAN_WORKERS > CPU count."""
+    if workers is None:
+        try:
+            workers = int(os.environ.get("GAIA_SCAN_WORKERS") or (os.cpu_count() or 1))
+        except ValueError:
+            workers = 1
+    return max(1, min(workers, project_count))
+
+
+def _collect_projects(project_dirs: list[Path], workers: int | None) -> list[dict]:
+    """Run collect_project over every project, in a process pool when useful."""
+    n = _scan_workers(len(project_dirs), workers)
+    if n > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=n) as pool:
+                return list(pool.map(collect_project, project_dirs))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable multiprocessing here (sandbox, missing /dev/shm):
+            # fall back to the serial loop below.
+            pass
+    return [collect_project(p) for p in project_dirs]
+
+
 def scan_workspace_to_store(
     workspace: str,
     root: Path,
     agent: str,
     *,
     db_path: Path | None = None,
+    workers: int | None = None,
+    projects: Iterable[Path] | None = None,
 ) -> dict:
     """Walk a workspace root, populate repo + infra + orchestration rows.
 
+    Projects are scanned in parallel (one process per project, up to
+    ``workers``), each with a single pruned directory walk. All discoveries
+    -- projects, every project-scoped table, stale-row pruning and
+    ``gaia_installations`` -- are then written in ONE transaction via
+    ``gaia.store.bulk_apply``.
+
     Args:
         workspace: Workspace identity (projects.name).
         root: Workspace root containing one or more repo subdirectories.
@@ -565,49 +672,106 @@ def scan_workspace_to_store(
             repo.
         agent: Agent name for permission enforcement.
         db_path: Optional explicit DB path (test override).
+        workers: Max scan processes. Defaults to ``GAIA_SCAN_WORKERS`` or
+            the CPU count; ``1`` scans serially in-process.
+        projects: Restrict the scan to these repo directories (those not
+            found by ``_list_repos(root)`` are ignored). Rows of the other
+            projects are left untouched, since pruning is per project.
+            Used by watch mode to resync only the repos that changed.
 
     Returns:
         Dict mapping repo names to per-repo result dicts, plus a
         ``__workspace__`` key for workspace-scoped populators
         (``gaia_installations``).
     """
-    project_dirs = _list_repos(root)
-    results = {}
-    for project_path in project_dirs:
-        project_name = project_path.name
-        project_res = populate_project(workspace, project_path, agent, db_path=db_path)
-        infra_res = populate_infrastructure(
-            workspace, project_name, project_path, agent, db_path=db_path
-        )
-        orch_res = populate_orchestration(
-            workspace, project_name, project_path, agent, db_path=db_path
-        )
-        feat_res = populate_features(
-            workspace, project_name, project_path, agent, db_path=db_path
-        )
-        apps_res = populate_apps(
-            workspace, project_name, project_path, agent, db_path=db_path
-        )
-        services_res = populate_services(
-            workspace, project_name, project_path, agent, db_path=db_path
-        )
-        libs_res = populate_libraries(
-            workspace, project_name, project_path, agent, db_path=db_path
-        )
-        results[project_name] = {
-            "project": project_res,
-            "infrastructure": infra_res,
-            "orchestration": orch_res,
-            "features": feat_res,
-            "apps": apps_res,
-            "services": services_res,
-            "libraries": libs_res,
+    from gaia.store import bulk_apply
+
+    all_dirs = _list_repos(root)
+    project_dirs = all_dirs
+    if projects is not None:
+        wanted = set(projects)
+        project_dirs = [p for p in all_dirs if p in wanted]
+    if workers is None and scan_profile.active() is not None:
+        # Worker processes cannot report into this process's profile.
+        workers = 1
+    with scan_profile.phase("store.collect"):
+        collected = _collect_projects(project_dirs, workers)
+        with scan_profile.scope("populator:gaia_installations"):
+            installations = _scan_gaia_installations(root)
+    now = _now_iso()
+
+    upserts: list[tuple[str, list[dict]]] = []
+    prunes: list[tuple[str, str, list[tuple]]] = []
+    if collected:
+        upserts.append(("projects", [{"name": c["name"], **c["fields"]} for c in collected]))
+    for tables in _RESULT_GROUPS.values():
+        for table, columns in tables.items():
+            rows = [
+                {"project": c["name"], "name": item["name"],
+                 **{col: item.get(col) for col in columns}, "scanner_ts": now}
+                for c in collected for item in c["tables"][table]
+            ]
+            if rows:
+                upserts.append((table, rows))
+            prunes.extend(
+                (table, c["name"], [(c["name"], item["name"]) for item in c["tables"][table]])
+                for c in collected
+            )
+    if installations:
+        upserts.append(("gaia_installations", [
+            {"machine": g["machine"], "version": g.get("version"),
+             "install_mode": g.get("install_mode"), "scanner_ts": now}
+            for g in installations
+        ]))
+
+    applied = {"upserts": [], "deleted": []}
+    if upserts or prunes:
+        with scan_profile.phase("store.write"):
+            applied = bulk_apply(
+                workspace, upserts, agent, prunes=prunes, db_path=db_path,
+                workspace_path=all_dirs[0] if all_dirs else None,
+            )
+    batch_ok = {
+        table: res["rejected"] == 0 for (table, _), res in zip(upserts, applied["upserts"])
+    }
+    deleted = {
+        (table, project): count for (table, project, _), count in zip(prunes, applied["deleted"])
+    }
+
+    results: dict[str, Any] = {}
+    for c in collected:
+        project_applied = 1 if batch_ok.get("projects") else 0
+        project_res: dict[str, Any] = {
+            "project": {
+                "applied": project_applied,
+                "rejected": 1 - project_applied,
+                "role": c["fields"]["role"],
+                "identity": c["identity"],
+                "name": c["name"],
+            },
         }
+        for group, tables in _RESULT_GROUPS.items():
+            group_res: dict[str, dict] = {}
+            for table in tables:
+                count = len(c["tables"][table])
+                table_res: dict[str, Any] = {}
+                if count:
+                    ok = batch_ok.get(table, False)
+                    table_res["upsert"] = {"applied": count if ok else 0,
+                                           "rejected": 0 if ok else count}
+                table_res["deleted"] = deleted.get((table, c["name"]), 0)
+                group_res[table] = table_res
+            project_res[group] = group_res
+        results[c["name"]] = project_res
 
     # Workspace-scoped populator: gaia_installations runs once per workspace.
-    gaia_inst_res = populate_gaia_installations(workspace, root, agent, db_path=db_path)
+    gaia_res: dict[str, Any] = {"deleted": 0}
+    if installations:
+        ok = batch_ok.get("gaia_installations", False)
+        gaia_res["upsert"] = {"applied": len(installations) if ok else 0,
+                              "rejected": 0 if ok else len(installations)}
     results["__workspace__"] = {
-        "gaia_installations": gaia_inst_res,
+        "gaia_installations": {"gaia_installations": gaia_res},
     }
     return results
 
@@ -622,21 +786,9 @@ def _now_iso() -> str:
 
 
 def _git_remote_origin(project_path: Path) -> str | None:
-    import shutil
-    import subprocess
-    if shutil.which("git") is None:
-        return None
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(project_path), "remote", "get-url", "origin"],
-            capture_output=True, text=True, timeout=2.0,
-        )
-    except (subprocess.TimeoutExpired, OSError):
-        return None
-    if result.returncode != 0:
-        return None
-    url = (result.stdout or "").strip()
-    return url or None
+    from gaia.gitmeta import remote_origin
+
+    return remote_origin(project_path)
 
 
 def _platform_from_remote(url: str | None) -> str | None:
@@ -703,55 +855,55 @@ def _list_repos(root: Path) -> list[Path]:
     return children
 
 
-def _scan_tf_modules(project_path: Path) -> list[dict]:
+def _scan_tf_modules(project_path: Path, files: FileIndex | None = None) -> list[dict]:
     """Detect Terraform module references in *.tf files.
 
     Returns a list of {name, source, version} dicts, one per `module` block.
+    Files are streamed through ``sniff.hcl_blocks`` (memoized on the index,
+    so _scan_clusters_defined reuses the same pass).
     """
-    import re
     modules = []
     seen = set()
-    pattern = re.compile(r'module\s+"([^"]+)"\s*\{', re.MULTILINE)
-    source_re = re.compile(r'\bsource\s*=\s*"([^"]+)"')
-    version_re = re.compile(r'\bversion\s*=\s*"([^"]+)"')
     if not project_path.is_dir():
         return modules
+    if files is None:
+        files = index_project(project_path)
     try:
-        for tf in project_path.rglob("*.tf"):
-            if any(p in tf.parts for p in (".terraform", "node_modules", ".git")):
-                continue
+        for tf in files.with_ext(".tf"):
             try:
-                content = tf.read_text(encoding="utf-8", errors="replace")
+                blocks = files.parsed(tf, hcl_blocks)
             except OSError:
                 continue
-            for m in pattern.finditer(content):
-                name = m.group(1)
+            for block in blocks:
+                if block.type != "module" or not block.labels:
+                    continue
+                name = block.labels[0]
                 if name in seen:
                     continue
                 seen.add(name)
-                # Find source/version near the match
-                tail = content[m.end(): m.end() + 400]
-                src = source_re.search(tail)
-                ver = version_re.search(tail)
                 modules.append({
                     "name": name,
-                    "source": src.group(1) if src else None,
-                    "version": ver.group(1) if ver else None,
+                    "source": block.attributes.get("source"),
+                    "version": block.attributes.get("version"),
                 })
     except OSError:
         pass
     return modules
 
 
-def _scan_tf_live(project_path: Path) -> list[dict]:
+def _scan_tf_live(project_path: Path, files: FileIndex | None = None) -> list[dict]:
     """Detect live Terraform resources from `live/` directories."""
     out = []
     seen = set()
     live_dir = project_path / "live"
     if not live_dir.is_dir():
         return out
+    if files is None:
+        files = index_project(project_path)
     try:
-        for tg in live_dir.rglob("terragrunt.hcl"):
+        for tg in files.named("terragrunt.hcl"):
+            if live_dir not in tg.parents:
+                continue
             rel = tg.parent.relative_to(project_path)
             name = str(rel).replace("/", "-")
             if name in seen:
@@ -767,35 +919,35 @@ def _scan_tf_live(project_path: Path) -> list[dict]:
     return out
 
 
-def _scan_clusters_defined(project_path: Path) -> list[dict]:
+_CLUSTER_PROVIDERS = {
+    "google_container_cluster": "gke",
+    "aws_eks_cluster": "eks",
+    "azurerm_kubernetes_cluster": "aks",
+}
+
+
+def _scan_clusters_defined(project_path: Path, files: FileIndex | None = None) -> list[dict]:
     """Detect cluster definitions in TF files (google_container_cluster etc.)."""
-    import re
     out = []
     seen = set()
-    cluster_re = re.compile(
-        r'resource\s+"(google_container_cluster|aws_eks_cluster|azurerm_kubernetes_cluster)"\s+"([^"]+)"'
-    )
     if not project_path.is_dir():
         return out
+    if files is None:
+        files = index_project(project_path)
     try:
-        for tf in project_path.rglob("*.tf"):
-            if any(p in tf.parts for p in (".terraform", "node_modules", ".git")):
-                continue
+        for tf in files.with_ext(".tf"):
             try:
-                content = tf.read_text(encoding="utf-8", errors="replace")
+                blocks = files.parsed(tf, hcl_blocks)
             except OSError:
                 continue
-            for m in cluster_re.finditer(content):
-                kind = m.group(1)
-                name = m.group(2)
-                if name in seen:
+            for block in blocks:
+                if block.type != "resource" or len(block.labels) < 2:
+                    continue
+                provider = _CLUSTER_PROVIDERS.get(block.labels[0])
+                name = block.labels[1]
+                if provider is None or name in seen:
                     continue
                 seen.add(name)
-                provider = {
-                    "google_container_cluster": "gke",
-                    "aws_eks_cluster": "eks",
-                    "azurerm_kubernetes_cluster": "aks",
-                }.get(kind)
                 out.append({
                     "name": name,
                     "provider": provider,
@@ -806,24 +958,25 @@ def _scan_clusters_defined(project_path: Path) -> list[dict]:
     return out
 
 
-def _scan_releases(project_path: Path) -> list[dict]:
-    """Detect HelmRelease + Kustomization YAMLs as 'releases' rows."""
+def _scan_releases(project_path: Path, files: FileIndex | None = None) -> list[dict]:
+    """Detect HelmRelease + Kustomization YAMLs as 'releases' rows.
+
+    Every document of a multi-document YAML file is considered.
+    """
     out = []
     seen = set()
     if not project_path.is_dir():
         return out
+    if files is None:
+        files = index_project(project_path)
     try:
-        for yml in project_path.rglob("*.y*ml"):
-            if any(p in yml.parts for p in ("node_modules", ".git", "__pycache__")):
-                continue
+        for yml in files.with_ext(".yaml", ".yml"):
             try:
-                content = yml.read_text(encoding="utf-8", errors="replace")
+                headers = files.parsed(yml, yaml_headers)
             except OSError:
                 continue
-            kind = _yaml_kind(content)
-            if kind in ("HelmRelease", "Kustomization"):
-                name = _yaml_metadata_name(content)
-                if not name:
+            for kind, name, _ in headers:
+                if kind not in ("HelmRelease", "Kustomization") or not name:
                     continue
                 key = f"{kind}:{name}"
                 if key in seen:
@@ -835,26 +988,26 @@ def _scan_releases(project_path: Path) -> list[dict]:
     return out
 
 
-def _scan_workloads(project_path: Path) -> list[dict]:
-    """Detect Deployment/StatefulSet/DaemonSet YAMLs."""
+def _scan_workloads(project_path: Path, files: FileIndex | None = None) -> list[dict]:
+    """Detect Deployment/StatefulSet/DaemonSet YAMLs.
+
+    Every document of a multi-document YAML file is considered.
+    """
     out = []
     seen = set()
     workload_kinds = {"Deployment", "StatefulSet", "DaemonSet"}
     if not project_path.is_dir():
         return out
+    if files is None:
+        files = index_project(project_path)
     try:
-        for yml in project_path.rglob("*.y*ml"):
-            if any(p in yml.parts for p in ("node_modules", ".git", "__pycache__")):
-                continue
+        for yml in files.with_ext(".yaml", ".yml"):
             try:
-                content = yml.read_text(encoding="utf-8", errors="replace")
+                headers = files.parsed(yml, yaml_headers)
             except OSError:
                 continue
-            kind = _yaml_kind(content)
-            if kind in workload_kinds:
-                name = _yaml_metadata_name(content)
-                ns = _yaml_metadata_namespace(content)
-                if not name:
+            for kind, name, ns in headers:
+                if kind not in workload_kinds or not name:
                     continue
                 key = f"{kind}:{name}"
                 if key in seen:
@@ -871,47 +1024,7 @@ def _scan_workloads(project_path: Path) -> list[dict]:
     return out
 
 
-def _yaml_kind(content: str) -> str | None:
-    for line in content.splitlines():
-        s = line.strip()
-        if s.startswith("kind:"):
-            return s[5:].strip().strip("'\"")
-    return None
-
-
-def _yaml_metadata_name(content: str) -> str | None:
-    in_meta = False
-    for line in content.splitlines():
-        if line.startswith("metadata:"):
-            in_meta = True
-            continue
-        if in_meta:
-            if line.startswith(" ") or line.startswith("\t"):
-                s = line.strip()
-                if s.startswith("name:"):
-                    return s[5:].strip().strip("'\"")
-            else:
-                in_meta = False
-    return None
-
-
-def _yaml_metadata_namespace(content: str) -> str | None:
-    in_meta = False
-    for line in content.splitlines():
-        if line.startswith("metadata:"):
-            in_meta = True
-            continue
-        if in_meta:
-            if line.startswith(" ") or line.startswith("\t"):
-                s = line.strip()
-                if s.startswith("namespace:"):
-                    return s[10:].strip().strip("'\"")
-            else:
-                in_meta = False
-    return None
-
-
-def _scan_features(project_path: Path) -> list[dict]:
+def _scan_features(project_path: Path, files: FileIndex | None = None) -> list[dict]:
     """Detect feature units in a project using a three-tier heuristic.
 
     Tier 1: ``features/`` subdirectory -- any child dir of
@@ -930,7 +1043,6 @@ def _scan_features(project_path: Path) -> list[dict]:
 
     out: list[dict] = []
     seen: set[str] = set()
-    _SKIP = {"node_modules", "__pycache__", ".git", ".terraform", "dist", "build", ".venv", "venv"}
 
     def _add(name: str) -> None:
         key = name.strip().lower()
@@ -951,18 +1063,11 @@ def _scan_features(project_path: Path) -> list[dict]:
         except OSError:
             pass
 
-    # Tier 2: feature descriptor files
-    try:
-        for desc in project_path.rglob("feature.json"):
-            if any(p in desc.parts for p in _SKIP):
-                continue
-            _add(desc.parent.name)
-        for desc in project_path.rglob("feature.y*ml"):
-            if any(p in desc.parts for p in _SKIP):
-                continue
-            _add(desc.parent.name)
-    except OSError:
-        pass
+    # Tier 2: feature descriptor files (noise dirs pruned by the walk)
+    if files is None:
+        files = index_project(project_path)
+    for desc in files.named("feature.json", "feature.yaml", "feature.yml"):
+        _add(desc.parent.name)
 
     # Tier 3: flags.json / flags.yaml at project root
     for flags_file in (project_path / "flags.json", project_path / "flags.yaml", project_path / "flags.yml"):
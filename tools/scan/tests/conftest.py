@@ -15,6 +15,22 @@ from typing import Any, Dict
 import pytest
 
 
+# ---------------------------------------------------------------------------
+# Isolation
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _isolated_version_cache(tmp_path_factory, monkeypatch):
+    """Point the tool-version probe cache at a per-test file.
+
+    Keeps mocked subprocess.run tests from being answered by probes cached
+    in the real ~/.gaia/cache by earlier runs.
+    """
+    path = tmp_path_factory.mktemp("version-cache") / "tool-versions.json"
+    monkeypatch.setenv("GAIA_SCAN_VERSION_CACHE", str(path))
+
+
 # ---------------------------------------------------------------------------
 # Basic project fixtures
 # ---------------------------------------------------------------------------
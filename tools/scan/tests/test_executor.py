@@ -0,0 +1,109 @@
+"""
+Tests for the process-pool scanner executor (ScanConfig.executor).
+
+Validates:
+- ScanResult round-trips through to_dict/from_dict
+- executor="process" yields the same sections as the thread executor
+- Only CPU_BOUND scanners are sent to the process pool
+- An unusable process pool falls back to in-process execution
+- Invalid executor values are rejected; GAIA_SCAN_EXECUTOR overrides
+"""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tools.scan import orchestrator
+from tools.scan.config import ScanConfig
+from tools.scan.orchestrator import ScanOrchestrator
+from tools.scan.registry import ScannerRegistry
+from tools.scan.scanners.base import ScanResult
+
+SCANNERS = ["git", "infrastructure", "orchestration", "stack"]
+
+
+def _scan(root: Path, executor: str):
+    config = ScanConfig(
+        project_root=root,
+        scanners=SCANNERS,
+        incremental=False,
+        executor=executor,
+    )
+    return ScanOrchestrator(registry=ScannerRegistry(), config=config).run(write_output=False)
+
+
+class TestScanResultSerialization:
+    def test_round_trip(self) -> None:
+        result = ScanResult(
+            scanner="stack",
+            sections={"stack": {"languages": [{"name": "python"}]}},
+            warnings=["w"],
+            duration_ms=1.5,
+        )
+
+        assert ScanResult.from_dict(result.to_dict()) == result
+
+
+class TestProcessExecutor:
+    def test_same_sections_as_threads(self, devops_project: Path) -> None:
+        threaded = _scan(devops_project, "thread")
+        pooled = _scan(devops_project, "process")
+
+        assert pooled.errors == []
+        assert pooled.context["sections"] == threaded.context["sections"]
+        assert set(pooled.scanner_results) == set(SCANNERS)
+
+    def test_only_cpu_bound_scanners_use_the_pool(self, devops_project: Path) -> None:
+        sent = []
+        real_submit = orchestrator.ProcessPoolExecutor.submit
+
+        def spy(pool, fn, scanner_cls, *args):
+            sent.append(scanner_cls().SCANNER_NAME)
+            return real_submit(pool, fn, scanner_cls, *args)
+
+        with patch.object(orchestrator.ProcessPoolExecutor, "submit", spy):
+            _scan(devops_project, "process")
+
+        assert sorted(sent) == ["infrastructure", "orchestration", "stack"]
+
+    def test_thread_executor_never_starts_a_pool(self, devops_project: Path) -> None:
+        with patch.object(orchestrator, "ProcessPoolExecutor") as pool_cls:
+            _scan(devops_project, "thread")
+
+        pool_cls.assert_not_called()
+
+    def test_unavailable_pool_falls_back_to_threads(self, devops_project: Path) -> None:
+        threaded = _scan(devops_project, "thread")
+        with patch.object(orchestrator, "ProcessPoolExecutor", side_effect=OSError("no /dev/shm")):
+            pooled = _scan(devops_project, "process")
+
+        assert pooled.errors == []
+        assert pooled.context["sections"] == threaded.context["sections"]
+
+    def test_broken_pool_reruns_in_process(self, devops_project: Path) -> None:
+        threaded = _scan(devops_project, "thread")
+
+        def failing_submit(pool, fn, *args):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+        with patch.object(orchestrator.ProcessPoolExecutor, "submit", failing_submit):
+            pooled = _scan(devops_project, "process")
+
+        assert pooled.errors == []
+        assert pooled.context["sections"] == threaded.context["sections"]
+
+
+class TestExecutorConfig:
+    def test_invalid_executor_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ScanConfig(executor="fiber")
+
+    def test_env_override(self, monkeypatch) -> None:
+        monkeypatch.setenv("GAIA_SCAN_EXECUTOR", "process")
+
+        assert ScanConfig().executor == "process"
@@ -0,0 +1,132 @@
+"""
+Tests for incremental rescans (tools/scan/manifest.py).
+
+Validates:
+- A no-op rescan reuses every tree scanner and yields the same sections
+- Editing a parsed manifest reruns only the scanners that read it
+- Editing a file no scanner parses reruns nothing
+- Adding a file reruns the tree scanners and reaches the index
+- Extra inputs (environment variables, hidden CI dirs) invalidate
+- The manifest-built FileIndex matches a fresh walk
+- incremental=False always rescans
+"""
+
+import json
+from pathlib import Path
+
+from tools.scan.config import ScanConfig
+from tools.scan.manifest import MANIFEST_FILENAME, ScanManifest
+from tools.scan.orchestrator import ScanOrchestrator
+from tools.scan.registry import ScannerRegistry
+from tools.scan.walk import index_project
+
+TREE_SCANNERS = ["infrastructure", "orchestration", "stack"]
+
+
+def _scan(root: Path, incremental: bool = True):
+    config = ScanConfig(
+        project_root=root,
+        scanners=TREE_SCANNERS,
+        parallel=False,
+        incremental=incremental,
+    )
+    return ScanOrchestrator(registry=ScannerRegistry(), config=config).run()
+
+
+class TestIncrementalRescan:
+    def test_noop_rescan_reuses_all_tree_scanners(self, devops_project: Path) -> None:
+        first = _scan(devops_project)
+        second = _scan(devops_project)
+
+        assert first.reused_scanners == []
+        assert second.reused_scanners == TREE_SCANNERS
+        assert second.context["sections"] == first.context["sections"]
+        manifest = devops_project / ".claude" / "project-context" / MANIFEST_FILENAME
+        assert json.loads(manifest.read_text())["results"].keys() == set(TREE_SCANNERS)
+
+    def test_manifest_edit_reruns_only_its_reader(self, devops_project: Path) -> None:
+        _scan(devops_project)
+        pkg = json.loads((devops_project / "package.json").read_text())
+        pkg["dependencies"]["react"] = "^18.2.0"
+        (devops_project / "package.json").write_text(json.dumps(pkg))
+
+        output = _scan(devops_project)
+
+        assert output.reused_scanners == ["infrastructure", "orchestration"]
+        frameworks = [f["name"] for f in output.context["sections"]["stack"]["frameworks"]]
+        assert "react" in frameworks
+
+    def test_unparsed_file_edit_reruns_nothing(self, devops_project: Path) -> None:
+        (devops_project / "Dockerfile").write_text("FROM node:20\n")
+        _scan(devops_project)
+        (devops_project / "Dockerfile").write_text("FROM node:22-alpine\n")
+
+        assert _scan(devops_project).reused_scanners == TREE_SCANNERS
+
+    def test_added_file_reruns_tree_scanners(self, devops_project: Path) -> None:
+        _scan(devops_project)
+        (devops_project / "k8s").mkdir()
+        (devops_project / "k8s" / "deploy.yaml").write_text(
+            "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: api\n"
+        )
+
+        output = _scan(devops_project)
+
+        assert output.reused_scanners == []
+        assert "Deployment" in json.dumps(output.context["sections"]["orchestration"])
+
+    def test_env_and_hidden_dir_inputs_invalidate(self, devops_project: Path, monkeypatch) -> None:
+        monkeypatch.delenv("KUBECONFIG", raising=False)
+        _scan(devops_project)
+
+        monkeypatch.setenv("KUBECONFIG", str(devops_project / "kubeconfig"))
+        assert _scan(devops_project).reused_scanners == ["infrastructure", "stack"]
+
+        (devops_project / ".circleci").mkdir()
+        (devops_project / ".circleci" / "config.yml").write_text("version: 2.1\n")
+        assert _scan(devops_project).reused_scanners == ["orchestration", "stack"]
+
+    def test_full_rescan_when_not_incremental(self, devops_project: Path) -> None:
+        _scan(devops_project)
+        assert _scan(devops_project, incremental=False).reused_scanners == []
+
+
+class TestManifestIndex:
+    def test_index_matches_fresh_walk_after_changes(self, devops_project: Path) -> None:
+        path = devops_project / MANIFEST_FILENAME
+        manifest = ScanManifest(devops_project)
+        manifest.build_index()
+        manifest.save(path)
+
+        (devops_project / "terraform" / "vars.tf").write_text("variable \"x\" {}\n")
+        (devops_project / "Dockerfile").unlink()
+        (devops_project / "node_modules" / "dep").mkdir(parents=True)
+
+        rebuilt = ScanManifest.load(path, devops_project).build_index()
+        fresh = index_project(devops_project)
+
+        assert rebuilt.dirs == fresh.dirs
+        assert [rebuilt.listing(d) for d in rebuilt.dirs] == [fresh.listing(d) for d in fresh.dirs]
+
+    def test_unchanged_dirs_are_not_relisted(self, devops_project: Path) -> None:
+        path = devops_project / ".claude" / MANIFEST_FILENAME
+        path.parent.mkdir()
+        first = ScanManifest(devops_project)
+        first.build_index()
+        # Pretend the previous scan ran well after every entry was written.
+        first.started_ns += 5_000_000_000
+        first.save(path)
+
+        second = ScanManifest.load(path, devops_project)
+        second.build_index()
+
+        assert first.dirs_listed == len(first.dirs)
+        assert second.dirs_listed == 0
+
+    def test_foreign_or_corrupt_manifest_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / MANIFEST_FILENAME
+        path.write_text("{not json")
+        assert ScanManifest.load(path, tmp_path).results == {}
+
+        path.write_text(json.dumps({"version": 1, "root": "/elsewhere", "results": {"stack": {}}}))
+        assert ScanManifest.load(path, tmp_path).results == {}
@@ -0,0 +1,131 @@
+"""
+Tests for scan profiling (tools/scan/profile.py).
+
+Validates:
+- profile_scan reports phases, per-scanner timings and the files/bytes each
+  scanner opened, plus the slowest directories
+- Store populators are timed per table when the store sync is requested,
+  and gaia.db is not touched otherwise
+- Subprocesses are counted per scope and per command
+- Nothing is recorded while no profile is active
+- format_profile renders RailUI sections
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gaia.store import connection as pool
+from gaia.store.writer import _connect
+from tools.scan import profile as scan_profile
+from tools.scan.config import ScanConfig
+from tools.scan.profile import ScanProfile, activate, format_profile, profile_scan
+from tools.scan.walk import index_project
+
+SCANNERS = ["git", "infrastructure", "orchestration", "stack"]
+
+
+def _config(root: Path) -> ScanConfig:
+    return ScanConfig(project_root=root, scanners=SCANNERS, incremental=False)
+
+
+class TestProfileScan:
+    def test_reports_phases_scanners_and_io(self, devops_project: Path) -> None:
+        output, profile = profile_scan(devops_project, _config(devops_project))
+        report = profile.to_dict()
+
+        assert output.errors == []
+        assert {"index", "scanners", "merge", "write"} <= set(report["phases"])
+        assert set(report["scanners"]) == set(SCANNERS)
+        assert report["scanners"]["stack"]["files"] >= 1
+        assert report["io"]["files"] >= report["scanners"]["stack"]["files"]
+        assert report["io"]["bytes"] > 0
+        assert report["io"]["dirs_listed"] >= 1
+        assert report["slowest_dirs"]
+        assert report["total_ms"] > 0
+        json.dumps(report)
+
+    def test_store_populators_are_timed(self, tmp_path: Path, tmp_db: Path) -> None:
+        repo = tmp_path / "ws"
+        (repo / ".git").mkdir(parents=True)
+        (repo / "main.tf").write_text('module "vpc" {\n  source = "x"\n}\n')
+
+        _, profile = profile_scan(repo, _config(repo), sync_store=True, db_path=tmp_db)
+        report = profile.to_dict()
+
+        assert report["errors"] == []
+        assert {"store.collect", "store.write"} <= set(report["phases"])
+        assert report["populators"]["tf_modules"]["calls"] == 1
+        assert report["populators"]["tf_modules"]["files"] >= 1
+
+    def test_store_untouched_by_default(self, tmp_path: Path, tmp_db: Path) -> None:
+        repo = tmp_path / "ws"
+        (repo / ".git").mkdir(parents=True)
+        (repo / "main.tf").write_text('module "vpc" {\n  source = "x"\n}\n')
+
+        _, profile = profile_scan(repo, _config(repo), db_path=tmp_db)
+        report = profile.to_dict()
+
+        assert not {"store.collect", "store.write"} & set(report["phases"])
+        assert report["populators"] == {}
+        con = _connect(tmp_db)
+        try:
+            assert con.execute("SELECT COUNT(*) FROM tf_modules").fetchone()[0] == 0
+        finally:
+            con.close()
+
+
+class TestCounters:
+    def test_subprocesses_counted_per_scope(self, tmp_path: Path) -> None:
+        profile = ScanProfile(tmp_path)
+        with activate(profile), scan_profile.scope("scanner:tools"):
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+        assert profile.scopes["scanner:tools"].subprocesses == 1
+        assert profile.to_dict()["subprocesses"]["total"] == 1
+
+    def test_only_reads_under_root_are_counted(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("hello")
+        profile = ScanProfile(tmp_path / "elsewhere")
+        with activate(profile):
+            (tmp_path / "a.txt").read_text()
+
+        assert profile.files == 0
+
+    def test_inactive_records_nothing(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("hello")
+        profile = ScanProfile(tmp_path)
+        with activate(profile):
+            pass
+        index_project(tmp_path).read_text(tmp_path / "a.txt")
+
+        assert scan_profile.active() is None
+        assert profile.files == 0
+        assert profile.dirs == {}
+
+
+def test_format_profile_sections(devops_project: Path) -> None:
+    _, profile = profile_scan(devops_project, _config(devops_project))
+
+    names = [s["name"] for s in format_profile(profile.to_dict())]
+
+    assert names == ["Phases", "Scanners", "I/O", "Slowest directories"]
+
+
+@pytest.fixture()
+def tmp_db(tmp_path: Path) -> Path:
+    db = tmp_path / "gaia.db"
+    con = _connect(db)
+    for table in ("projects", "tf_modules"):
+        con.execute(
+            "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+            "VALUES (?, 'developer', 1)",
+            (table,),
+        )
+    con.commit()
+    con.close()
+    yield db
+    pool.close_all(db)
@@ -0,0 +1,167 @@
+"""
+Tests for the streaming YAML/HCL header sniffers (tools/scan/sniff.py).
+
+Validates:
+- Every document of a multi-document YAML file yields its own header
+- kind/name/namespace come from the document's top level / metadata only
+- Lines past a complete header are not parsed (body keys are ignored)
+- HCL module blocks carry their own source/version, resource labels parse
+- store_populator consumes both through one memoized pass per file
+"""
+
+from pathlib import Path
+
+from tools.scan.sniff import HclBlock, YamlHeader, hcl_blocks, yaml_headers
+from tools.scan.store_populator import (
+    _scan_clusters_defined,
+    _scan_releases,
+    _scan_tf_modules,
+    _scan_workloads,
+)
+from tools.scan.walk import index_project
+
+
+class TestYamlHeaders:
+    def test_multi_document_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "all.yaml"
+        path.write_text(
+            "---\n"
+            "apiVersion: v1\n"
+            "kind: Namespace\n"
+            "metadata:\n"
+            "  name: payments\n"
+            "---\n"
+            "apiVersion: apps/v1\n"
+            "kind: Deployment\n"
+            "metadata:\n"
+            "  name: api\n"
+            "  namespace: payments\n"
+            "spec:\n"
+            "  template:\n"
+            "    metadata:\n"
+            "      name: ignored\n"
+            "---\n"
+            "# empty document\n"
+            "---\n"
+            "metadata:\n"
+            "  name: \"worker\"  \n"
+            "  namespace: 'payments'\n"
+            "kind: StatefulSet\n"
+        )
+
+        assert yaml_headers(path) == [
+            YamlHeader("Namespace", "payments", None),
+            YamlHeader("Deployment", "api", "payments"),
+            YamlHeader("StatefulSet", "worker", "payments"),
+        ]
+
+    def test_nested_keys_are_not_header_fields(self, tmp_path: Path) -> None:
+        path = tmp_path / "release.yaml"
+        path.write_text(
+            "apiVersion: helm.toolkit.fluxcd.io/v2\n"
+            "kind: HelmRelease\n"
+            "metadata:\n"
+            "  labels:\n"
+            "    name: label-name\n"
+            "  name: ingress  # the release\n"
+            "spec:\n"
+            "  chart:\n"
+            "    spec:\n"
+            "      sourceRef:\n"
+            "        kind: HelmRepository\n"
+            "        name: bitnami\n"
+        )
+
+        assert yaml_headers(path) == [YamlHeader("HelmRelease", "ingress", None)]
+
+    def test_body_after_complete_header_is_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.yaml"
+        body = "".join(f"  key{i}: kind: x\n" for i in range(1000))
+        path.write_bytes(
+            b"kind: ConfigMap\nmetadata:\n  name: cfg\ndata:\n"
+            + body.encode()
+            + b"kind: Overwritten\n"
+        )
+
+        assert yaml_headers(path) == [YamlHeader("ConfigMap", "cfg", None)]
+
+    def test_file_without_header_yields_nothing(self, tmp_path: Path) -> None:
+        path = tmp_path / "values.yaml"
+        path.write_text("replicaCount: 2\nimage:\n  name: nginx\n")
+
+        assert yaml_headers(path) == []
+
+
+class TestHclBlocks:
+    def test_modules_and_resources(self, tmp_path: Path) -> None:
+        path = tmp_path / "main.tf"
+        path.write_text(
+            'module "vpc" {\n'
+            '  source  = "terraform-google-modules/network/google"\n'
+            '  version = "~> 9.0"\n'
+            "  subnets = [{\n"
+            '    source = "nested-is-ignored"\n'
+            "  }]\n"
+            "}\n"
+            'module "inline" { source = "./modules/inline" }\n'
+            'resource "google_container_cluster" "primary" {\n'
+            '  name = "primary"\n'
+            "}\n"
+            'module "late" {\n'
+            "  count = 1\n"
+            '  source = "./modules/late"\n'
+            "}\n"
+        )
+
+        assert hcl_blocks(path) == [
+            HclBlock("module", ("vpc",), {
+                "source": "terraform-google-modules/network/google",
+                "version": "~> 9.0",
+            }),
+            HclBlock("module", ("inline",), {"source": "./modules/inline"}),
+            HclBlock("resource", ("google_container_cluster", "primary"), {}),
+            HclBlock("module", ("late",), {"source": "./modules/late"}),
+        ]
+
+    def test_source_is_not_borrowed_from_next_block(self, tmp_path: Path) -> None:
+        path = tmp_path / "main.tf"
+        path.write_text(
+            'module "bare" {\n}\n'
+            'module "next" {\n  source = "./next"\n}\n'
+        )
+
+        blocks = hcl_blocks(path)
+
+        assert blocks[0] == HclBlock("module", ("bare",), {})
+        assert blocks[1].attributes == {"source": "./next"}
+
+
+class TestStorePopulatorIntegration:
+    def test_one_parse_per_file_across_populators(self, tmp_path: Path) -> None:
+        (tmp_path / "infra").mkdir()
+        (tmp_path / "infra" / "main.tf").write_text(
+            'module "gke" {\n  source = "./gke"\n}\n'
+            'resource "aws_eks_cluster" "eks-main" {}\n'
+        )
+        (tmp_path / "k8s").mkdir()
+        (tmp_path / "k8s" / "app.yaml").write_text(
+            "kind: Deployment\nmetadata:\n  name: web\n  namespace: prod\n"
+            "---\n"
+            "kind: DaemonSet\nmetadata:\n  name: agent\n"
+            "---\n"
+            "kind: Kustomization\nmetadata:\n  name: apps\n"
+        )
+        files = index_project(tmp_path)
+
+        assert _scan_tf_modules(tmp_path, files) == [
+            {"name": "gke", "source": "./gke", "version": None},
+        ]
+        # Deleting the files proves the second consumer reuses the first parse.
+        (tmp_path / "infra" / "main.tf").unlink()
+        assert _scan_clusters_defined(tmp_path, files) == [
+            {"name": "eks-main", "provider": "eks", "region": None},
+        ]
+
+        assert [w["name"] for w in _scan_workloads(tmp_path, files)] == ["web", "agent"]
+        (tmp_path / "k8s" / "app.yaml").unlink()
+        assert _scan_releases(tmp_path, files) == [{"name": "apps"}]
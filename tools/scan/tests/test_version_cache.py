@@ -0,0 +1,143 @@
+"""
+Tests for the persistent tool-version probe cache (tools/scan/version_cache.py).
+
+Validates:
+- A repeated probe of an unchanged binary does not spawn a subprocess
+- Changing the binary (size/mtime) re-runs the probe
+- Timeouts are cached briefly and still reported as "unknown"
+- Failed probes expire after minutes, successful ones after days
+- ToolScanner and EnvironmentScanner share probes for the same binary+args
+- Entries persist across processes via flush(); the cache can be disabled
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tools.scan.scanners.environment import EnvironmentScanner
+from tools.scan.scanners.tools import ToolScanner
+from tools.scan.version_cache import Probe, VersionCache, get_cache
+
+
+@pytest.fixture
+def fake_tool(tmp_path: Path) -> Path:
+    tool = tmp_path / "bin" / "faketool"
+    tool.parent.mkdir()
+    tool.write_text("#!/bin/sh\necho 'faketool 1.2.3'\n")
+    tool.chmod(0o755)
+    return tool
+
+
+def _completed(stdout: str, returncode: int = 0) -> MagicMock:
+    result = MagicMock()
+    result.returncode = returncode
+    result.stdout = stdout
+    result.stderr = ""
+    return result
+
+
+class TestToolScannerCache:
+    def test_unchanged_binary_is_probed_once(self, fake_tool: Path) -> None:
+        with patch(
+            "tools.scan.scanners.tools.subprocess.run",
+            return_value=_completed("faketool 1.2.3\n"),
+        ) as run:
+            first = ToolScanner._extract_version(str(fake_tool), "--version", None)
+            second = ToolScanner._extract_version(str(fake_tool), "--version", None)
+
+        assert first == second == "faketool 1.2.3"
+        assert run.call_count == 1
+
+    def test_changed_binary_is_reprobed(self, fake_tool: Path) -> None:
+        with patch(
+            "tools.scan.scanners.tools.subprocess.run",
+            side_effect=[_completed("faketool 1.2.3\n"), _completed("faketool 2.0.0\n")],
+        ) as run:
+            ToolScanner._extract_version(str(fake_tool), "--version", None)
+            fake_tool.write_text("#!/bin/sh\necho 'faketool 2.0.0' # upgraded\n")
+            version = ToolScanner._extract_version(str(fake_tool), "--version", None)
+
+        assert version == "faketool 2.0.0"
+        assert run.call_count == 2
+
+    def test_timeout_is_cached(self, fake_tool: Path) -> None:
+        with patch(
+            "tools.scan.scanners.tools.subprocess.run",
+            side_effect=subprocess.TimeoutExpired(cmd="faketool", timeout=2),
+        ) as run:
+            assert ToolScanner._extract_version(str(fake_tool), "--version", None) == "unknown"
+            assert ToolScanner._extract_version(str(fake_tool), "--version", None) == "unknown"
+
+        assert run.call_count == 1
+
+    def test_missing_binary_is_not_cached(self, tmp_path: Path) -> None:
+        missing = str(tmp_path / "nope")
+        with patch(
+            "tools.scan.scanners.tools.subprocess.run",
+            return_value=_completed("nope 1.0\n"),
+        ) as run:
+            ToolScanner._extract_version(missing, "--version", None)
+            ToolScanner._extract_version(missing, "--version", None)
+
+        assert run.call_count == 2
+
+
+class TestSharedAcrossScanners:
+    def test_environment_reuses_tool_probe(self, fake_tool: Path, monkeypatch) -> None:
+        monkeypatch.setenv("PATH", str(fake_tool.parent))
+        with patch(
+            "tools.scan.scanners.tools.subprocess.run",
+            return_value=_completed("faketool 1.2.3\n"),
+        ):
+            ToolScanner._extract_version(str(fake_tool), "--version", None)
+
+        with patch("tools.scan.scanners.environment.subprocess.run") as run:
+            version = EnvironmentScanner()._get_version("faketool", "--version", [])
+
+        assert version == "1.2.3"
+        run.assert_not_called()
+
+
+class TestPersistence:
+    def test_flush_persists_across_instances(self, fake_tool: Path, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "tool-versions.json"
+        key = VersionCache.key(str(fake_tool), ["--version"])
+        writer = VersionCache(path)
+        writer.put(key, Probe(0, "faketool 1.2.3"))
+        writer.flush()
+
+        assert VersionCache(path).get(key) == Probe(0, "faketool 1.2.3")
+
+    def test_expired_entry_is_a_miss(self, fake_tool: Path, tmp_path: Path) -> None:
+        cache = VersionCache(tmp_path / "tool-versions.json")
+        key = VersionCache.key(str(fake_tool), ["--version"])
+        with patch("tools.scan.version_cache.time.time", return_value=0):
+            cache.put(key, Probe(0, "old"))
+
+        assert cache.get(key) is None
+
+    def test_failed_probe_expires_after_minutes(self, fake_tool: Path, tmp_path: Path) -> None:
+        cache = VersionCache(tmp_path / "tool-versions.json")
+        ok = VersionCache.key(str(fake_tool), ["--version"])
+        timed_out = VersionCache.key(str(fake_tool), ["version"])
+        failed = VersionCache.key(str(fake_tool), ["-v"])
+        with patch("tools.scan.version_cache.time.time", return_value=1_000_000):
+            cache.put(ok, Probe(0, "faketool 1.2.3"))
+            cache.put(timed_out, Probe(None, ""))
+            cache.put(failed, Probe(1, "unknown flag"))
+
+        with patch("tools.scan.version_cache.time.time", return_value=1_000_000 + 3600):
+            assert cache.get(ok) == Probe(0, "faketool 1.2.3")
+            assert cache.get(timed_out) is None
+            assert cache.get(failed) is None
+
+    def test_disabled_cache_never_hits(self, fake_tool: Path, monkeypatch) -> None:
+        monkeypatch.setenv("GAIA_SCAN_VERSION_CACHE", "off")
+        cache = get_cache()
+        key = cache.key(str(fake_tool), ["--version"])
+        cache.put(key, Probe(0, "faketool 1.2.3"))
+
+        assert cache.path is None
+        assert cache.get(key) is None
@@ -0,0 +1,107 @@
+"""
+Tests for the shared FileIndex (tools/scan/walk.py).
+
+Validates:
+- Pruned single-walk indexing (SKIP_DIRS and hidden dirs never indexed)
+- Query helpers: by extension, by basename, by prefix, per-directory listing
+- under= / max_depth= scoping used by depth-limited scanners
+- ScanOrchestrator walks the project tree exactly once per scan
+"""
+
+import os
+from pathlib import Path
+
+from tools.scan.config import ScanConfig
+from tools.scan.orchestrator import ScanOrchestrator
+from tools.scan.registry import ScannerRegistry
+from tools.scan.walk import index_project
+
+
+def _tree(root: Path) -> Path:
+    for rel in (
+        "package.json",
+        "apps/web/package.json",
+        "apps/web/tsconfig.base.json",
+        "apps/web/src/deep/nested/package.json",
+        "infra/main.tf",
+        "infra/modules/vpc/vpc.tf",
+        "k8s/kustomization.yaml",
+        "k8s/deploy.yml",
+        "Dockerfile.prod",
+        "node_modules/x/package.json",
+        ".hidden/Chart.yaml",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x\n")
+    return root
+
+
+class TestFileIndex:
+    def test_pruned_dirs_are_not_indexed(self, tmp_path: Path) -> None:
+        index = index_project(_tree(tmp_path))
+
+        assert not index.covers(tmp_path / "node_modules")
+        assert not index.covers(tmp_path / ".hidden")
+        assert index.named("Chart.yaml") == []
+        assert tmp_path / "node_modules" / "x" / "package.json" not in index.named("package.json")
+
+    def test_queries_return_walk_order(self, tmp_path: Path) -> None:
+        index = index_project(_tree(tmp_path))
+
+        assert index.named("package.json") == [
+            tmp_path / "package.json",
+            tmp_path / "apps" / "web" / "package.json",
+            tmp_path / "apps" / "web" / "src" / "deep" / "nested" / "package.json",
+        ]
+        assert index.with_ext(".yaml", ".yml") == [
+            tmp_path / "k8s" / "deploy.yml",
+            tmp_path / "k8s" / "kustomization.yaml",
+        ]
+        assert index.with_prefix("Dockerfile.") == [tmp_path / "Dockerfile.prod"]
+        assert index.listing(tmp_path / "k8s") == ["deploy.yml", "kustomization.yaml"]
+
+    def test_under_and_max_depth(self, tmp_path: Path) -> None:
+        index = index_project(_tree(tmp_path))
+        web = tmp_path / "apps" / "web"
+
+        assert index.named("package.json", max_depth=3) == [
+            tmp_path / "package.json",
+            web / "package.json",
+        ]
+        assert index.named("package.json", under=web, max_depth=0) == [web / "package.json"]
+        assert index.with_ext(".tf", under=tmp_path / "infra" / "modules") == [
+            tmp_path / "infra" / "modules" / "vpc" / "vpc.tf",
+        ]
+        assert index.directories(under=tmp_path / "infra") == [
+            tmp_path / "infra",
+            tmp_path / "infra" / "modules",
+            tmp_path / "infra" / "modules" / "vpc",
+        ]
+
+
+class TestOrchestratorSharedIndex:
+    def test_single_walk_per_scan(self, tmp_path: Path, monkeypatch) -> None:
+        project = _tree(tmp_path / "project")
+        real_scandir = os.scandir
+        walked = []
+
+        def counting_scandir(path=".", *args, **kwargs):
+            if Path(path) == project:
+                walked.append(path)
+            return real_scandir(path, *args, **kwargs)
+
+        # os.walk lists each directory through os.scandir as well.
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        config = ScanConfig(
+            project_root=project,
+            output_path=tmp_path / "out" / "project-context.json",
+            parallel=True,
+        )
+        registry = ScannerRegistry()
+        output = ScanOrchestrator(registry=registry, config=config).run()
+
+        assert len(walked) == 1
+        assert output.context["sections"]["infrastructure"]["iac"]
+        assert all(s.file_index is None for s in registry.get_all())
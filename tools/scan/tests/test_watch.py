@@ -0,0 +1,148 @@
+"""
+Tests for watch mode (tools/scan/watch.py).
+
+Validates:
+- Snapshots see added/modified/removed files, skip pruned dirs and cover
+  declared extra paths
+- A burst of writes is debounced into one change set; stop ends idle waits
+- A refresh reruns only the tree scanners whose inputs changed
+- Only repos containing a changed path are resynced into the store
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from gaia.store import connection as pool
+from gaia.store.writer import _connect
+from tools.scan.config import ScanConfig
+from tools.scan.watch import ScanWatcher, diff_snapshots, snapshot
+
+TREE_SCANNERS = ["infrastructure", "orchestration", "stack"]
+
+
+def _watcher(root: Path, **kwargs) -> ScanWatcher:
+    config = ScanConfig(project_root=root, scanners=TREE_SCANNERS, parallel=False)
+    kwargs.setdefault("sync_store", False)
+    return ScanWatcher(root, config, interval=0.01, debounce=0.05, **kwargs)
+
+
+class TestSnapshot:
+    def test_add_modify_remove(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        before = snapshot(tmp_path)
+
+        (tmp_path / "a.txt").write_text("changed")
+        (tmp_path / "b.txt").unlink()
+        (tmp_path / "c.txt").write_text("c")
+
+        assert diff_snapshots(before, snapshot(tmp_path)) == {
+            str(tmp_path / "a.txt"), str(tmp_path / "b.txt"), str(tmp_path / "c.txt"),
+        }
+
+    def test_pruned_dirs_ignored_extra_paths_included(self, tmp_path: Path) -> None:
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / ".github" / "workflows").mkdir(parents=True)
+        before = snapshot(tmp_path, (".github/workflows",))
+
+        (tmp_path / "node_modules" / "x.js").write_text("x")
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / ".claude" / "out.json").write_text("{}")
+        (tmp_path / ".github" / "workflows" / "ci.yml").write_text("on: push\n")
+
+        assert diff_snapshots(before, snapshot(tmp_path, (".github/workflows",))) == {
+            str(tmp_path / ".github" / "workflows" / "ci.yml"),
+        }
+
+
+class TestDebounce:
+    def test_burst_is_one_change_set(self, tmp_path: Path) -> None:
+        watcher = _watcher(tmp_path)
+
+        def burst() -> None:
+            for i in range(5):
+                (tmp_path / f"f{i}.txt").write_text(str(i))
+                time.sleep(0.02)
+
+        writer = threading.Thread(target=burst)
+        writer.start()
+        changed = watcher.wait_for_changes(threading.Event())
+        writer.join()
+
+        assert changed == {str(tmp_path / f"f{i}.txt") for i in range(5)}
+
+    def test_stop_ends_idle_wait(self, tmp_path: Path) -> None:
+        watcher = _watcher(tmp_path)
+        stop = threading.Event()
+        stop.set()
+
+        assert watcher.wait_for_changes(stop) == set()
+
+
+class TestRefresh:
+    def test_refresh_reruns_only_affected_scanners(self, devops_project: Path) -> None:
+        watcher = _watcher(devops_project)
+        first = watcher.refresh()
+        assert first.scanners_run == TREE_SCANNERS
+
+        pkg = json.loads((devops_project / "package.json").read_text())
+        pkg["dependencies"]["react"] = "^18.2.0"
+        (devops_project / "package.json").write_text(json.dumps(pkg))
+        changed = watcher.poll()
+        cycle = watcher.refresh(changed)
+
+        assert cycle.changed == [str(devops_project / "package.json")]
+        assert cycle.scanners_run == ["stack"]
+        assert cycle.scanners_reused == ["infrastructure", "orchestration"]
+        context = json.loads(
+            (devops_project / ".claude" / "project-context" / "project-context.json").read_text()
+        )
+        assert "react" in [f["name"] for f in context["sections"]["stack"]["frameworks"]]
+
+    def test_run_stops_after_max_cycles(self, devops_project: Path) -> None:
+        seen = []
+
+        assert _watcher(devops_project).run(on_cycle=seen.append, max_cycles=1) == 1
+        assert seen[0].changed == []
+
+
+@pytest.fixture()
+def tmp_db(tmp_path: Path) -> Path:
+    db = tmp_path / "gaia.db"
+    con = _connect(db)
+    for table in ("projects", "tf_modules", "clusters_defined"):
+        con.execute(
+            "INSERT OR IGNORE INTO agent_permissions (table_name, agent_name, allow_write) "
+            "VALUES (?, 'developer', 1)",
+            (table,),
+        )
+    con.commit()
+    con.close()
+    yield db
+    pool.close_all(db)
+
+
+class TestStoreSync:
+    def test_only_changed_repos_are_resynced(self, tmp_path: Path, tmp_db: Path) -> None:
+        ws = tmp_path / "ws"
+        for name in ("alpha", "beta"):
+            (ws / name / ".git").mkdir(parents=True)
+            (ws / name / "main.tf").write_text(f'module "{name}-vpc" {{\n  source = "x"\n}}\n')
+        watcher = _watcher(ws, sync_store=True, db_path=tmp_db)
+
+        assert watcher.refresh().projects_synced == ["alpha", "beta"]
+
+        (ws / "beta" / "main.tf").write_text('module "beta-gke" {\n  source = "y"\n}\n')
+        cycle = watcher.refresh(watcher.poll())
+
+        assert cycle.projects_synced == ["beta"]
+        con = _connect(tmp_db)
+        try:
+            rows = sorted(r[0] for r in con.execute("SELECT name FROM tf_modules"))
+        finally:
+            con.close()
+        assert rows == ["alpha-vpc", "beta-gke"]
@@ -0,0 +1,161 @@
+"""
+Tool Version Probe Cache
+
+Persists the output of `<tool> --version` probes so a rescan does not
+re-execute every detected binary. Entries are keyed by the invoked path,
+the resolved binary path, its size and mtime, and the probe arguments: a
+probe re-runs only when the binary changes (upgrade, reinstall, symlink
+retarget) or the entry is older than _MAX_AGE_S (wrapper scripts such as
+gcloud can change version without the script itself changing). Failed
+probes (timeout or non-zero exit) only live for _FAILURE_MAX_AGE_S, so a
+tool that was slow or broken once is retried on a later scan instead of
+reporting "unknown" for a week.
+
+Shared by ToolScanner._extract_version and EnvironmentScanner._get_version,
+which each keep their own subprocess.run call and parsing; the cache only
+stores the raw probe outcome (return code + output, or a timeout).
+
+Location: ``gaia.paths.cache_dir() / "tool-versions.json"``. Override with
+GAIA_SCAN_VERSION_CACHE=<path>, or disable with GAIA_SCAN_VERSION_CACHE=off.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+CACHE_FILENAME = "tool-versions.json"
+
+# Upper bound on entry age, in seconds (7 days).
+_MAX_AGE_S = 7 * 24 * 3600
+
+# Upper bound for failed probes (timeout / non-zero exit), in seconds.
+_FAILURE_MAX_AGE_S = 5 * 60
+
+
+class Probe(NamedTuple):
+    """Raw outcome of a version probe.
+
+    Attributes:
+        returncode: Process exit code, or None when the probe timed out.
+        output: Stripped stdout, or stripped stderr when stdout was empty.
+    """
+
+    returncode: Optional[int]
+    output: str
+
+
+def _cache_path() -> Optional[Path]:
+    """Resolve the cache file from the environment (None = disabled)."""
+    override = os.environ.get("GAIA_SCAN_VERSION_CACHE", "")
+    if override.lower() in ("off", "0", "false", "no"):
+        return None
+    if override:
+        return Path(override)
+    try:
+        from gaia.paths import cache_dir
+    except ImportError:
+        return None
+    return cache_dir() / CACHE_FILENAME
+
+
+class VersionCache:
+    """Thread-safe probe cache backed by one JSON file (see module docstring)."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            entries: Dict[str, dict] = {}
+            if self.path is not None:
+                try:
+                    with open(self.path, "r") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                        entries = data.get("entries", {})
+                except (OSError, ValueError):
+                    pass
+            self._entries = entries
+        return self._entries
+
+    @staticmethod
+    def key(binary: str, args: List[str]) -> Optional[str]:
+        """Cache key for running *binary* with *args*; None if it cannot be stat'ed."""
+        invoked = binary if os.sep in binary else shutil.which(binary)
+        if not invoked:
+            return None
+        try:
+            real = os.path.realpath(invoked)
+            st = os.stat(real)
+        except OSError:
+            return None
+        return json.dumps([invoked, real, st.st_size, st.st_mtime_ns, args])
+
+    def get(self, key: Optional[str]) -> Optional[Probe]:
+        """Return the cached probe for *key*, or None on miss/expiry/disabled."""
+        if key is None or self.path is None:
+            return None
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None:
+            return None
+        max_age = _MAX_AGE_S if entry.get("rc") == 0 else _FAILURE_MAX_AGE_S
+        if time.time() - entry.get("at", 0) > max_age:
+            return None
+        return Probe(entry.get("rc"), entry.get("out", ""))
+
+    def put(self, key: Optional[str], probe: Probe) -> None:
+        """Record *probe* for *key* (no-op when key is None or caching is off)."""
+        if key is None or self.path is None:
+            return
+        with self._lock:
+            self._load()[key] = {"rc": probe.returncode, "out": probe.output, "at": time.time()}
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending entries (temp file + rename). Best effort."""
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return
+            entries = dict(self._load())
+            self._dirty = False
+        tmp_path = self.path.with_name(
+            f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.debug("Failed to write tool version cache: %s", exc)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+_caches: Dict[Optional[Path], VersionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache() -> VersionCache:
+    """Return the process-wide cache for the currently configured location."""
+    path = _cache_path()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = VersionCache(path)
+            _caches[path] = cache
+        return cache
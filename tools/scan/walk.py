@@ -6,8 +6,13 @@ expensive directories (node_modules, .git, .terraform, etc.) before descending.
 """
 
 import os
+import time
 from pathlib import Path
-from typing import FrozenSet, Iterator, Sequence
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from tools.scan import profile as scan_profile
+
+T = TypeVar("T")
 
 # Directories to skip during scanning -- shared across all scanners
 SKIP_DIRS: FrozenSet[str] = frozenset({
@@ -116,3 +121,174 @@ def walk_project_named(root: Path, filenames: Sequence[str]) -> Iterator[Path]:
         for f in fnames:
             if f in name_set:
                 yield Path(dirpath) / f
+
+
+class FileIndex:
+    """In-memory listing of a project tree built from ONE pruned walk.
+
+    Lets several scanners share a single traversal: instead of each one
+    calling ``rglob``/``walk_project`` on the same root, build the index once
+    and query it by extension, exact filename, filename prefix, or directory.
+    Directories and files are visited in sorted order and every query
+    returns paths in that walk order (pre-order, parents before children),
+    so results are deterministic.
+
+    Queries accept ``under`` (restrict to a subtree) and ``max_depth``
+    (depth of the file's directory relative to ``under``/root: 0 = files
+    directly in it), which covers depth-limited scanners too.
+
+    Only directory listings are stored while walking; the basename lookup
+    is built on the first query and Path objects are created only for the
+    files a query returns, so indexing a large tree stays cheap.
+
+    File contents read through ``read_text`` are memoized for the lifetime
+    of the index, so two scanners parsing the same ``*.tf`` or YAML file
+    read it from disk once; ``parsed`` memoizes streaming parsers the same
+    way.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.dirs: List[Path] = []
+        self._listing: Dict[Path, List[str]] = {}
+        self._names: Optional[Dict[str, List[int]]] = None
+        self._exts: Optional[Dict[str, List[str]]] = None
+        self._text: Dict[Path, str] = {}
+        self._parsed: Dict[Tuple[Callable, Path], Any] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Ship only the listing to a process-pool worker; caches rebuild there.
+        state = dict(self.__dict__)
+        state.update(_names=None, _exts=None, _text={}, _parsed={})
+        return state
+
+    def add_dir(self, directory: Path, filenames: List[str]) -> None:
+        """Record *directory* and its (already pruned, sorted) filenames."""
+        self.dirs.append(directory)
+        self._listing[directory] = filenames
+        self._names = None
+        self._exts = None
+
+    def covers(self, path: Path) -> bool:
+        """True when *path* is an indexed (non-pruned) directory."""
+        return path in self._listing
+
+    def listing(self, directory: Path) -> List[str]:
+        """Filenames directly inside *directory* (empty if not indexed)."""
+        return list(self._listing.get(directory, ()))
+
+    def directories(self, under: Optional[Path] = None) -> List[Path]:
+        """Indexed directories (including *under*/root itself), walk order."""
+        if under is None or under == self.root:
+            return list(self.dirs)
+        return [d for d in self.dirs if d == under or under in d.parents]
+
+    def with_ext(
+        self, *extensions: str, under: Optional[Path] = None, max_depth: Optional[int] = None
+    ) -> List[Path]:
+        """Files whose last suffix is one of *extensions* (e.g. ".tf")."""
+        exts = self._ext_names()
+        return self._select([n for e in extensions for n in exts.get(e, ())], under, max_depth)
+
+    def named(
+        self, *filenames: str, under: Optional[Path] = None, max_depth: Optional[int] = None
+    ) -> List[Path]:
+        """Files whose basename is exactly one of *filenames*."""
+        return self._select(filenames, under, max_depth)
+
+    def with_prefix(
+        self, *prefixes: str, under: Optional[Path] = None, max_depth: Optional[int] = None
+    ) -> List[Path]:
+        """Files whose basename starts with one of *prefixes*."""
+        names = [n for n in self._name_dirs() if n.startswith(tuple(prefixes))]
+        return self._select(names, under, max_depth)
+
+    def read_text(self, path: Path) -> str:
+        """Read *path* as UTF-8 (errors replaced), memoized. Raises OSError."""
+        text = self._text.get(path)
+        if text is None:
+            start = time.perf_counter()
+            text = path.read_text(encoding="utf-8", errors="replace")
+            self._text[path] = text
+            profile = scan_profile.active()
+            if profile is not None:
+                profile.record_read(path, time.perf_counter() - start)
+        return text
+
+    def parsed(self, path: Path, parser: Callable[[Path], T]) -> T:
+        """Return ``parser(path)``, memoized per (parser, path). Raises OSError.
+
+        For streaming parsers (see tools/scan/sniff.py) that extract a few
+        fields without materializing the whole file; consumers sharing the
+        same parser function parse each file once per index.
+        """
+        key = (parser, path)
+        if key in self._parsed:
+            return self._parsed[key]
+        start = time.perf_counter()
+        value = parser(path)
+        self._parsed[key] = value
+        profile = scan_profile.active()
+        if profile is not None:
+            profile.record_read(path, time.perf_counter() - start)
+        return value
+
+    def _name_dirs(self) -> Dict[str, List[int]]:
+        """basename -> indexes (into self.dirs) of the directories holding it."""
+        if self._names is None:
+            names: Dict[str, List[int]] = {}
+            for i, directory in enumerate(self.dirs):
+                for name in self._listing[directory]:
+                    names.setdefault(name, []).append(i)
+            self._names = names
+        return self._names
+
+    def _ext_names(self) -> Dict[str, List[str]]:
+        """suffix -> basenames carrying it."""
+        if self._exts is None:
+            exts: Dict[str, List[str]] = {}
+            for name in self._name_dirs():
+                dot_idx = name.rfind(".")
+                if dot_idx >= 0:
+                    exts.setdefault(name[dot_idx:], []).append(name)
+            self._exts = exts
+        return self._exts
+
+    def _select(
+        self, names: Sequence[str], under: Optional[Path], max_depth: Optional[int]
+    ) -> List[Path]:
+        name_dirs = self._name_dirs()
+        hits = [(i, n) for n in dict.fromkeys(names) for i in name_dirs.get(n, ())]
+        if len(names) > 1:
+            hits.sort()
+        base = self.root if under is None else under
+        if base != self.root or max_depth is not None:
+            base_depth = len(base.parts)
+            keep = {}
+            for i, _ in hits:
+                if i not in keep:
+                    d = self.dirs[i]
+                    keep[i] = (d == base or base in d.parents) and (
+                        max_depth is None or len(d.parts) - base_depth <= max_depth
+                    )
+            hits = [h for h in hits if keep[h[0]]]
+        return [self.dirs[i] / n for i, n in hits]
+
+
+def index_project(root: Path) -> FileIndex:
+    """Build a FileIndex for *root* with the same pruning as walk_project."""
+    index = FileIndex(root)
+    profile = scan_profile.active()
+    start = time.perf_counter()
+    for dirpath, dirnames, filenames in os.walk(str(root)):
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if d not in SKIP_DIRS and not d.startswith(".")
+        )
+        index.add_dir(Path(dirpath), sorted(filenames))
+        if profile is not None:
+            # os.walk lists a directory right before yielding it.
+            now = time.perf_counter()
+            profile.record_dir(dirpath, now - start)
+            start = now
+    return index
@@ -0,0 +1,281 @@
+"""
+Watch Mode
+
+Keeps project-context.json (and the project rows in gaia.db) live while a
+``gaia scan --watch`` process runs, so hooks and agents read fresh context
+without paying for a synchronous scan.
+
+Change detection is stdlib polling: each poll stats every file of the
+pruned project tree (same pruning as walk.index_project) plus the extra
+paths the tree scanners declare in their WatchSpec (CI dirs, ~/.kube/config,
+...), and diffs (mtime_ns, size) against the previous poll. No third-party
+watcher is required.
+
+Bursts (git checkout, rebase, code generation) are debounced: once a change
+is seen, polling continues every ``debounce`` seconds until a poll finds
+nothing new or ``max_delay`` has passed, and the whole burst becomes one
+refresh.
+
+A refresh feeds the change set incrementally:
+  - the ScanOrchestrator runs with config.incremental, so the scan manifest
+    re-lists only changed directories and reruns only the tree scanners
+    whose inputs changed (tools/scan/manifest.py);
+  - only the repos that contain a changed path are re-collected into the
+    store (store_populator.scan_workspace_to_store(projects=...)).
+
+Both writes are atomic: project-context.json via temp file + rename, the
+store via one bulk_apply transaction.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from tools.scan.config import ScanConfig
+from tools.scan.registry import ScannerRegistry
+from tools.scan.walk import SKIP_DIRS
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) per file path.
+Snapshot = Dict[str, Tuple[int, int]]
+
+DEFAULT_INTERVAL_S = 2.0
+DEFAULT_DEBOUNCE_S = 0.5
+DEFAULT_MAX_DELAY_S = 10.0
+
+
+def _stat_tree(directory: str, out: Snapshot, prune: bool) -> None:
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not prune or (entry.name not in SKIP_DIRS and not entry.name.startswith(".")):
+                        stack.append(entry.path)
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            out[entry.path] = (st.st_mtime_ns, st.st_size)
+
+
+def snapshot(root: Path, extra_paths: Tuple[str, ...] = ()) -> Snapshot:
+    """Stat every file in the pruned tree of *root* and in *extra_paths*.
+
+    Args:
+        root: Project root.
+        extra_paths: Root-relative or ``~/``-relative files or directories
+            outside the pruned tree (directories are walked without pruning).
+
+    Returns:
+        Mapping of file path to (mtime_ns, size).
+    """
+    out: Snapshot = {}
+    _stat_tree(str(root), out, prune=True)
+    for spec in extra_paths:
+        path = Path(spec).expanduser() if spec.startswith("~") else root / spec
+        if path.is_dir():
+            _stat_tree(str(path), out, prune=False)
+        else:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            out[str(path)] = (st.st_mtime_ns, st.st_size)
+    return out
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> Set[str]:
+    """Paths added, removed or modified between two snapshots."""
+    changed = {p for p, sig in after.items() if before.get(p) != sig}
+    changed.update(p for p in before if p not in after)
+    return changed
+
+
+@dataclass
+class WatchCycle:
+    """Outcome of one refresh.
+
+    Attributes:
+        changed: Changed paths that triggered the refresh (empty for the
+            initial refresh).
+        scanners_run: Scanners that ran.
+        scanners_reused: Tree scanners served from the scan manifest.
+        projects_synced: Repo names re-collected into the store.
+        errors: Scanner errors plus a store sync failure, if any.
+        duration_ms: Wall time of the refresh.
+    """
+
+    changed: List[str] = field(default_factory=list)
+    scanners_run: List[str] = field(default_factory=list)
+    scanners_reused: List[str] = field(default_factory=list)
+    projects_synced: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+
+class ScanWatcher:
+    """Poll a project tree and refresh context/store on debounced changes.
+
+    Args:
+        root: Project (or multi-repo workspace) root.
+        config: Scan configuration; incremental is forced on.
+        interval: Seconds between polls while idle.
+        debounce: Quiet period (seconds) that ends a burst of changes.
+        max_delay: Upper bound (seconds) on how long a burst can defer a refresh.
+        sync_store: Also resync changed repos into gaia.db.
+        agent: Agent name used for store writes.
+        db_path: Optional explicit DB path (test override).
+        registry: Scanner registry (default: auto-discovered).
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        config: Optional[ScanConfig] = None,
+        *,
+        interval: float = DEFAULT_INTERVAL_S,
+        debounce: float = DEFAULT_DEBOUNCE_S,
+        max_delay: float = DEFAULT_MAX_DELAY_S,
+        sync_store: bool = True,
+        agent: str = "developer",
+        db_path: Optional[Path] = None,
+        registry: Optional[ScannerRegistry] = None,
+    ) -> None:
+        self.root = root
+        self.config = replace(config or ScanConfig(), project_root=root, incremental=True)
+        self.interval = interval
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.sync_store = sync_store
+        self.agent = agent
+        self.db_path = db_path
+        self.registry = registry or ScannerRegistry()
+        self.extra_paths = tuple(sorted({
+            spec
+            for scanner in self.registry.get_all()
+            if scanner.WATCH is not None
+            for spec in scanner.WATCH.extra_paths
+        }))
+        self._snapshot: Snapshot = snapshot(root, self.extra_paths)
+
+    def poll(self) -> Set[str]:
+        """Take a new snapshot and return the paths changed since the last one."""
+        current = snapshot(self.root, self.extra_paths)
+        changed = diff_snapshots(self._snapshot, current)
+        self._snapshot = current
+        return changed
+
+    def wait_for_changes(self, stop: threading.Event) -> Set[str]:
+        """Block until a debounced burst of changes is seen (or *stop* is set).
+
+        Returns:
+            The accumulated changed paths (empty when stopped while idle).
+        """
+        changed: Set[str] = set()
+        while not changed:
+            if stop.wait(self.interval):
+                return set()
+            changed = self.poll()
+        deadline = time.monotonic() + self.max_delay
+        while time.monotonic() < deadline:
+            if stop.wait(self.debounce):
+                break
+            more = self.poll()
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def _affected_projects(self, changed: Set[str]) -> List[Path]:
+        """Repo dirs (per store_populator._list_repos) containing a changed path."""
+        from tools.scan.store_populator import _list_repos
+
+        repos = _list_repos(self.root)
+        hits = []
+        for repo in repos:
+            prefix = str(repo) + os.sep
+            if any(p.startswith(prefix) for p in changed):
+                hits.append(repo)
+        return hits
+
+    def refresh(self, changed: Optional[Set[str]] = None) -> WatchCycle:
+        """Rescan incrementally and resync the affected repos into the store.
+
+        Args:
+            changed: Paths that changed; None for a full initial refresh.
+        """
+        from tools.scan.orchestrator import ScanOrchestrator
+
+        start = time.monotonic()
+        cycle = WatchCycle(changed=sorted(changed or ()))
+        output = ScanOrchestrator(registry=self.registry, config=self.config).run(self.root)
+        cycle.scanners_run = sorted(output.scanner_results.keys() - set(output.reused_scanners))
+        cycle.scanners_reused = list(output.reused_scanners)
+        cycle.errors.extend(output.errors)
+
+        if self.sync_store:
+            projects = None if changed is None else self._affected_projects(changed)
+            if projects is None or projects:
+                try:
+                    from tools.scan.store_populator import resolve_identity, scan_workspace_to_store
+
+                    results = scan_workspace_to_store(
+                        workspace=resolve_identity(self.root),
+                        root=self.root,
+                        agent=self.agent,
+                        db_path=self.db_path,
+                        projects=projects,
+                    )
+                    cycle.projects_synced = sorted(k for k in results if k != "__workspace__")
+                except Exception as exc:
+                    msg = f"store sync failed: {type(exc).__name__}: {exc}"
+                    logger.warning(msg)
+                    cycle.errors.append(msg)
+
+        cycle.duration_ms = (time.monotonic() - start) * 1000
+        return cycle
+
+    def run(
+        self,
+        stop: Optional[threading.Event] = None,
+        on_cycle: Optional[Callable[[WatchCycle], None]] = None,
+        max_cycles: Optional[int] = None,
+    ) -> int:
+        """Refresh once, then refresh on every debounced burst until stopped.
+
+        Args:
+            stop: Event that ends the loop (default: run until interrupted).
+            on_cycle: Called with each WatchCycle (progress output).
+            max_cycles: Stop after this many refreshes, initial one included.
+
+        Returns:
+            Number of refreshes performed.
+        """
+        stop = stop or threading.Event()
+        cycles = 0
+        changed: Optional[Set[str]] = None
+        while True:
+            # The snapshot predates the refresh, so edits made while it runs
+            # show up in the next poll. Our own writes never do: they land in
+            # a pruned dir (.claude/) or outside the tree (gaia.db).
+            cycle = self.refresh(changed)
+            cycles += 1
+            if on_cycle is not None:
+                on_cycle(cycle)
+            if max_cycles is not None and cycles >= max_cycles:
+                return cycles
+            changed = self.wait_for_changes(stop)
+            if not changed:
+                return cycles